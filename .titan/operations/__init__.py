@@ -22,17 +22,36 @@ from .pytest_operations import (
 from .log_operations import (
     LogEntry,
     LogSession,
+    LogIndex,
+    SessionSummary,
     WorkflowRun,
     StepRun,
     SessionAnalysis,
     SLOW_THRESHOLD_SECONDS,
     STEP_RESULT_ICONS,
     WORKFLOW_STATUS_ICONS,
+    iter_log_sessions,
     parse_log_file,
+    log_index_path,
+    update_log_index,
+    list_log_sessions,
+    load_log_session,
     analyze_session,
     format_session_label,
 )
 
+from .change_scope_operations import (
+    TEST_MAP_PATH,
+    TestSelection,
+    collect_changed_files,
+    filter_python_files,
+    select_tests,
+    parse_coverage_contexts,
+    merge_test_map,
+    load_test_map,
+    save_test_map,
+)
+
 from .plugin_docs_operations import (
     OFFICIAL_PLUGIN_REFS,
     build_all_plugin_inventories,
@@ -68,16 +87,34 @@ __all__ = [
     # Log operations
     "LogEntry",
     "LogSession",
+    "LogIndex",
+    "SessionSummary",
     "WorkflowRun",
     "StepRun",
     "SessionAnalysis",
     "SLOW_THRESHOLD_SECONDS",
     "STEP_RESULT_ICONS",
     "WORKFLOW_STATUS_ICONS",
+    "iter_log_sessions",
     "parse_log_file",
+    "log_index_path",
+    "update_log_index",
+    "list_log_sessions",
+    "load_log_session",
     "analyze_session",
     "format_session_label",
 
+    # Change scope operations
+    "TEST_MAP_PATH",
+    "TestSelection",
+    "collect_changed_files",
+    "filter_python_files",
+    "select_tests",
+    "parse_coverage_contexts",
+    "merge_test_map",
+    "load_test_map",
+    "save_test_map",
+
     # Plugin docs operations
     "OFFICIAL_PLUGIN_REFS",
     "build_all_plugin_inventories",
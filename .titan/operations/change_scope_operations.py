@@ -0,0 +1,283 @@
+"""
+Change Scope Operations
+
+Pure business logic for scoping lint and test runs to the files changed
+relative to a base ref.
+
+Test selection is driven by a file → test map kept in ``.pytest_cache``. The
+map records, for each test file, the source files its tests executed, read
+from a coverage run with per-test contexts. A full run rebuilds it; a
+selective run refreshes the entries of the test files it ran.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterable, List, Optional
+
+from titan_cli.core.result import ClientSuccess
+
+TEST_MAP_PATH = Path(".pytest_cache") / "titan-test-map.json"
+
+# Bump when the map layout changes
+TEST_MAP_VERSION = 1
+
+# Changes to these can affect any test: selection falls back to a full run
+FULL_RUN_TRIGGERS = frozenset({
+    "conftest.py",
+    "pyproject.toml",
+    "poetry.lock",
+    "pytest.ini",
+    "setup.cfg",
+    "tox.ini",
+})
+
+PYTHON_SUFFIXES = (".py", ".pyi")
+
+
+@dataclass
+class TestSelection:
+    """Tests to run for a set of changes."""
+    full_run: bool
+    test_files: List[str] = field(default_factory=list)
+    reason: str = ""
+
+
+def collect_changed_files(git_client: Optional[Any], base_ref: Optional[str] = None) -> Optional[List[str]]:
+    """
+    List the files changed relative to a base ref, including uncommitted work.
+
+    Covers the commits since the merge base of `base_ref` and HEAD plus staged,
+    modified and untracked files. Paths are relative to the repository root.
+
+    Args:
+        git_client: GitClient of the repository (ctx.git), or None
+        base_ref: Branch or ref the changes are measured against
+            (default: the client's main branch)
+
+    Returns:
+        Sorted list of paths, or None if git could not tell
+        (no git plugin, unknown base ref, not a repository)
+    """
+    if git_client is None:
+        return None
+    base_ref = base_ref or git_client.main_branch
+    merge_base = git_client.get_merge_base(base_ref, "HEAD")
+    if not isinstance(merge_base, ClientSuccess):
+        return None
+    committed = git_client.get_changed_files(merge_base.data, "HEAD")
+    status = git_client.get_status()
+    if not isinstance(committed, ClientSuccess) or not isinstance(status, ClientSuccess):
+        return None
+
+    changed = set(committed.data)
+    changed.update(status.data.staged_files)
+    changed.update(status.data.modified_files)
+    changed.update(_expand_untracked(git_client.repo_path, status.data.untracked_files))
+    changed.update(status.data.conflicted_files)
+    for original, renamed in status.data.renamed_files:
+        changed.update((original, renamed))
+    return sorted(changed)
+
+
+def _expand_untracked(repo_path: str, paths: Iterable[str]) -> List[str]:
+    # git status lists a new directory as "dir/" rather than its files
+    files = []
+    for path in paths:
+        if not path.endswith("/"):
+            files.append(path)
+            continue
+        root = Path(repo_path)
+        files.extend(
+            child.relative_to(root).as_posix()
+            for child in sorted((root / path).rglob("*"))
+            if child.is_file()
+        )
+    return files
+
+
+def filter_python_files(paths: Iterable[str], project_root: str) -> List[str]:
+    """
+    Keep the Python files that still exist (deleted files cannot be linted).
+
+    Args:
+        paths: Paths relative to project_root
+        project_root: Project root directory
+
+    Returns:
+        Existing Python file paths, in input order
+    """
+    root = Path(project_root)
+    return [
+        path for path in paths
+        if path.endswith(PYTHON_SUFFIXES) and (root / path).is_file()
+    ]
+
+
+def is_test_file(path: str) -> bool:
+    """
+    Whether a path is a pytest test module.
+
+    Examples:
+        >>> is_test_file("tests/core/test_config.py")
+        True
+        >>> is_test_file("tests/conftest.py")
+        False
+    """
+    name = PurePosixPath(path).name
+    return name.startswith("test_") and name.endswith(".py")
+
+
+def select_tests(
+    changed: List[str],
+    test_map: Optional[Dict[str, List[str]]],
+    project_root: str,
+) -> TestSelection:
+    """
+    Choose the test files affected by a set of changed files.
+
+    Changed test files are always selected, along with every test file whose
+    recorded sources include a changed file. The map only knows the Python
+    files tests executed, so anything it cannot vouch for selects the full
+    suite: a missing map, pytest or project configuration, and any other
+    changed file that is not Python (workflows, prompts, fixtures, templates)
+    or that no recorded test executed (new modules, helpers).
+
+    Args:
+        changed: Changed paths relative to project_root
+        test_map: Test file → source files map, or None if there is none yet
+        project_root: Project root directory
+
+    Returns:
+        TestSelection
+    """
+    if test_map is None:
+        return TestSelection(full_run=True, reason="no test map yet")
+
+    triggers = sorted(path for path in changed if PurePosixPath(path).name in FULL_RUN_TRIGGERS)
+    if triggers:
+        return TestSelection(full_run=True, reason=f"{triggers[0]} changed")
+
+    known_sources = {source for sources in test_map.values() for source in sources}
+    unmapped = sorted(
+        path for path in changed
+        if not is_test_file(path)
+        and (not path.endswith(PYTHON_SUFFIXES) or path not in known_sources)
+    )
+    if unmapped:
+        return TestSelection(full_run=True, reason=f"{unmapped[0]} is not in the test map")
+
+    changed_set = set(changed)
+    selected = {path for path in changed if is_test_file(path)}
+    for test_file, sources in test_map.items():
+        if changed_set.intersection(sources):
+            selected.add(test_file)
+
+    root = Path(project_root)
+    return TestSelection(
+        full_run=False,
+        test_files=sorted(path for path in selected if (root / path).is_file()),
+        reason=f"{len(changed)} changed file(s)",
+    )
+
+
+def parse_coverage_contexts(coverage_report: Dict[str, Any]) -> Dict[str, List[str]]:
+    """
+    Build a test file → source files map from a coverage JSON report.
+
+    Expects the output of ``coverage json --show-contexts`` for a run made
+    with ``--cov-context=test``, whose contexts look like
+    ``tests/test_a.py::TestA::test_b|run``. Lines run outside any test
+    (empty context) are ignored.
+
+    Args:
+        coverage_report: Parsed coverage JSON report
+
+    Returns:
+        Map of test file → sorted source files it executed
+
+    Examples:
+        >>> report = {"files": {"pkg/a.py": {"contexts": {"3": ["tests/test_a.py::test_x|run"]}}}}
+        >>> parse_coverage_contexts(report)
+        {'tests/test_a.py': ['pkg/a.py']}
+    """
+    sources_by_test: Dict[str, set] = {}
+    for source, data in coverage_report.get("files", {}).items():
+        source = Path(source).as_posix()
+        contexts = set()
+        for line_contexts in (data.get("contexts") or {}).values():
+            contexts.update(line_contexts)
+        for context in contexts:
+            test_file = context.split("::", 1)[0]
+            if not test_file or test_file == context:
+                continue
+            sources_by_test.setdefault(test_file, set()).add(source)
+    return {test: sorted(sources) for test, sources in sorted(sources_by_test.items())}
+
+
+def merge_test_map(
+    test_map: Optional[Dict[str, List[str]]],
+    coverage_map: Dict[str, List[str]],
+    ran_test_files: Iterable[str],
+    project_root: str,
+) -> Dict[str, List[str]]:
+    """
+    Refresh a test map with the results of a run.
+
+    Entries of the test files that ran are replaced by what coverage saw (a
+    test file that executed nothing keeps an empty entry), and entries of test
+    files that no longer exist are dropped.
+
+    Args:
+        test_map: Current map, or None
+        coverage_map: Map from parse_coverage_contexts for this run
+        ran_test_files: Test files the run covered
+        project_root: Project root directory
+
+    Returns:
+        The updated map
+    """
+    merged = dict(test_map or {})
+    for test_file in ran_test_files:
+        merged[test_file] = []
+    merged.update(coverage_map)
+    root = Path(project_root)
+    return {test: sources for test, sources in sorted(merged.items()) if (root / test).is_file()}
+
+
+def load_test_map(path: Path) -> Optional[Dict[str, List[str]]]:
+    """
+    Read the test map, or None if it is missing, unreadable or outdated.
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != TEST_MAP_VERSION:
+        return None
+    tests = data.get("tests")
+    return tests if isinstance(tests, dict) else None
+
+
+def save_test_map(path: Path, test_map: Dict[str, List[str]]) -> None:
+    """Write the test map, creating its directory if needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps({"version": TEST_MAP_VERSION, "tests": test_map}, indent=1),
+        encoding="utf-8",
+    )
+
+
+__all__ = [
+    "TEST_MAP_PATH",
+    "FULL_RUN_TRIGGERS",
+    "TestSelection",
+    "collect_changed_files",
+    "filter_python_files",
+    "is_test_file",
+    "select_tests",
+    "parse_coverage_contexts",
+    "merge_test_map",
+    "load_test_map",
+    "save_test_map",
+]
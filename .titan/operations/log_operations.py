@@ -3,18 +3,39 @@ Log Parsing and Analysis Operations
 
 Pure business logic for parsing and analyzing titan structured log files.
 Log format: JSON lines (structlog), with plain-text SESSION START separators.
+
+Listing sessions goes through a sidecar index next to the log
+(``titan.log`` → ``titan.log.index.json``) holding each session's byte range,
+times and counts. The index is extended from where it stopped as the log
+grows, and rebuilt when the file was rotated, truncated or replaced, so only
+new bytes are parsed. A selected session is then read by seeking straight to
+its range.
 """
 
+import hashlib
 import json
+import os
 import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 
 SLOW_THRESHOLD_SECONDS = 2.0
 SESSION_MARKER = "SESSION START"
 
+# Bump when the index layout or the counting rules change
+INDEX_VERSION = 2
+INDEX_SUFFIX = ".index.json"
+
+# Leading bytes hashed to tell a rotated or rewritten log from a grown one
+_FINGERPRINT_BYTES = 4096
+
+_ERROR_LEVELS = ("error", "exception")
+
+# Events already represented in the workflow timeline
+_WORKFLOW_ENGINE_EVENTS = {"step_failed", "step_success", "step_skipped", "step_exit", "step_exception", "workflow_started", "workflow_completed", "workflow_failed"}
+
 STEP_RESULT_ICONS = {
     "success": "✅",
     "failed": "❌",
@@ -77,16 +98,64 @@ class LogSession:
 
     @property
     def duration_seconds(self) -> Optional[float]:
-        if self.start_time and self.end_time:
-            start = self.start_time
-            end = self.end_time
-            # Strip timezone info for comparison if needed
-            if start.tzinfo and not end.tzinfo:
-                end = end.replace(tzinfo=timezone.utc)
-            elif end.tzinfo and not start.tzinfo:
-                start = start.replace(tzinfo=timezone.utc)
-            return (end - start).total_seconds()
-        return None
+        return _span_seconds(self.start_time, self.end_time)
+
+    @property
+    def entry_count(self) -> int:
+        return len(self.entries)
+
+    @property
+    def error_count(self) -> int:
+        return sum(1 for e in self.entries if e.level in _ERROR_LEVELS)
+
+
+@dataclass
+class SessionSummary:
+    """
+    Index record of one session: where it lives in the log and what it holds.
+
+    Carries the same header fields as LogSession, so it can be listed and
+    labelled without reading the session's records.
+    """
+    start_offset: int
+    end_offset: int
+    start_time: Optional[datetime]
+    pid: Optional[int]
+    version: Optional[str] = None
+    mode: Optional[str] = None
+    end_time: Optional[datetime] = None
+    entry_count: int = 0
+    error_count: int = 0
+    # Errors outside the workflow engine's own step/workflow events, as
+    # analyze_session() reports them
+    app_error_count: int = 0
+    warning_count: int = 0
+    finished_workflows: int = 0
+    # Workflows started but not finished yet, kept so a session still being
+    # written can be extended on the next update
+    open_workflows: List[str] = field(default_factory=list)
+
+    @property
+    def session_id(self) -> str:
+        return str(self.start_offset)
+
+    @property
+    def duration_seconds(self) -> Optional[float]:
+        return _span_seconds(self.start_time, self.end_time)
+
+    @property
+    def workflow_count(self) -> int:
+        return self.finished_workflows + len(self.open_workflows)
+
+
+@dataclass
+class LogIndex:
+    """Sidecar index of a log file, valid for the bytes before `offset`."""
+    offset: int = 0
+    device: Optional[int] = None
+    inode: Optional[int] = None
+    fingerprint: str = ""
+    sessions: List[SessionSummary] = field(default_factory=list)
 
 
 @dataclass
@@ -98,6 +167,20 @@ class SessionAnalysis:
     slow_ops: List[LogEntry]
 
 
+def iter_log_sessions(path: Path) -> Iterator[LogSession]:
+    """
+    Stream the sessions of a titan log file, one at a time.
+
+    Args:
+        path: Path to the log file
+
+    Yields:
+        LogSession objects, oldest first
+    """
+    with open(path, "rb") as f:
+        yield from _read_sessions(f, 0)
+
+
 def parse_log_file(path: Path) -> List[LogSession]:
     """
     Parse a titan log file and split it into sessions.
@@ -108,58 +191,79 @@ def parse_log_file(path: Path) -> List[LogSession]:
     Returns:
         List of LogSession objects, oldest first
     """
-    sessions: List[LogSession] = []
-    current_entries: List[LogEntry] = []
-    current_start_time: Optional[datetime] = None
-    current_pid: Optional[int] = None
-    current_version: Optional[str] = None
-    current_mode: Optional[str] = None
-
-    with open(path, "r", encoding="utf-8", errors="replace") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-
-            if SESSION_MARKER in line:
-                # Save previous session
-                if current_entries or current_start_time:
-                    sessions.append(LogSession(
-                        start_time=current_start_time,
-                        pid=current_pid,
-                        version=current_version,
-                        mode=current_mode,
-                        entries=current_entries,
-                    ))
-                current_entries = []
-                current_start_time = _parse_session_time(line)
-                current_pid = _parse_session_pid(line)
-                current_version = None
-                current_mode = None
-                continue
-
-            # Skip plain-text separator lines (─────)
-            if line.startswith("─") or line.startswith("-" * 10):
-                continue
-
-            entry = _parse_log_entry(line)
-            if entry:
-                if entry.event == "session_started" and current_version is None:
-                    current_version = entry.raw.get("version")
-                    current_mode = entry.raw.get("mode")
-                current_entries.append(entry)
+    return list(iter_log_sessions(path))
 
-    # Don't forget the last session
-    if current_entries or current_start_time:
-        sessions.append(LogSession(
-            start_time=current_start_time,
-            pid=current_pid,
-            version=current_version,
-            mode=current_mode,
-            entries=current_entries,
-        ))
 
-    return sessions
+def log_index_path(path: Path) -> Path:
+    """Sidecar index location for a log file."""
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def update_log_index(path: Path, index_path: Optional[Path] = None) -> LogIndex:
+    """
+    Bring the sidecar index of a log file up to date and save it.
+
+    Only the bytes written since the last update are parsed. The index is
+    rebuilt from scratch when the file is no longer the one it describes
+    (rotated, truncated or rewritten). A trailing line still being written is
+    left for the next update. Failing to save the index is not an error: the
+    up-to-date index is returned either way.
+
+    Args:
+        path: Path to the log file
+        index_path: Where the index lives (default: next to the log file)
+
+    Returns:
+        The up-to-date LogIndex
+    """
+    index_path = index_path or log_index_path(path)
+    stat = os.stat(path)
+
+    with open(path, "rb") as f:
+        index = _load_index(index_path)
+        if index is None or not _index_matches(index, f, stat):
+            index = LogIndex(device=stat.st_dev, inode=stat.st_ino)
+
+        if stat.st_size > index.offset:
+            previous_offset = index.offset
+            _extend_index(index, f)
+            if index.offset != previous_offset:
+                index.fingerprint = _fingerprint(f, index.offset)
+                _save_index(index, index_path)
+
+    return index
+
+
+def list_log_sessions(path: Path, index_path: Optional[Path] = None) -> List[SessionSummary]:
+    """
+    List the sessions of a titan log file from its sidecar index.
+
+    Args:
+        path: Path to the log file
+        index_path: Where the index lives (default: next to the log file)
+
+    Returns:
+        List of SessionSummary objects, oldest first
+    """
+    index = update_log_index(path, index_path)
+    return [s for s in index.sessions if s.entry_count or s.start_time]
+
+
+def load_log_session(path: Path, summary: SessionSummary) -> LogSession:
+    """
+    Read a single session by seeking to its byte range.
+
+    Args:
+        path: Path to the log file the summary was indexed from
+        summary: SessionSummary from list_log_sessions
+
+    Returns:
+        The session with all its entries
+    """
+    with open(path, "rb") as f:
+        for session in _read_sessions(f, summary.start_offset, summary.end_offset):
+            return session
+    return LogSession(start_time=summary.start_time, pid=summary.pid)
 
 
 def analyze_session(session: LogSession) -> SessionAnalysis:
@@ -172,13 +276,10 @@ def analyze_session(session: LogSession) -> SessionAnalysis:
     Returns:
         SessionAnalysis with all extracted information
     """
-    # Events already represented in the workflow timeline
-    _WORKFLOW_ENGINE_EVENTS = {"step_failed", "step_success", "step_skipped", "step_exit", "step_exception", "workflow_started", "workflow_completed", "workflow_failed"}
-
     workflows = _extract_workflows(session.entries)
     errors = [
         e for e in session.entries
-        if e.level in ("error", "exception") and e.event not in _WORKFLOW_ENGINE_EVENTS
+        if e.level in _ERROR_LEVELS and e.event not in _WORKFLOW_ENGINE_EVENTS
     ]
     warnings = [e for e in session.entries if e.level == "warning"]
     slow_ops = [
@@ -195,12 +296,12 @@ def analyze_session(session: LogSession) -> SessionAnalysis:
     )
 
 
-def format_session_label(session: LogSession) -> str:
+def format_session_label(session: Union[LogSession, SessionSummary]) -> str:
     """
     Format a session label for display in a selection list.
 
     Args:
-        session: LogSession to format
+        session: LogSession or SessionSummary to format
 
     Returns:
         Human-readable label string
@@ -214,21 +315,240 @@ def format_session_label(session: LogSession) -> str:
     dur = session.duration_seconds
     dur_str = f"  {dur:.0f}s" if dur else ""
 
-    error_count = sum(1 for e in session.entries if e.level in ("error", "exception"))
+    error_count = session.error_count
     error_str = f"  ⚠ {error_count} error{'s' if error_count != 1 else ''}" if error_count else ""
 
-    entry_count = len(session.entries)
+    entry_count = session.entry_count
 
     return f"{time_str}{pid_str}{dur_str}  —  {entry_count} events{error_str}"
 
 
 # ── Private helpers ────────────────────────────────────────────────────────────
 
+def _span_seconds(start: Optional[datetime], end: Optional[datetime]) -> Optional[float]:
+    if start and end:
+        # Strip timezone info for comparison if needed
+        if start.tzinfo and not end.tzinfo:
+            end = end.replace(tzinfo=timezone.utc)
+        elif end.tzinfo and not start.tzinfo:
+            start = start.replace(tzinfo=timezone.utc)
+        return (end - start).total_seconds()
+    return None
+
+
+def _iter_lines(f: BinaryIO, start: int, end: Optional[int] = None) -> Iterator[Tuple[int, bytes]]:
+    """Yield (offset, raw line) pairs from `start` up to `end`."""
+    f.seek(start)
+    offset = start
+    for raw in f:
+        if end is not None and offset >= end:
+            break
+        yield offset, raw
+        offset += len(raw)
+
+
+def _is_separator(line: str) -> bool:
+    # Plain-text separator lines (─────) around session markers
+    return line.startswith("─") or line.startswith("-" * 10)
+
+
+def _read_sessions(f: BinaryIO, start: int, end: Optional[int] = None) -> Iterator[LogSession]:
+    current = LogSession(start_time=None, pid=None)
+
+    for _, raw in _iter_lines(f, start, end):
+        line = raw.decode("utf-8", errors="replace").strip()
+        if not line:
+            continue
+
+        if SESSION_MARKER in line:
+            if current.entries or current.start_time:
+                yield current
+            current = LogSession(
+                start_time=_parse_session_time(line),
+                pid=_parse_session_pid(line),
+            )
+            continue
+
+        if _is_separator(line):
+            continue
+
+        entry = _parse_log_entry(line)
+        if entry:
+            if entry.event == "session_started" and current.version is None:
+                current.version = entry.raw.get("version")
+                current.mode = entry.raw.get("mode")
+            current.entries.append(entry)
+
+    # Don't forget the last session
+    if current.entries or current.start_time:
+        yield current
+
+
+def _extend_index(index: LogIndex, f: BinaryIO) -> None:
+    """Index the complete lines after `index.offset`, continuing the last session."""
+    if index.sessions:
+        current = index.sessions.pop()
+    else:
+        current = SessionSummary(start_offset=0, end_offset=0, start_time=None, pid=None)
+
+    offset = index.offset
+    for line_start, raw in _iter_lines(f, index.offset):
+        if not raw.endswith(b"\n"):
+            # Still being written: pick it up on the next update
+            break
+        offset = line_start + len(raw)
+
+        line = raw.decode("utf-8", errors="replace").strip()
+        if not line:
+            continue
+
+        if SESSION_MARKER in line:
+            current.end_offset = line_start
+            if current.entry_count or current.start_time:
+                index.sessions.append(current)
+            current = SessionSummary(
+                start_offset=line_start,
+                end_offset=line_start,
+                start_time=_parse_session_time(line),
+                pid=_parse_session_pid(line),
+            )
+            continue
+
+        if _is_separator(line):
+            continue
+
+        entry = _parse_log_entry(line)
+        if entry:
+            _count_entry(current, entry)
+
+    current.end_offset = offset
+    index.sessions.append(current)
+    index.offset = offset
+
+
+def _count_entry(summary: SessionSummary, entry: LogEntry) -> None:
+    summary.entry_count += 1
+    if entry.timestamp:
+        summary.end_time = entry.timestamp
+    if entry.level in _ERROR_LEVELS:
+        summary.error_count += 1
+        if entry.event not in _WORKFLOW_ENGINE_EVENTS:
+            summary.app_error_count += 1
+    elif entry.level == "warning":
+        summary.warning_count += 1
+
+    event = entry.event
+    if event == "session_started" and summary.version is None:
+        summary.version = entry.raw.get("version")
+        summary.mode = entry.raw.get("mode")
+    # Same bookkeeping as _extract_workflows, without keeping the steps
+    elif event == "workflow_started":
+        name = entry.raw.get("workflow", "")
+        if name not in summary.open_workflows:
+            summary.open_workflows.append(name)
+    elif event in ("workflow_completed", "workflow_failed"):
+        name = entry.raw.get("workflow", "")
+        if name in summary.open_workflows:
+            summary.open_workflows.remove(name)
+        summary.finished_workflows += 1
+
+
+def _fingerprint(f: BinaryIO, length: int) -> str:
+    f.seek(0)
+    return hashlib.sha256(f.read(min(length, _FINGERPRINT_BYTES))).hexdigest()
+
+
+def _index_matches(index: LogIndex, f: BinaryIO, stat: os.stat_result) -> bool:
+    """Whether the index still describes the head of this file."""
+    return (
+        index.device == stat.st_dev
+        and index.inode == stat.st_ino
+        and index.offset <= stat.st_size
+        and index.fingerprint == _fingerprint(f, index.offset)
+    )
+
+
+def _load_index(index_path: Path) -> Optional[LogIndex]:
+    try:
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+        if data.get("version") != INDEX_VERSION:
+            return None
+        return LogIndex(
+            offset=int(data["offset"]),
+            device=data["device"],
+            inode=data["inode"],
+            fingerprint=data["fingerprint"],
+            sessions=[_summary_from_json(s) for s in data["sessions"]],
+        )
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        # Missing or unreadable index: rebuild it
+        return None
+
+
+def _save_index(index: LogIndex, index_path: Path) -> None:
+    data = {
+        "version": INDEX_VERSION,
+        "offset": index.offset,
+        "device": index.device,
+        "inode": index.inode,
+        "fingerprint": index.fingerprint,
+        "sessions": [_summary_to_json(s) for s in index.sessions],
+    }
+    tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, index_path)
+    except OSError:
+        # Read-only log directory: the index is simply rebuilt next time
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _summary_to_json(summary: SessionSummary) -> Dict[str, Any]:
+    return {
+        "start_offset": summary.start_offset,
+        "end_offset": summary.end_offset,
+        "start_time": summary.start_time.isoformat() if summary.start_time else None,
+        "end_time": summary.end_time.isoformat() if summary.end_time else None,
+        "pid": summary.pid,
+        "version": summary.version,
+        "mode": summary.mode,
+        "entry_count": summary.entry_count,
+        "error_count": summary.error_count,
+        "app_error_count": summary.app_error_count,
+        "warning_count": summary.warning_count,
+        "finished_workflows": summary.finished_workflows,
+        "open_workflows": summary.open_workflows,
+    }
+
+
+def _summary_from_json(data: Dict[str, Any]) -> SessionSummary:
+    return SessionSummary(
+        start_offset=int(data["start_offset"]),
+        end_offset=int(data["end_offset"]),
+        start_time=datetime.fromisoformat(data["start_time"]) if data["start_time"] else None,
+        end_time=datetime.fromisoformat(data["end_time"]) if data["end_time"] else None,
+        pid=data["pid"],
+        version=data["version"],
+        mode=data["mode"],
+        entry_count=int(data["entry_count"]),
+        error_count=int(data["error_count"]),
+        app_error_count=int(data["app_error_count"]),
+        warning_count=int(data["warning_count"]),
+        finished_workflows=int(data["finished_workflows"]),
+        open_workflows=list(data["open_workflows"]),
+    )
+
+
 def _parse_log_entry(line: str) -> Optional[LogEntry]:
     try:
         data = json.loads(line)
     except (json.JSONDecodeError, ValueError):
         return None
+    if not isinstance(data, dict):
+        return None
 
     timestamp = None
     ts_str = data.get("timestamp")
@@ -321,13 +641,20 @@ def _extract_workflows(entries: List[LogEntry]) -> List[WorkflowRun]:
 __all__ = [
     "LogEntry",
     "LogSession",
+    "LogIndex",
+    "SessionSummary",
     "WorkflowRun",
     "StepRun",
     "SessionAnalysis",
     "SLOW_THRESHOLD_SECONDS",
     "STEP_RESULT_ICONS",
     "WORKFLOW_STATUS_ICONS",
+    "iter_log_sessions",
     "parse_log_file",
+    "log_index_path",
+    "update_log_index",
+    "list_log_sessions",
+    "load_log_session",
     "analyze_session",
     "format_session_label",
 ]
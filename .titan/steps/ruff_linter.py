@@ -1,4 +1,8 @@
+import hashlib
 import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional
+
 from titan_cli.engine.context import WorkflowContext
 from titan_cli.engine.results import Success, Error, WorkflowResult
 from titan_cli.engine.utils import get_poetry_venv_env
@@ -9,12 +13,22 @@ from operations import (
     parse_ruff_json_output,
     build_ruff_error_table_data,
     format_ruff_errors_for_ai,
+    collect_changed_files,
+    filter_python_files,
 )
 
 
 def ruff_linter(ctx: WorkflowContext) -> WorkflowResult:
     """
-    Run ruff with autofix and show diff between before/after.
+    Run ruff with autofix on the changed Python files and report what remains.
+
+    Fixing and checking happen in a single `ruff check --fix` pass: its JSON
+    output lists the issues left after the fixes.
+
+    Inputs (from ctx.data):
+        full_run (bool, optional): Lint the whole project instead of the changes
+        base_ref (str, optional): Ref the changes are measured against
+            (default: the git plugin's main branch)
     """
     if not ctx.textual:
         return Error("Textual UI context is not available for this step.")
@@ -31,11 +45,27 @@ def ruff_linter(ctx: WorkflowContext) -> WorkflowResult:
         ctx.textual.end_step("error")
         return Error("Could not determine poetry virtual environment for ruff.")
 
-    # 1. Scan before fix
-    ctx.textual.dim_text("Running initial ruff scan...")
+    # 1. Scope the run to the changed files unless a full run is requested
+    targets: Optional[List[str]] = None
+    if ctx.get("full_run"):
+        ctx.textual.dim_text("Full run requested: linting the whole project")
+    else:
+        changed = collect_changed_files(ctx.git, ctx.get("base_ref"))
+        if changed is None:
+            ctx.textual.dim_text("Could not determine changed files: linting the whole project")
+        else:
+            targets = filter_python_files(changed, project_root)
+            if not targets:
+                ctx.textual.success_text("No changed Python files to lint")
+                ctx.textual.end_step("success")
+                return Success("Linting skipped: no changed Python files")
+            ctx.textual.dim_text(f"Linting {len(targets)} changed Python file(s)...")
+
+    # 2. Fix and check in one pass
+    before = _file_digests(project_root, targets) if targets else {}
     try:
-        result_before = subprocess.run(
-            ["ruff", "check", ".", "--output-format=json"],
+        result = subprocess.run(
+            ["ruff", "check", "--fix", "--force-exclude", "--output-format=json", *(targets or ["."])],
             capture_output=True,
             text=True,
             cwd=project_root,
@@ -49,86 +79,73 @@ def ruff_linter(ctx: WorkflowContext) -> WorkflowResult:
         ctx.textual.end_step("error")
         return Error(f"ruff command not found: {e}")
 
-    # Parse using operations
-    errors_before = parse_ruff_json_output(result_before.stdout)
-    if errors_before is None and result_before.returncode != 0:
+    # Exit code 2 means ruff itself failed (bad config, invalid arguments)
+    if result.returncode not in (0, 1):
         ctx.textual.text("")
-        ctx.textual.error_text("Failed to parse initial ruff output as JSON")
+        ctx.textual.error_text("ruff failed")
         ctx.textual.text("")
-        if result_before.stdout:
+        if result.stdout:
             ctx.textual.dim_text("STDOUT:")
-            ctx.textual.dim_text(result_before.stdout[:500])
-        if result_before.stderr:
+            ctx.textual.dim_text(result.stdout[:500])
+        if result.stderr:
             ctx.textual.dim_text("STDERR:")
-            ctx.textual.dim_text(result_before.stderr[:500])
-        ctx.textual.dim_text(f"Return code: {result_before.returncode}")
+            ctx.textual.dim_text(result.stderr[:500])
+        ctx.textual.dim_text(f"Return code: {result.returncode}")
         ctx.textual.end_step("error")
-        return Error("Failed to parse ruff output as JSON")
-
-    # 2. Auto-fix
-    ctx.textual.dim_text("Applying auto-fixes...")
-    subprocess.run(
-        ["ruff", "check", ".", "--fix", "--quiet"],
-        capture_output=True,
-        cwd=project_root,
-        env=venv_env
-    )
-
-    # 3. Scan after fix
-    ctx.textual.dim_text("Running final ruff scan...")
-    result_after = subprocess.run(
-        ["ruff", "check", ".", "--output-format=json"],
-        capture_output=True,
-        text=True,
-        cwd=project_root,
-        env=venv_env
-    )
+        return Error("ruff failed; see its output above")
 
     # Parse using operations
-    errors_after = parse_ruff_json_output(result_after.stdout)
-    if errors_after is None and result_after.returncode != 0:
-        ctx.textual.end_step("error")
-        return Error(f"Failed to parse final ruff output as JSON.\n{result_after.stdout}")
+    errors_after = parse_ruff_json_output(result.stdout)
 
-    # 4. Show summary
+    # 3. Show summary
     ctx.textual.text("")  # spacing
-    fixed_count = len(errors_before) - len(errors_after)
-
-    if fixed_count > 0:
-        ctx.textual.success_text(f"Auto-fixed {fixed_count} issue(s)")
+    if targets:
+        after = _file_digests(project_root, targets)
+        fixed_files = sum(1 for path, digest in before.items() if after.get(path) != digest)
+        if fixed_files:
+            ctx.textual.success_text(f"Auto-fixed issues in {fixed_files} file(s)")
+        fixed_summary = f"{fixed_files} file(s) auto-fixed"
+    else:
+        fixed_summary = "auto-fixes applied"
 
     if not errors_after:
         ctx.textual.success_text("All linting issues resolved!")
         ctx.textual.end_step("success")
         return Success("Linting passed")
 
-    # 5. Show remaining errors
-    if errors_after:
-        ctx.textual.warning_text(f"{len(errors_after)} issue(s) require manual fix:")
-        ctx.textual.text("")  # spacing
-
-        # Build table data using operations
-        table_headers, table_rows = build_ruff_error_table_data(errors_after, project_root)
-
-        # Mount table widget
-        ctx.textual.mount(
-            Table(
-                headers=table_headers,
-                rows=table_rows,
-                title="Remaining Ruff Issues"
-            )
-        )
+    # 4. Show remaining errors
+    ctx.textual.warning_text(f"{len(errors_after)} issue(s) require manual fix:")
+    ctx.textual.text("")  # spacing
 
-        # Build formatted error list for AI assistant using operations
-        errors_text = format_ruff_errors_for_ai(errors_after, project_root)
+    # Build table data using operations
+    table_headers, table_rows = build_ruff_error_table_data(errors_after, project_root)
 
-        # Return Success with errors in metadata for next step to consume
-        ctx.textual.end_step("success")
-        return Success(
-            message=f"Linting complete: {fixed_count} auto-fixed, {len(errors_after)} need manual attention",
-            metadata={"step_output": errors_text}
+    # Mount table widget
+    ctx.textual.mount(
+        Table(
+            headers=table_headers,
+            rows=table_rows,
+            title="Remaining Ruff Issues"
         )
+    )
 
-    # All issues resolved
+    # Build formatted error list for AI assistant using operations
+    errors_text = format_ruff_errors_for_ai(errors_after, project_root)
+
+    # Return Success with errors in metadata for next step to consume
     ctx.textual.end_step("success")
-    return Success("Linting passed - all issues resolved!")
+    return Success(
+        message=f"Linting complete: {fixed_summary}, {len(errors_after)} need manual attention",
+        metadata={"step_output": errors_text}
+    )
+
+
+def _file_digests(project_root: str, paths: List[str]) -> Dict[str, str]:
+    """Content hashes of the lint targets, to tell which ones ruff rewrote."""
+    digests = {}
+    for path in paths:
+        try:
+            digests[path] = hashlib.sha256((Path(project_root) / path).read_bytes()).hexdigest()
+        except OSError:
+            continue
+    return digests
@@ -1,19 +1,22 @@
 """
 Step: select_log_session
 
-Parse the log file and let the user pick a session to analyze.
+List the sessions of the log file and let the user pick one to analyze.
 """
 
 from pathlib import Path
 from titan_cli.engine import WorkflowContext, WorkflowResult, Success, Error
 from titan_cli.ui.tui.widgets import OptionItem
 
-from operations import parse_log_file, format_session_label
+from operations import list_log_sessions, load_log_session, format_session_label
 
 
 def select_log_session(ctx: WorkflowContext) -> WorkflowResult:
     """
-    Parse the log file and present a session selector.
+    List the log's sessions and present a session selector.
+
+    Sessions are listed from the log's sidecar index, which only parses what
+    was written since the last run; just the selected session is then read.
 
     Inputs (from ctx.data):
         log_path (str): Path to the log file
@@ -31,10 +34,10 @@ def select_log_session(ctx: WorkflowContext) -> WorkflowResult:
         ctx.textual.end_step("error")
         return Error("No log path in context. Run prompt_log_path first.")
 
-    ctx.textual.dim_text(f"Parsing {log_path}...")
+    ctx.textual.dim_text(f"Indexing {log_path}...")
 
     try:
-        sessions = parse_log_file(Path(log_path))
+        sessions = list_log_sessions(Path(log_path))
     except Exception as e:
         ctx.textual.error_text(f"Failed to parse log file: {e}")
         ctx.textual.end_step("error")
@@ -71,17 +74,22 @@ def select_log_session(ctx: WorkflowContext) -> WorkflowResult:
 
         selected = sessions_desc[selected_idx]
 
-    ctx.set("log_session", selected)
+    try:
+        session = load_log_session(Path(log_path), selected)
+    except Exception as e:
+        ctx.textual.error_text(f"Failed to read session: {e}")
+        ctx.textual.end_step("error")
+        return Error(f"Failed to read session: {e}")
+
+    ctx.set("log_session", session)
 
     ctx.textual.end_step("success")
     return Success(f"Session selected: {format_session_label(selected)}")
 
 
-def _session_description(session) -> str:
-    from operations import analyze_session
-    analysis = analyze_session(session)
-    wf_count = len(analysis.workflows)
-    err_count = len(analysis.errors)
+def _session_description(summary) -> str:
+    wf_count = summary.workflow_count
+    err_count = summary.app_error_count
     parts = []
     if wf_count:
         parts.append(f"{wf_count} workflow{'s' if wf_count != 1 else ''}")
@@ -1,7 +1,9 @@
 import subprocess
 import json
 import os
+import tempfile
 from pathlib import Path
+from typing import Dict, Optional
 from titan_cli.engine.context import WorkflowContext
 from titan_cli.engine.results import Success, Error, WorkflowResult
 from titan_cli.engine.utils import get_poetry_venv_env
@@ -13,12 +15,30 @@ from operations import (
     parse_pytest_report_summary,
     build_failure_table_data,
     format_failures_for_ai,
+    TEST_MAP_PATH,
+    TestSelection,
+    collect_changed_files,
+    select_tests,
+    parse_coverage_contexts,
+    merge_test_map,
+    load_test_map,
+    save_test_map,
 )
 
 
 def test_runner(ctx: WorkflowContext) -> WorkflowResult:
     """
-    Run pytest using the --json-report flag and parse the structured output.
+    Run the tests affected by the changes using the --json-report flag and
+    parse the structured output.
+
+    Test files are chosen from a file → test map built from coverage data
+    (see change_scope_operations). The map is rebuilt by full runs and
+    refreshed by selective ones whenever pytest-cov is installed.
+
+    Inputs (from ctx.data):
+        full_run (bool, optional): Run the whole suite instead of the affected tests
+        base_ref (str, optional): Ref the changes are measured against
+            (default: the git plugin's main branch)
     """
     if not ctx.textual:
         return Error("Textual UI context is not available for this step.")
@@ -28,6 +48,7 @@ def test_runner(ctx: WorkflowContext) -> WorkflowResult:
 
     project_root = ctx.get("project_root", ".")
     report_path = Path(project_root) / ".report.json"
+    test_map_path = Path(project_root) / TEST_MAP_PATH
 
     # Get poetry venv environment for consistency with other steps
     venv_env = get_poetry_venv_env(cwd=project_root)
@@ -38,24 +59,71 @@ def test_runner(ctx: WorkflowContext) -> WorkflowResult:
         ctx.textual.end_step("error")
         return Error("Could not determine poetry virtual environment for pytest.")
 
-    ctx.textual.dim_text("Running tests with pytest...")
+    # Choose the tests to run
+    test_map = load_test_map(test_map_path)
+    if ctx.get("full_run"):
+        selection = TestSelection(full_run=True, reason="full run requested")
+    else:
+        changed = collect_changed_files(ctx.git, ctx.get("base_ref"))
+        if changed is None:
+            selection = TestSelection(full_run=True, reason="changed files unavailable")
+        else:
+            selection = select_tests(changed, test_map, project_root)
+
+    if not selection.full_run and not selection.test_files:
+        ctx.textual.success_text("No tests affected by the changes")
+        ctx.textual.end_step("success")
+        return Success("No tests affected by the changes")
 
-    # Run pytest with JSON report enabled, using the venv environment
-    try:
-        result = subprocess.run(
-            ["pytest", "--json-report", f"--json-report-file={report_path}"],
-            capture_output=True,
-            text=True,
-            cwd=project_root,
-            env=venv_env
+    # The map can only be maintained when pytest-cov is installed in the venv
+    track_coverage = _has_pytest_cov(project_root, venv_env)
+
+    if selection.full_run:
+        ctx.textual.dim_text(f"Running the full test suite ({selection.reason})...")
+    else:
+        ctx.textual.dim_text(
+            f"Running {len(selection.test_files)} affected test file(s) ({selection.reason})..."
         )
-    except FileNotFoundError as e:
-        ctx.textual.text("")
-        ctx.textual.error_text(f"Failed to run pytest: {e}")
-        ctx.textual.dim_text("Make sure pytest and pytest-json-report are installed")
-        ctx.textual.dim_text("Try running: poetry install")
-        ctx.textual.end_step("error")
-        return Error(f"pytest command not found: {e}")
+
+    with tempfile.TemporaryDirectory(prefix="titan-tests-") as scratch:
+        pytest_env = dict(venv_env)
+        command = ["pytest", "--json-report", f"--json-report-file={report_path}"]
+        if track_coverage:
+            # Per-test contexts feed the map; keep the data away from the project's .coverage
+            pytest_env["COVERAGE_FILE"] = str(Path(scratch) / ".coverage")
+            command += ["--cov=.", "--cov-context=test", "--cov-report="]
+        command += selection.test_files
+
+        # Run pytest with JSON report enabled, using the venv environment
+        try:
+            result = subprocess.run(
+                command,
+                capture_output=True,
+                text=True,
+                cwd=project_root,
+                env=pytest_env
+            )
+        except FileNotFoundError as e:
+            ctx.textual.text("")
+            ctx.textual.error_text(f"Failed to run pytest: {e}")
+            ctx.textual.dim_text("Make sure pytest and pytest-json-report are installed")
+            ctx.textual.dim_text("Try running: poetry install")
+            ctx.textual.end_step("error")
+            return Error(f"pytest command not found: {e}")
+
+        if track_coverage:
+            refreshed = _read_coverage_map(project_root, pytest_env, scratch)
+            if refreshed is not None:
+                save_test_map(test_map_path, merge_test_map(
+                    None if selection.full_run else test_map,
+                    refreshed,
+                    selection.test_files,
+                    project_root,
+                ))
+            else:
+                ctx.textual.dim_text("Could not read coverage data; the test map was not updated")
+        elif test_map is None:
+            ctx.textual.dim_text("Install pytest-cov to run only the tests affected by changes")
 
     # Read the report
     if not report_path.exists():
@@ -150,3 +218,35 @@ def test_runner(ctx: WorkflowContext) -> WorkflowResult:
         message="Tests completed with failures",
         metadata={"step_output": failures_text}
     )
+
+
+def _has_pytest_cov(project_root: str, env: Dict[str, str]) -> bool:
+    """Whether the venv's python can import the pytest-cov plugin."""
+    try:
+        result = subprocess.run(
+            ["python", "-c", "import pytest_cov"],
+            capture_output=True,
+            cwd=project_root,
+            env=env,
+        )
+    except OSError:
+        return False
+    return result.returncode == 0
+
+
+def _read_coverage_map(project_root: str, env: Dict[str, str], scratch: str) -> Optional[Dict]:
+    """Export the run's coverage contexts and turn them into test map entries."""
+    report_path = Path(scratch) / "coverage.json"
+    try:
+        subprocess.run(
+            # coverage comes with pytest-cov, but its script may not be on PATH
+            ["python", "-m", "coverage", "json", "--show-contexts", "-q", "-o", str(report_path)],
+            capture_output=True,
+            cwd=project_root,
+            env=env,
+            check=True,
+        )
+        with open(report_path) as f:
+            return parse_coverage_contexts(json.load(f))
+    except (OSError, subprocess.CalledProcessError, json.JSONDecodeError):
+        return None
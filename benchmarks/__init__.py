@@ -0,0 +1,7 @@
+"""
+Offline performance benchmarks for Titan CLI.
+
+Each scenario runs a hot path against a synthetic workspace, with fake `gh`,
+`git`, AI CLI and Jira backends, and records wall time, subprocess count and
+peak RSS. See benchmarks/README.md.
+"""
@@ -0,0 +1,67 @@
+"""
+Fake external tools for the benchmarks.
+
+`install_fakes()` writes a directory of executables that shadow the real ones
+when put first on PATH:
+
+    gh       answers from fixtures (see `gh.py`)
+    claude   deterministic AI answers (see `claude.py`)
+    git      the real git, except that network subcommands succeed offline
+
+The Jira stand-in is an HTTP server instead (see `jira_server.py`).
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+_HERE = Path(__file__).resolve().parent
+
+# Subcommands that would talk to a remote. The synthetic repo's `origin/*`
+# refs are local, so succeeding without doing anything is what a fetch of an
+# up-to-date remote looks like.
+_GIT_SHIM = """#!/bin/sh
+sub=""
+skip=0
+for arg in "$@"; do
+    if [ "$skip" = 1 ]; then skip=0; continue; fi
+    case "$arg" in
+        -C|-c) skip=1 ;;
+        -*) ;;
+        *) sub="$arg"; break ;;
+    esac
+done
+case "$sub" in
+    fetch|pull|push|ls-remote) exit 0 ;;
+esac
+exec "{real_git}" "$@"
+"""
+
+
+def install_fakes(bin_dir: Path) -> Path:
+    """
+    Write the fake `gh`, `claude` and `git` executables into `bin_dir`.
+
+    Returns:
+        `bin_dir`, to prepend to PATH
+
+    Raises:
+        RuntimeError: If the real git is not installed
+    """
+    real_git = shutil.which("git")
+    if real_git is None:
+        raise RuntimeError("The benchmarks need git installed")
+
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    scripts = {
+        # -S: the fakes only use the standard library, and skipping site
+        # keeps their startup (paid once per call) small
+        "gh": f"#!{sys.executable} -S\n" + (_HERE / "gh.py").read_text(encoding="utf-8"),
+        "claude": f"#!{sys.executable} -S\n" + (_HERE / "claude.py").read_text(encoding="utf-8"),
+        "git": _GIT_SHIM.replace("{real_git}", real_git),
+    }
+    for name, content in scripts.items():
+        path = bin_dir / name
+        path.write_text(content, encoding="utf-8")
+        path.chmod(0o755)
+    return bin_dir
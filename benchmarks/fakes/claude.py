@@ -0,0 +1,122 @@
+"""
+Deterministic stand-in for a headless AI CLI (`claude --print`).
+
+The review steps talk to AI through headless CLI adapters, so the fake AI is
+an executable the Claude adapter finds on PATH. It recognizes the three
+prompts of the review chain and answers from their content, the same way for
+the same prompt:
+
+    plan          the top ranked candidates, two review axes
+    findings      up to two findings per reviewed file, anchored on added lines
+    verification  "confirmed", except every third finding "refuted"
+
+Any other prompt gets an empty JSON object. With `--json-schema` the answer is
+wrapped in the `--output-format json` envelope, as the real CLI does.
+
+Runs with `python -S`: standard library only.
+"""
+
+import json
+import re
+import sys
+
+_ADDED_LINE = re.compile(r"^\s*(\d+) \[ADDED\] (.*)$")
+_FINDING_INDEX = re.compile(r'"index":\s*(\d+)')
+_MAX_FOCUS = re.compile(r"Focus at most (\d+) files")
+
+# Review axes the plan may name, in order of preference
+_AXES = ("functional_correctness", "error_handling", "data_validation", "state_consistency")
+
+
+def _section(prompt: str, heading: str) -> str:
+    """Text under `## heading`, up to the next second-level heading."""
+    start = prompt.find(f"## {heading}\n")
+    if start < 0:
+        return ""
+    start += len(heading) + 4
+    end = prompt.find("\n## ", start)
+    return prompt[start:] if end < 0 else prompt[start:end]
+
+
+def _plan(prompt: str) -> dict:
+    try:
+        candidates = json.loads(_section(prompt, "Ranked Candidate Files"))
+        checklist = json.loads(_section(prompt, "Review Checklist"))
+    except json.JSONDecodeError:
+        return {}
+    limit_match = _MAX_FOCUS.search(prompt)
+    limit = int(limit_match.group(1)) if limit_match else 5
+    checklist_ids = {str(item.get("id")) for item in checklist}
+    return {
+        "focus_files": [
+            {
+                "path": candidate["path"],
+                "priority": candidate.get("priority") or "medium",
+                "read_mode": "expanded_hunks",
+                "reasons": ["ranked candidate"],
+            }
+            for candidate in candidates[:limit]
+        ],
+        "review_axes": [axis for axis in _AXES if axis in checklist_ids][:2],
+        "extra_context_requests": [],
+        "excluded_files": [],
+    }
+
+
+def _findings(prompt: str) -> list:
+    findings = []
+    code = _section(prompt, "Code to Review")
+    for block in code.split("\n### "):
+        path, _, body = block.lstrip("# ").partition("\n")
+        added = [match.groups() for match in map(_ADDED_LINE.match, body.splitlines()) if match]
+        for line, text in added[:: max(1, len(added) // 2)][:2]:
+            snippet = text.strip()
+            findings.append({
+                "severity": "important",
+                "category": "error_handling",
+                "path": path.strip(),
+                "line": int(line),
+                "title": f"Unchecked retry budget in {path.strip().rsplit('/', 1)[-1]}",
+                "why": "The retry budget changed without a bound on the total wait.",
+                "evidence": snippet,
+                "snippet": snippet,
+                "suggested_comment": "Could this retry loop cap its total wait time?",
+            })
+    return findings
+
+
+def _verdicts(prompt: str) -> list:
+    indexes = sorted({int(i) for i in _FINDING_INDEX.findall(_section(prompt, "Findings to Verify"))})
+    return [
+        {
+            "index": index,
+            "verdict": "refuted" if index % 3 == 2 else "confirmed",
+            "reasoning": "Deterministic benchmark verdict.",
+        }
+        for index in indexes
+    ]
+
+
+def main(args: list) -> int:
+    prompt = args[-1] if args else ""
+    structured = "--json-schema" in args
+
+    if "## Ranked Candidate Files" in prompt:
+        answer, key = _plan(prompt), None
+    elif "## Findings to Verify" in prompt:
+        answer, key = _verdicts(prompt), "verdicts"
+    elif "## Code to Review" in prompt:
+        answer, key = _findings(prompt), "findings"
+    else:
+        answer, key = {}, None
+
+    if structured:
+        structured_output = {key: answer} if key else answer
+        print(json.dumps({"type": "result", "is_error": False, "structured_output": structured_output}))
+    else:
+        print(json.dumps(answer))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
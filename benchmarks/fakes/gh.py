@@ -0,0 +1,91 @@
+"""
+Scripted stand-in for the GitHub CLI.
+
+Answers the `gh` invocations of the review chain from the workspace's
+`fixtures/gh.json` (path in TITAN_BENCH_GH_FIXTURES). Anything else is
+reported on stderr, appended to TITAN_BENCH_UNHANDLED, and fails like gh does.
+
+Runs with `python -S`: standard library only.
+"""
+
+import json
+import os
+import re
+import sys
+
+_FILES_PAGE = re.compile(r"^/?repos/[^/]+/[^/]+/pulls/\d+/files\?.*page=(\d+)")
+
+
+def _fixtures() -> dict:
+    with open(os.environ["TITAN_BENCH_GH_FIXTURES"], encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _option(args: list, name: str):
+    if name in args:
+        index = args.index(name)
+        if index + 1 < len(args):
+            return args[index + 1]
+    return None
+
+
+def _unhandled(args: list) -> int:
+    line = "gh " + " ".join(args)
+    log_path = os.environ.get("TITAN_BENCH_UNHANDLED")
+    if log_path:
+        with open(log_path, "a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+    sys.stderr.write(f"fake gh: unsupported command: {line}\n")
+    return 1
+
+
+def main(args: list) -> int:
+    if args[:2] == ["auth", "status"]:
+        sys.stderr.write("github.com\n  ✓ Logged in to github.com (fake)\n")
+        return 0
+
+    fixtures = _fixtures()
+
+    if args[:2] == ["pr", "view"]:
+        fields = (_option(args, "--json") or "").split(",")
+        pull_request = fixtures["pull_request"]
+        print(json.dumps({field: pull_request.get(field) for field in fields if field}))
+        return 0
+
+    if args[:2] == ["pr", "diff"]:
+        sys.stdout.write(fixtures["diff"])
+        return 0
+
+    if args[:2] == ["pr", "list"]:
+        print(json.dumps([fixtures["pull_request"]]))
+        return 0
+
+    if args[:1] == ["api"] and len(args) > 1:
+        endpoint = args[1]
+        if endpoint == "user":
+            print(fixtures["user"])
+            return 0
+        if endpoint == "graphql":
+            query = json.loads(sys.stdin.read() or "{}").get("query", "")
+            if "reviewThreads" in query:
+                print(json.dumps(fixtures["review_threads"]))
+                return 0
+            if "comments" in query:
+                print(json.dumps(fixtures["general_comments"]))
+                return 0
+        page = _FILES_PAGE.match(endpoint)
+        if page:
+            start = (int(page.group(1)) - 1) * 100
+            print(json.dumps(fixtures["files"][start:start + 100]))
+            return 0
+
+    if args[:2] == ["repo", "view"]:
+        owner, name = fixtures["repo"].split("/")
+        print(json.dumps({"name": name, "owner": {"login": owner}, "nameWithOwner": fixtures["repo"]}))
+        return 0
+
+    return _unhandled(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,93 @@
+"""
+Local HTTP stand-in for the Jira Cloud REST API.
+
+Serves the workspace's `fixtures/jira.json` on 127.0.0.1:
+
+    POST /rest/api/3/search/jql      pages of issues, with `nextPageToken`
+    GET  /rest/api/3/issue/<key>     one issue
+    GET  /rest/api/3/myself          the current user
+
+Started by the Jira scenario in its own process, so serving requests never
+competes with the code being measured:
+
+    python -m benchmarks.fakes.jira_server <fixtures.json>
+
+It prints the port it listens on, then serves until killed.
+"""
+
+import json
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict
+
+_API = "/rest/api/3/"
+
+
+class _JiraHandler(BaseHTTPRequestHandler):
+    server: "FakeJiraServer"
+
+    def do_GET(self) -> None:
+        path = self.path.split("?", 1)[0]
+        if path == _API + "myself":
+            self._send(200, {"accountId": "bench-1", "displayName": "Bench User", "active": True})
+            return
+        if path.startswith(_API + "issue/"):
+            issue = self.server.issues_by_key.get(path[len(_API + "issue/"):])
+            if issue is None:
+                self._send(404, {"errorMessages": ["Issue does not exist"]})
+            else:
+                self._send(200, issue)
+            return
+        self._send(404, {"errorMessages": [f"Not supported by the fake: {path}"]})
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if self.path.split("?", 1)[0] != _API + "search/jql":
+            self._send(404, {"errorMessages": [f"Not supported by the fake: {self.path}"]})
+            return
+        start = int(payload.get("nextPageToken") or 0)
+        end = start + int(payload.get("maxResults") or 50)
+        issues = self.server.issues[start:end]
+        page: Dict[str, Any] = {"issues": issues, "isLast": end >= len(self.server.issues)}
+        if not page["isLast"]:
+            page["nextPageToken"] = str(end)
+        self._send(200, page)
+
+    def _send(self, status: int, body: Any) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class FakeJiraServer(ThreadingHTTPServer):
+    """HTTP server answering from a fixtures file."""
+
+    daemon_threads = True
+
+    def __init__(self, fixtures: Dict[str, Any]):
+        super().__init__(("127.0.0.1", 0), _JiraHandler)
+        self.issues = fixtures["issues"]
+        self.issues_by_key = {issue["key"]: issue for issue in self.issues}
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+def main(argv: list) -> int:
+    with open(argv[0], encoding="utf-8") as handle:
+        server = FakeJiraServer(json.load(handle))
+    print(server.server_address[1], flush=True)
+    server.serve_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,179 @@
+"""
+Command line entry point: run scenarios and compare them with the baseline.
+
+Usage:
+    python -m benchmarks [--size small|medium|large] [--scenario NAME ...]
+                         [--repeat N] [--tolerance 0.25] [--update-baseline]
+
+Exit status is 1 when a scenario fails or regresses against the baseline.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .fakes import install_fakes
+from .scenarios import SCENARIOS
+from .synthetic import SIZES, Workspace, ensure_workspace
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCHMARKS_DIR.parent
+DEFAULT_BASELINE = BENCHMARKS_DIR / "baseline.json"
+
+# Timings this close to the baseline are noise, whatever the tolerance says
+_MIN_WALL_DELTA_MS = 2.0
+
+
+def _worker_env(workspace: Workspace, bin_dir: Path, unhandled: Path) -> Dict[str, str]:
+    env = dict(os.environ)
+    for name in ("TITAN_TRACE", "TITAN_ENV"):
+        env.pop(name, None)
+    env.update({
+        "PATH": f"{bin_dir}{os.pathsep}{env.get('PATH', '')}",
+        "HOME": str(workspace.home),
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")])),
+        "GIT_CONFIG_NOSYSTEM": "1",
+        "TITAN_BENCH_GH_FIXTURES": str(workspace.fixtures / "gh.json"),
+        "TITAN_BENCH_UNHANDLED": str(unhandled),
+    })
+    return env
+
+
+def run_scenario(name: str, workspace: Workspace, bin_dir: Path, repeat: int) -> dict:
+    """
+    Run one scenario in a fresh worker process.
+
+    Returns:
+        The worker's measurements, or {"scenario": name, "error": ...} when it failed
+    """
+    with tempfile.TemporaryDirectory(prefix="titan-bench-") as scratch:
+        output = Path(scratch) / "result.json"
+        unhandled = Path(scratch) / "unhandled.txt"
+        process = subprocess.run(
+            [sys.executable, "-m", "benchmarks.worker", name, str(workspace.root), workspace.size,
+             str(repeat), str(output)],
+            cwd=workspace.repo,
+            env=_worker_env(workspace, bin_dir, unhandled),
+            capture_output=True,
+            text=True,
+        )
+        if process.returncode != 0 or not output.exists():
+            tail = "\n".join((process.stderr or process.stdout).strip().splitlines()[-15:])
+            return {"scenario": name, "error": tail or f"worker exited with {process.returncode}"}
+        if unhandled.exists():
+            commands = sorted(set(unhandled.read_text().splitlines()))
+            return {"scenario": name, "error": "fake gh could not answer: " + "; ".join(commands)}
+        return json.loads(output.read_text())
+
+
+def load_baseline(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text()).get("sizes", {})
+
+
+def save_baseline(path: Path, size: str, results: List[dict]) -> None:
+    """Store the results of `size`, keeping other sizes and scenarios not run."""
+    sizes = load_baseline(path)
+    stored = sizes.setdefault(size, {})
+    for result in results:
+        if "error" not in result:
+            stored[result["scenario"]] = {
+                key: result[key] for key in ("wall_ms", "subprocesses", "peak_rss_mb")
+            }
+    document = {
+        "_comment": "Written by `python -m benchmarks --update-baseline`; compare on the same machine.",
+        "sizes": {name: dict(sorted(values.items())) for name, values in sorted(sizes.items())},
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n")
+
+
+def compare(result: dict, baseline: Optional[dict], tolerance: float) -> List[str]:
+    """Regressions of `result` against its baseline entry, as readable strings."""
+    if baseline is None:
+        return []
+    regressions = []
+    wall, base_wall = result["wall_ms"], baseline["wall_ms"]
+    if wall > base_wall * (1 + tolerance) and wall - base_wall > _MIN_WALL_DELTA_MS:
+        regressions.append(f"wall time {base_wall:.1f} → {wall:.1f} ms")
+    # Subprocess counts are deterministic: any extra spawn is a regression
+    if result["subprocesses"] > baseline["subprocesses"]:
+        regressions.append(f"subprocesses {baseline['subprocesses']} → {result['subprocesses']}")
+    if result["peak_rss_mb"] > baseline["peak_rss_mb"] * (1 + tolerance):
+        regressions.append(f"peak RSS {baseline['peak_rss_mb']:.1f} → {result['peak_rss_mb']:.1f} MB")
+    return regressions
+
+
+def _change(value: float, base: Optional[float]) -> str:
+    if not base:
+        return "new"
+    return f"{(value - base) / base:+.0%}"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Offline performance benchmarks for Titan CLI",
+    )
+    parser.add_argument("--size", choices=sorted(SIZES), default="small", help="Synthetic workspace size")
+    parser.add_argument(
+        "--scenario", action="append", choices=sorted(SCENARIOS), help="Run only this scenario (repeatable)"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Measured runs per scenario, after one warm-up run")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="Allowed slowdown and memory growth, as a fraction"
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline file")
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument(
+        "--workdir", type=Path, default=Path(tempfile.gettempdir()) / "titan-bench",
+        help="Where synthetic workspaces are generated and reused",
+    )
+    parser.add_argument("--list", action="store_true", help="List scenarios and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for scenario in SCENARIOS.values():
+            print(f"{scenario.name:<20} {scenario.description}")
+        return 0
+
+    print(f"Preparing {args.size} workspace in {args.workdir} ...", flush=True)
+    workspace = ensure_workspace(args.workdir, args.size)
+    bin_dir = install_fakes(workspace.root / "bin")
+    baseline = load_baseline(args.baseline).get(args.size, {})
+
+    names = args.scenario or list(SCENARIOS)
+    results = []
+    failed = False
+    print(
+        f"\n{'scenario':<20} {'wall ms':>10} {'cold ms':>10} {'procs':>6} {'RSS MB':>8}  vs baseline"
+    )
+    for name in names:
+        result = run_scenario(name, workspace, bin_dir, args.repeat)
+        results.append(result)
+        if "error" in result:
+            failed = True
+            print(f"{name:<20} FAILED\n    " + result["error"].replace("\n", "\n    "))
+            continue
+
+        base = baseline.get(name)
+        regressions = [] if args.update_baseline else compare(result, base, args.tolerance)
+        failed = failed or bool(regressions)
+        status = "REGRESSED: " + ", ".join(regressions) if regressions else (
+            f"wall {_change(result['wall_ms'], base and base['wall_ms'])}, "
+            f"RSS {_change(result['peak_rss_mb'], base and base['peak_rss_mb'])}"
+        )
+        print(
+            f"{name:<20} {result['wall_ms']:>10.1f} {result['cold_ms']:>10.1f} "
+            f"{result['subprocesses']:>6} {result['peak_rss_mb']:>8.1f}  {status}"
+        )
+
+    if args.update_baseline:
+        save_baseline(args.baseline, args.size, results)
+        print(f"\nBaseline for '{args.size}' written to {args.baseline}")
+    return 1 if failed else 0
@@ -0,0 +1,320 @@
+"""
+Benchmark scenarios.
+
+A scenario is a generator function: everything before its `yield` is setup
+(not measured), the callable it yields is the measured operation, and
+everything after the `yield` is teardown. The measured callable runs once per
+repeat and must leave nothing behind that changes the next run.
+
+Scenarios run inside the worker process, with the fakes first on PATH, HOME
+pointing at the workspace and the synthetic repository as working directory.
+"""
+
+import contextlib
+import json
+import random
+import subprocess
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, ContextManager, Dict, Iterator
+
+from .synthetic import BASE_BRANCH, HEAD_BRANCH, PR_NUMBER, REVIEWER, Workspace
+
+Operation = Callable[[], Any]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A named benchmark."""
+    name: str
+    description: str
+    setup: Callable[[Workspace], ContextManager[Operation]]
+
+
+SCENARIOS: Dict[str, Scenario] = {}
+
+
+def scenario(name: str, description: str):
+    """Register a generator function as a scenario."""
+    def decorator(func: Callable[[Workspace], Iterator[Operation]]):
+        SCENARIOS[name] = Scenario(name=name, description=description, setup=contextmanager(func))
+        return func
+    return decorator
+
+
+class HeadlessTextual:
+    """
+    `ctx.textual` for steps run without a TUI: output is discarded.
+
+    Prompts raise, so a scenario that reaches an interactive step fails
+    loudly instead of hanging.
+    """
+
+    def loading(self, *_args, **_kwargs):
+        return contextlib.nullcontext()
+
+    def __getattr__(self, name: str):
+        if name.startswith("ask_"):
+            def prompt(*_args, **_kwargs):
+                raise RuntimeError(f"Interactive prompt '{name}' reached in a headless benchmark")
+            return prompt
+        return lambda *_args, **_kwargs: None
+
+
+def _gh_fixtures(workspace: Workspace) -> dict:
+    return json.loads((workspace.fixtures / "gh.json").read_text())
+
+
+def _ui_pull_request(fixtures: dict):
+    from titan_plugin_github.models.mappers.pr_mapper import from_network_pr_file, from_rest_pr
+    from titan_plugin_github.models.network.rest.pull_request import NetworkPRFile, NetworkPullRequest
+
+    pr = from_rest_pr(NetworkPullRequest.from_json(fixtures["pull_request"]))
+    files = [from_network_pr_file(NetworkPRFile.from_json(f)) for f in fixtures["files"]]
+    return pr, files
+
+
+# ---------------------------------------------------------------------------
+# Review hot paths
+# ---------------------------------------------------------------------------
+
+@scenario("diff_context", "Parse the -U20 review diff, attach GitHub's diff, resolve lines")
+def diff_context(workspace: Workspace) -> Iterator[Operation]:
+    from titan_plugin_github.managers.diff_context_manager import DiffContextManager
+
+    review_diff = subprocess.run(
+        ["git", "diff", "-U20", f"origin/{BASE_BRANCH}...origin/{HEAD_BRANCH}"],
+        cwd=workspace.repo, capture_output=True, text=True, check=True,
+    ).stdout
+    github_diff = _gh_fixtures(workspace)["diff"]
+
+    def run() -> None:
+        manager = DiffContextManager.from_diff(review_diff)
+        manager.attach_github_diff(github_diff)
+        for path, lines in manager.get_all_valid_lines().items():
+            manager.get_publishable_lines(path)
+            for line in sorted(lines)[::7]:
+                manager.get_hunk_for_line(path, line)
+
+    yield run
+
+
+@scenario("change_manifest", "build_change_manifest over the PR's changed files")
+def change_manifest(workspace: Workspace) -> Iterator[Operation]:
+    from titan_plugin_github.managers import ReviewProfileManager
+    from titan_plugin_github.operations.manifest_operations import build_change_manifest
+
+    pr, files = _ui_pull_request(_gh_fixtures(workspace))
+    review_profile = ReviewProfileManager().get_effective_profile()
+
+    yield lambda: build_change_manifest(pr, files, review_profile=review_profile)
+
+
+@scenario("dedupe_findings", "dedupe_findings step against the existing comments index")
+def dedupe_findings(workspace: Workspace) -> Iterator[Operation]:
+    from titan_cli.engine import WorkflowContext
+    from titan_plugin_github.models.review_models import ExistingCommentIndexEntry, Finding
+    from titan_plugin_github.steps.code_review_steps import dedupe_findings as dedupe_step
+
+    rng = random.Random("dedupe")
+    fixtures = _gh_fixtures(workspace)
+    threads = fixtures["review_threads"]["data"]["repository"]["pullRequest"]["reviewThreads"]["nodes"]
+    index = [
+        ExistingCommentIndexEntry(
+            comment_id=comment["databaseId"],
+            thread_id=thread["id"],
+            is_resolved=thread["isResolved"],
+            path=thread["path"],
+            line=thread["line"],
+            category="error_handling",
+            title=comment["body"][:80],
+            author=comment["author"]["login"],
+            reply_count=len(thread["comments"]["nodes"]) - 1,
+        )
+        for thread in threads
+        for comment in thread["comments"]["nodes"][:1]
+    ]
+    paths = [f["filename"] for f in fixtures["files"]]
+    findings = []
+    for number in range(workspace.preset.findings):
+        if index and number % 4 == 0:
+            # Near an existing comment: removed as already discussed
+            existing = rng.choice(index)
+            path, line = existing.path, existing.line + rng.randint(-3, 3)
+        else:
+            path, line = rng.choice(paths), rng.randint(1, workspace.preset.lines_per_file)
+        findings.append(Finding(
+            severity="important",
+            category=rng.choice(["error_handling", "data_validation", "functional_correctness"]),
+            path=path,
+            line=line,
+            title=f"Retry budget issue {number % (workspace.preset.findings // 2 or 1)}",
+            why="The retry budget changed without a bound on the total wait.",
+            evidence="retries=5",
+            suggested_comment="Could this loop cap its total wait?",
+        ))
+
+    def run() -> None:
+        ctx = WorkflowContext()
+        ctx.textual = HeadlessTextual()
+        ctx.data["normalized_findings"] = findings
+        ctx.data["existing_comments_index"] = index
+        dedupe_step(ctx)
+
+    yield run
+
+
+# ---------------------------------------------------------------------------
+# Startup paths
+# ---------------------------------------------------------------------------
+
+@scenario("config_load", "TitanConfig construction: global + project config and plugin init")
+def config_load(workspace: Workspace) -> Iterator[Operation]:
+    from titan_cli.core.config import TitanConfig
+
+    yield lambda: TitanConfig()
+
+
+@scenario("workflow_discovery", "WorkflowRegistry.discover and resolving every discovered workflow")
+def workflow_discovery(workspace: Workspace) -> Iterator[Operation]:
+    from titan_cli.core.config import TitanConfig
+    from titan_cli.core.workflows import ProjectStepSource, UserStepSource, WorkflowRegistry
+
+    config = TitanConfig()
+
+    def run() -> None:
+        registry = WorkflowRegistry(
+            project_root=workspace.repo,
+            plugin_registry=config.registry,
+            project_step_source=ProjectStepSource(project_root=workspace.repo),
+            user_step_source=UserStepSource(),
+            config=config,
+        )
+        for info in registry.discover():
+            registry.get_workflow(info.name)
+
+    yield run
+
+
+@scenario("redaction", "redact() and contains_secret() over log lines with registered secrets")
+def redaction(workspace: Workspace) -> Iterator[Operation]:
+    from titan_cli.core.security.redaction import contains_secret, redact, register_secret
+
+    rng = random.Random("redaction")
+    secrets = [f"ghp_{rng.getrandbits(128):032x}" for _ in range(workspace.preset.secrets)]
+    for secret in secrets:
+        register_secret(secret)
+    lines = [
+        f"2026-01-01 12:00:{n % 60:02d} [info] request id={n} token={rng.choice(secrets)}"
+        if n % 50 == 0
+        else f"2026-01-01 12:00:{n % 60:02d} [info] handled request id={n} status=200 path=/api/v1/items/{n}"
+        for n in range(workspace.preset.log_lines)
+    ]
+
+    def run() -> None:
+        for line in lines:
+            redact(line)
+            contains_secret(line)
+
+    yield run
+
+
+# ---------------------------------------------------------------------------
+# Clients against the fakes
+# ---------------------------------------------------------------------------
+
+@scenario("jira_search", "JiraClient.iter_search over every issue, then get_issue, against the fake Jira")
+def jira_search(workspace: Workspace) -> Iterator[Operation]:
+    from titan_plugin_jira.clients.jira_client import JiraClient
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.fakes.jira_server", str(workspace.fixtures / "jira.json")],
+        stdout=subprocess.PIPE, text=True,
+    )
+    try:
+        port = int(server.stdout.readline())
+        client = JiraClient(
+            base_url=f"http://127.0.0.1:{port}",
+            email="bench@example.com",
+            api_token="bench-token",
+            project_key="BENCH",
+        )
+        keys = [f"BENCH-{n}" for n in range(1, workspace.preset.jira_issues + 1, 97)]
+
+        def run() -> None:
+            fetched = sum(len(page.data) for page in client.iter_search("project = BENCH", page_size=100))
+            if fetched != workspace.preset.jira_issues:
+                raise RuntimeError(f"Fake Jira search returned {fetched} issues")
+            for key in keys:
+                client.get_issue(key)
+
+        yield run
+    finally:
+        server.terminate()
+        server.wait()
+
+
+_REVIEW_STEPS = (
+    "fetch_bundle",
+    "build_manifest",
+    "build_comments_index",
+    "classify_pr",
+    "score_candidates",
+    "build_checklist",
+    "select_strategy",
+    "ai_plan",
+    "validate_plan",
+    "resolve_context",
+    "ai_findings",
+    "normalize",
+    "dedupe",
+    "verify",
+    "build_actions",
+)
+"""Steps of review-pr that run without a person: PR selection, the worktree and the approval gates are left out."""
+
+
+@scenario("review_pr", "review-pr step chain from fetch_bundle to build_actions, on fake gh/git/AI")
+def review_pr(workspace: Workspace) -> Iterator[Operation]:
+    from titan_cli.core.config import TitanConfig
+    from titan_cli.core.workflows.workflow_registry import ParsedWorkflow
+    from titan_cli.engine import WorkflowContextBuilder
+    from titan_cli.engine.results import is_error
+    from titan_cli.engine.workflow_executor import WorkflowExecutor
+
+    config = TitanConfig()
+    failed = config.registry.list_failed()
+    if failed:
+        raise RuntimeError(f"Plugins failed to initialize: {failed}")
+
+    review = config.workflows.get_workflow("review-pr")
+    workflow = ParsedWorkflow(
+        name=review.name,
+        description=review.description,
+        source=review.source,
+        steps=[step for step in review.steps if step.get("id") in _REVIEW_STEPS],
+        params=review.params,
+    )
+    github = config.registry.get_plugin("github")
+    git = config.registry.get_plugin("git")
+
+    def run() -> None:
+        builder = WorkflowContextBuilder(plugin_registry=config.registry, ai_config=config.config.ai)
+        builder.with_titan_config(config)
+        builder.with_git(git.get_client())
+        builder.with_github(github.get_client())
+        builder.with_plugin_managers("github", github.get_workflow_managers(project_root=workspace.repo))
+        ctx = builder.build()
+        ctx.textual = HeadlessTextual()
+        ctx.data["project_root"] = str(workspace.repo)
+
+        result = WorkflowExecutor(config.registry, config.workflows).execute(
+            workflow, ctx, params_override={"review_pr_number": PR_NUMBER}
+        )
+        if is_error(result) or not ctx.data.get("deduped_findings"):
+            raise RuntimeError(f"review-pr chain did not produce findings: {result.message}")
+        if ctx.data.get("review_current_user") != REVIEWER:
+            raise RuntimeError("review-pr chain did not read the fake gh user")
+
+    yield run
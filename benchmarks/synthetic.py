@@ -0,0 +1,454 @@
+"""
+Synthetic workspaces for the benchmarks.
+
+A workspace holds everything a scenario needs, generated deterministically
+from a size preset:
+
+    <workspace>/
+        repo/          git repository with a `main` base and a `feature` PR branch,
+                       a `.titan` project config and project workflows
+        home/          HOME for the worker: empty global config, no credentials
+        fixtures/      answers for the fake `gh` and the fake Jira server
+
+`origin/main` and `origin/feature` are plain local refs, so nothing ever needs
+the network: the `git` shim turns `fetch` into a no-op.
+"""
+
+import json
+import os
+import random
+import subprocess
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List
+
+PR_NUMBER = 4242
+REPO_OWNER = "acme"
+REPO_NAME = "bench"
+BASE_BRANCH = "main"
+HEAD_BRANCH = "feature"
+REVIEWER = "bench-reviewer"
+
+# Bump when the generated content changes, so cached workspaces are rebuilt
+_GENERATOR_VERSION = 1
+
+
+@dataclass(frozen=True)
+class SizePreset:
+    """How big the generated workspace is."""
+    files: int
+    changed_files: int
+    lines_per_file: int
+    review_threads: int
+    findings: int
+    workflows: int
+    jira_issues: int
+    secrets: int
+    log_lines: int
+
+
+SIZES: Dict[str, SizePreset] = {
+    "small": SizePreset(
+        files=40, changed_files=8, lines_per_file=120, review_threads=6, findings=60,
+        workflows=8, jira_issues=120, secrets=20, log_lines=5_000,
+    ),
+    "medium": SizePreset(
+        files=300, changed_files=40, lines_per_file=220, review_threads=40, findings=400,
+        workflows=40, jira_issues=800, secrets=100, log_lines=40_000,
+    ),
+    "large": SizePreset(
+        files=1500, changed_files=150, lines_per_file=320, review_threads=150, findings=2_000,
+        workflows=150, jira_issues=3_000, secrets=400, log_lines=150_000,
+    ),
+}
+
+
+@dataclass(frozen=True)
+class Workspace:
+    """Paths of a generated workspace."""
+    root: Path
+    size: str
+
+    @property
+    def repo(self) -> Path:
+        return self.root / "repo"
+
+    @property
+    def home(self) -> Path:
+        return self.root / "home"
+
+    @property
+    def fixtures(self) -> Path:
+        return self.root / "fixtures"
+
+    @property
+    def preset(self) -> SizePreset:
+        return SIZES[self.size]
+
+
+def ensure_workspace(root: Path, size: str) -> Workspace:
+    """Generate the workspace for `size` under `root`, unless an identical one is already there."""
+    workspace = Workspace(root=root / size, size=size)
+    stamp = workspace.root / "workspace.json"
+    expected = {"version": _GENERATOR_VERSION, "size": size, "preset": asdict(workspace.preset)}
+    if stamp.exists() and json.loads(stamp.read_text()) == expected:
+        return workspace
+
+    if workspace.root.exists():
+        subprocess.run(["rm", "-rf", str(workspace.root)], check=True)
+    workspace.repo.mkdir(parents=True)
+    workspace.home.mkdir()
+    workspace.fixtures.mkdir()
+
+    rng = random.Random(f"titan-bench-{size}")
+    # Project files first, so they are part of the base commit and the
+    # checkout stays clean
+    _write_project_config(workspace)
+    _write_project_workflows(workspace)
+    _build_repo(workspace, rng)
+    _write_home(workspace)
+    _write_gh_fixtures(workspace, rng)
+    _write_jira_fixtures(workspace, rng)
+
+    stamp.write_text(json.dumps(expected))
+    return workspace
+
+
+# ---------------------------------------------------------------------------
+# Repository
+# ---------------------------------------------------------------------------
+
+_GIT_ENV = {
+    "GIT_AUTHOR_NAME": "Bench",
+    "GIT_AUTHOR_EMAIL": "bench@example.com",
+    "GIT_COMMITTER_NAME": "Bench",
+    "GIT_COMMITTER_EMAIL": "bench@example.com",
+    "GIT_AUTHOR_DATE": "2026-01-01T12:00:00+00:00",
+    "GIT_COMMITTER_DATE": "2026-01-01T12:00:00+00:00",
+    "GIT_CONFIG_NOSYSTEM": "1",
+}
+
+
+def _git(repo: Path, *args: str) -> str:
+    env = {**os.environ, **_GIT_ENV, "GIT_CONFIG_GLOBAL": os.devnull}
+    result = subprocess.run(
+        ["git", *args], cwd=repo, env=env, capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+
+def _file_path(index: int) -> str:
+    package = f"pkg_{index // 50:02d}"
+    if index % 10 == 9:
+        return f"tests/{package}/test_module_{index:04d}.py"
+    if index % 25 == 24:
+        return f"docs/{package}/module_{index:04d}.md"
+    return f"src/{package}/module_{index:04d}.py"
+
+
+def _function(rng: random.Random, name: str) -> List[str]:
+    arg = rng.choice(["value", "items", "payload", "config", "request"])
+    return [
+        f"def {name}({arg}, retries=3):",
+        f'    """Process {arg} for {name}."""',
+        f"    if {arg} is None:",
+        f"        raise ValueError('{name} needs {arg}')",
+        "    result = []",
+        "    for attempt in range(retries):",
+        f"        result.append(({arg}, attempt, {rng.randint(1, 999)}))",
+        "    return result",
+        "",
+    ]
+
+
+def _module_lines(rng: random.Random, index: int, line_count: int) -> List[str]:
+    lines = [f'"""Synthetic module {index}."""', "", "import json", "import os", ""]
+    counter = 0
+    while len(lines) < line_count:
+        lines.extend(_function(rng, f"handler_{index}_{counter}"))
+        counter += 1
+    return lines[:line_count]
+
+
+def _build_repo(workspace: Workspace, rng: random.Random) -> None:
+    preset = workspace.preset
+    repo = workspace.repo
+    _git(repo, "init", "-q", "-b", BASE_BRANCH)
+
+    contents: Dict[str, List[str]] = {}
+    for index in range(preset.files):
+        path = _file_path(index)
+        contents[path] = _module_lines(rng, index, preset.lines_per_file)
+        target = repo / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("\n".join(contents[path]) + "\n")
+    (repo / ".gitignore").write_text("__pycache__/\n")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "Initial import")
+
+    _git(repo, "checkout", "-q", "-b", HEAD_BRANCH)
+    changed = rng.sample(sorted(contents), preset.changed_files)
+    for position, path in enumerate(changed):
+        lines = contents[path]
+        # A mix of edits: replaced lines, an inserted function, a deleted block
+        for _ in range(3):
+            at = rng.randrange(5, len(lines))
+            lines[at] = lines[at].replace("retries=3", "retries=5").replace("append", "insert")
+        at = rng.randrange(5, len(lines))
+        lines[at:at] = _function(rng, f"added_{position}")
+        del lines[10:10 + rng.randint(0, 4)]
+        (repo / path).write_text("\n".join(lines) + "\n")
+    for position in range(max(1, preset.changed_files // 10)):
+        path = f"src/new/feature_{position:03d}.py"
+        (repo / path).parent.mkdir(parents=True, exist_ok=True)
+        (repo / path).write_text("\n".join(_module_lines(rng, 9000 + position, 60)) + "\n")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "Feature work")
+
+    _git(repo, "remote", "add", "origin", f"https://github.com/{REPO_OWNER}/{REPO_NAME}.git")
+    _git(repo, "update-ref", f"refs/remotes/origin/{BASE_BRANCH}", BASE_BRANCH)
+    _git(repo, "update-ref", f"refs/remotes/origin/{HEAD_BRANCH}", HEAD_BRANCH)
+
+
+def _write_project_config(workspace: Workspace) -> None:
+    titan_dir = workspace.repo / ".titan"
+    titan_dir.mkdir(parents=True, exist_ok=True)
+    (titan_dir / "config.toml").write_text(
+        "\n".join([
+            'config_version = "1.0"',
+            "",
+            "[project]",
+            f'name = "{REPO_NAME}"',
+            "",
+            "[plugins.git]",
+            "enabled = true",
+            "",
+            "[plugins.git.config]",
+            f'main_branch = "{BASE_BRANCH}"',
+            'default_remote = "origin"',
+            "",
+            "[plugins.github]",
+            "enabled = true",
+            "",
+            "[plugins.github.config]",
+            f'repo_owner = "{REPO_OWNER}"',
+            f'repo_name = "{REPO_NAME}"',
+            f'default_branch = "{BASE_BRANCH}"',
+            "",
+            "[plugins.jira]",
+            "enabled = false",
+            "",
+        ])
+    )
+    # Verification is off by default; on here so the review chain exercises it
+    (titan_dir / "review").mkdir(exist_ok=True)
+    (titan_dir / "review" / "profile.yaml").write_text("findings_verification_enabled: true\n")
+
+
+def _write_project_workflows(workspace: Workspace) -> None:
+    workflows_dir = workspace.repo / ".titan" / "workflows"
+    steps_dir = workspace.repo / ".titan" / "steps"
+    workflows_dir.mkdir(parents=True, exist_ok=True)
+    steps_dir.mkdir(parents=True, exist_ok=True)
+
+    for index in range(workspace.preset.workflows):
+        name = f"bench-{index:03d}"
+        if index % 3 == 2:
+            body = [
+                f'name: "Bench {index} commit"',
+                'extends: "plugin:git/commit-ai"',
+                "",
+                "hooks:",
+                "  before_commit:",
+                f"    - id: lint-{index}",
+                '      name: "Lint"',
+                "      plugin: project",
+                f"      step: check_{index % 10}",
+            ]
+        else:
+            body = [
+                f'name: "Bench {index}"',
+                f'description: "Synthetic workflow {index}"',
+                "",
+                "steps:",
+            ]
+            for step in range(6):
+                body += [
+                    f"  - id: step-{step}",
+                    f'    name: "Step {step}"',
+                    f'    command: "echo {index}-{step}"',
+                ]
+        (workflows_dir / f"{name}.yaml").write_text("\n".join(body) + "\n")
+
+    for index in range(10):
+        (steps_dir / f"check_{index}.py").write_text(
+            "from titan_cli.engine import WorkflowContext, WorkflowResult, Success\n\n\n"
+            f"def check_{index}(ctx: WorkflowContext) -> WorkflowResult:\n"
+            f'    return Success("check {index}")\n'
+        )
+
+
+def _write_home(workspace: Workspace) -> None:
+    titan_dir = workspace.home / ".titan"
+    titan_dir.mkdir(parents=True, exist_ok=True)
+    (titan_dir / "config.toml").write_text('config_version = "1.0"\n\n[ai]\n')
+
+
+# ---------------------------------------------------------------------------
+# GitHub answers
+# ---------------------------------------------------------------------------
+
+def _write_gh_fixtures(workspace: Workspace, rng: random.Random) -> None:
+    repo = workspace.repo
+    preset = workspace.preset
+    base = f"origin/{BASE_BRANCH}"
+    head = f"origin/{HEAD_BRANCH}"
+
+    diff = _git(repo, "diff", f"{base}...{head}")
+    head_sha = _git(repo, "rev-parse", head).strip()
+
+    files = []
+    additions_total = deletions_total = 0
+    for line in _git(repo, "diff", "--numstat", f"{base}...{head}").splitlines():
+        additions, deletions, path = line.split("\t")
+        files.append({
+            "filename": path,
+            "status": "added" if path.startswith("src/new/") else "modified",
+            "additions": int(additions),
+            "deletions": int(deletions),
+            "changes": int(additions) + int(deletions),
+        })
+        additions_total += int(additions)
+        deletions_total += int(deletions)
+
+    pull_request = {
+        "number": PR_NUMBER,
+        "title": "Retry handlers with a larger budget",
+        "body": "Raises the retry budget of every handler and adds feature modules.\n\n- [x] Tests",
+        "state": "OPEN",
+        "author": {"login": "bench-author", "name": "Bench Author"},
+        "baseRefName": BASE_BRANCH,
+        "headRefName": HEAD_BRANCH,
+        "headRefOid": head_sha,
+        "additions": additions_total,
+        "deletions": deletions_total,
+        "changedFiles": len(files),
+        "mergeable": "MERGEABLE",
+        "isDraft": False,
+        "createdAt": "2026-01-01T12:00:00Z",
+        "updatedAt": "2026-01-02T12:00:00Z",
+        "mergedAt": None,
+        "reviews": [],
+        "labels": [],
+        "statusCheckRollup": [],
+        "reviewDecision": "REVIEW_REQUIRED",
+        "reviewRequests": [{"login": REVIEWER}],
+        "isCrossRepository": False,
+        "headRepositoryOwner": {"login": REPO_OWNER},
+        "headRepository": {"name": REPO_NAME},
+    }
+
+    modified = [f["filename"] for f in files if f["status"] == "modified"]
+    threads = []
+    for index in range(preset.review_threads):
+        path = rng.choice(modified)
+        line = rng.randint(5, preset.lines_per_file)
+        comments = [
+            _review_comment(index * 10 + reply, path, line, author, body)
+            for reply, (author, body) in enumerate([
+                (REVIEWER, f"Should handler {index} validate its input before retrying?"),
+                ("bench-author", "Good catch, fixed."),
+            ][: 1 + index % 2])
+        ]
+        threads.append({
+            "id": f"PRRT_{index}",
+            "isResolved": index % 4 == 0,
+            "isOutdated": False,
+            "path": path,
+            "line": line,
+            "comments": {"nodes": comments},
+        })
+
+    general = [
+        {
+            "databaseId": 900_000 + index,
+            "body": f"General remark {index} about the retry budget.",
+            "author": {"login": "bench-author"},
+            "createdAt": "2026-01-02T12:00:00Z",
+            "updatedAt": "2026-01-02T12:00:00Z",
+        }
+        for index in range(max(1, preset.review_threads // 5))
+    ]
+
+    fixtures = {
+        "repo": f"{REPO_OWNER}/{REPO_NAME}",
+        "user": REVIEWER,
+        "pull_request": pull_request,
+        "files": files,
+        "diff": diff,
+        "review_threads": {
+            "data": {"repository": {"pullRequest": {"reviewThreads": {"nodes": threads}}}}
+        },
+        "general_comments": {
+            "data": {"repository": {"pullRequest": {
+                "comments": {"nodes": general},
+                "reviews": {"nodes": []},
+            }}}
+        },
+    }
+    (workspace.fixtures / "gh.json").write_text(json.dumps(fixtures))
+
+
+def _review_comment(comment_id: int, path: str, line: int, author: str, body: str) -> dict:
+    return {
+        "databaseId": 100_000 + comment_id,
+        "body": body,
+        "author": {"login": author},
+        "createdAt": "2026-01-02T12:00:00Z",
+        "updatedAt": "2026-01-02T12:00:00Z",
+        "path": path,
+        "position": None,
+        "line": line,
+        "originalLine": line,
+        "diffHunk": f"@@ -{line},3 +{line},3 @@\n def handler(value, retries=3):",
+    }
+
+
+# ---------------------------------------------------------------------------
+# Jira answers
+# ---------------------------------------------------------------------------
+
+def _write_jira_fixtures(workspace: Workspace, rng: random.Random) -> None:
+    statuses = [("10000", "To Do", "new"), ("10001", "In Progress", "indeterminate"), ("10002", "Done", "done")]
+    issues = []
+    for index in range(workspace.preset.jira_issues):
+        status_id, status_name, category = rng.choice(statuses)
+        issues.append({
+            "id": str(20_000 + index),
+            "key": f"BENCH-{index + 1}",
+            "fields": {
+                "summary": f"Synthetic issue {index + 1}",
+                "description": {
+                    "type": "doc",
+                    "version": 1,
+                    "content": [{"type": "paragraph", "content": [
+                        {"type": "text", "text": f"Handler {index} retries too often. " * 5}
+                    ]}],
+                },
+                "status": {
+                    "id": status_id,
+                    "name": status_name,
+                    "statusCategory": {"id": "1", "key": category, "name": status_name, "colorName": "blue"},
+                },
+                "issuetype": {"id": "10004", "name": "Bug", "subtask": False},
+                "priority": {"id": "3", "name": "Medium"},
+                "assignee": {"accountId": "bench-1", "displayName": "Bench User", "active": True},
+                "reporter": {"accountId": "bench-2", "displayName": "Bench Reporter", "active": True},
+                "labels": ["bench", f"area-{index % 7}"],
+                "components": [],
+                "fixVersions": [],
+                "created": "2026-01-01T12:00:00.000+0000",
+                "updated": "2026-01-02T12:00:00.000+0000",
+            },
+        })
+    (workspace.fixtures / "jira.json").write_text(json.dumps({"issues": issues}))
@@ -0,0 +1,86 @@
+"""
+Runs one scenario and writes its measurements as JSON.
+
+Started by the runner in a fresh process per scenario, so the peak RSS it
+reports belongs to that scenario alone:
+
+    python -m benchmarks.worker <scenario> <workspace> <size> <repeat> <output.json>
+
+The subprocess count comes from the `subprocess.Popen` and `os.system` audit
+events, counted only while the measured operation runs.
+"""
+
+import json
+import resource
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from .scenarios import SCENARIOS
+from .synthetic import Workspace
+
+_SPAWN_EVENTS = frozenset({"subprocess.Popen", "os.system"})
+
+
+class _SpawnCounter:
+    def __init__(self) -> None:
+        self.active = False
+        self.count = 0
+
+    def __call__(self, event: str, _args) -> None:
+        if self.active and event in _SPAWN_EVENTS:
+            self.count += 1
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def main(argv: list) -> int:
+    name, workspace_root, size, repeat, output = argv
+    workspace = Workspace(root=Path(workspace_root), size=size)
+
+    from titan_cli.core.logging.config import disable_console_logging, setup_logging
+    log_dir = workspace.root / "logs"
+    log_dir.mkdir(exist_ok=True)
+    setup_logging(log_file=log_dir / f"{name}.log")
+    disable_console_logging()
+
+    counter = _SpawnCounter()
+    sys.addaudithook(counter)
+
+    timings = []
+    spawns = []
+    with SCENARIOS[name].setup(workspace) as operation:
+        # The first run pays for lazy imports and cold caches; it is reported
+        # separately and the median of the others is the comparable figure.
+        for _ in range(int(repeat) + 1):
+            counter.count = 0
+            counter.active = True
+            start = time.perf_counter()
+            try:
+                operation()
+            finally:
+                elapsed = time.perf_counter() - start
+                counter.active = False
+            timings.append(elapsed * 1000)
+            spawns.append(counter.count)
+
+    result = {
+        "scenario": name,
+        "size": size,
+        "wall_ms": round(statistics.median(timings[1:] or timings), 2),
+        "cold_ms": round(timings[0], 2),
+        "subprocesses": max(spawns),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "runs": len(timings),
+    }
+    Path(output).write_text(json.dumps(result), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,13 @@
+"""
+Fixtures shared by the core and plugin test suites.
+"""
+
+import pytest
+
+from titan_cli.core.plugins.trust_cache import TrustScanCache
+
+
+@pytest.fixture(autouse=True)
+def _isolated_trust_scan_cache(tmp_path, monkeypatch):
+    """Keep trust scan caches built with the default path out of the real ~/.titan."""
+    monkeypatch.setattr(TrustScanCache, "CACHE_PATH", tmp_path / "trust-scan.sqlite")
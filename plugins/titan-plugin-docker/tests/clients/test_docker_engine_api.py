@@ -0,0 +1,237 @@
+import json
+import os
+import shutil
+import socket
+import socketserver
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler
+from unittest.mock import patch
+
+import pytest
+
+from titan_cli.core.result import ClientError, ClientSuccess
+from titan_plugin_docker.clients.docker_client import DockerClient
+from titan_plugin_docker.clients.network.docker_engine_api import DockerEngineAPI
+from titan_plugin_docker.exceptions import DockerCommandError, DockerEngineUnavailableError
+
+# Bodies recorded from a Docker 27 daemon, trimmed to the fields the plugin reads.
+CONTAINERS = [
+    {
+        "Id": "4f1a2b3c4d5e6f708192a3b4c5d6e7f8",
+        "Names": ["/postgres_container"],
+        "Image": "pgvector/pgvector:pg17",
+        "State": "running",
+        "Status": "Up 2 hours (healthy)",
+        "Labels": {
+            "com.docker.compose.project": "economy",
+            "com.docker.compose.project.config_files": "{compose}",
+            "com.docker.compose.service": "db",
+        },
+    },
+    {
+        "Id": "9a8b7c6d5e4f3a2b1c0d9e8f7a6b5c4d",
+        "Names": ["/other_web"],
+        "Image": "nginx:1.27",
+        "State": "running",
+        "Status": "Up 5 minutes",
+        "Labels": {
+            "com.docker.compose.project": "other",
+            "com.docker.compose.project.config_files": "/srv/other/compose.yml",
+            "com.docker.compose.service": "web",
+        },
+    },
+]
+SYSTEM_DF = {
+    "LayersSize": 36450000000,
+    "Images": [
+        {"Containers": 1, "Size": 2000000000, "SharedSize": 500000000},
+        {"Containers": 0, "Size": 1000000000, "SharedSize": 0},
+    ],
+    "Containers": [
+        {"State": "running", "SizeRw": 89450000},
+        {"State": "exited", "SizeRw": 10550000},
+    ],
+    "Volumes": [
+        {"UsageData": {"Size": 3000000, "RefCount": 1}},
+        {"UsageData": {"Size": 1000000, "RefCount": 0}},
+    ],
+    "BuildCache": [
+        {"Size": 700000000, "InUse": False, "Shared": False},
+        {"Size": 300000000, "InUse": True, "Shared": False},
+        {"Size": 999, "InUse": False, "Shared": True},
+    ],
+}
+
+
+class _FakeEngine(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, routes):
+        self.routes = routes
+        self.requests = []
+        self.connections = 0
+        super().__init__(path, _Handler)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the daemon
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def _respond(self):
+        self.server.requests.append((self.command, self.path))
+        status, body = self.server.routes.get((self.command, self.path.split("?")[0]), (404, {"message": "page not found"}))
+        # Raw bytes stand for a non-JSON body, e.g. from a proxy in front of the socket.
+        payload = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain" if isinstance(body, bytes) else "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def engine_dir():
+    # Unix socket paths are limited to ~100 bytes, so not under pytest's tmp_path.
+    path = tempfile.mkdtemp(prefix="titan-docker-")
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture
+def fake_engine(engine_dir):
+    compose_file = os.path.join(engine_dir, "docker-compose.yml")
+    containers = json.loads(json.dumps(CONTAINERS).replace("{compose}", compose_file))
+    server = _FakeEngine(
+        os.path.join(engine_dir, "docker.sock"),
+        {
+            ("GET", "/containers/json"): (200, containers),
+            ("GET", "/system/df"): (200, SYSTEM_DF),
+            ("POST", "/containers/prune"): (200, {"ContainersDeleted": ["abc"], "SpaceReclaimed": 12300000}),
+            ("POST", "/volumes/prune"): (500, {"message": "a prune operation is already running"}),
+            ("GET", "/images/json"): (502, b"Bad Gateway: upstream socket closed"),
+            ("GET", "/_ping"): (200, b"OK"),
+        },
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(engine_dir, socket_path) -> DockerClient:
+    with patch("shutil.which", return_value="/usr/bin/docker"):
+        return DockerClient(project_path=engine_dir, engine_api=True, engine_socket=socket_path)
+
+
+def test_requests_share_one_persistent_connection(fake_engine):
+    api = DockerEngineAPI(socket_path=fake_engine.server_address)
+
+    for _ in range(3):
+        api.get("/containers/json", {"all": 1, "filters": {"label": ["a=b"]}})
+    api.close()
+
+    assert fake_engine.connections == 1
+    method, path = fake_engine.requests[0]
+    assert method == "GET"
+    assert "all=1" in path and "filters=%7B%22label%22" in path
+
+
+def test_list_containers_through_engine_api(engine_dir, fake_engine):
+    client = _client(engine_dir, fake_engine.server_address)
+
+    with patch.object(client.network, "run_command") as run_command:
+        result = client.list_containers()
+
+    run_command.assert_not_called()
+    assert isinstance(result, ClientSuccess)
+    assert [(c.container_id, c.name) for c in result.data] == [
+        ("4f1a2b3c4d5e", "postgres_container"),
+        ("9a8b7c6d5e4f", "other_web"),
+    ]
+
+
+def test_compose_status_keeps_only_this_projects_containers(engine_dir, fake_engine):
+    client = _client(engine_dir, fake_engine.server_address)
+
+    result = client.compose_status()
+
+    assert isinstance(result, ClientSuccess)
+    assert [(s.service, s.health) for s in result.data.services] == [("db", "healthy")]
+    assert client.compose_status(services=["cache"]).data.services == []
+
+
+def test_disk_usage_matches_cli_formatting(engine_dir, fake_engine):
+    client = _client(engine_dir, fake_engine.server_address)
+
+    result = client.disk_usage()
+
+    assert isinstance(result, ClientSuccess)
+    rows = {entry.resource_type: entry for entry in result.data.entries}
+    assert (rows["Images"].total_count, rows["Images"].active, rows["Images"].size) == ("2", "1", "36.45GB")
+    assert rows["Images"].reclaimable == "34.95GB (95%)"
+    assert rows["Containers"].reclaimable == "10.55MB (10%)"
+    assert rows["Local Volumes"].reclaimable == "1MB (25%)"
+    assert (rows["Build Cache"].active, rows["Build Cache"].reclaimable) == ("1", "700MB")
+
+
+def test_prune_reports_reclaimed_space_and_daemon_errors(engine_dir, fake_engine):
+    client = _client(engine_dir, fake_engine.server_address)
+
+    pruned = client.prune(["containers"])
+    failed = client.prune(["volumes"])
+
+    assert pruned.data[0].reclaimed == "12.3MB"
+    assert isinstance(failed, ClientError)
+    assert "already running" in failed.error_message
+
+
+def test_non_json_error_body_is_reported_verbatim(fake_engine):
+    api = DockerEngineAPI(socket_path=fake_engine.server_address)
+
+    with pytest.raises(DockerCommandError, match=r"\(502\): Bad Gateway: upstream socket closed"):
+        api.get("/images/json")
+    api.close()
+
+
+def test_non_json_success_body_is_a_command_error(fake_engine):
+    api = DockerEngineAPI(socket_path=fake_engine.server_address)
+
+    with pytest.raises(DockerCommandError, match=r"non-JSON body \(200\): OK"):
+        api.get("/_ping")
+    api.close()
+
+
+def test_platform_without_unix_sockets_is_unavailable(fake_engine, monkeypatch):
+    monkeypatch.delattr(socket, "AF_UNIX")
+    api = DockerEngineAPI(socket_path=fake_engine.server_address)
+
+    with pytest.raises(DockerEngineUnavailableError, match="not supported"):
+        api.get("/containers/json")
+    assert api.usable is False
+
+
+def test_falls_back_to_cli_when_socket_is_unreachable(engine_dir):
+    client = _client(engine_dir, os.path.join(engine_dir, "missing.sock"))
+    ps_output = json.dumps([{"ID": "1", "Names": "db", "Image": "postgres", "State": "running", "Status": "Up"}])
+
+    with patch.object(client.network, "run_command", return_value=ps_output) as run_command:
+        first = client.list_containers()
+        second = client.list_containers()
+
+    assert [c.name for c in first.data] == ["db"]
+    assert isinstance(second, ClientSuccess)
+    assert run_command.call_count == 2
+    assert client.engine.usable is False
+    with pytest.raises(DockerEngineUnavailableError):
+        client.engine.get("/_ping")
@@ -1,10 +1,16 @@
+import os
+import threading
+import time
 from unittest.mock import patch
 
 import pytest
 
+from titan_cli.core.interrupt import WorkflowAborted, cancellation_scope, live_processes
 from titan_plugin_docker.clients.network.docker_network import DockerNetwork
 from titan_plugin_docker.exceptions import DockerCommandError
 
+posix_only = pytest.mark.skipif(os.name == "nt", reason="process groups are POSIX-only")
+
 
 @pytest.fixture
 def network() -> DockerNetwork:
@@ -62,3 +68,48 @@ def test_sanitize_plain_text_untouched():
     from titan_plugin_docker.clients.network.docker_network import _sanitize_output_line
     line = "#7 naming to docker.io/acme/reports-scheduler:1.2.3 done"
     assert _sanitize_output_line(line) == line
+
+
+def _wait_until_dead(pid: int, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                if f.read().rsplit(")", 1)[1].split()[0] == "Z":
+                    return True
+        except FileNotFoundError:
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@posix_only
+def test_cancelling_a_stream_kills_the_whole_process_group(network: DockerNetwork) -> None:
+    pids = []
+
+    def on_line(line: str) -> None:
+        pids.append(int(line))
+        token.cancel("user pressed escape")
+
+    with cancellation_scope() as token, pytest.raises(WorkflowAborted):
+        network.stream_command(["sh", "-c", "sleep 30 & echo $!; wait"], on_line=on_line)
+
+    assert live_processes() == []
+    assert _wait_until_dead(pids[0])
+
+
+@posix_only
+def test_cancelling_run_command_kills_the_whole_process_group(network: DockerNetwork, tmp_path) -> None:
+    pid_file = tmp_path / "sleep.pid"
+
+    def cancel_once_started() -> None:
+        while not (pid_file.exists() and pid_file.read_text().strip()):
+            time.sleep(0.02)
+        token.cancel("user pressed escape")
+
+    with cancellation_scope() as token, pytest.raises(WorkflowAborted):
+        threading.Thread(target=cancel_once_started, daemon=True).start()
+        network.run_command(["sh", "-c", f"sleep 30 & echo $! > {pid_file}; wait"])
+
+    assert live_processes() == []
+    assert _wait_until_dead(int(pid_file.read_text()))
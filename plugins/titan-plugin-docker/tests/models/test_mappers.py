@@ -1,7 +1,9 @@
 from titan_plugin_docker.models.network.disk_usage import NetworkDiskUsageEntry, NetworkDiskUsage
 from titan_plugin_docker.models.network.prune_result import NetworkPruneEntry
 from titan_plugin_docker.models.network.container import NetworkContainer
+from titan_plugin_docker.models.network.build_result import NetworkBuildResult
 from titan_plugin_docker.models.mappers import (
+    from_network_build_result,
     from_network_disk_usage,
     from_network_prune_entry,
     from_network_container,
@@ -38,3 +40,30 @@ def test_from_network_container_sets_state_icon() -> None:
 
     assert running.state_icon == "✓"
     assert exited.state_icon == "✗"
+
+
+def test_from_network_build_result_reports_time_and_cache_hits() -> None:
+    output = "\n".join([
+        "#1 [internal] load build definition from Dockerfile",
+        "#1 DONE 0.0s",
+        "#5 [builder 1/3] FROM docker.io/library/node:20",
+        "#5 CACHED",
+        "#6 [linux/arm64 builder 2/3] COPY package.json .",
+        "#6 CACHED",
+        "#7 [builder 3/3] RUN npm ci",
+        "#7 DONE 41.2s",
+    ])
+    network = NetworkBuildResult(name="web", image="ghcr.io/org/web", tag="latest", duration_seconds=75.4, output=output)
+
+    ui = from_network_build_result(network)
+
+    assert (ui.cached_steps, ui.total_steps) == (2, 3)
+    assert ui.duration == "1m 15s"
+    assert ui.summary == "Built ghcr.io/org/web:latest in 1m 15s, 2/3 steps cached"
+
+
+def test_from_network_build_result_omits_cache_stats_without_progress_output() -> None:
+    ui = from_network_build_result(NetworkBuildResult(name="web", image="app", tag="1", pushed=True, duration_seconds=3.21))
+
+    assert ui.total_steps == 0
+    assert ui.summary == "Built app:1 (pushed) in 3.2s"
@@ -1,7 +1,11 @@
+import threading
+import time
+
 import pytest
 
 from titan_cli.core.plugins.models import DockerBuildTargetConfig
-from titan_plugin_docker.operations.build_operations import resolve_build_targets
+from titan_cli.core.result import ClientError, ClientSuccess
+from titan_plugin_docker.operations.build_operations import resolve_build_targets, run_builds
 from titan_plugin_docker.exceptions import DockerBuildTargetNotFoundError
 
 
@@ -35,3 +39,54 @@ def test_resolve_build_targets_unknown_name_raises() -> None:
 
 def test_resolve_build_targets_empty_config_returns_empty() -> None:
     assert resolve_build_targets([]) == []
+
+
+def _builder(fail=(), delay=0.0):
+    state = {"active": 0, "peak": 0, "built": []}
+    lock = threading.Lock()
+
+    def build(target):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(delay)
+        with lock:
+            state["active"] -= 1
+            state["built"].append(target.name)
+        if target.name in fail:
+            return ClientError(error_message="boom", error_code="BUILD_ERROR")
+        return ClientSuccess(data=target.name)
+
+    return build, state
+
+
+def test_run_builds_bounds_parallelism_and_keeps_target_order() -> None:
+    targets = [_target(f"img{i}") for i in range(6)]
+    build, state = _builder(delay=0.05)
+
+    results = run_builds(targets, build, max_parallel=3)
+
+    assert state["peak"] == 3
+    assert [result.data for result in results] == [target.name for target in targets]
+
+
+def test_run_builds_fail_fast_skips_targets_not_started() -> None:
+    targets = [_target("api"), _target("worker"), _target("web")]
+    build, state = _builder(fail=("api",))
+
+    results = run_builds(targets, build, max_parallel=1, fail_fast=True)
+
+    assert isinstance(results[0], ClientError)
+    assert results[1:] == [None, None]
+    assert state["built"] == ["api"]
+
+
+def test_run_builds_keep_going_builds_every_target() -> None:
+    targets = [_target("api"), _target("worker"), _target("web")]
+    build, state = _builder(fail=("api",))
+
+    results = run_builds(targets, build, max_parallel=2, fail_fast=False)
+
+    assert isinstance(results[0], ClientError)
+    assert all(isinstance(result, ClientSuccess) for result in results[1:])
+    assert sorted(state["built"]) == ["api", "web", "worker"]
@@ -10,7 +10,7 @@ from typing import Callable, Dict, List, Optional
 from titan_cli.core.result import ClientResult
 from titan_cli.core.plugins.models import DockerBuildTargetConfig
 
-from .network import DockerNetwork
+from .network import DockerNetwork, DockerEngineAPI
 from .services import ComposeService, BuildService, PruneService, ContainerService
 from ..models.view import UIComposeStatus, UIBuildResult, UIDiskUsage, UIPruneEntry, UIContainer
 
@@ -33,6 +33,10 @@ class DockerClient:
         compose_file: str = "docker-compose.yml",
         service_groups: Optional[Dict[str, List[str]]] = None,
         build_targets: Optional[List[DockerBuildTargetConfig]] = None,
+        build_concurrency: int = 1,
+        build_fail_fast: bool = True,
+        engine_api: bool = False,
+        engine_socket: Optional[str] = None,
     ):
         """
         Initialize Docker client.
@@ -42,20 +46,27 @@ class DockerClient:
             compose_file: Path to the compose file, relative to the project root
             service_groups: Project-configured named service groups
             build_targets: Project-configured build targets
+            build_concurrency: Maximum number of targets built at the same time
+            build_fail_fast: Stop starting new builds after the first failure
+            engine_api: Query and prune through the Engine API socket, falling back to the CLI
+            engine_socket: Engine API unix socket (default: DOCKER_HOST or /var/run/docker.sock)
         """
         self.project_path = project_path
         self.compose_file = compose_file
         self.service_groups = service_groups or {}
         self.build_targets = build_targets or []
+        self.build_concurrency = build_concurrency
+        self.build_fail_fast = build_fail_fast
 
         # Initialize network layer
         self.network = DockerNetwork(project_path=project_path)
+        self.engine = DockerEngineAPI(socket_path=engine_socket) if engine_api else None
 
         # Initialize services
-        self.compose_service = ComposeService(self.network, compose_file)
+        self.compose_service = ComposeService(self.network, compose_file, engine_api=self.engine)
         self.build_service = BuildService(self.network)
-        self.prune_service = PruneService(self.network)
-        self.container_service = ContainerService(self.network)
+        self.prune_service = PruneService(self.network, engine_api=self.engine)
+        self.container_service = ContainerService(self.network, engine_api=self.engine)
 
     # ===== Compose Methods =====
 
@@ -1,4 +1,5 @@
 """Network layer for Docker plugin."""
 from .docker_network import DockerNetwork
+from .docker_engine_api import DockerEngineAPI
 
-__all__ = ["DockerNetwork"]
+__all__ = ["DockerNetwork", "DockerEngineAPI"]
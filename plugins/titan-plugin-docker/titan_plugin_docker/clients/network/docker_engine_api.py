@@ -0,0 +1,198 @@
+# plugins/titan-plugin-docker/titan_plugin_docker/clients/network/docker_engine_api.py
+"""
+Docker Engine API Network Client
+
+Low-level client for the Docker Engine HTTP API over the daemon's unix socket.
+Keeps one HTTP/1.1 connection open, so a request costs a round trip on the
+socket instead of starting a `docker` CLI process.
+No model conversion - returns the decoded JSON body.
+"""
+import http.client
+import json
+import os
+import socket
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+from titan_cli.core.logging.config import get_logger
+from titan_cli.core.tracing import span
+
+from ...exceptions import DockerCommandError, DockerEngineUnavailableError
+
+DEFAULT_ENGINE_SOCKET = "/var/run/docker.sock"
+
+# Generous enough for `system df` and prunes on a large host, which the daemon
+# answers only once the work is done.
+_REQUEST_TIMEOUT_SECONDS = 300
+
+
+def default_engine_socket() -> str:
+    """
+    Socket of the local daemon: the `unix://` path in DOCKER_HOST, or the default path.
+
+    Returns:
+        Filesystem path of the Docker Engine unix socket
+    """
+    docker_host = os.environ.get("DOCKER_HOST", "")
+    if docker_host.startswith("unix://"):
+        return docker_host[len("unix://"):]
+    return DEFAULT_ENGINE_SOCKET
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection that connects to a unix socket instead of a TCP host."""
+
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        if not hasattr(socket, "AF_UNIX"):
+            # Windows daemons listen on a named pipe, which only the CLI speaks
+            raise OSError("unix sockets are not supported on this platform")
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class DockerEngineAPI:
+    """
+    Docker network client using the Engine API (unversioned paths, daemon default version).
+
+    Requests are serialized over one persistent connection. A connection that
+    the daemon closed is reopened once; when the socket cannot be reached at
+    all the client marks itself unusable, so services fall back to the CLI
+    without paying a connection attempt per call.
+    """
+
+    def __init__(self, socket_path: Optional[str] = None, timeout: float = _REQUEST_TIMEOUT_SECONDS):
+        """
+        Initialize Docker Engine API client. No connection is made until the first request.
+
+        Args:
+            socket_path: Engine unix socket (default: DOCKER_HOST unix path or /var/run/docker.sock)
+            timeout: Socket timeout in seconds for each request
+        """
+        self.socket_path = socket_path or default_engine_socket()
+        self.timeout = timeout
+        self.usable = True
+        self._connection: Optional[_UnixHTTPConnection] = None
+        self._lock = threading.Lock()
+        self._logger = get_logger(__name__)
+
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET `path` and return the decoded JSON body."""
+        return self.request("GET", path, params)
+
+    def post(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """POST to `path` (no body) and return the decoded JSON body."""
+        return self.request("POST", path, params)
+
+    def request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Send one request and return the decoded JSON body (None for an empty body).
+
+        Args:
+            method: HTTP method
+            path: API path, e.g. "/containers/json"
+            params: Query parameters; dict/list values are JSON-encoded (e.g. `filters`)
+
+        Returns:
+            Decoded JSON response body
+
+        Raises:
+            DockerEngineUnavailableError: If the socket cannot be reached, or the
+                platform has no unix sockets
+            DockerCommandError: If the daemon answers with an error status or a
+                body that is not JSON
+        """
+        if not self.usable:
+            raise DockerEngineUnavailableError(f"Docker Engine API at {self.socket_path} is unavailable")
+
+        url = path
+        if params:
+            url += "?" + urlencode(
+                {
+                    key: json.dumps(value) if isinstance(value, (dict, list)) else value
+                    for key, value in params.items()
+                }
+            )
+        start = time.time()
+
+        with span(f"{method} {path}", "http"), self._lock:
+            status, body = self._send(method, url)
+
+        self._logger.debug(
+            "docker_engine_request",
+            method=method,
+            path=path,
+            status=status,
+            duration=round(time.time() - start, 3),
+        )
+        if status >= 400:
+            raise DockerCommandError(f"Docker Engine API error ({status}): {self._error_message(body)}")
+        try:
+            return json.loads(body) if body else None
+        except ValueError as e:
+            raise DockerCommandError(
+                f"Docker Engine API returned a non-JSON body ({status}): {body.decode(errors='replace')}"
+            ) from e
+
+    @staticmethod
+    def _error_message(body: bytes) -> str:
+        # The daemon answers errors with {"message": ...}, but a proxy in front
+        # of the socket, or a plain-text 404, may not.
+        raw = body.decode(errors="replace")
+        try:
+            payload = json.loads(body) if body else None
+        except ValueError:
+            return raw
+        message = payload.get("message") if isinstance(payload, dict) else None
+        return message or raw
+
+    def close(self) -> None:
+        """Close the persistent connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _send(self, method: str, url: str) -> tuple:
+        # A kept-alive connection the daemon has since closed fails on first
+        # use; only that case is retried, on a fresh connection.
+        for attempt in range(2):
+            fresh = self._connection is None
+            if fresh:
+                self._connection = _UnixHTTPConnection(self.socket_path, self.timeout)
+            try:
+                self._connection.request(method, url, headers={"Host": "docker"})
+                response = self._connection.getresponse()
+                body = response.read()
+                if response.will_close:
+                    self._connection.close()
+                    self._connection = None
+                return response.status, body
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError) as e:
+                self._connection.close()
+                self._connection = None
+                if fresh or attempt:
+                    return self._unavailable(e)
+            except (OSError, http.client.HTTPException) as e:
+                self._connection.close()
+                self._connection = None
+                return self._unavailable(e)
+        return self._unavailable(None)
+
+    def _unavailable(self, error: Optional[Exception]) -> tuple:
+        self.usable = False
+        self._logger.debug("docker_engine_unavailable", socket=self.socket_path, error=str(error))
+        raise DockerEngineUnavailableError(
+            f"Docker Engine API at {self.socket_path} is unavailable: {error}"
+        )
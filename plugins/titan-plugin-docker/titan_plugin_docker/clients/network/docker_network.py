@@ -12,7 +12,9 @@ import shutil
 import time
 from typing import Callable, List, Optional
 
+from titan_cli.core.interrupt import process_group_kwargs, run_process, watch_process
 from titan_cli.core.logging.config import get_logger
+from titan_cli.core.tracing import span
 
 from ...exceptions import DockerError, DockerClientError, DockerCommandError
 
@@ -93,13 +95,15 @@ class DockerNetwork:
         start = time.time()
 
         try:
-            result = subprocess.run(
-                args,
-                cwd=cwd or self.project_path,
-                capture_output=True,
-                text=True,
-                check=check,
-            )
+            with span(f"docker {subcommand}", "subprocess"):
+                # Own process group: cancelling the workflow stops the command
+                result = run_process(
+                    args,
+                    cwd=cwd or self.project_path,
+                    capture_output=True,
+                    text=True,
+                    check=check,
+                )
             self._logger.debug(
                 "docker_command_ok",
                 subcommand=subcommand,
@@ -154,19 +158,24 @@ class DockerNetwork:
         lines: List[str] = []
 
         try:
-            process = subprocess.Popen(
-                args,
-                cwd=cwd or self.project_path,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-            )
-            for line in process.stdout:
-                stripped = _sanitize_output_line(line.rstrip("\n"))
-                lines.append(stripped)
-                on_line(stripped)
-            process.wait()
+            with span(f"docker {subcommand}", "subprocess"):
+                with subprocess.Popen(
+                    args,
+                    cwd=cwd or self.project_path,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1,
+                    **process_group_kwargs(),
+                ) as process, watch_process(process):
+                    # Cancelling the workflow kills the group, which closes the
+                    # pipe and ends this loop; watch_process then raises WorkflowAborted.
+                    for line in process.stdout:
+                        stripped = _sanitize_output_line(line.rstrip("\n"))
+                        lines.append(stripped)
+                        on_line(stripped)
+                    process.wait()
 
             output = "\n".join(lines)
             if check and process.returncode != 0:
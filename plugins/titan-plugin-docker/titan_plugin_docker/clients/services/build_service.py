@@ -5,6 +5,7 @@ Build Service
 Business logic for building (and optionally pushing) Docker images.
 Uses network layer to execute commands, parses to network models, maps to view models.
 """
+import time
 from typing import Callable, Optional
 
 from titan_cli.core.result import ClientResult, ClientSuccess, ClientError
@@ -77,10 +78,11 @@ class BuildService:
                 args.append("--push")
             args.append(target.context)
 
+            start = time.monotonic()
             if on_output:
-                self.docker.stream_command(args, on_line=on_output)
+                output = self.docker.stream_command(args, on_line=on_output)
             else:
-                self.docker.run_command(args)
+                output = self.docker.run_command(args)
 
             network_result = NetworkBuildResult(
                 name=target.name,
@@ -89,6 +91,8 @@ class BuildService:
                 platforms=target.platforms,
                 target=target.target or "",
                 pushed=target.push,
+                duration_seconds=time.monotonic() - start,
+                output=output or "",
             )
             ui_result = from_network_build_result(network_result)
 
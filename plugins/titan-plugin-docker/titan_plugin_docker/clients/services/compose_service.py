@@ -6,16 +6,24 @@ Business logic for Docker Compose lifecycle operations.
 Uses network layer to execute commands, parses to network models, maps to view models.
 """
 import json
+import os
+import re
 from typing import List, Optional
 
 from titan_cli.core.result import ClientResult, ClientSuccess, ClientError
 from titan_cli.core.logging import log_client_operation
 
-from ..network import DockerNetwork
+from ..network import DockerNetwork, DockerEngineAPI
 from ...models.network.compose_status import NetworkComposeService, NetworkComposeStatus
 from ...models.view.compose_status import UIComposeStatus
 from ...models.mappers import from_network_compose_status
-from ...exceptions import DockerCommandError
+from ...exceptions import DockerCommandError, DockerEngineUnavailableError
+
+_PROJECT_LABEL = "com.docker.compose.project"
+_CONFIG_FILES_LABEL = "com.docker.compose.project.config_files"
+_SERVICE_LABEL = "com.docker.compose.service"
+# "Up 2 hours (healthy)", "Up 5 seconds (health: starting)"
+_HEALTH_RE = re.compile(r"\((?:health: )?(healthy|unhealthy|starting)\)")
 
 
 class ComposeService:
@@ -27,16 +35,23 @@ class ComposeService:
     that resolution happens in the operations layer.
     """
 
-    def __init__(self, docker_network: DockerNetwork, compose_file: str = "docker-compose.yml"):
+    def __init__(
+        self,
+        docker_network: DockerNetwork,
+        compose_file: str = "docker-compose.yml",
+        engine_api: Optional[DockerEngineAPI] = None,
+    ):
         """
         Initialize Compose service.
 
         Args:
             docker_network: DockerNetwork instance for command execution
             compose_file: Path to the compose file, relative to the project root
+            engine_api: Optional Engine API client, preferred over the CLI for status
         """
         self.docker = docker_network
         self.compose_file = compose_file
+        self.engine_api = engine_api
 
     def _compose_args(self, *args: str) -> List[str]:
         return ["docker", "compose", "-f", self.compose_file, *args]
@@ -105,11 +120,14 @@ class ComposeService:
             ClientResult[UIComposeStatus]
         """
         try:
-            args = self._compose_args("ps", "--format", "json")
-            args.extend(services or [])
-
-            output = self.docker.run_command(args, check=False)
-            network_status = NetworkComposeStatus(services=self._parse_ps_output(output))
+            network_services = self._status_from_engine(services)
+            if network_services is None:
+                args = self._compose_args("ps", "--format", "json")
+                args.extend(services or [])
+                output = self.docker.run_command(args, check=False)
+                network_services = self._parse_ps_output(output)
+
+            network_status = NetworkComposeStatus(services=network_services)
             ui_status = from_network_compose_status(network_status)
 
             return ClientSuccess(data=ui_status, message="Status retrieved")
@@ -133,6 +151,54 @@ class ComposeService:
         except DockerCommandError as e:
             return ClientError(error_message=str(e), error_code="COMPOSE_LIST_SERVICES_ERROR")
 
+    def _status_from_engine(self, services: Optional[List[str]]) -> Optional[List[NetworkComposeService]]:
+        """
+        Running containers of this compose project through the Engine API, shaped like `docker compose ps`.
+
+        Compose labels every container with the absolute paths of the compose
+        files that created it, so the project is matched by its compose file
+        rather than by re-deriving compose's project-name rules.
+
+        Returns None when no Engine API is configured or its socket is unreachable.
+        """
+        if not (self.engine_api and self.engine_api.usable):
+            return None
+        try:
+            entries = self.engine_api.get("/containers/json", {"filters": {"label": [_PROJECT_LABEL]}})
+        except DockerEngineUnavailableError:
+            return None
+
+        compose_path = os.path.join(self.docker.project_path, self.compose_file)
+        wanted = {os.path.abspath(compose_path), os.path.realpath(compose_path)}
+        network_services = []
+        for entry in entries:
+            labels = entry.get("Labels") or {}
+            config_files = {
+                variant
+                for path in labels.get(_CONFIG_FILES_LABEL, "").split(",")
+                if path
+                for variant in (path, os.path.realpath(path))
+            }
+            service = labels.get(_SERVICE_LABEL, "")
+            if not wanted & config_files or (services and service not in services):
+                continue
+            status = entry.get("Status", "")
+            health = (entry.get("Health") or {}).get("Status", "")
+            if not health:
+                match = _HEALTH_RE.search(status)
+                health = match.group(1) if match else ""
+            network_services.append(
+                NetworkComposeService(
+                    service=service,
+                    container_name=(entry.get("Names") or [""])[0].lstrip("/"),
+                    image=entry.get("Image", ""),
+                    state=entry.get("State", ""),
+                    status=status,
+                    health=health,
+                )
+            )
+        return sorted(network_services, key=lambda service: service.container_name)
+
     @staticmethod
     def _parse_ps_output(output: str) -> List[NetworkComposeService]:
         """
@@ -9,16 +9,16 @@ Unlike ComposeService, this operates on every container on the host, not a
 single project's compose file.
 """
 import json
-from typing import List
+from typing import List, Optional
 
 from titan_cli.core.result import ClientResult, ClientSuccess, ClientError
 from titan_cli.core.logging import log_client_operation
 
-from ..network import DockerNetwork
+from ..network import DockerNetwork, DockerEngineAPI
 from ...models.network.container import NetworkContainer
 from ...models.view.container import UIContainer
 from ...models.mappers import from_network_containers
-from ...exceptions import DockerCommandError
+from ...exceptions import DockerCommandError, DockerEngineUnavailableError
 
 
 class ContainerService:
@@ -30,14 +30,16 @@ class ContainerService:
     tries to remove a still-running container.
     """
 
-    def __init__(self, docker_network: DockerNetwork):
+    def __init__(self, docker_network: DockerNetwork, engine_api: Optional[DockerEngineAPI] = None):
         """
         Initialize Container service.
 
         Args:
             docker_network: DockerNetwork instance for command execution
+            engine_api: Optional Engine API client, preferred over the CLI for listing
         """
         self.docker = docker_network
+        self.engine_api = engine_api
 
     @log_client_operation()
     def list_containers(self) -> ClientResult[List[UIContainer]]:
@@ -48,8 +50,10 @@ class ContainerService:
             ClientResult[List[UIContainer]]
         """
         try:
-            output = self.docker.run_command(["docker", "ps", "-a", "--format", "json"])
-            network_containers = self._parse_ps_output(output)
+            network_containers = self._list_from_engine()
+            if network_containers is None:
+                output = self.docker.run_command(["docker", "ps", "-a", "--format", "json"])
+                network_containers = self._parse_ps_output(output)
             ui_containers = from_network_containers(network_containers)
 
             return ClientSuccess(data=ui_containers, message=f"Found {len(ui_containers)} container(s)")
@@ -73,6 +77,30 @@ class ContainerService:
         except DockerCommandError as e:
             return ClientError(error_message=str(e), error_code="REMOVE_CONTAINERS_ERROR")
 
+    def _list_from_engine(self) -> Optional[List[NetworkContainer]]:
+        """
+        List containers through `GET /containers/json?all=1`, shaped like `docker ps -a`.
+
+        Returns None when no Engine API is configured or its socket is unreachable.
+        """
+        if not (self.engine_api and self.engine_api.usable):
+            return None
+        try:
+            entries = self.engine_api.get("/containers/json", {"all": 1})
+        except DockerEngineUnavailableError:
+            return None
+
+        return [
+            NetworkContainer(
+                container_id=entry.get("Id", "")[:12],
+                name=",".join(name.lstrip("/") for name in entry.get("Names") or []),
+                image=entry.get("Image", ""),
+                state=entry.get("State", ""),
+                status=entry.get("Status", ""),
+            )
+            for entry in entries
+        ]
+
     @staticmethod
     def _parse_ps_output(output: str) -> List[NetworkContainer]:
         """
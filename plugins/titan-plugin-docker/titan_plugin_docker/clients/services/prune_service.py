@@ -10,18 +10,19 @@ not a single project's compose file - disk usage and prune targets aren't
 scoped to any particular project.
 """
 import json
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from titan_cli.core.result import ClientResult, ClientSuccess, ClientError
 from titan_cli.core.logging import log_client_operation
 
-from ..network import DockerNetwork
+from ..network import DockerNetwork, DockerEngineAPI
 from ...models.network.disk_usage import NetworkDiskUsageEntry, NetworkDiskUsage
 from ...models.network.prune_result import NetworkPruneEntry
 from ...models.view.disk_usage import UIDiskUsage
 from ...models.view.prune_result import UIPruneEntry
 from ...models.mappers import from_network_disk_usage, from_network_prune_entry
-from ...exceptions import DockerCommandError
+from ...models.formatting import human_size
+from ...exceptions import DockerCommandError, DockerEngineUnavailableError
 
 # Maps a prune target key to its docker CLI subcommand.
 # `images` only removes dangling images (safe default); it does not pass
@@ -33,6 +34,17 @@ PRUNE_COMMANDS = {
     "volumes": ["docker", "volume", "prune", "-f"],
 }
 
+# The same prunes as Engine API endpoints. Their defaults match the CLI
+# commands above (images: dangling only; volumes: anonymous only).
+PRUNE_ENDPOINTS = {
+    "containers": "/containers/prune",
+    "images": "/images/prune",
+    "build_cache": "/build/prune",
+    "volumes": "/volumes/prune",
+}
+
+_ACTIVE_CONTAINER_STATES = {"running", "paused", "restarting"}
+
 
 class PruneService:
     """
@@ -43,14 +55,16 @@ class PruneService:
     orphaned volumes - this service does not need to special-case that.
     """
 
-    def __init__(self, docker_network: DockerNetwork):
+    def __init__(self, docker_network: DockerNetwork, engine_api: Optional[DockerEngineAPI] = None):
         """
         Initialize Prune service.
 
         Args:
             docker_network: DockerNetwork instance for command execution
+            engine_api: Optional Engine API client, preferred over the CLI
         """
         self.docker = docker_network
+        self.engine_api = engine_api
 
     @log_client_operation()
     def disk_usage(self) -> ClientResult[UIDiskUsage]:
@@ -62,8 +76,10 @@ class PruneService:
             ClientResult[UIDiskUsage]
         """
         try:
-            output = self.docker.run_command(["docker", "system", "df", "--format", "{{json .}}"])
-            entries = self._parse_df_output(output)
+            entries = self._disk_usage_from_engine()
+            if entries is None:
+                output = self.docker.run_command(["docker", "system", "df", "--format", "{{json .}}"])
+                entries = self._parse_df_output(output)
             ui_usage = from_network_disk_usage(NetworkDiskUsage(entries=entries))
 
             return ClientSuccess(data=ui_usage, message="Disk usage retrieved")
@@ -84,15 +100,108 @@ class PruneService:
         try:
             results = []
             for target in targets:
-                args = PRUNE_COMMANDS[target]
-                output = self.docker.run_command(args)
-                network_entry = NetworkPruneEntry(target=target, output=output)
+                network_entry = self._prune_through_engine(target)
+                if network_entry is None:
+                    output = self.docker.run_command(PRUNE_COMMANDS[target])
+                    network_entry = NetworkPruneEntry(target=target, output=output)
                 results.append(from_network_prune_entry(network_entry))
 
             return ClientSuccess(data=results, message=f"Pruned {len(results)} target(s)")
         except DockerCommandError as e:
             return ClientError(error_message=str(e), error_code="PRUNE_ERROR")
 
+    def _prune_through_engine(self, target: str) -> Optional[NetworkPruneEntry]:
+        """
+        Prune one target through the Engine API.
+
+        Returns None when no Engine API is configured or its socket is unreachable.
+        """
+        if not (self.engine_api and self.engine_api.usable):
+            return None
+        try:
+            response = self.engine_api.post(PRUNE_ENDPOINTS[target]) or {}
+        except DockerEngineUnavailableError:
+            return None
+        return NetworkPruneEntry(target=target, output="", space_reclaimed=response.get("SpaceReclaimed") or 0)
+
+    def _disk_usage_from_engine(self) -> Optional[List[NetworkDiskUsageEntry]]:
+        """
+        Disk usage through `GET /system/df`, computed and formatted as `docker system df` does.
+
+        Returns None when no Engine API is configured or its socket is unreachable.
+        """
+        if not (self.engine_api and self.engine_api.usable):
+            return None
+        try:
+            df = self.engine_api.get("/system/df")
+        except DockerEngineUnavailableError:
+            return None
+        return self._parse_engine_df(df)
+
+    @staticmethod
+    def _parse_engine_df(df: Dict[str, Any]) -> List[NetworkDiskUsageEntry]:
+        """Build the four `docker system df` rows from an Engine API `/system/df` body."""
+
+        def entry(resource_type: str, count: int, active: int, size: int, reclaimable: int, percent: bool = True):
+            formatted = human_size(reclaimable)
+            if percent and size > 0:
+                formatted += f" ({reclaimable * 100 // size}%)"
+            return NetworkDiskUsageEntry(
+                resource_type=resource_type,
+                total_count=str(count),
+                active=str(active),
+                size=human_size(size),
+                reclaimable=formatted,
+            )
+
+        images = df.get("Images") or []
+        images_size = df.get("LayersSize") or 0
+        images_used = sum(
+            image["Size"] - image["SharedSize"]
+            for image in images
+            if image.get("Containers", 0) > 0 and image.get("Size", -1) != -1 and image.get("SharedSize", -1) != -1
+        )
+
+        containers = df.get("Containers") or []
+        containers_active = [c for c in containers if c.get("State") in _ACTIVE_CONTAINER_STATES]
+
+        volumes = [v.get("UsageData") or {} for v in df.get("Volumes") or []]
+        sized_volumes = [usage for usage in volumes if usage.get("Size", -1) != -1]
+
+        caches = [cache for cache in df.get("BuildCache") or [] if not cache.get("Shared")]
+
+        return [
+            entry(
+                "Images",
+                len(images),
+                sum(1 for image in images if image.get("Containers", 0) > 0),
+                images_size,
+                images_size - images_used,
+            ),
+            entry(
+                "Containers",
+                len(containers),
+                len(containers_active),
+                sum(c.get("SizeRw", 0) for c in containers),
+                sum(c.get("SizeRw", 0) for c in containers if c.get("State") not in _ACTIVE_CONTAINER_STATES),
+            ),
+            entry(
+                "Local Volumes",
+                len(volumes),
+                sum(1 for usage in volumes if usage.get("RefCount", 0) > 0),
+                sum(usage["Size"] for usage in sized_volumes),
+                sum(usage["Size"] for usage in sized_volumes if usage.get("RefCount", 0) == 0),
+            ),
+            entry(
+                "Build Cache",
+                len(df.get("BuildCache") or []),
+                sum(1 for cache in df.get("BuildCache") or [] if cache.get("InUse")),
+                sum(cache.get("Size", 0) for cache in caches),
+                sum(cache.get("Size", 0) for cache in caches if not cache.get("InUse")),
+                percent=False,
+            ),
+        ]
+
     @staticmethod
     def _parse_df_output(output: str) -> List[NetworkDiskUsageEntry]:
         """
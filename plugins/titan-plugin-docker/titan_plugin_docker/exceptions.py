@@ -20,6 +20,11 @@ class DockerCommandError(DockerError):
     pass
 
 
+class DockerEngineUnavailableError(DockerError):
+    """Docker Engine API socket could not be reached (callers fall back to the CLI)"""
+    pass
+
+
 class DockerComposeError(DockerError):
     """Docker Compose operation failed"""
     pass
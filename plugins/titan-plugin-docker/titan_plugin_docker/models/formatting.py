@@ -2,6 +2,10 @@
 import re
 
 _RECLAIMED_SPACE_RE = re.compile(r"Total reclaimed space:\s*(.+)", re.IGNORECASE)
+# `--progress=plain` vertex headers for Dockerfile instructions, e.g.
+# "#6 [builder 3/6] COPY . ." or "#6 [linux/arm64 builder 3/6] ...".
+_BUILD_STEP_RE = re.compile(r"^#(\d+) \[[^\]]*\b\d+/\d+\]", re.MULTILINE)
+_BUILD_CACHED_RE = re.compile(r"^#(\d+) CACHED\s*$", re.MULTILINE)
 
 
 def parse_reclaimed_space(output: str) -> str:
@@ -18,3 +22,54 @@ def parse_reclaimed_space(output: str) -> str:
     if not match:
         return "0B"
     return match.group(1).strip()
+
+
+def parse_build_cache_stats(output: str) -> tuple[int, int]:
+    """
+    Count cached Dockerfile steps in `docker buildx build --progress=plain` output.
+
+    Args:
+        output: Raw build output (stdout+stderr merged)
+
+    Returns:
+        (cached_steps, total_steps); (0, 0) when the output carries no progress
+    """
+    steps = set(_BUILD_STEP_RE.findall(output))
+    cached = steps.intersection(_BUILD_CACHED_RE.findall(output))
+    return len(cached), len(steps)
+
+
+def format_duration(seconds: float) -> str:
+    """
+    Format a wall time for display.
+
+    Args:
+        seconds: Elapsed seconds
+
+    Returns:
+        "12.3s" under a minute, "2m 05s" above
+    """
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes, remainder = divmod(int(round(seconds)), 60)
+    return f"{minutes}m {remainder:02d}s"
+
+
+_SIZE_UNITS = ["B", "kB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB"]
+
+
+def human_size(size: float) -> str:
+    """
+    Format a byte count the way the docker CLI does (decimal units, 4 significant digits).
+
+    Args:
+        size: Size in bytes
+
+    Returns:
+        e.g. "36.45GB", "512B"
+    """
+    unit = 0
+    while size >= 1000 and unit < len(_SIZE_UNITS) - 1:
+        size /= 1000
+        unit += 1
+    return f"{size:.4g}{_SIZE_UNITS[unit]}"
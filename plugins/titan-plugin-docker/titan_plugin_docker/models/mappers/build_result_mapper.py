@@ -1,4 +1,5 @@
 """Mapper for Docker build result: Network model → UI model."""
+from ..formatting import format_duration, parse_build_cache_stats
 from ..network.build_result import NetworkBuildResult
 from ..view.build_result import UIBuildResult
 
@@ -15,9 +16,14 @@ def from_network_build_result(network_result: NetworkBuildResult) -> UIBuildResu
     """
     image_ref = f"{network_result.image}:{network_result.tag}"
     platforms = network_result.platforms or "builder native"
+    cached_steps, total_steps = parse_build_cache_stats(network_result.output)
+    duration = format_duration(network_result.duration_seconds)
     summary = f"Built {image_ref}"
     if network_result.pushed:
         summary += " (pushed)"
+    summary += f" in {duration}"
+    if total_steps:
+        summary += f", {cached_steps}/{total_steps} steps cached"
 
     return UIBuildResult(
         name=network_result.name,
@@ -27,4 +33,8 @@ def from_network_build_result(network_result: NetworkBuildResult) -> UIBuildResu
         pushed=network_result.pushed,
         status_icon="✓",
         summary=summary,
+        duration_seconds=network_result.duration_seconds,
+        duration=duration,
+        cached_steps=cached_steps,
+        total_steps=total_steps,
     )
@@ -1,5 +1,5 @@
 """Mapper for Docker prune results: Network model → UI model."""
-from ..formatting import parse_reclaimed_space
+from ..formatting import human_size, parse_reclaimed_space
 from ..network.prune_result import NetworkPruneEntry
 from ..view.prune_result import UIPruneEntry
 
@@ -9,12 +9,15 @@ def from_network_prune_entry(network_entry: NetworkPruneEntry) -> UIPruneEntry:
     Transform a network prune entry to a UI prune entry.
 
     Args:
-        network_entry: Raw stdout from a `docker ... prune` command
+        network_entry: Raw stdout from a `docker ... prune` command, or the Engine API byte count
 
     Returns:
         Formatted UI prune entry with the reclaimed space parsed out
     """
-    reclaimed = parse_reclaimed_space(network_entry.output)
+    if network_entry.space_reclaimed is not None:
+        reclaimed = human_size(network_entry.space_reclaimed)
+    else:
+        reclaimed = parse_reclaimed_space(network_entry.output)
 
     return UIPruneEntry(
         target=network_entry.target,
@@ -14,3 +14,5 @@ class NetworkBuildResult:
     platforms: Optional[str] = None  # None when no --platform was passed (builder native)
     target: str = ""
     pushed: bool = False
+    duration_seconds: float = 0.0  # wall time of the buildx invocation
+    output: str = ""  # merged build output; empty when the build was not streamed
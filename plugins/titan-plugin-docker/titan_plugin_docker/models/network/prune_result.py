@@ -1,11 +1,14 @@
-"""Network model for a Docker prune invocation - faithful to CLI output."""
+"""Network model for a Docker prune invocation - faithful to CLI/Engine API output."""
 from dataclasses import dataclass
+from typing import Optional
 
 
 @dataclass
 class NetworkPruneEntry:
     """
-    Network model for a single prune invocation - raw stdout from the CLI.
+    Network model for a single prune invocation - raw stdout from the CLI,
+    or the reclaimed byte count reported by the Engine API.
     """
     target: str  # e.g. "containers", "images", "build_cache", "volumes"
     output: str
+    space_reclaimed: Optional[int] = None  # bytes; set when pruned through the Engine API
@@ -12,3 +12,7 @@ class UIBuildResult:
     pushed: bool = False
     status_icon: str = "✓"
     summary: str = ""
+    duration_seconds: float = 0.0
+    duration: str = ""  # e.g. "12.3s"
+    cached_steps: int = 0
+    total_steps: int = 0  # 0 when the build output carried no step progress
@@ -1,6 +1,6 @@
 """Operations layer for Docker plugin."""
 from .compose_operations import resolve_services, list_group_names, resolve_stop_selection
-from .build_operations import resolve_build_targets
+from .build_operations import resolve_build_targets, run_builds
 from .container_operations import list_removable_containers
 
 __all__ = [
@@ -8,5 +8,6 @@ __all__ = [
     "list_group_names",
     "resolve_stop_selection",
     "resolve_build_targets",
+    "run_builds",
     "list_removable_containers",
 ]
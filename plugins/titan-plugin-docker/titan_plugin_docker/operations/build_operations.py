@@ -4,9 +4,15 @@ Build Operations
 Pure business logic for resolving which configured build targets a step
 should build. These functions can be used by any step and are easily testable.
 """
-from typing import List, Optional
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
 
 from titan_cli.core.plugins.models import DockerBuildTargetConfig
+from titan_cli.core.result import ClientError, ClientResult
+
+from ..models.view import UIBuildResult
 
 from ..exceptions import DockerBuildTargetNotFoundError
 
@@ -38,3 +44,45 @@ def resolve_build_targets(
     raise DockerBuildTargetNotFoundError(
         f"Build target '{name}' is not defined in the project configuration."
     )
+
+
+def run_builds(
+    targets: List[DockerBuildTargetConfig],
+    build: Callable[[DockerBuildTargetConfig], ClientResult[UIBuildResult]],
+    max_parallel: int = 1,
+    fail_fast: bool = True,
+) -> List[Optional[ClientResult[UIBuildResult]]]:
+    """
+    Build targets with up to `max_parallel` builds running at once.
+
+    Targets start in configuration order. With `fail_fast`, the first failed
+    build stops targets that have not started yet; builds already running are
+    left to finish, so their results (and cache) are not wasted.
+
+    Args:
+        targets: Build targets to build
+        build: Builds one target (e.g. `DockerClient.build_target` with its output callback)
+        max_parallel: Maximum number of concurrent builds (1 builds sequentially)
+        fail_fast: Stop starting new builds after the first failure
+
+    Returns:
+        One result per target, in target order; None for a target that was never started
+    """
+    results: List[Optional[ClientResult[UIBuildResult]]] = [None] * len(targets)
+    if not targets:
+        return results
+    stop = threading.Event()
+
+    def run(index: int) -> None:
+        if stop.is_set():
+            return
+        results[index] = build(targets[index])
+        if fail_fast and isinstance(results[index], ClientError):
+            stop.set()
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_parallel, len(targets)))) as pool:
+        # Builds run in copies of the caller's context, so trace spans nest under the step
+        futures = [pool.submit(contextvars.copy_context().run, run, index) for index in range(len(targets))]
+        for future in futures:
+            future.result()
+    return results
@@ -44,6 +44,10 @@ class DockerPlugin(TitanPlugin):
             compose_file=validated_config.compose_file,
             service_groups=validated_config.service_groups,
             build_targets=validated_config.build_targets,
+            build_concurrency=validated_config.build_concurrency,
+            build_fail_fast=validated_config.build_fail_fast,
+            engine_api=validated_config.engine_api,
+            engine_socket=validated_config.engine_socket,
         )
 
     def _get_plugin_config(self, config: TitanConfig) -> dict:
@@ -1,17 +1,22 @@
 # plugins/titan-plugin-docker/titan_plugin_docker/steps/build_push_images_step.py
+import time
+
 from textual.widgets import Log
 
 from titan_cli.engine import WorkflowContext, WorkflowResult, Success, Error
 from titan_cli.core.result import ClientSuccess, ClientError
 
-from ..operations import resolve_build_targets
+from ..operations import resolve_build_targets, run_builds
 from ..exceptions import DockerError
+from ..models.formatting import format_duration
 
 
 # Console height while a build is streaming vs. once it has finished. Finished
 # logs are collapsed so a multi-target build doesn't scroll away past results.
 LIVE_CONSOLE_HEIGHT = 40
 FINISHED_CONSOLE_HEIGHT = 12
+# Concurrent builds show every console at once, so each gets less room.
+CONCURRENT_CONSOLE_HEIGHT = 16
 
 # The console is a `Log`, not a `TextArea`: Log is Textual's append-only
 # streaming widget. TextArea is an editor — flooding it with per-line
@@ -47,20 +52,91 @@ def _collapse_console(app, console: Log) -> None:
         pass
 
 
+def _mount_console(ctx: WorkflowContext, height: int, title: str = "") -> Log:
+    console = Log(highlight=False, auto_scroll=True)
+    console.styles.height = height
+    console.styles.border = ("round", "gray")
+    if title:
+        console.border_title = title
+    ctx.textual.mount(console)
+    return console
+
+
+def _build_sequentially(ctx: WorkflowContext, targets, fail_fast: bool) -> list:
+    """One step per target, each streaming into its own console while the others wait."""
+    outcomes = [None] * len(targets)
+    for index, target in enumerate(targets):
+        platforms = target.platforms or "builder native"
+        ctx.textual.begin_step(f"[{index + 1}/{len(targets)}] {target.name} ({platforms})")
+
+        console = _mount_console(ctx, LIVE_CONSOLE_HEIGHT)
+        result = ctx.docker.build_target(target, on_output=_make_on_output(ctx.textual.app, console))
+        _collapse_console(ctx.textual.app, console)
+        outcomes[index] = result
+
+        match result:
+            case ClientSuccess(data=build_result):
+                ctx.textual.success_text(build_result.summary)
+                ctx.textual.end_step("success")
+            case ClientError(error_message=err):
+                ctx.textual.error_text(f"Failed to build {target.name}: {err}")
+                ctx.textual.end_step("error")
+                if fail_fast:
+                    break
+    return outcomes
+
+
+def _build_concurrently(ctx: WorkflowContext, targets, max_parallel: int, fail_fast: bool) -> list:
+    """
+    One step for all targets: every target gets its own titled console up front,
+    and up to `max_parallel` of them stream at once.
+    """
+    ctx.textual.begin_step(
+        f"Building {len(targets)} images ({min(max_parallel, len(targets))} at a time)"
+    )
+    app = ctx.textual.app
+    consoles = [
+        _mount_console(
+            ctx, CONCURRENT_CONSOLE_HEIGHT, f"{target.name} ({target.platforms or 'builder native'})"
+        )
+        for target in targets
+    ]
+    console_of = {id(target): console for target, console in zip(targets, consoles)}
+
+    def build(target):
+        console = console_of[id(target)]
+        result = ctx.docker.build_target(target, on_output=_make_on_output(app, console))
+        _collapse_console(app, console)
+        return result
+
+    outcomes = run_builds(targets, build, max_parallel=max_parallel, fail_fast=fail_fast)
+    failed = any(isinstance(result, ClientError) for result in outcomes)
+    ctx.textual.end_step("error" if failed else "success")
+    return outcomes
+
+
 def build_push_images_step(ctx: WorkflowContext) -> WorkflowResult:
     """
     Build (and push, per target config) one or all configured Docker images.
 
-    Each target gets its own bordered container in the execution panel, titled
-    with the image name and platforms, so it is obvious where one build ends and
-    the next begins. Inside it, `docker buildx build` output streams into a live,
-    selectable/copyable text area (collapsed once the build finishes) instead of
+    Each target's `docker buildx build` output streams into a live,
+    selectable/copyable console (collapsed once the build finishes) instead of
     a plain spinner, so progress is visible for long builds and the log can be
-    copied out.
+    copied out. With a build concurrency of 1, each target gets its own step,
+    one after another. Above 1, targets build in parallel in a single step,
+    each console titled with the image name and platforms so the interleaved
+    builds stay readable.
+
+    A build summary lists every target with its wall time and BuildKit cache
+    hits, and the total wall time against the sum of the individual builds.
 
     Inputs (from ctx.data):
         build_target_name (str, optional): Name of a single configured build target
             (absent builds every target configured for the project)
+        build_concurrency (int, optional): Maximum number of concurrent builds
+            (defaults to the project's `build_concurrency`)
+        build_fail_fast (bool, optional): Stop starting builds after the first failure
+            (defaults to the project's `build_fail_fast`)
 
     Outputs (saved to ctx.data):
         docker_build_results (List[UIBuildResult]): One result per built image
@@ -91,33 +167,37 @@ def build_push_images_step(ctx: WorkflowContext) -> WorkflowResult:
         ctx.textual.end_step("error")
         return Error("No build targets configured for this project.")
 
-    results = []
-    for index, target in enumerate(targets, start=1):
-        platforms = target.platforms or "builder native"
-        ctx.textual.begin_step(f"[{index}/{len(targets)}] {target.name} ({platforms})")
+    max_parallel = max(1, int(ctx.get("build_concurrency", ctx.docker.build_concurrency)))
+    fail_fast = bool(ctx.get("build_fail_fast", ctx.docker.build_fail_fast))
 
-        console = Log(highlight=False, auto_scroll=True)
-        console.styles.height = LIVE_CONSOLE_HEIGHT
-        console.styles.border = ("round", "gray")
-        ctx.textual.mount(console)
+    start = time.monotonic()
+    if max_parallel > 1 and len(targets) > 1:
+        outcomes = _build_concurrently(ctx, targets, max_parallel, fail_fast)
+    else:
+        outcomes = _build_sequentially(ctx, targets, fail_fast)
+    wall_time = time.monotonic() - start
 
-        result = ctx.docker.build_target(target, on_output=_make_on_output(ctx.textual.app, console))
-        _collapse_console(ctx.textual.app, console)
-
-        match result:
+    results = []
+    failures = []
+    ctx.textual.begin_step("Build Summary")
+    for target, outcome in zip(targets, outcomes):
+        match outcome:
             case ClientSuccess(data=build_result):
                 ctx.textual.success_text(build_result.summary)
-                ctx.textual.end_step("success")
                 results.append(build_result)
             case ClientError(error_message=err):
                 ctx.textual.error_text(f"Failed to build {target.name}: {err}")
-                ctx.textual.end_step("error")
-                return Error(f"Failed to build {target.name}: {err}")
+                failures.append(target.name)
+            case None:
+                ctx.textual.dim_text(f"Skipped {target.name} (an earlier build failed)")
+    build_time = sum(result.duration_seconds for result in results)
+    ctx.textual.dim_text(
+        f"Total {format_duration(wall_time)} wall time, {format_duration(build_time)} of successful builds"
+    )
+    ctx.textual.end_step("error" if failures else "success")
 
-    ctx.textual.begin_step("Build Summary")
-    for build_result in results:
-        ctx.textual.success_text(build_result.summary)
-    ctx.textual.end_step("success")
+    if failures:
+        return Error(f"Failed to build {', '.join(failures)}")
 
     return Success(
         f"Built {len(results)} image(s)",
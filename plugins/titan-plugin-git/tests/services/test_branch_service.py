@@ -49,10 +49,11 @@ class TestBranchServiceGetBranches:
 
     def test_get_branches_local(self, mock_git_network):
         """Test listing local branches"""
-        mock_git_network.run_command.side_effect = [
-            "* main\n  feature\n  develop",  # git branch -l
-            "",  # upstream check (fails)
-        ]
+        mock_git_network.run_command.return_value = (
+            "*\0refs/heads/main\0origin/main\0\n"
+            " \0refs/heads/feature\0\0\n"
+            " \0refs/heads/develop\0origin/develop\0"
+        )
 
         service = BranchService(mock_git_network)
         result = service.get_branches(remote=False)
@@ -61,12 +62,19 @@ class TestBranchServiceGetBranches:
         assert len(result.data) == 3
         assert result.data[0].name == "main"
         assert result.data[0].is_current is True
+        assert result.data[0].upstream == "origin/main"
         assert result.data[1].name == "feature"
         assert result.data[1].is_current is False
+        assert result.data[1].upstream is None
+        assert result.data[2].upstream == "origin/develop"
+        mock_git_network.run_command.assert_called_once()
 
     def test_get_branches_remote(self, mock_git_network):
         """Test listing remote branches"""
-        mock_git_network.run_command.return_value = "  origin/main\n  origin/feature"
+        mock_git_network.run_command.return_value = (
+            " \0refs/remotes/origin/main\0\0\n"
+            " \0refs/remotes/origin/feature\0\0"
+        )
 
         service = BranchService(mock_git_network)
         result = service.get_branches(remote=True)
@@ -78,7 +86,10 @@ class TestBranchServiceGetBranches:
 
     def test_get_branches_skips_origin_head(self, mock_git_network):
         """Test that origin/HEAD is skipped"""
-        mock_git_network.run_command.return_value = "  origin/HEAD -> origin/main\n  origin/main"
+        mock_git_network.run_command.return_value = (
+            " \0refs/remotes/origin/HEAD\0\0refs/remotes/origin/main\n"
+            " \0refs/remotes/origin/main\0\0"
+        )
 
         service = BranchService(mock_git_network)
         result = service.get_branches(remote=True)
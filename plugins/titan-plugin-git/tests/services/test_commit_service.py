@@ -122,7 +122,7 @@ class TestCommitServiceCommitFiles:
     def test_commit_files_handles_deleted_paths_with_pathspec(self, service, mock_git_network):
         """Test deleted tracked files are staged with git rm and committed by pathspec"""
         mock_git_network.run_command.side_effect = [
-            "tracked",
+            "removed.py\0",
             "",
             "",
             "deadbeef\n",
@@ -133,10 +133,45 @@ class TestCommitServiceCommitFiles:
 
         assert isinstance(result, ClientSuccess)
         calls = [c.args[0] for c in mock_git_network.run_command.call_args_list]
-        assert ["git", "ls-files", "--error-unmatch", "removed.py"] in calls
+        assert ["git", "--literal-pathspecs", "ls-files", "-z", "--", "removed.py"] in calls
         assert ["git", "rm", "--", "removed.py"] in calls
         assert ["git", "commit", "-m", "fix: Remove file", "--", "removed.py"] in calls
 
+    def test_commit_files_classifies_missing_paths_in_one_call(self, service, mock_git_network):
+        """Test untracked missing files are skipped without a git call per file"""
+        mock_git_network.run_command.side_effect = [
+            "gone/a.py\0gone/c.py\0",
+            "",
+            "",
+            "deadbeef\n",
+        ]
+        files = ["gone/a.py", "./gone/b.py", "gone/c.py"]
+
+        with patch("titan_plugin_git.clients.services.commit_service.os.path.exists", return_value=False):
+            result = service.commit_files(files, "refactor: Drop module")
+
+        assert isinstance(result, ClientSuccess)
+        calls = [c.args[0] for c in mock_git_network.run_command.call_args_list]
+        assert sum(1 for call in calls if "ls-files" in call) == 1
+        assert ["git", "rm", "--", "gone/a.py", "gone/c.py"] in calls
+
+    def test_commit_files_streams_long_path_lists_via_pathspec_file(self, service, mock_git_network):
+        """Test very long path lists use --pathspec-from-file instead of argv"""
+        files = [f"src/module_{i:05d}/{'x' * 80}.py" for i in range(2000)]
+        mock_git_network.run_command.side_effect = ["", "", "abc123\n"]
+
+        with patch("titan_plugin_git.clients.services.commit_service.os.path.exists", return_value=True):
+            result = service.commit_files(files, "chore: Bulk change")
+
+        assert isinstance(result, ClientSuccess)
+        add_call, commit_call, _ = mock_git_network.run_command.call_args_list
+        assert add_call.args[0] == [
+            "git", "add", "--pathspec-from-file=-", "--pathspec-file-nul"
+        ]
+        assert add_call.kwargs["input"] == "\0".join(files)
+        assert commit_call.args[0][-2:] == ["--pathspec-from-file=-", "--pathspec-file-nul"]
+        assert commit_call.kwargs["input"] == "\0".join(files)
+
     def test_commit_files_error_returns_client_error(self, service, mock_git_network):
         """Test git error returns ClientError"""
         mock_git_network.run_command.side_effect = GitCommandError("commit failed")
@@ -170,6 +205,30 @@ class TestCommitServiceGetCommitSha:
         assert result.error_code == "COMMIT_ERROR"
 
 
+@pytest.mark.unit
+class TestCommitServiceGetMergeBase:
+    """Test CommitService.get_merge_base()"""
+
+    def test_resolves_merge_base_against_head(self, service, mock_git_network):
+        """Test defaults the other ref to HEAD"""
+        mock_git_network.run_command.return_value = "deadbeef"
+
+        result = service.get_merge_base("origin/main")
+
+        assert isinstance(result, ClientSuccess)
+        assert result.data == "deadbeef"
+        mock_git_network.run_command.assert_called_once_with(["git", "merge-base", "origin/main", "HEAD"])
+
+    def test_error_returns_client_error(self, service, mock_git_network):
+        """Test unrelated or unknown refs return ClientError"""
+        mock_git_network.run_command.side_effect = GitCommandError("no merge base")
+
+        result = service.get_merge_base("main", "orphan")
+
+        assert isinstance(result, ClientError)
+        assert result.error_code == "COMMIT_ERROR"
+
+
 @pytest.mark.unit
 class TestCommitServiceGetCommitsVsBase:
     """Test CommitService.get_commits_vs_base()"""
@@ -6,6 +6,7 @@ import pytest
 from unittest.mock import Mock
 from titan_cli.core.result import ClientSuccess, ClientError
 from titan_plugin_git.clients.services.status_service import StatusService
+from titan_plugin_git.clients.services.status_snapshot import parse_porcelain_v2_status
 from titan_plugin_git.exceptions import GitCommandError
 
 
@@ -15,17 +16,31 @@ def mock_git_network():
     return Mock()
 
 
+def porcelain(branch="main", ahead=0, behind=0, entries=(), upstream="origin/main"):
+    """Build `git status --porcelain=v2 --branch -z` output"""
+    records = [
+        "# branch.oid 1111111111111111111111111111111111111111",
+        f"# branch.head {branch}",
+    ]
+    if upstream:
+        records.append(f"# branch.upstream {upstream}")
+        records.append(f"# branch.ab +{ahead} -{behind}")
+    records.extend(entries)
+    return "\0".join(records) + "\0"
+
+
+def changed(xy, path):
+    """Ordinary changed entry (type 1)"""
+    return f"1 {xy} N... 100644 100644 100644 aaaaaaa bbbbbbb {path}"
+
+
 @pytest.mark.unit
 class TestStatusServiceGetStatus:
     """Test StatusService.get_status()"""
 
     def test_get_status_clean(self, mock_git_network):
         """Test getting status for clean repository"""
-        mock_git_network.run_command.side_effect = [
-            "main",  # current branch
-            "",  # git status --short (clean)
-            "0\t0",  # upstream status
-        ]
+        mock_git_network.run_command.return_value = porcelain()
 
         service = StatusService(mock_git_network)
         result = service.get_status()
@@ -36,14 +51,28 @@ class TestStatusServiceGetStatus:
         assert result.data.clean_icon == "✓"
         assert result.data.status_summary == "Clean"
         assert result.data.sync_status == "synced"
+        assert result.data.upstream == "origin/main"
+
+    def test_get_status_uses_single_git_process(self, mock_git_network):
+        """Branch, upstream and file state come from one porcelain-v2 call"""
+        mock_git_network.run_command.return_value = porcelain()
+
+        service = StatusService(mock_git_network)
+        service.get_status()
+
+        mock_git_network.run_command.assert_called_once_with(
+            ["git", "status", "--porcelain=v2", "--branch", "-z"],
+            strip_output=False,
+        )
 
     def test_get_status_with_modified_files(self, mock_git_network):
         """Test getting status with modified files"""
-        mock_git_network.run_command.side_effect = [
-            "feature",  # current branch
-            " M file1.py\n M file2.py",  # git status --short
-            "2\t1",  # upstream status (2 ahead, 1 behind)
-        ]
+        mock_git_network.run_command.return_value = porcelain(
+            branch="feature",
+            ahead=2,
+            behind=1,
+            entries=[changed(".M", "file1.py"), changed(".M", "file2.py")],
+        )
 
         service = StatusService(mock_git_network)
         result = service.get_status()
@@ -60,11 +89,9 @@ class TestStatusServiceGetStatus:
 
     def test_get_status_with_untracked_files(self, mock_git_network):
         """Test getting status with untracked files"""
-        mock_git_network.run_command.side_effect = [
-            "main",
-            "?? new_file.py\n?? another.py",
-            "0\t0",
-        ]
+        mock_git_network.run_command.return_value = porcelain(
+            entries=["? new_file.py", "? another.py"],
+        )
 
         service = StatusService(mock_git_network)
         result = service.get_status()
@@ -75,11 +102,9 @@ class TestStatusServiceGetStatus:
 
     def test_get_status_with_staged_files(self, mock_git_network):
         """Test getting status with staged files"""
-        mock_git_network.run_command.side_effect = [
-            "main",
-            "M  staged.py\nA  new.py",
-            "0\t0",
-        ]
+        mock_git_network.run_command.return_value = porcelain(
+            entries=[changed("M.", "staged.py"), changed("A.", "new.py")],
+        )
 
         service = StatusService(mock_git_network)
         result = service.get_status()
@@ -90,11 +115,7 @@ class TestStatusServiceGetStatus:
 
     def test_get_status_ahead_only(self, mock_git_network):
         """Test status when ahead of remote"""
-        mock_git_network.run_command.side_effect = [
-            "main",
-            "",
-            "3\t0",  # 3 ahead, 0 behind
-        ]
+        mock_git_network.run_command.return_value = porcelain(ahead=3)
 
         service = StatusService(mock_git_network)
         result = service.get_status()
@@ -106,11 +127,7 @@ class TestStatusServiceGetStatus:
 
     def test_get_status_behind_only(self, mock_git_network):
         """Test status when behind remote"""
-        mock_git_network.run_command.side_effect = [
-            "main",
-            "",
-            "0\t2",  # 0 ahead, 2 behind
-        ]
+        mock_git_network.run_command.return_value = porcelain(behind=2)
 
         service = StatusService(mock_git_network)
         result = service.get_status()
@@ -120,6 +137,16 @@ class TestStatusServiceGetStatus:
         assert result.data.behind == 2
         assert result.data.sync_status == "↓2"
 
+    def test_get_status_without_upstream(self, mock_git_network):
+        """No upstream means no ahead/behind header"""
+        mock_git_network.run_command.return_value = porcelain(upstream=None)
+
+        service = StatusService(mock_git_network)
+        result = service.get_status()
+
+        assert result.data.upstream is None
+        assert result.data.sync_status == "synced"
+
     def test_get_status_error(self, mock_git_network):
         """Test error when getting status"""
         mock_git_network.run_command.side_effect = GitCommandError("Failed")
@@ -129,6 +156,73 @@ class TestStatusServiceGetStatus:
 
         assert isinstance(result, ClientError)
 
+    def test_get_status_reuses_snapshot_within_epoch(self, mock_git_network):
+        """Repeated reads share one snapshot until the network records a mutation"""
+        mock_git_network.mutation_epoch = 0
+        mock_git_network.run_command.return_value = porcelain()
+
+        service = StatusService(mock_git_network)
+        service.get_status()
+        service.has_uncommitted_changes()
+        assert mock_git_network.run_command.call_count == 1
+
+        mock_git_network.mutation_epoch = 1
+        service.get_status()
+        assert mock_git_network.run_command.call_count == 2
+
+
+@pytest.mark.unit
+class TestParsePorcelainV2Status:
+    """Test parse_porcelain_v2_status()"""
+
+    def test_parses_rename_with_original_path(self):
+        output = porcelain(entries=[
+            "2 R. N... 100644 100644 100644 aaaaaaa bbbbbbb R100 new name.py",
+            "old name.py",
+            changed(".M", "other.py"),
+        ])
+
+        status = parse_porcelain_v2_status(output)
+
+        assert status.staged_files == ["new name.py"]
+        assert status.renamed_files == [("old name.py", "new name.py")]
+        assert status.modified_files == ["other.py"]
+
+    def test_keeps_special_characters_in_paths_verbatim(self):
+        output = porcelain(entries=[
+            changed(".M", 'dir with space/quo"te.py'),
+            "? ñandú.txt",
+        ])
+
+        status = parse_porcelain_v2_status(output)
+
+        assert status.modified_files == ['dir with space/quo"te.py']
+        assert status.untracked_files == ["ñandú.txt"]
+
+    def test_worktree_deletion_is_not_clean(self):
+        status = parse_porcelain_v2_status(porcelain(entries=[changed(".D", "gone.py")]))
+
+        assert status.is_clean is False
+        assert status.modified_files == ["gone.py"]
+
+    def test_unmerged_entries_are_conflicts(self):
+        output = porcelain(entries=[
+            "u UU N... 100644 100644 100644 100644 aaaaaaa bbbbbbb ccccccc conflict.py",
+        ])
+
+        status = parse_porcelain_v2_status(output)
+
+        assert status.conflicted_files == ["conflict.py"]
+        assert status.is_clean is False
+
+    def test_detached_head_reports_head(self):
+        output = "# branch.oid abc\0# branch.head (detached)\0"
+
+        status = parse_porcelain_v2_status(output)
+
+        assert status.branch == "HEAD"
+        assert status.head_oid == "abc"
+
 
 @pytest.mark.unit
 class TestStatusServiceHasUncommittedChanges:
@@ -136,7 +230,7 @@ class TestStatusServiceHasUncommittedChanges:
 
     def test_has_uncommitted_changes_true(self, mock_git_network):
         """Test repository has uncommitted changes"""
-        mock_git_network.run_command.return_value = "M  file.py\n"
+        mock_git_network.run_command.return_value = porcelain(entries=[changed("M.", "file.py")])
 
         service = StatusService(mock_git_network)
         result = service.has_uncommitted_changes()
@@ -146,7 +240,7 @@ class TestStatusServiceHasUncommittedChanges:
 
     def test_has_uncommitted_changes_false(self, mock_git_network):
         """Test repository has no uncommitted changes"""
-        mock_git_network.run_command.return_value = ""
+        mock_git_network.run_command.return_value = porcelain()
 
         service = StatusService(mock_git_network)
         result = service.has_uncommitted_changes()
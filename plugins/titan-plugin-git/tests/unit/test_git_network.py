@@ -2,8 +2,13 @@
 Unit tests for Git Network Layer
 """
 
+import os
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock, patch
+from titan_cli.core.interrupt import WorkflowAborted, cancellation_scope, live_processes
 from titan_plugin_git.clients.network import GitNetwork
 from titan_plugin_git.exceptions import GitClientError, GitCommandError, GitNotRepositoryError
 
@@ -48,7 +53,7 @@ class TestGitNetworkRunCommand:
     """Test GitNetwork.run_command()"""
 
     @patch('titan_plugin_git.clients.network.git_network.shutil.which')
-    @patch('titan_plugin_git.clients.network.git_network.subprocess.run')
+    @patch('titan_plugin_git.clients.network.git_network.run_process')
     @patch.object(GitNetwork, '_check_repository')
     def test_run_command_success(self, mock_check_repo, mock_subprocess, mock_which):
         """Test successful command execution"""
@@ -64,7 +69,7 @@ class TestGitNetworkRunCommand:
         mock_subprocess.assert_called_once()
 
     @patch('titan_plugin_git.clients.network.git_network.shutil.which')
-    @patch('titan_plugin_git.clients.network.git_network.subprocess.run')
+    @patch('titan_plugin_git.clients.network.git_network.run_process')
     @patch.object(GitNetwork, '_check_repository')
     def test_run_command_preserves_leading_status_space(
         self, mock_check_repo, mock_subprocess, mock_which
@@ -81,7 +86,7 @@ class TestGitNetworkRunCommand:
         assert output == " M app/file.py"
 
     @patch('titan_plugin_git.clients.network.git_network.shutil.which')
-    @patch('titan_plugin_git.clients.network.git_network.subprocess.run')
+    @patch('titan_plugin_git.clients.network.git_network.run_process')
     @patch.object(GitNetwork, '_check_repository')
     def test_run_command_strip_output_false_preserves_trailing_context_line(
         self, mock_check_repo, mock_subprocess, mock_which
@@ -100,7 +105,7 @@ class TestGitNetworkRunCommand:
         assert output == '@@ -1,2 +1,2 @@\n+code\n \n'
 
     @patch('titan_plugin_git.clients.network.git_network.shutil.which')
-    @patch('titan_plugin_git.clients.network.git_network.subprocess.run')
+    @patch('titan_plugin_git.clients.network.git_network.run_process')
     @patch.object(GitNetwork, '_check_repository')
     def test_run_command_with_custom_cwd(self, mock_check_repo, mock_subprocess, mock_which):
         """Test command execution with custom working directory"""
@@ -121,7 +126,7 @@ class TestGitNetworkRunCommand:
         assert call_kwargs['cwd'] == "/tmp/custom"
 
     @patch('titan_plugin_git.clients.network.git_network.shutil.which')
-    @patch('titan_plugin_git.clients.network.git_network.subprocess.run')
+    @patch('titan_plugin_git.clients.network.git_network.run_process')
     @patch.object(GitNetwork, '_check_repository')
     def test_run_command_error(self, mock_check_repo, mock_subprocess, mock_which):
         """Test command execution error"""
@@ -140,7 +145,7 @@ class TestGitNetworkRunCommand:
             network.run_command(["git", "invalid"])
 
     @patch('titan_plugin_git.clients.network.git_network.shutil.which')
-    @patch('titan_plugin_git.clients.network.git_network.subprocess.run')
+    @patch('titan_plugin_git.clients.network.git_network.run_process')
     @patch.object(GitNetwork, '_check_repository')
     def test_run_command_not_a_repository_error(self, mock_check_repo, mock_subprocess, mock_which):
         """Test command fails with 'not a git repository' error"""
@@ -159,7 +164,7 @@ class TestGitNetworkRunCommand:
             network.run_command(["git", "status"])
 
     @patch('titan_plugin_git.clients.network.git_network.shutil.which')
-    @patch('titan_plugin_git.clients.network.git_network.subprocess.run')
+    @patch('titan_plugin_git.clients.network.git_network.run_process')
     @patch.object(GitNetwork, '_check_repository')
     def test_run_command_check_false(self, mock_check_repo, mock_subprocess, mock_which):
         """Test command execution with check=False"""
@@ -176,6 +181,48 @@ class TestGitNetworkRunCommand:
         assert call_kwargs['check'] is False
 
 
+@pytest.mark.unit
+class TestGitNetworkMutationEpoch:
+    """Test GitNetwork mutation epoch tracking"""
+
+    @patch('titan_plugin_git.clients.network.git_network.shutil.which')
+    @patch('titan_plugin_git.clients.network.git_network.run_process')
+    @patch.object(GitNetwork, '_check_repository')
+    def test_read_only_commands_keep_epoch(self, mock_check_repo, mock_subprocess, mock_which):
+        """Status, log and rev-parse never invalidate shared snapshots"""
+        mock_which.return_value = '/usr/bin/git'
+        mock_subprocess.return_value = Mock(stdout='')
+
+        network = GitNetwork(repo_path="/tmp/repo")
+        network.run_command(["git", "status", "--porcelain=v2"])
+        network.run_command(["git", "-c", "core.untrackedCache=true", "status"])
+        network.run_command(["git", "log", "-1"])
+
+        assert network.mutation_epoch == 0
+
+    @patch('titan_plugin_git.clients.network.git_network.shutil.which')
+    @patch('titan_plugin_git.clients.network.git_network.run_process')
+    @patch.object(GitNetwork, '_check_repository')
+    def test_mutating_commands_advance_epoch_even_on_failure(
+        self, mock_check_repo, mock_subprocess, mock_which
+    ):
+        """A failed checkout may still have touched the tree"""
+        import subprocess
+
+        mock_which.return_value = '/usr/bin/git'
+        mock_subprocess.side_effect = [
+            Mock(stdout=''),
+            subprocess.CalledProcessError(1, "git", stderr="conflict"),
+        ]
+
+        network = GitNetwork(repo_path="/tmp/repo")
+        network.run_command(["git", "add", "file.py"])
+        with pytest.raises(GitCommandError):
+            network.run_command(["git", "checkout", "main"])
+
+        assert network.mutation_epoch == 2
+
+
 @pytest.mark.unit
 class TestGitNetworkGetRepoPath:
     """Test GitNetwork.get_repo_path()"""
@@ -189,3 +236,43 @@ class TestGitNetworkGetRepoPath:
         network = GitNetwork(repo_path="/home/user/project")
 
         assert network.get_repo_path() == "/home/user/project"
+
+
+def _wait_until_dead(pid, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                if f.read().rsplit(")", 1)[1].split()[0] == "Z":
+                    return True
+        except FileNotFoundError:
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(os.name == "nt", reason="process groups are POSIX-only")
+class TestGitNetworkCancellation:
+    """Test that a cancelled workflow leaves no git process behind"""
+
+    @patch.object(GitNetwork, '_check_repository')
+    def test_cancel_kills_the_command_and_its_children(self, mock_check_repo, tmp_path):
+        """A hung command (here an alias standing in for a stalled push) is
+        terminated with everything it started."""
+        pid_file = tmp_path / "sleep.pid"
+        network = GitNetwork(repo_path=str(tmp_path))
+
+        def cancel_once_started():
+            while not (pid_file.exists() and pid_file.read_text().strip()):
+                time.sleep(0.02)
+            token.cancel("user pressed escape")
+
+        with cancellation_scope() as token, pytest.raises(WorkflowAborted):
+            threading.Thread(target=cancel_once_started, daemon=True).start()
+            network.run_command(
+                ["git", "-c", f"alias.hang=!sleep 30 & echo $! > {pid_file}; wait", "hang"]
+            )
+
+        assert live_processes() == []
+        assert _wait_until_dead(int(pid_file.read_text()))
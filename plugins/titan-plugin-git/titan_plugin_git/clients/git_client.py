@@ -21,6 +21,7 @@ from .services import (
     TagService,
     WorktreeService,
 )
+from .services.status_snapshot import StatusSnapshotReader
 from ..models.view import (
     UIFileChurn,
     UIGitBranch,
@@ -54,7 +55,9 @@ class GitClient:
         self,
         repo_path: str = ".",
         main_branch: str = "main",
-        default_remote: str = "origin"
+        default_remote: str = "origin",
+        status_untracked_cache: bool = False,
+        status_fsmonitor: bool = False
     ):
         """
         Initialize Git client.
@@ -63,6 +66,8 @@ class GitClient:
             repo_path: Path to git repository (default: current directory)
             main_branch: Main branch name (from config)
             default_remote: Default remote name (from config)
+            status_untracked_cache: Use core.untrackedCache for status snapshots
+            status_fsmonitor: Use the builtin fsmonitor daemon for status snapshots
         """
         self.repo_path = repo_path
         self.main_branch = main_branch
@@ -71,10 +76,17 @@ class GitClient:
         # Initialize network layer
         self.network = GitNetwork(repo_path=repo_path)
 
+        # One status snapshot per mutation epoch, shared by status-based services
+        self.status_snapshot = StatusSnapshotReader(
+            self.network,
+            untracked_cache=status_untracked_cache,
+            fsmonitor=status_fsmonitor,
+        )
+
         # Initialize services
         self.branch_service = BranchService(self.network)
         self.commit_service = CommitService(self.network, main_branch, default_remote)
-        self.status_service = StatusService(self.network)
+        self.status_service = StatusService(self.network, self.status_snapshot)
         self.diff_service = DiffService(self.network, default_remote)
         self.merge_service = MergeService(self.network)
         self.remote_service = RemoteService(self.network)
@@ -261,6 +273,10 @@ class GitClient:
         """Get commit SHA for any git ref."""
         return self.commit_service.get_commit_sha(ref)
 
+    def get_merge_base(self, ref: str, other_ref: str = "HEAD") -> ClientResult[str]:
+        """Get the best common ancestor of two refs."""
+        return self.commit_service.get_merge_base(ref, other_ref)
+
     def get_commits_vs_base(self) -> ClientResult[List[str]]:
         """Get commit messages from base branch to HEAD."""
         return self.commit_service.get_commits_vs_base()
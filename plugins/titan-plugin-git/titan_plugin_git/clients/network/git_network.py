@@ -11,7 +11,9 @@ import shutil
 import time
 from typing import List, Optional
 
+from titan_cli.core.interrupt import run_process
 from titan_cli.core.logging.config import get_logger
+from titan_cli.core.tracing import span
 
 from ...exceptions import (
     GitError,
@@ -21,6 +23,48 @@ from ...exceptions import (
 )
 from ...messages import msg
 
+# Subcommands that never change refs, the index or the worktree. Anything else
+# (including unknown subcommands) is assumed to mutate repository state.
+READ_ONLY_SUBCOMMANDS = frozenset({
+    "blame",
+    "cat-file",
+    "check-ignore",
+    "describe",
+    "diff",
+    "diff-files",
+    "diff-index",
+    "diff-tree",
+    "for-each-ref",
+    "grep",
+    "log",
+    "ls-files",
+    "ls-remote",
+    "ls-tree",
+    "merge-base",
+    "name-rev",
+    "rev-list",
+    "rev-parse",
+    "shortlog",
+    "show",
+    "show-ref",
+    "status",
+})
+
+
+def _subcommand_of(args: List[str]) -> str:
+    """Return the git subcommand, skipping global options such as ``-c key=value``."""
+    index = 1
+    while index < len(args):
+        arg = args[index]
+        if arg in ("-c", "-C"):
+            index += 2
+            continue
+        if arg.startswith("-"):
+            index += 1
+            continue
+        return arg
+    return "unknown"
+
 
 class GitNetwork:
     """
@@ -47,6 +91,7 @@ class GitNetwork:
             GitNotRepositoryError: If not in a git repository
         """
         self.repo_path = repo_path
+        self.mutation_epoch = 0
         self._logger = get_logger(__name__)
         self._check_git_installed()
         self._check_repository()
@@ -75,12 +120,18 @@ class GitNetwork:
                 msg.Git.NOT_A_REPOSITORY.format(repo_path=self.repo_path)
             )
 
+    def _record_mutation(self, args: List[str]) -> None:
+        """Advance the mutation epoch when ``args`` may have changed the repository."""
+        if _subcommand_of(args) not in READ_ONLY_SUBCOMMANDS:
+            self.mutation_epoch += 1
+
     def run_command(
         self,
         args: List[str],
         check: bool = True,
         cwd: Optional[str] = None,
-        strip_output: bool = True
+        strip_output: bool = True,
+        input: Optional[str] = None
     ) -> str:
         """
         Run git command and return stdout.
@@ -93,6 +144,8 @@ class GitNetwork:
                 Pass False for diff output: a diff whose last hunk ends in an empty
                 context line ends with a meaningful " \\n" that stripping destroys,
                 leaving the hunk one line short of what its @@ header declares.
+            input: Optional text fed to the command's stdin (e.g. for
+                ``--pathspec-from-file=-``)
 
         Returns:
             Command stdout as string
@@ -112,13 +165,16 @@ class GitNetwork:
         start = time.time()
 
         try:
-            result = subprocess.run(
-                args,
-                cwd=cwd or self.repo_path,
-                capture_output=True,
-                text=True,
-                check=check
-            )
+            with span(f"git {subcommand}", "subprocess"):
+                # Own process group: cancelling the workflow stops a push/fetch
+                result = run_process(
+                    args,
+                    cwd=cwd or self.repo_path,
+                    capture_output=True,
+                    text=True,
+                    check=check,
+                    input=input
+                )
             self._logger.debug(
                 "git_command_ok",
                 subcommand=subcommand,
@@ -144,6 +200,9 @@ class GitNetwork:
             raise GitClientError(msg.Git.CLI_NOT_FOUND)
         except Exception as e:
             raise GitError(msg.Git.UNEXPECTED_ERROR.format(e=e)) from e
+        finally:
+            # Even a failed merge/checkout can leave the tree changed.
+            self._record_mutation(args)
 
     def get_repo_path(self) -> str:
         """
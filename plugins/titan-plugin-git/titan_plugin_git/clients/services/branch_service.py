@@ -17,6 +17,8 @@ from ...models.mappers import from_network_branch
 from ...exceptions import GitCommandError
 from ...messages import msg
 
+BRANCH_REF_FORMAT = "%(HEAD)%00%(refname)%00%(upstream:short)%00%(symref)"
+
 
 class BranchService:
     """
@@ -61,42 +63,30 @@ class BranchService:
             ClientResult[List[UIGitBranch]]
         """
         try:
-            args = ["git", "branch"]
-            if remote:
-                args.append("-r")
-            else:
-                args.append("-l")
-
-            output = self.git.run_command(args)
+            # One for-each-ref call yields every branch with its upstream,
+            # instead of `git branch` plus a rev-parse per current branch.
+            namespace = "refs/remotes/" if remote else "refs/heads/"
+            output = self.git.run_command([
+                "git", "for-each-ref",
+                f"--format={BRANCH_REF_FORMAT}",
+                namespace.rstrip("/"),
+            ])
 
             network_branches = []
             for line in output.splitlines():
-                is_current = line.startswith("*")
-                name = line[2:].strip() if is_current else line.strip()
+                if not line.strip():
+                    continue
+                head_marker, refname, upstream, symref = (line.split("\0") + ["", "", ""])[:4]
 
                 # Skip 'origin/HEAD -> origin/main' type refs
-                if name.startswith("origin/HEAD"):
+                if symref:
                     continue
 
-                is_remote_branch = remote
-                upstream = None
-
-                # Try to get upstream if local and current branch
-                if not remote and is_current:
-                    try:
-                        upstream_output = self.git.run_command(
-                            ["git", "rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"],
-                            check=False
-                        )
-                        upstream = upstream_output.strip()
-                    except GitCommandError:
-                        pass  # No upstream configured
-
                 network_branches.append(NetworkGitBranch(
-                    name=name,
-                    is_current=is_current,
-                    is_remote=is_remote_branch,
-                    upstream=upstream
+                    name=refname[len(namespace):] if refname.startswith(namespace) else refname,
+                    is_current=head_marker == "*",
+                    is_remote=remote,
+                    upstream=upstream or None
                 ))
 
             # Map to UI models
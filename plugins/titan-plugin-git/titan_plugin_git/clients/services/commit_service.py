@@ -14,6 +14,9 @@ from titan_cli.core.logging import log_client_operation
 from ..network import GitNetwork
 from ...exceptions import GitCommandError
 
+PATHSPEC_INLINE_LIMIT = 64 * 1024
+"""Total argv bytes of paths above which pathspecs are streamed through stdin."""
+
 
 class CommitService:
     """
@@ -90,36 +93,35 @@ class CommitService:
             # Separate existing files from deleted ones
             # Only include files that exist in the filesystem OR are tracked in git
             existing_files = []
-            deleted_files = []
-
+            missing_files = []
             for f in files:
-                if os.path.exists(f):
-                    # File exists in filesystem
-                    existing_files.append(f)
-                else:
-                    # File doesn't exist - check if it's tracked in git
-                    # If it's tracked, we can use git rm; if not, skip it
-                    try:
-                        self.git.run_command(["git", "ls-files", "--error-unmatch", f])
-                        # File is tracked, mark for deletion
-                        deleted_files.append(f)
-                    except GitCommandError:
-                        # File not tracked in git, skip it
-                        pass
+                (existing_files if os.path.exists(f) else missing_files).append(f)
+
+            # A missing file is a deletion only if git tracks it; one ls-files
+            # call classifies all of them instead of one process per file
+            tracked = self._list_tracked_paths(missing_files) if missing_files else set()
+            deleted_files = [f for f in missing_files if self._normalize_path(f) in tracked]
 
             # Stage existing files with git add
             if existing_files:
-                self.git.run_command(["git", "add", "--"] + existing_files)
+                self._run_with_pathspecs(["git", "add"], existing_files)
 
             # Stage deleted files with git rm
             if deleted_files:
-                self.git.run_command(["git", "rm", "--"] + deleted_files)
+                self._run_with_pathspecs(["git", "rm"], deleted_files)
+
+            # Untracked paths that no longer exist would make the pathspec fail
+            commit_paths = existing_files + deleted_files
+            if not commit_paths:
+                return ClientError(
+                    error_message="None of the selected files exist or are tracked by git",
+                    error_code="COMMIT_ERROR"
+                )
 
             args = ["git", "commit", "-m", message]
             if no_verify:
                 args.append("--no-verify")
-            args.extend(["--"] + list(files))
-            self.git.run_command(args)
+            self._run_with_pathspecs(args, commit_paths)
 
             commit_hash = self.git.run_command(["git", "rev-parse", "HEAD"])
             return ClientSuccess(
@@ -129,6 +131,43 @@ class CommitService:
         except GitCommandError as e:
             return ClientError(error_message=str(e), error_code="COMMIT_ERROR")
 
+    @staticmethod
+    def _normalize_path(path: str) -> str:
+        """Normalize a user-supplied path the way git prints it (forward slashes, no ./)."""
+        return os.path.normpath(path).replace(os.sep, "/")
+
+    @staticmethod
+    def _exceeds_inline_limit(paths: Sequence[str]) -> bool:
+        """Whether passing paths as argv risks hitting the OS ARG_MAX limit."""
+        return sum(len(p) + 1 for p in paths) > PATHSPEC_INLINE_LIMIT
+
+    def _run_with_pathspecs(self, args: List[str], paths: Sequence[str]) -> str:
+        """
+        Run a git command restricted to paths.
+
+        Short lists are passed inline after ``--``; long ones are streamed via
+        ``--pathspec-from-file=-`` so very large changes don't exceed ARG_MAX.
+        """
+        if self._exceeds_inline_limit(paths):
+            return self.git.run_command(
+                args + ["--pathspec-from-file=-", "--pathspec-file-nul"],
+                input="\0".join(paths),
+            )
+        return self.git.run_command(args + ["--"] + list(paths))
+
+    def _list_tracked_paths(self, paths: Sequence[str]) -> set:
+        """
+        Return which of paths are tracked in the index, using one git process.
+
+        ``ls-files`` has no pathspec-file mode, so for lists too long for argv
+        the whole index is listed instead.
+        """
+        args = ["git", "--literal-pathspecs", "ls-files", "-z"]
+        if not self._exceeds_inline_limit(paths):
+            args += ["--"] + list(paths)
+        output = self.git.run_command(args, strip_output=False)
+        return {entry for entry in output.split("\0") if entry}
+
     @log_client_operation()
     def get_current_commit(self) -> ClientResult[str]:
         """
@@ -166,6 +205,27 @@ class CommitService:
         except GitCommandError as e:
             return ClientError(error_message=str(e), error_code="COMMIT_ERROR")
 
+    @log_client_operation()
+    def get_merge_base(self, ref: str, other_ref: str = "HEAD") -> ClientResult[str]:
+        """
+        Get the best common ancestor of two refs.
+
+        Args:
+            ref: Git reference (e.g., "develop", "origin/main")
+            other_ref: The other reference (default: HEAD)
+
+        Returns:
+            ClientResult[str] with full SHA of the merge base
+        """
+        try:
+            commit_hash = self.git.run_command(["git", "merge-base", ref, other_ref])
+            return ClientSuccess(
+                data=commit_hash,
+                message=f"Merge base of {ref} and {other_ref}: {commit_hash[:7]}"
+            )
+        except GitCommandError as e:
+            return ClientError(error_message=str(e), error_code="COMMIT_ERROR")
+
     @log_client_operation()
     def get_commits_vs_base(self) -> ClientResult[List[str]]:
         """
@@ -0,0 +1,179 @@
+# plugins/titan-plugin-git/titan_plugin_git/clients/services/status_snapshot.py
+"""
+Status Snapshot
+
+One-shot repository status based on ``git status --porcelain=v2 --branch -z``.
+A single git process yields the branch, upstream, ahead/behind counts and every
+staged, unstaged, untracked, renamed and conflicted path. Services share one
+snapshot per mutation epoch of the underlying GitNetwork.
+"""
+import time
+from typing import List, Optional
+
+from ..network import GitNetwork
+from ...models.network.status import NetworkGitStatus
+
+DETACHED_HEAD = "HEAD"
+"""Branch name reported for a detached HEAD (matches ``rev-parse --abbrev-ref HEAD``)."""
+
+DEFAULT_SNAPSHOT_MAX_AGE_SECONDS = 1.0
+"""Edits made outside of git (editor saves) do not advance the mutation epoch,
+so a snapshot is also bounded in age."""
+
+
+def parse_porcelain_v2_status(output: str) -> NetworkGitStatus:
+    """
+    Parse ``git status --porcelain=v2 --branch -z`` output.
+
+    Records are NUL-terminated and paths are never quoted, so names with
+    spaces, quotes or non-ASCII characters come through verbatim. Rename and
+    copy records (type ``2``) carry the original path as the following record.
+
+    Args:
+        output: Raw stdout of the status command
+
+    Returns:
+        NetworkGitStatus with branch, upstream and per-file state
+    """
+    branch = DETACHED_HEAD
+    head_oid: Optional[str] = None
+    upstream: Optional[str] = None
+    ahead = behind = 0
+    staged: List[str] = []
+    modified: List[str] = []
+    untracked: List[str] = []
+    renamed: List[tuple[str, str]] = []
+    conflicted: List[str] = []
+
+    records = output.split("\0")
+    index = 0
+    while index < len(records):
+        record = records[index]
+        index += 1
+        if not record:
+            continue
+
+        if record.startswith("# "):
+            key, _, value = record[2:].partition(" ")
+            if key == "branch.oid":
+                head_oid = None if value == "(initial)" else value
+            elif key == "branch.head":
+                branch = DETACHED_HEAD if value == "(detached)" else value
+            elif key == "branch.upstream":
+                upstream = value
+            elif key == "branch.ab":
+                parts = value.split()
+                if len(parts) == 2:
+                    ahead = int(parts[0].lstrip("+"))
+                    behind = abs(int(parts[1]))
+            continue
+
+        kind = record[0]
+        if kind == "?":
+            untracked.append(record[2:])
+            continue
+        if kind == "!":
+            continue
+
+        if kind == "1":
+            fields = record.split(" ", 8)
+            xy, path = fields[1], fields[8]
+        elif kind == "2":
+            fields = record.split(" ", 9)
+            xy, path = fields[1], fields[9]
+            original = records[index] if index < len(records) else ""
+            index += 1
+            renamed.append((original, path))
+        elif kind == "u":
+            fields = record.split(" ", 10)
+            conflicted.append(fields[10])
+            continue
+        else:
+            continue
+
+        if xy[0] != ".":
+            staged.append(path)
+        if xy[1] != ".":
+            modified.append(path)
+
+    return NetworkGitStatus(
+        branch=branch,
+        is_clean=not (staged or modified or untracked or conflicted),
+        modified_files=modified,
+        untracked_files=untracked,
+        staged_files=staged,
+        ahead=ahead,
+        behind=behind,
+        upstream=upstream,
+        head_oid=head_oid,
+        renamed_files=renamed,
+        conflicted_files=conflicted,
+    )
+
+
+class StatusSnapshotReader:
+    """
+    Reads and caches porcelain-v2 status snapshots.
+
+    A snapshot is reused while the GitNetwork mutation epoch is unchanged and
+    it is younger than ``max_age_seconds``; any mutating git command run
+    through the same network forces the next read to hit git again.
+    """
+
+    def __init__(
+        self,
+        git_network: GitNetwork,
+        untracked_cache: bool = False,
+        fsmonitor: bool = False,
+        max_age_seconds: float = DEFAULT_SNAPSHOT_MAX_AGE_SECONDS,
+    ):
+        """
+        Initialize the snapshot reader.
+
+        Args:
+            git_network: GitNetwork instance for command execution
+            untracked_cache: Enable ``core.untrackedCache`` for the status call
+            fsmonitor: Enable the builtin ``core.fsmonitor`` daemon for the status call
+            max_age_seconds: Upper bound on how long a snapshot is reused
+        """
+        self.git = git_network
+        self.untracked_cache = untracked_cache
+        self.fsmonitor = fsmonitor
+        self.max_age_seconds = max_age_seconds
+        self._snapshot: Optional[NetworkGitStatus] = None
+        self._epoch = None
+        self._read_at = 0.0
+
+    def build_command(self) -> List[str]:
+        """Return the git status command used for snapshots."""
+        args = ["git"]
+        if self.untracked_cache:
+            args += ["-c", "core.untrackedCache=true"]
+        if self.fsmonitor:
+            args += ["-c", "core.fsmonitor=true"]
+        return args + ["status", "--porcelain=v2", "--branch", "-z"]
+
+    def read(self) -> NetworkGitStatus:
+        """
+        Return the current status snapshot.
+
+        Raises:
+            GitCommandError: If git status fails
+        """
+        epoch = self.git.mutation_epoch
+        if (
+            self._snapshot is not None
+            and self._epoch == epoch
+            and (time.monotonic() - self._read_at) <= self.max_age_seconds
+        ):
+            return self._snapshot
+
+        output = self.git.run_command(self.build_command(), strip_output=False)
+        self._snapshot = parse_porcelain_v2_status(output)
+        self._epoch = self.git.mutation_epoch
+        self._read_at = time.monotonic()
+        return self._snapshot
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot so the next read runs git status."""
+        self._snapshot = None
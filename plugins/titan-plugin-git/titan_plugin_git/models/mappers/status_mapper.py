@@ -29,6 +29,8 @@ def from_network_status(network_status: NetworkGitStatus) -> UIGitStatus:
         status_summary = "Clean"
     else:
         parts = []
+        if network_status.conflicted_files:
+            parts.append(f"{len(network_status.conflicted_files)} conflicted")
         if network_status.modified_files:
             parts.append(f"{len(network_status.modified_files)} modified")
         if network_status.staged_files:
@@ -59,4 +61,7 @@ def from_network_status(network_status: NetworkGitStatus) -> UIGitStatus:
         ahead=network_status.ahead,
         behind=network_status.behind,
         sync_status=sync_status,
+        upstream=network_status.upstream,
+        renamed_files=network_status.renamed_files,
+        conflicted_files=network_status.conflicted_files,
     )
@@ -1,6 +1,6 @@
 """Network model for Git status - faithful to git CLI output."""
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 
 
 @dataclass
@@ -18,3 +18,7 @@ class NetworkGitStatus:
     staged_files: List[str]
     ahead: int = 0
     behind: int = 0
+    upstream: Optional[str] = None
+    head_oid: Optional[str] = None
+    renamed_files: List[Tuple[str, str]] = field(default_factory=list)  # (original, new)
+    conflicted_files: List[str] = field(default_factory=list)
@@ -1,6 +1,6 @@
 """UI model for Git status - pre-formatted for display."""
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 
 
 @dataclass
@@ -20,3 +20,6 @@ class UIGitStatus:
     clean_icon: str = ""  # "✓" if clean, "✗" if dirty
     status_summary: str = ""  # e.g., "Clean" or "3 modified, 2 untracked"
     sync_status: str = ""  # e.g., "↑2 ↓1" or "↑3" or "synced"
+    upstream: Optional[str] = None  # e.g., "origin/main"
+    renamed_files: List[Tuple[str, str]] = field(default_factory=list)  # (original, new)
+    conflicted_files: List[str] = field(default_factory=list)
@@ -49,7 +49,9 @@ class GitPlugin(TitanPlugin):
         # Initialize client with validated configuration
         self._client = GitClient(
             main_branch=validated_config.main_branch,
-            default_remote=validated_config.default_remote
+            default_remote=validated_config.default_remote,
+            status_untracked_cache=validated_config.status_untracked_cache,
+            status_fsmonitor=validated_config.status_fsmonitor
         )
 
     def _get_plugin_config(self, config: TitanConfig) -> dict:
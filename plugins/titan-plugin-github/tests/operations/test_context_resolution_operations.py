@@ -436,6 +436,25 @@ class TestBuildPackageWithoutFileReads:
         assert entry.worktree_reference is False
         assert entry.read_mode == FileReadMode.HUNKS_ONLY
 
+    def test_revision_snapshot_reads_files_but_never_delegates_to_disk(self, tmp_path):
+        """A git-object snapshot is the PR head, but the directory the CLI would
+        read from is not — oversized files stay hunks_only."""
+        path = "big.py"
+        diff, plan, manifest, checklist, strategy = _single_file_setup(
+            FileReadMode.FULL_FILE, path=path
+        )
+        diff = make_diff(path, "x" * 40_000)
+
+        package = build_review_context_package(
+            plan, diff, manifest, checklist,
+            comment_context=[], strategy=strategy,
+            cwd=str(tmp_path), allow_file_reads=True, allow_disk_reads=False,
+        )
+
+        entry = package.batches[0].files_context[path]
+        assert entry.worktree_reference is False
+        assert entry.read_mode == FileReadMode.HUNKS_ONLY
+
     def test_file_absent_from_diff_gets_headers_only_with_a_hint(self):
         diff, plan, manifest, checklist, strategy = _single_file_setup(
             FileReadMode.FULL_FILE, path="in_plan.py"
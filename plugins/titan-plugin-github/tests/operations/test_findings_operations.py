@@ -862,3 +862,63 @@ def test_dedupe_synthesis_different_categories_keep_the_strict_title_bar():
     }
 
     assert dedupe_synthesis_findings([other_category], existing) == [other_category]
+
+
+def _pairwise_dedupe_synthesis(synthesis, existing, line_window=5, threshold=0.75, same_category=0.5):
+    """The all-pairs scan dedupe_synthesis_findings must stay equivalent to."""
+    from difflib import SequenceMatcher
+
+    def duplicate(candidate, item):
+        if candidate.get("path") != item.get("path"):
+            return False
+        line_a, line_b = candidate.get("line"), item.get("line")
+        title_a = str(candidate.get("title", "")).lower()
+        title_b = str(item.get("title", "")).lower()
+        if line_a is None and line_b is None:
+            return title_a == title_b
+        if line_a is None or line_b is None:
+            return False
+        try:
+            if abs(int(line_a) - int(line_b)) > line_window:
+                return False
+        except (TypeError, ValueError):
+            return False
+        if title_a == title_b:
+            return True
+        similarity = SequenceMatcher(None, title_a, title_b).ratio()
+        category_a = str(candidate.get("category", "")).lower()
+        if category_a and category_a == str(item.get("category", "")).lower():
+            return similarity > same_category
+        return similarity > threshold
+
+    unique = []
+    kept = [item for item in existing if isinstance(item, dict)]
+    for candidate in synthesis:
+        if isinstance(candidate, dict) and not any(duplicate(candidate, item) for item in kept + unique):
+            unique.append(candidate)
+    return unique
+
+
+def test_dedupe_synthesis_matches_pairwise_scan_on_random_corpus():
+    import random
+
+    from titan_plugin_github.operations.findings_operations import dedupe_synthesis_findings
+
+    rng = random.Random(37)
+    words = ["null", "check", "missing", "in", "parser", "cache", "leak", "race", "retry"]
+
+    def item():
+        return {
+            "path": rng.choice(["a.py", "b.py", ["a.py"], None]),
+            "line": rng.choice([None, "7", "x", 3.5, *range(0, 25)]),
+            "category": rng.choice(["security", "Security", "", None, "performance"]),
+            "title": " ".join(rng.choice(words) for _ in range(rng.randint(1, 4))),
+        }
+
+    existing = [item() for _ in range(200)] + ["garbage"]
+    synthesis = [item() for _ in range(200)] + [42]
+
+    for window in (5, 0, 10):
+        assert dedupe_synthesis_findings(
+            synthesis, existing, line_window=window
+        ) == _pairwise_dedupe_synthesis(synthesis, existing, line_window=window)
@@ -463,3 +463,54 @@ def test_is_duplicate_returns_false_if_not_adjudicated_and_dissimilar():
     )
 
     assert is_duplicate(finding, existing, title_similarity_threshold=0.9) is False
+
+
+_TITLE_WORDS = ["null", "check", "missing", "in", "parser", "cache", "leak", "race", "on", "retry", "loop"]
+
+
+def _random_title(rng):
+    return " ".join(rng.choice(_TITLE_WORDS) for _ in range(rng.randint(1, 5)))
+
+
+def test_existing_comment_matcher_agrees_with_is_duplicate_on_random_corpus():
+    import random
+
+    from titan_plugin_github.models.validators import ExistingCommentMatcher
+
+    rng = random.Random(37)
+    paths = ["src/a.py", "src/b.py", None]
+    categories = ["security", "performance", "Security", None]
+    lines = [None, *range(0, 30)]
+    existing = [
+        ExistingCommentIndexEntry(
+            comment_id=index,
+            thread_id=f"t{index}",
+            is_resolved=rng.random() < 0.6,
+            path=rng.choice(paths),
+            line=rng.choice(lines),
+            category=rng.choice(categories),
+            title=_random_title(rng),
+            author="reviewer",
+            is_adjudicated=rng.random() < 0.3,
+        )
+        for index in range(300)
+    ]
+    findings = [
+        Finding(
+            severity=FindingSeverity.IMPORTANT,
+            category=rng.choice(["security", "performance", "testing"]),
+            path=rng.choice(["src/a.py", "src/b.py"]),
+            line=rng.choice(lines),
+            title=_random_title(rng),
+            why="Why",
+            evidence="Evidence",
+            suggested_comment="Comment",
+        )
+        for _ in range(300)
+    ]
+
+    for window, threshold in [(5, 0.75), (0, 0.5), (12, 0.9)]:
+        matcher = ExistingCommentMatcher(existing, window, threshold)
+        for finding in findings:
+            expected = [ex for ex in existing if is_duplicate(finding, ex, window, threshold)]
+            assert matcher.matches(finding) == expected
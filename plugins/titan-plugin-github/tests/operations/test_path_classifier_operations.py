@@ -0,0 +1,129 @@
+from fnmatch import fnmatch
+from pathlib import PurePath
+
+from titan_plugin_github.models.review_enums import ChecklistCategory, FileChangeStatus
+from titan_plugin_github.models.review_profile_models import (
+    CandidateScoringRule,
+    ReviewAxisRule,
+    ReviewProfile,
+)
+from titan_plugin_github.models.view import UIFileChange
+from titan_plugin_github.operations.manifest_operations import build_change_manifest, is_config_file
+from titan_plugin_github.operations.path_classifier_operations import (
+    PathClassifier,
+    classify_path,
+    get_path_classifier,
+    glob_matches_any,
+)
+from titan_plugin_github.review_profiles import DEFAULT_REVIEW_PROFILE
+
+
+PATHS = [
+    "src/core/Engine.kt",
+    "app/src/main/java/com/foo/MainActivity.kt",
+    "lib/Services/payment.py",
+    "web/src/components/Button.test.tsx",
+    "Sources/Views/ProfileScreenView.swift",
+    "config/settings.yaml",
+    "pkg\\server\\router.go",
+    "README.md",
+    "tests/test_api.py",
+    "latest.py",
+    "[weird]/file?.txt",
+]
+
+
+def _fnmatch_any(path, patterns):
+    normalized = path.replace("\\", "/").lower()
+    return any(fnmatch(normalized, pattern.lower()) for pattern in patterns)
+
+
+def test_classification_matches_fnmatch_for_every_rule():
+    profile = DEFAULT_REVIEW_PROFILE
+    for path in PATHS:
+        classification = classify_path(path, profile)
+        assert classification.change_patterns == [
+            name for name, patterns in profile.change_patterns.items() if _fnmatch_any(path, patterns)
+        ], path
+        assert classification.file_roles == [
+            role for role, patterns in profile.file_roles.items() if _fnmatch_any(path, patterns)
+        ], path
+        assert classification.scoring_rules == [
+            rule.name for rule in profile.candidate_scoring if _fnmatch_any(path, rule.patterns)
+        ], path
+        assert classification.review_axes == [
+            axis for axis, rule in profile.review_axes.items() if _fnmatch_any(path, rule.patterns)
+        ], path
+
+
+def test_glob_matches_any_matches_fnmatch_and_handles_empty_patterns():
+    patterns = ["**/*View*", "docs/*.MD", "[!a]?.py"]
+    for path in PATHS + ["b1.py", "a1.py", "docs/Guide.md"]:
+        assert glob_matches_any(path, patterns) == _fnmatch_any(path, patterns), path
+    assert glob_matches_any("anything", []) is False
+
+
+def test_shared_globs_report_every_rule_that_uses_them():
+    profile = ReviewProfile(
+        change_patterns={"central_behavior": ["**/core/**"]},
+        file_roles={"domain": ["**/CORE/**"]},
+        candidate_scoring=[
+            CandidateScoringRule(name="core", patterns=["**/core/**"], score_delta=3, reason="core"),
+            CandidateScoringRule(name="never", patterns=["**/nope/**"], score_delta=1, reason="no"),
+        ],
+        review_axes={ChecklistCategory.DOCUMENTATION: ReviewAxisRule(patterns=["**/core/**"])},
+    )
+
+    classification = PathClassifier(profile).classify("app/core/thing.py")
+
+    assert classification.change_patterns == ["central_behavior"]
+    assert classification.file_roles == ["domain"]
+    assert classification.scoring_rules == ["core"]
+    assert classification.review_axes == [ChecklistCategory.DOCUMENTATION]
+
+
+def test_classifier_is_compiled_once_per_profile():
+    profile = DEFAULT_REVIEW_PROFILE.model_copy(deep=True)
+
+    assert get_path_classifier(profile) is get_path_classifier(profile)
+    assert get_path_classifier(profile.model_copy(deep=True)) is not get_path_classifier(profile)
+
+
+def test_manifest_stores_classification_only_with_a_profile(sample_ui_pr):
+    files = [
+        UIFileChange(
+            path="src/services/payments.py",
+            additions=10,
+            deletions=2,
+            status=FileChangeStatus.MODIFIED,
+            status_icon="~",
+        )
+    ]
+
+    with_profile = build_change_manifest(sample_ui_pr, files, DEFAULT_REVIEW_PROFILE)
+    without_profile = build_change_manifest(sample_ui_pr, files)
+
+    assert "central_behavior" in with_profile.files[0].classification.change_patterns
+    assert without_profile.files[0].classification is None
+
+
+def test_config_detection_keeps_pathlib_suffix_rules():
+    for path in ["a/.env", "a/b.YML", "x/settings.", "Dockerfile.dev", "app/build.gradle.kts", "src/main.py"]:
+        name = PurePath(path).name
+        expected = (
+            PurePath(path).suffix.lower() in {".yaml", ".yml", ".toml", ".ini", ".cfg", ".json",
+                                               ".gradle", ".kts", ".plist", ".pbxproj"}
+            or name.startswith(".")
+            or name.lower().startswith(("dockerfile", "makefile", "podfile", "fastfile"))
+            or name.lower().endswith((".gradle.kts", ".xcconfig"))
+        )
+        assert is_config_file(path) == expected, path
+
+
+def test_bracket_globs_are_not_prefiltered_away():
+    profile = ReviewProfile(file_roles={"odd": ["[]x]y"], "kotlin": ["**/[!.]*.kt"]})
+    classifier = PathClassifier(profile)
+
+    assert classifier.classify("]y").file_roles == ["odd"]
+    assert classifier.classify("src/Main.kt").file_roles == ["kotlin"]
+    assert classifier.classify("src/.Main.kt").file_roles == []
@@ -1,6 +1,7 @@
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from titan_plugin_github.checklists.defaults import DEFAULT_REVIEW_CHECKLIST
 from titan_plugin_github.managers.checklist_manager import ChecklistManager
@@ -12,13 +13,39 @@ def test_returns_default_checklist_contents():
     assert checklist == DEFAULT_REVIEW_CHECKLIST
 
 
-def test_returns_defensive_copy():
+def test_items_are_shared_and_immutable():
     checklist = ChecklistManager().get_effective_checklist()
-    checklist[0].name = "Changed"
+    with pytest.raises(ValidationError):
+        checklist[0].name = "Changed"
+    checklist.pop()
 
     fresh = ChecklistManager().get_effective_checklist()
 
-    assert fresh[0].name == DEFAULT_REVIEW_CHECKLIST[0].name
+    assert fresh == DEFAULT_REVIEW_CHECKLIST
+    assert fresh[0] is checklist[0]
+
+
+def test_project_checklist_is_parsed_once_until_it_changes(tmp_path: Path):
+    review_dir = tmp_path / ".titan" / "review"
+    review_dir.mkdir(parents=True)
+    checklist_path = review_dir / "checklist.yaml"
+    checklist_path.write_text(
+        "items:\n  - id: security\n    name: Security\n    description: Auth\n",
+        encoding="utf-8",
+    )
+
+    first = ChecklistManager(project_root=tmp_path).get_effective_checklist()
+    second = ChecklistManager(project_root=tmp_path).get_effective_checklist()
+
+    assert first[0] is second[0]
+
+    checklist_path.write_text(
+        "items:\n  - id: security\n    name: Security and secrets\n    description: Auth\n",
+        encoding="utf-8",
+    )
+    changed = ChecklistManager(project_root=tmp_path).get_effective_checklist()
+
+    assert changed[0].name == "Security and secrets"
 
 
 def test_loads_project_checklist_from_yaml(tmp_path: Path):
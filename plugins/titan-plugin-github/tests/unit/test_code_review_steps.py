@@ -529,6 +529,14 @@ class _FakeFindingsAdapter:
         return HeadlessResponse(stdout="[]", stderr="", exit_code=0)
 
 
+_CODE_LINE = "    total = compute_value(item, 42)\n"
+
+
+def _code(chars: int) -> str:
+    """Code-like filler: budgets are in tokens, which a run of one letter badly understates."""
+    return (_CODE_LINE * (chars // len(_CODE_LINE) + 1))[:chars]
+
+
 def _make_findings_batch(batch_id: str, files_chars: dict[str, int]) -> FocusContextBatch:
     return FocusContextBatch(
         batch_id=batch_id,
@@ -536,7 +544,7 @@ def _make_findings_batch(batch_id: str, files_chars: dict[str, int]) -> FocusCon
             path: FileContextEntry(
                 path=path,
                 read_mode=FileReadMode.HUNKS_ONLY,
-                hunks=["x" * chars],
+                hunks=[_code(chars)],
                 approximate_chars=chars,
             )
             for path, chars in files_chars.items()
@@ -1840,7 +1848,7 @@ def test_ai_review_findings_synthesis_skipped_over_budget(monkeypatch):
     # Big diff hunks blow the synthesis prompt past the budget, while the per-file
     # batches (100 chars each) still fit comfortably.
     ctx, fake_adapter = _synthesis_ctx(
-        ["[]", "[]"], diff=_synthesis_diff(line="z" * 15000)
+        ["[]", "[]"], diff=_synthesis_diff(line=_code(15000).replace("\n", " "))
     )
     monkeypatch.setattr(code_review_steps, "_resolve_headless_adapter", lambda _pref: fake_adapter)
 
@@ -2160,3 +2168,26 @@ def test_validate_review_actions_releases_worktree_even_with_no_actions(monkeypa
 
     assert isinstance(result, Skip)
     assert removed == ["/tmp/wt/titan-review-9"]
+
+
+def test_worktree_reference_batch_disables_the_sparse_checkout(monkeypatch):
+    import titan_plugin_github.operations as gh_operations
+
+    disabled = []
+    monkeypatch.setattr(
+        gh_operations, "disable_sparse_checkout", lambda git, path: disabled.append(path) or True
+    )
+    ctx = WorkflowContext()
+    ctx.textual = _FakeTextual()
+    ctx.git = Mock()
+    ctx.data["worktree_path"] = "/tmp/wt/titan-review-pool-1"
+    ctx.data["worktree_sparse_checkout"] = True
+    inline = Mock(files_context={"a.py": Mock(worktree_reference=False)})
+    delegated = Mock(files_context={"b.py": Mock(worktree_reference=True)})
+
+    code_review_steps._ensure_full_worktree(ctx, [inline])
+    assert disabled == []
+
+    code_review_steps._ensure_full_worktree(ctx, [inline, delegated])
+    assert disabled == ["/tmp/wt/titan-review-pool-1"]
+    assert ctx.data["worktree_sparse_checkout"] is False
@@ -0,0 +1,128 @@
+"""Tests for the per-review file snapshot."""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import Mock
+
+from titan_cli.engine import WorkflowContext
+
+from titan_plugin_github.managers.file_snapshot_manager import FileSnapshotManager
+from titan_plugin_github.models.review_enums import ContextRequestType
+from titan_plugin_github.models.review_models import ContextRequest
+from titan_plugin_github.operations.context_resolution_operations import (
+    FileReadAccess,
+    resolve_context_requests,
+)
+from titan_plugin_github.steps import code_review_steps
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(repo), *args], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def _commit_repo(repo: Path, files: dict[str, str]) -> str:
+    _git(repo, "init", "-q")
+    for path, content in files.items():
+        (repo / path).parent.mkdir(parents=True, exist_ok=True)
+        (repo / path).write_text(content, encoding="utf-8")
+    _git(repo, "add", "-A")
+    _git(repo, "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-q", "-m", "init")
+    return _git(repo, "rev-parse", "HEAD")
+
+
+def test_directory_snapshot_reads_each_file_once(tmp_path: Path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "api.py").write_text("v1", encoding="utf-8")
+    snapshot = FileSnapshotManager.for_directory(str(tmp_path))
+
+    assert snapshot.read("src/api.py") == "v1"
+    (tmp_path / "src" / "api.py").write_text("v2", encoding="utf-8")
+
+    assert snapshot.read("./src/api.py") == "v1"
+    assert snapshot.exists("src/api.py") is True
+    assert snapshot.exists("src/missing.py") is False
+    assert snapshot.exists("src") is False
+    assert snapshot.read("src/missing.py") is None
+
+
+def test_revision_snapshot_reads_head_objects_not_the_checkout(tmp_path: Path):
+    head = _commit_repo(tmp_path, {"src/api.py": "at head\n", "src/tests/test_api.py": "test\n"})
+    (tmp_path / "src" / "api.py").write_text("local edit\n", encoding="utf-8")
+    (tmp_path / "src" / "untracked.py").write_text("x\n", encoding="utf-8")
+
+    snapshot = FileSnapshotManager.for_revision(str(tmp_path), head)
+    try:
+        assert snapshot.read("src/api.py") == "at head\n"
+        assert snapshot.read("src/tests/test_api.py") == "test\n"
+        assert snapshot.exists("src/untracked.py") is False
+        assert snapshot.read("src/untracked.py") is None
+    finally:
+        snapshot.close()
+
+
+def test_revision_snapshot_is_none_when_commit_is_missing(tmp_path: Path):
+    _commit_repo(tmp_path, {"a.py": "a\n"})
+
+    assert FileSnapshotManager.for_revision(str(tmp_path), "f" * 40) is None
+
+
+def test_related_tests_are_probed_through_the_snapshot(tmp_path: Path):
+    (tmp_path / "src" / "tests").mkdir(parents=True)
+    (tmp_path / "src" / "tests" / "test_api.py").write_text("def test(): ...", encoding="utf-8")
+    snapshot = FileSnapshotManager.for_directory(str(tmp_path))
+    request = ContextRequest(
+        type=ContextRequestType.RELATED_TESTS, for_path="src/api.py", reason="tests"
+    )
+
+    related = resolve_context_requests([request], snapshot=snapshot)
+
+    assert related == {f"{request.type}:src/api.py": "def test(): ..."}
+
+
+def test_review_falls_back_to_head_objects_when_checkout_is_elsewhere(tmp_path: Path):
+    head = _commit_repo(tmp_path, {"src/api.py": "at head\n"})
+    ctx = WorkflowContext()
+    ctx.data["review_commit_sha"] = head
+    ctx.git = Mock()
+    ctx.git.repo_path = str(tmp_path)
+    blocked = FileReadAccess(False, "none", "checkout is elsewhere")
+
+    snapshot, access = code_review_steps._get_file_snapshot(ctx, blocked, str(tmp_path))
+
+    assert access.allowed is True
+    assert access.source == "revision"
+    assert access.disk_reads_allowed is False
+    assert snapshot.read("src/api.py") == "at head\n"
+    assert ctx.data["review_file_snapshot"] is snapshot
+    assert code_review_steps._get_file_snapshot(ctx, blocked, str(tmp_path))[0] is snapshot
+    snapshot.close()
+
+
+def test_review_stays_diff_only_when_head_objects_are_missing(tmp_path: Path):
+    _commit_repo(tmp_path, {"a.py": "a\n"})
+    ctx = WorkflowContext()
+    ctx.data["review_commit_sha"] = "f" * 40
+    ctx.git = Mock()
+    ctx.git.repo_path = str(tmp_path)
+    blocked = FileReadAccess(False, "none", "checkout is elsewhere")
+
+    snapshot, access = code_review_steps._get_file_snapshot(ctx, blocked, str(tmp_path))
+
+    assert snapshot is None
+    assert access is blocked
+
+
+def test_releasing_the_review_closes_the_snapshot(tmp_path: Path):
+    head = _commit_repo(tmp_path, {"a.py": "a\n"})
+    snapshot = FileSnapshotManager.for_revision(str(tmp_path), head)
+    snapshot.close = Mock(wraps=snapshot.close)
+    ctx = WorkflowContext()
+    ctx.textual = Mock()
+    ctx.data["review_file_snapshot"] = snapshot
+
+    code_review_steps._release_review_worktree(ctx)
+
+    snapshot.close.assert_called_once_with()
+    assert "review_file_snapshot" not in ctx.data
@@ -13,8 +13,8 @@ from titan_plugin_github.exceptions import GitHubError, GitHubAuthenticationErro
 
 @pytest.fixture
 def mock_subprocess():
-    """Mock subprocess.run to avoid actual gh CLI calls"""
-    with patch('titan_plugin_github.clients.network.gh_network.subprocess.run') as mock:
+    """Mock run_process to avoid actual gh CLI calls"""
+    with patch('titan_plugin_github.clients.network.gh_network.run_process') as mock:
         # Mock auth check to succeed by default
         mock.return_value = Mock(returncode=0, stdout="", stderr="")
         yield mock
@@ -48,7 +48,7 @@ def test_network_initialization_checks_auth(mock_subprocess):
 
 def test_network_initialization_raises_when_not_authenticated():
     """Test that initialization raises error if gh CLI not authenticated"""
-    with patch('titan_plugin_github.clients.network.gh_network.subprocess.run') as mock_run:
+    with patch('titan_plugin_github.clients.network.gh_network.run_process') as mock_run:
         # Simulate auth failure
         mock_run.side_effect = subprocess.CalledProcessError(
             returncode=1,
@@ -125,7 +125,7 @@ def test_run_command_with_stdin(gh_network, mock_subprocess):
 
 def test_run_command_api_error(gh_network):
     """Test command execution when gh CLI returns error"""
-    with patch('titan_plugin_github.clients.network.gh_network.subprocess.run') as mock_run:
+    with patch('titan_plugin_github.clients.network.gh_network.run_process') as mock_run:
         # Simulate API error
         mock_run.side_effect = subprocess.CalledProcessError(
             returncode=1,
@@ -144,7 +144,7 @@ def test_run_command_api_error_logs_with_custom_logger(gh_network):
     """API failures should be logged via the custom structured logger."""
     gh_network._logger = Mock()
 
-    with patch('titan_plugin_github.clients.network.gh_network.subprocess.run') as mock_run:
+    with patch('titan_plugin_github.clients.network.gh_network.run_process') as mock_run:
         mock_run.side_effect = subprocess.CalledProcessError(
             returncode=1,
             cmd=["gh", "pr", "create", "--body", "secret body"],
@@ -166,7 +166,7 @@ def test_run_command_api_error_logs_with_custom_logger(gh_network):
 
 
 def test_run_command_api_error_preserves_stdout_and_stderr(gh_network):
-    with patch('titan_plugin_github.clients.network.gh_network.subprocess.run') as mock_run:
+    with patch('titan_plugin_github.clients.network.gh_network.run_process') as mock_run:
         mock_run.side_effect = subprocess.CalledProcessError(
             returncode=1,
             cmd=["gh", "api", "/repos/foo/bar/pulls/1/reviews"],
@@ -186,7 +186,7 @@ def test_run_command_api_error_preserves_stdout_and_stderr(gh_network):
 
 def test_run_command_cli_not_found(gh_network):
     """Test command execution when gh CLI is not installed"""
-    with patch('titan_plugin_github.clients.network.gh_network.subprocess.run') as mock_run:
+    with patch('titan_plugin_github.clients.network.gh_network.run_process') as mock_run:
         # Simulate FileNotFoundError (gh not found)
         mock_run.side_effect = FileNotFoundError("gh command not found")
 
@@ -199,7 +199,7 @@ def test_run_command_cli_not_found(gh_network):
 
 def test_run_command_unexpected_error(gh_network):
     """Test command execution with unexpected error"""
-    with patch('titan_plugin_github.clients.network.gh_network.subprocess.run') as mock_run:
+    with patch('titan_plugin_github.clients.network.gh_network.run_process') as mock_run:
         # Simulate unexpected exception
         mock_run.side_effect = RuntimeError("Unexpected runtime error")
 
@@ -217,7 +217,7 @@ def test_get_repo_arg(gh_network):
 
 def test_get_repo_arg_when_no_repo():
     """Test that repo argument is empty when no repo configured"""
-    with patch('titan_plugin_github.clients.network.gh_network.subprocess.run'):
+    with patch('titan_plugin_github.clients.network.gh_network.run_process'):
         network = GHNetwork(repo_owner="", repo_name="")
         repo_arg = network.get_repo_arg()
 
@@ -249,7 +249,7 @@ def test_run_command_strips_whitespace(gh_network, mock_subprocess):
 
 def test_run_command_with_empty_stderr(gh_network):
     """Test command error handling when stderr is empty"""
-    with patch('titan_plugin_github.clients.network.gh_network.subprocess.run') as mock_run:
+    with patch('titan_plugin_github.clients.network.gh_network.run_process') as mock_run:
         # Simulate error with empty stderr
         error = subprocess.CalledProcessError(
             returncode=1,
@@ -12,6 +12,12 @@ from titan_plugin_github.managers.prompt_budget_manager import (
     PromptBudgetManager,
     get_prompt_budget_manager,
 )
+from titan_plugin_github.managers.token_estimator import (
+    HeuristicTokenEstimator,
+    TiktokenEstimator,
+    TokenCounter,
+    default_token_estimator,
+)
 from titan_plugin_github.models.review_enums import FileReadMode, PRSizeClass, ReviewStrategyType
 from titan_plugin_github.models.review_models import FileContextEntry, FocusContextBatch, ReviewStrategy
 
@@ -135,28 +141,109 @@ def test_fit_batch_within_budget_is_unchanged():
     assert fitted[0].prompt_actual_chars == 100
 
 
-def test_fit_batch_splits_multi_file_batch_in_half():
-    manager = PromptBudgetManager()
+class _CharEstimator:
+    """One token per char, so packing arithmetic is easy to follow."""
+
+    name = "chars"
+
+    def __init__(self):
+        self.calls = 0
+
+    def count(self, text):
+        self.calls += 1
+        return len(text)
+
+
+def _packing_case(sizes: dict[str, int], overhead: int):
+    entries = {path: make_entry(path, chars=size) for path, size in sizes.items()}
+    files_text = "".join("x" * size for size in sizes.values())
+    prompt_parts = {"prompt": "o" * overhead + files_text, "files_context": files_text}
+    return make_batch(entries), prompt_parts
+
+
+def test_fit_batch_packs_files_into_fewest_groups_in_one_pass():
+    manager = PromptBudgetManager(token_estimator=_CharEstimator())
+    batch, prompt_parts = _packing_case({"a.py": 600, "b.py": 300, "c.py": 300, "d.py": 200}, overhead=200)
+
+    # 1000 tokens with 200 of overhead leaves 800 per group. Halving would give
+    # [a, b] (900) and need another round; packing gives two full groups.
+    fitted, changed = manager.fit_batch_to_budget(batch, prompt_parts, budget_chars=4000)
+
+    assert changed is True
+    assert [candidate.batch_id for candidate in fitted] == ["batch_1a", "batch_1b"]
+    assert list(fitted[0].files_context) == ["a.py", "d.py"]
+    assert list(fitted[1].files_context) == ["b.py", "c.py"]
+    assert all(candidate.degraded_context for candidate in fitted)
+
+
+def test_fit_batch_gives_files_larger_than_a_group_their_own_batch():
+    manager = PromptBudgetManager(token_estimator=_CharEstimator())
+    batch, prompt_parts = _packing_case({"a.py": 100, "huge.py": 5000, "b.py": 100}, overhead=200)
+
+    fitted, _ = manager.fit_batch_to_budget(batch, prompt_parts, budget_chars=4000)
+
+    assert [list(candidate.files_context) for candidate in fitted] == [["a.py", "b.py"], ["huge.py"]]
+
+
+def test_fit_batch_splits_when_estimate_says_everything_fits():
+    manager = PromptBudgetManager(token_estimator=_CharEstimator())
     batch = make_batch(
-        {
-            "a.py": make_entry("a.py", chars=100),
-            "b.py": make_entry("b.py", chars=100),
-            "c.py": make_entry("c.py", chars=100),
-            "d.py": make_entry("d.py", chars=100),
-        }
+        {"a.py": make_entry("a.py", chars=10), "b.py": make_entry("b.py", chars=20)}
     )
-    prompt_parts = {"prompt": "x" * 5000}
 
-    fitted, changed = manager.fit_batch_to_budget(batch, prompt_parts, budget_chars=1000)
+    fitted, changed = manager.fit_batch_to_budget(batch, {"prompt": "x" * 5000}, budget_chars=1000)
 
     assert changed is True
-    assert len(fitted) == 2
-    assert fitted[0].batch_id == "batch_1a"
-    assert fitted[1].batch_id == "batch_1b"
-    assert list(fitted[0].files_context.keys()) == ["a.py", "b.py"]
-    assert list(fitted[1].files_context.keys()) == ["c.py", "d.py"]
-    assert fitted[0].degraded_context is True
-    assert fitted[1].degraded_context is True
+    assert [list(candidate.files_context) for candidate in fitted] == [["a.py"], ["b.py"]]
+    assert [candidate.batch_id for candidate in fitted] == ["batch_1a", "batch_1b"]
+
+
+def test_prompt_fits_counts_tokens_not_chars():
+    manager = PromptBudgetManager(token_estimator=HeuristicTokenEstimator())
+    prose = "The review found nothing to report in this file. " * 20
+    minified = "a9Fk2=Qz7;" * 98
+
+    assert len(prose) == len(minified)
+    assert manager.prompt_fits(prose, budget_chars=len(prose))
+    assert not manager.prompt_fits(minified, budget_chars=len(minified))
+
+
+def test_fitted_batch_records_prompt_tokens():
+    manager = PromptBudgetManager(token_estimator=_CharEstimator())
+    batch = make_batch({"a.py": make_entry("a.py", chars=100)})
+
+    fitted, _ = manager.fit_batch_to_budget(batch, {"prompt": "x" * 100}, budget_chars=1000)
+
+    assert fitted[0].prompt_actual_tokens == 100
+
+
+def test_token_counts_are_memoized_by_content():
+    estimator = _CharEstimator()
+    counter = TokenCounter(estimator, max_entries=2)
+
+    assert counter.count("abc") == 3
+    assert counter.count("abc") == 3
+    assert counter.count("") == 0
+    assert estimator.calls == 1
+
+    counter.count("d")
+    counter.count("e")  # evicts "abc", the least recently used
+    counter.count("abc")
+    assert estimator.calls == 4
+
+
+def test_heuristic_estimator_counts_identifier_humps_and_digit_groups():
+    estimator = HeuristicTokenEstimator()
+
+    assert estimator.count("getUserAccountByID") == 5
+    assert estimator.count("1234567") == 3
+    assert estimator.count("return value") == 2
+
+
+def test_default_estimator_falls_back_to_heuristic(monkeypatch):
+    monkeypatch.setattr(TiktokenEstimator, "load", classmethod(lambda cls: None))
+
+    assert isinstance(default_token_estimator(), HeuristicTokenEstimator)
 
 
 def test_fit_batch_degrades_single_file_to_worktree_reference():
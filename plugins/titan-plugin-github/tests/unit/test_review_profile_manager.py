@@ -1,6 +1,8 @@
+import os
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from titan_plugin_github.managers.review_profile_manager import ReviewProfileManager
 from titan_plugin_github.review_profiles import DEFAULT_REVIEW_PROFILE
@@ -78,3 +80,36 @@ candidate_scoring:
 
     with pytest.raises(ValueError, match="Invalid review profile configuration"):
         ReviewProfileManager(project_root=tmp_path).get_effective_profile()
+
+
+def test_profile_and_classifier_are_shared_until_the_file_changes(tmp_path: Path):
+    review_dir = tmp_path / ".titan" / "review"
+    review_dir.mkdir(parents=True)
+    profile_path = review_dir / "profile.yaml"
+    profile_path.write_text('file_roles:\n  domain:\n    - "**/core/**"\n', encoding="utf-8")
+
+    first = ReviewProfileManager(project_root=tmp_path)
+    second = ReviewProfileManager(project_root=tmp_path)
+
+    assert first.get_effective_profile() is second.get_effective_profile()
+    assert first.get_path_classifier() is second.get_path_classifier()
+
+    # Touching without changing content keeps the parsed profile.
+    stat = profile_path.stat()
+    os.utime(profile_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert second.get_effective_profile() is first.get_effective_profile()
+
+    profile_path.write_text('file_roles:\n  domain:\n    - "**/domain/**"\n', encoding="utf-8")
+    changed = second.get_effective_profile()
+
+    assert changed.file_roles == {"domain": ["**/domain/**"]}
+    assert second.get_path_classifier().classify("app/domain/x.py").file_roles == ["domain"]
+
+
+def test_profile_is_immutable():
+    profile = ReviewProfileManager().get_effective_profile()
+
+    with pytest.raises(ValidationError):
+        profile.findings_verification_enabled = True
+    with pytest.raises(ValidationError):
+        profile.candidate_scoring[0].score_delta = 0
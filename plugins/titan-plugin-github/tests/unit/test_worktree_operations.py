@@ -4,13 +4,19 @@ Unit tests for worktree operations
 
 
 import pytest
-from titan_cli.core.result import ClientError
+from titan_cli.core.result import ClientError, ClientSuccess
 from titan_plugin_github.operations.worktree_operations import (
+    acquire_review_worktree,
+    disable_sparse_checkout,
+    evict_review_worktrees,
+    release_review_worktree,
+    review_sparse_dirs,
     setup_worktree,
     cleanup_worktree,
     clear_stale_worktree,
     commit_in_worktree,
 )
+from titan_plugin_github.operations import worktree_operations
 
 
 @pytest.mark.unit
@@ -257,3 +263,146 @@ class TestCommitInWorktree:
                 add_all=True,
                 no_verify=False
             )
+
+
+class _SubprocessGitClient:
+    """Runs the git commands the pool needs for real, against a local repo."""
+
+    def __init__(self, repo):
+        self.repo = repo
+        self.heads = {}
+
+    def _run(self, args, cwd):
+        import subprocess
+
+        result = subprocess.run(args, cwd=cwd, capture_output=True, text=True)
+        if result.returncode:
+            return ClientError(error_message=result.stderr, error_code="GIT_ERROR")
+        return ClientSuccess(data=result.stdout, message="ok")
+
+    def fetch_refspec(self, remote, refspec):
+        # Stands in for fetching pull/N/head: point the review ref at a local commit.
+        source, target = refspec.split(":")
+        pr_number = int(source.split("/")[1])
+        return self._run(["git", "update-ref", target, self.heads[pr_number]], self.repo)
+
+    def run_in_worktree(self, worktree_path, args):
+        return self._run(args, worktree_path)
+
+    def remove_worktree(self, path, force=False):
+        return self._run(["git", "worktree", "remove", "--force", path], self.repo)
+
+    def prune_worktrees(self):
+        return self._run(["git", "worktree", "prune"], self.repo)
+
+
+def _commit(repo, files):
+    import subprocess
+
+    for path, content in files.items():
+        (repo / path).parent.mkdir(parents=True, exist_ok=True)
+        (repo / path).write_text(content, encoding="utf-8")
+    subprocess.run(["git", "add", "-A"], cwd=repo, check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", "commit", "-qm", "c"],
+        cwd=repo, check=True,
+    )
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def review_repo(tmp_path, monkeypatch):
+    import subprocess
+
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    (tmp_path / ".gitignore").write_text(".titan/\n", encoding="utf-8")
+    client = _SubprocessGitClient(tmp_path)
+    client.heads[1] = _commit(tmp_path, {
+        "src/api/handler.py": "v1\n", "src/db/models.py": "db\n", "docs/guide.md": "doc\n",
+    })
+    client.heads[2] = _commit(tmp_path, {"src/api/handler.py": "v2\n"})
+    monkeypatch.chdir(tmp_path)
+    return client
+
+
+@pytest.mark.unit
+class TestReviewWorktreePool:
+    """Pooled, sparse review worktrees"""
+
+    def test_sparse_dirs_cover_related_file_lookups(self):
+        assert review_sparse_dirs(["src/api/handler.py", "README.md"]) == [
+            "src/api", "src/api/tests", "tests", "tests/src/api",
+        ]
+
+    def test_worktree_is_sparse_and_repointed_in_place(self, review_repo, tmp_path):
+        path, ready = acquire_review_worktree(review_repo, 1, sparse_dirs=["src/api"], pool_size=1)
+
+        assert ready is True
+        assert (tmp_path / path / "src/api/handler.py").read_text() == "v1\n"
+        assert not (tmp_path / path / "src/db").exists()
+        assert release_review_worktree(review_repo, path) is True
+
+        second_path, ready = acquire_review_worktree(review_repo, 2, sparse_dirs=["src/api"], pool_size=1)
+
+        assert ready is True
+        assert second_path == path
+        assert (tmp_path / path / "src/api/handler.py").read_text() == "v2\n"
+
+    def test_full_checkout_without_sparse_dirs(self, review_repo, tmp_path):
+        path, _ = acquire_review_worktree(review_repo, 1, sparse_dirs=["src/api"])
+        release_review_worktree(review_repo, path)
+
+        path, ready = acquire_review_worktree(review_repo, 1)
+
+        assert ready is True
+        assert (tmp_path / path / "src/db/models.py").exists()
+
+    def test_slot_held_by_a_live_process_is_not_taken(self, review_repo):
+        import json
+        import os
+
+        path, _ = acquire_review_worktree(review_repo, 1, pool_size=1)
+        index_path = ".titan/worktrees/pool.json"
+        with open(index_path, encoding="utf-8") as handle:
+            index = json.load(handle)
+        index[os.path.basename(path)]["pid"] = os.getppid()
+        with open(index_path, "w", encoding="utf-8") as handle:
+            json.dump(index, handle)
+
+        other_path, ready = acquire_review_worktree(review_repo, 2, pool_size=1)
+
+        assert ready is True
+        assert other_path != path
+
+    def test_sparse_checkout_can_be_disabled_in_place(self, review_repo, tmp_path):
+        path, _ = acquire_review_worktree(review_repo, 1, sparse_dirs=["src/api"])
+
+        assert disable_sparse_checkout(review_repo, path) is True
+        assert (tmp_path / path / "src/db/models.py").read_text() == "db\n"
+
+    def test_pool_lock_serialises_slot_claims(self, tmp_path):
+        import threading
+
+        entered = threading.Event()
+
+        def claim():
+            with worktree_operations._pool_lock(str(tmp_path)):
+                entered.set()
+
+        with worktree_operations._pool_lock(str(tmp_path)):
+            thread = threading.Thread(target=claim, daemon=True)
+            thread.start()
+            assert not entered.wait(0.2)
+        thread.join(5)
+
+        assert entered.is_set()
+
+    def test_idle_worktrees_are_evicted_over_the_disk_budget(self, review_repo, tmp_path):
+        path, _ = acquire_review_worktree(review_repo, 1)
+
+        assert release_review_worktree(review_repo, path, disk_budget_bytes=0) is True
+
+        assert not (tmp_path / path).exists()
+        assert evict_review_worktrees(review_repo, disk_budget_bytes=0) == []
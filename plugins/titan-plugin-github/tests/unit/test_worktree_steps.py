@@ -97,3 +97,21 @@ class TestCleanupWorktreeStep:
         result = cleanup_worktree_step(ctx)
 
         assert isinstance(result, Skip)
+
+    def test_pooled_worktree_is_released_not_removed(self, monkeypatch):
+        import titan_plugin_github.steps.worktree_steps as worktree_steps
+
+        released = []
+        monkeypatch.setattr(
+            worktree_steps,
+            "release_review_worktree",
+            lambda git, path: released.append(path) or True,
+        )
+        ctx = _make_context()
+        ctx.data["worktree_pooled"] = True
+
+        result = cleanup_worktree_step(ctx)
+
+        assert isinstance(result, Success)
+        assert released == ["/tmp/wt"]
+        ctx.git.remove_worktree.assert_not_called()
@@ -10,7 +10,9 @@ import subprocess
 import time
 from typing import List, Optional
 
+from titan_cli.core.interrupt import run_process
 from titan_cli.core.logging.config import get_logger
+from titan_cli.core.tracing import span
 
 from ...exceptions import GitHubError, GitHubAuthenticationError, GitHubAPIError
 from ...messages import msg
@@ -53,7 +55,7 @@ class GHNetwork:
             GitHubAuthenticationError: If not authenticated
         """
         try:
-            subprocess.run(["gh", "auth", "status"], capture_output=True, check=True)
+            run_process(["gh", "auth", "status"], capture_output=True, check=True)
         except subprocess.CalledProcessError:
             raise GitHubAuthenticationError(msg.GitHub.NOT_AUTHENTICATED)
 
@@ -88,13 +90,14 @@ class GHNetwork:
         start = time.time()
 
         try:
-            result = subprocess.run(
-                ["gh"] + args,
-                input=stdin_input,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+            with span(f"gh {subcommand} {action}".rstrip(), "subprocess"):
+                result = run_process(
+                    ["gh"] + args,
+                    input=stdin_input,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
             self._logger.debug(
                 "gh_command_ok",
                 subcommand=subcommand,
@@ -9,6 +9,7 @@ from titan_cli.core.logging import get_logger
 from ..checklists.defaults import DEFAULT_REVIEW_CHECKLIST
 from ..models.review_models import ReviewChecklistItem
 from ..models.review_profile_models import ReviewChecklistFile
+from .config_file_cache import ConfigFileCache
 
 
 logger = get_logger(__name__)
@@ -20,29 +21,27 @@ class ChecklistManager:
     def __init__(self, project_root: Path | None = None):
         self.project_root = project_root
 
+    _cache: ConfigFileCache[tuple[ReviewChecklistItem, ...]] = ConfigFileCache()
+
     def get_effective_checklist(self) -> list[ReviewChecklistItem]:
         """
         Return the review checklist to use for the current project.
 
-        The manager currently serves the built-in default checklist. It owns
-        future project-specific resolution so the workflow step does not need
-        to know where the checklist comes from.
+        Items are frozen and shared between callers; the project file is only
+        parsed again when its content changes. The returned list is the
+        caller's own and may be filtered or reordered freely.
         """
         config_path = self._checklist_path()
         if not config_path or not config_path.exists():
-            checklist = [item.model_copy(deep=True) for item in DEFAULT_REVIEW_CHECKLIST]
-            logger.debug(
-                "review_checklist_resolved",
-                source="default",
-                path=str(config_path) if config_path else None,
-                items_count=len(checklist),
-                item_ids=[str(item.id) for item in checklist],
-            )
-            return checklist
+            return list(DEFAULT_REVIEW_CHECKLIST)
+        return list(
+            self._cache.get(config_path, lambda content: self._load_checklist(config_path, content))
+        )
 
+    @staticmethod
+    def _load_checklist(config_path: Path, content: bytes) -> tuple[ReviewChecklistItem, ...]:
         try:
-            with config_path.open("r", encoding="utf-8") as handle:
-                data = yaml.safe_load(handle) or {}
+            data = yaml.safe_load(content) or {}
         except yaml.YAMLError as exc:
             raise ValueError(f"Invalid review checklist YAML at {config_path}: {exc}") from exc
 
@@ -51,7 +50,7 @@ class ChecklistManager:
         except ValidationError as exc:
             raise ValueError(f"Invalid review checklist configuration at {config_path}: {exc}") from exc
 
-        checklist = [
+        checklist = tuple(
             ReviewChecklistItem(
                 id=item.id,
                 name=item.name,
@@ -59,7 +58,7 @@ class ChecklistManager:
                 relevant_file_patterns=list(item.relevant_file_patterns),
             )
             for item in checklist_file.items
-        ]
+        )
         logger.debug(
             "review_checklist_resolved",
             source="project",
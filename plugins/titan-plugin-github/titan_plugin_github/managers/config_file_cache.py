@@ -0,0 +1,59 @@
+"""Process-wide cache of validated review configuration files."""
+
+import hashlib
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Entry(Generic[T]):
+    mtime_ns: int
+    size: int
+    digest: str
+    value: T
+
+
+class ConfigFileCache(Generic[T]):
+    """Parsed models of config files, reused until the file changes.
+
+    A hit costs one ``stat``: the entry is reused while mtime and size are
+    unchanged. When they differ (a checkout, an editor touching the file) the
+    bytes are hashed, and only different content is parsed again. Parse errors
+    propagate and are never cached, so a fixed file is picked up on the next
+    call.
+
+    Cached values are shared between callers and must not be mutated; the
+    review models stored here are frozen for that reason.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Path, _Entry[T]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: Path, parse: Callable[[bytes], T]) -> T:
+        """Return the parsed value for ``path``, parsing only when its content changed."""
+        key = path.resolve()
+        stat = key.stat()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and (entry.mtime_ns, entry.size) == (stat.st_mtime_ns, stat.st_size):
+            return entry.value
+
+        content = key.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+        if entry is not None and entry.digest == digest:
+            value = entry.value
+        else:
+            value = parse(content)
+        with self._lock:
+            self._entries[key] = _Entry(stat.st_mtime_ns, stat.st_size, digest, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+        with self._lock:
+            self._entries.clear()
@@ -56,6 +56,7 @@ class DiffContextManager:
         # Optional source of whole-file content, for code the diff does not contain at all.
         self._content_provider: Optional[Callable[[str], Optional[str]]] = None
         self._content_cache: dict[str, Optional[str]] = {}
+        self._cache_content = True
 
     # ------------------------------------------------------------------
     # Construction
@@ -309,7 +310,9 @@ class DiffContextManager:
     # File content (code the diff does not contain)
     # ------------------------------------------------------------------
 
-    def attach_content_provider(self, provider: Callable[[str], Optional[str]]) -> None:
+    def attach_content_provider(
+        self, provider: Callable[[str], Optional[str]], cache: bool = True
+    ) -> None:
         """
         Attach a source of whole-file content, keyed by repo-relative path.
 
@@ -317,10 +320,12 @@ class DiffContextManager:
         the diff contains. A finding about pre-existing code the PR never touched has no
         such lines — without a provider there is nothing to show for it at all. The
         provider is expected to return content for the PR's head revision (or None), and
-        results are cached per path.
+        results are cached per path unless ``cache`` is False (for providers that already
+        cache, such as the review's FileSnapshotManager).
         """
         self._content_provider = provider
         self._content_cache = {}
+        self._cache_content = cache
         logger.debug("attach_content_provider: provider attached")
 
     @property
@@ -338,7 +343,8 @@ class DiffContextManager:
         try:
             content = self._content_provider(path)
             # Only cache successful lookups or legitimate None returns
-            self._content_cache[path] = content
+            if self._cache_content:
+                self._content_cache[path] = content
             logger.debug(
                 "get_file_content: path=%s found=%s", path, content is not None
             )
@@ -0,0 +1,225 @@
+"""Whole-file content of the reviewed revision, read once per review."""
+
+from __future__ import annotations
+
+import os
+import posixpath
+import subprocess
+import threading
+import weakref
+from pathlib import Path
+from typing import Optional, Protocol
+
+from titan_cli.core.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+_GIT_TIMEOUT_SECONDS = 30
+_SYMLINK_MODE = "120000"
+
+
+class _SnapshotSource(Protocol):
+    def list_dir(self, directory: str) -> frozenset[str]: ...
+
+    def read(self, path: str) -> Optional[str]: ...
+
+    def close(self) -> None: ...
+
+
+class _DirectorySource:
+    """Files of a directory already verified to hold the reviewed revision."""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    def list_dir(self, directory: str) -> frozenset[str]:
+        try:
+            with os.scandir(self.root / directory) as entries:
+                return frozenset(entry.name for entry in entries if entry.is_file())
+        except (OSError, ValueError):
+            return frozenset()
+
+    def read(self, path: str) -> Optional[str]:
+        try:
+            return (self.root / path).read_text(encoding="utf-8", errors="replace")
+        except (OSError, ValueError) as e:
+            logger.debug("Could not read %s: %s", path, e)
+            return None
+
+    def close(self) -> None:
+        pass
+
+
+class _GitRevisionSource:
+    """Blobs of one commit, listed with ``ls-tree`` and read through ``cat-file --batch``.
+
+    Objects are read straight from the repository, so no checkout has to be at
+    the revision. One ``cat-file`` process serves every read of the review.
+    """
+
+    def __init__(self, repo_path: str, revision: str, blobs: dict[str, str]):
+        self.repo_path = repo_path
+        self.revision = revision
+        self._blobs = blobs
+        self._directories: dict[str, set[str]] = {}
+        for path in blobs:
+            directory, name = posixpath.split(path)
+            self._directories.setdefault(directory, set()).add(name)
+        self._contents: dict[str, str] = {}
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._finalizer = weakref.finalize(self, _GitRevisionSource._terminate, [None])
+
+    @classmethod
+    def open(cls, repo_path: str, revision: str) -> _GitRevisionSource:
+        output = subprocess.run(
+            ["git", "-C", repo_path, "ls-tree", "-r", "-z", "--full-tree", revision],
+            capture_output=True,
+            check=True,
+            timeout=_GIT_TIMEOUT_SECONDS,
+        ).stdout
+        blobs: dict[str, str] = {}
+        for record in output.split(b"\0"):
+            if not record:
+                continue
+            meta, _, path = record.partition(b"\t")
+            mode, object_type, object_id = meta.decode().split(" ")
+            if object_type == "blob" and mode != _SYMLINK_MODE:
+                blobs[path.decode("utf-8", errors="surrogateescape")] = object_id
+        return cls(repo_path, revision, blobs)
+
+    def list_dir(self, directory: str) -> frozenset[str]:
+        return frozenset(self._directories.get(directory, ()))
+
+    def read(self, path: str) -> Optional[str]:
+        object_id = self._blobs.get(path)
+        if object_id is None:
+            return None
+        with self._lock:
+            if object_id in self._contents:
+                return self._contents[object_id]
+            try:
+                process = self._ensure_process()
+                process.stdin.write(f"{object_id}\n".encode())
+                process.stdin.flush()
+                header = process.stdout.readline().decode().split()
+                if len(header) != 3:
+                    logger.debug("cat-file returned no object for %s: %s", path, header)
+                    return None
+                size = int(header[2])
+                content = process.stdout.read(size + 1)[:size]
+            except (OSError, ValueError) as e:
+                logger.debug("Could not read %s at %s: %s", path, self.revision[:8], e)
+                self._stop_process()
+                return None
+            # Keyed by object id: files with identical content are read once.
+            text = self._contents[object_id] = content.decode("utf-8", errors="replace")
+        return text
+
+    def close(self) -> None:
+        with self._lock:
+            self._stop_process()
+
+    def _ensure_process(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                ["git", "-C", self.repo_path, "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            self._finalizer.detach()
+            self._finalizer = weakref.finalize(
+                self, _GitRevisionSource._terminate, [self._process]
+            )
+        return self._process
+
+    def _stop_process(self) -> None:
+        if self._process is not None:
+            _GitRevisionSource._terminate([self._process])
+            self._process = None
+
+    @staticmethod
+    def _terminate(holder: list) -> None:
+        process = holder[0]
+        if process is None or process.poll() is not None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+
+
+class FileSnapshotManager:
+    """
+    One review's view of the files at the reviewed revision.
+
+    Every consumer of whole-file content during a review (focus-file context,
+    related-file probing, and finding excerpts via the diff manager) reads
+    through one snapshot, so each file is read at most once. Directory
+    listings are indexed on first use, so probing for candidate files is a set
+    lookup instead of a filesystem round trip per candidate.
+
+    Content comes either from a directory verified to be at the revision (the
+    PR worktree, or a clean checkout at the head commit) or straight from the
+    git objects of the head commit, which needs no checkout at all.
+    """
+
+    def __init__(self, source: _SnapshotSource, description: str, key: tuple[str, str]):
+        self._source = source
+        self.description = description
+        self.key = key
+        self._listings: dict[str, frozenset[str]] = {}
+        self._contents: dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_directory(cls, root: str) -> FileSnapshotManager:
+        """Snapshot over a directory already verified to hold the reviewed revision."""
+        return cls(_DirectorySource(root), f"files in {root}", ("directory", str(root)))
+
+    @classmethod
+    def for_revision(cls, repo_path: str, revision: str) -> Optional[FileSnapshotManager]:
+        """
+        Snapshot over the git objects of ``revision`` in ``repo_path``.
+
+        Returns None when the revision is not available locally (or git is not),
+        so callers can fall back to reviewing from the diff only.
+        """
+        try:
+            source = _GitRevisionSource.open(repo_path, revision)
+        except (OSError, ValueError, TypeError, subprocess.SubprocessError) as e:
+            logger.debug("file_snapshot_revision_unavailable", revision=revision, error=str(e))
+            return None
+        return cls(source, f"git objects at {revision[:8]}", ("revision", revision))
+
+    def exists(self, path: str) -> bool:
+        """Return True when ``path`` is a file of the snapshot."""
+        directory, name = posixpath.split(_normalize(path))
+        listing = self._listings.get(directory)
+        if listing is None:
+            listing = self._source.list_dir(directory)
+            with self._lock:
+                self._listings[directory] = listing
+        return name in listing
+
+    def read(self, path: str) -> Optional[str]:
+        """Return the content of ``path`` at the snapshot's revision, or None."""
+        path = _normalize(path)
+        if path in self._contents:
+            return self._contents[path]
+        content = self._source.read(path) if self.exists(path) else None
+        with self._lock:
+            self._contents[path] = content
+        return content
+
+    def close(self) -> None:
+        """Release the resources of the underlying source (the ``cat-file`` process)."""
+        self._source.close()
+
+
+def _normalize(path: str) -> str:
+    normalized = posixpath.normpath(str(path).replace("\\", "/"))
+    return "" if normalized == "." else normalized
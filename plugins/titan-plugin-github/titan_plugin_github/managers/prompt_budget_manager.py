@@ -3,10 +3,16 @@
 Centralizes the content-budget sizing and batch fit/split/degradation
 policy previously duplicated as free functions in
 `context_resolution_operations.py` and `code_review_steps.py`.
+
+Strategies express budgets in characters; prompts are checked against the
+equivalent token budget, counted by the estimator in `token_estimator.py`.
 """
 
+from typing import Optional
+
 from ..models.review_enums import FileReadMode, PRSizeClass
 from ..models.review_models import FileContextEntry, FocusContextBatch, ReviewStrategy
+from .token_estimator import CHARS_PER_TOKEN, TokenCounter, TokenEstimator, default_token_estimator
 
 
 class PromptBudgetManager:
@@ -17,6 +23,9 @@ class PromptBudgetManager:
     # actual cost is much higher than its prompt-text size suggests.
     WORKTREE_REFERENCE_ESTIMATED_CHARS = 5000
 
+    def __init__(self, token_estimator: Optional[TokenEstimator] = None):
+        self._token_counter = TokenCounter(token_estimator) if token_estimator else None
+
     def content_budget(self, strategy: ReviewStrategy) -> int:
         """Return the char budget available for file/related/comment context."""
         reserve = 5000 if strategy.size_class in {PRSizeClass.LARGE, PRSizeClass.HUGE} else 3500
@@ -34,6 +43,25 @@ class PromptBudgetManager:
             return self.WORKTREE_REFERENCE_ESTIMATED_CHARS
         return 0
 
+    @property
+    def token_counter(self) -> TokenCounter:
+        """Memoized token counter, using the exact tokenizer when one is installed."""
+        if self._token_counter is None:
+            self._token_counter = TokenCounter(default_token_estimator())
+        return self._token_counter
+
+    def count_tokens(self, text: str) -> int:
+        """Return the token count of a prompt or prompt part."""
+        return self.token_counter.count(text)
+
+    def token_budget(self, budget_chars: int) -> int:
+        """Convert a strategy's char budget into the token budget prompts are checked against."""
+        return budget_chars // CHARS_PER_TOKEN
+
+    def prompt_fits(self, prompt: str, budget_chars: int) -> bool:
+        """Return True when ``prompt`` fits the token budget derived from ``budget_chars``."""
+        return self.count_tokens(prompt) <= self.token_budget(budget_chars)
+
     def fit_batch_to_budget(
         self,
         batch: FocusContextBatch,
@@ -41,7 +69,10 @@ class PromptBudgetManager:
         budget_chars: int,
         allow_file_reads: bool = True,
     ) -> tuple[list[FocusContextBatch], bool]:
-        """Shrink or split a batch until it fits the prompt budget, or mark it oversized.
+        """Pack, shrink, or mark oversized a batch whose prompt exceeds the token budget.
+
+        A multi-file batch is packed in one pass into as few sub-batches as fit
+        the budget; a single file then degrades step by step.
 
         ``allow_file_reads=False`` forbids the worktree_reference degradation: that
         mode instructs the model to read the file from disk, which is exactly what
@@ -50,28 +81,27 @@ class PromptBudgetManager:
         """
         prompt = prompt_parts["prompt"]
         actual_chars = len(prompt)
-        if actual_chars <= budget_chars:
-            fitted = batch.model_copy(update={"prompt_actual_chars": actual_chars})
+        actual_tokens = self.count_tokens(prompt)
+        budget_tokens = self.token_budget(budget_chars)
+        if actual_tokens <= budget_tokens:
+            fitted = batch.model_copy(
+                update={"prompt_actual_chars": actual_chars, "prompt_actual_tokens": actual_tokens}
+            )
             return [fitted], False
 
         file_items = list(batch.files_context.items())
         if len(file_items) > 1:
-            midpoint = max(1, len(file_items) // 2)
-            left = batch.model_copy(
-                update={
-                    "batch_id": f"{batch.batch_id}a",
-                    "files_context": dict(file_items[:midpoint]),
-                    "degraded_context": True,
-                }
-            )
-            right = batch.model_copy(
-                update={
-                    "batch_id": f"{batch.batch_id}b",
-                    "files_context": dict(file_items[midpoint:]),
-                    "degraded_context": True,
-                }
-            )
-            return [left, right], True
+            groups = self._pack_files(file_items, prompt_parts, actual_tokens, budget_tokens)
+            return [
+                batch.model_copy(
+                    update={
+                        "batch_id": f"{batch.batch_id}{_group_suffix(index)}",
+                        "files_context": dict(group),
+                        "degraded_context": True,
+                    }
+                )
+                for index, group in enumerate(groups)
+            ], True
 
         only_path, only_entry = file_items[0]
         if not only_entry.worktree_reference and allow_file_reads:
@@ -105,12 +135,76 @@ class PromptBudgetManager:
         oversized = batch.model_copy(
             update={
                 "prompt_actual_chars": actual_chars,
+                "prompt_actual_tokens": actual_tokens,
                 "prompt_still_too_large": True,
                 "degraded_context": True,
             }
         )
         return [oversized], False
 
+    def _pack_files(
+        self,
+        file_items: list[tuple[str, FileContextEntry]],
+        prompt_parts: dict[str, str],
+        prompt_tokens: int,
+        budget_tokens: int,
+    ) -> list[list[tuple[str, FileContextEntry]]]:
+        """First-fit-decreasing packing of files into groups that each fit the budget.
+
+        Everything in the prompt but the files (instructions, schema, comments,
+        related context) repeats in every group, so each group has the budget
+        minus that overhead for its files. A file too large for any group gets
+        one of its own, to be degraded on the next pass.
+        """
+        files_tokens = self.count_tokens(prompt_parts.get("files_context", ""))
+        capacity = budget_tokens - max(0, prompt_tokens - files_tokens)
+        costs = {path: self._entry_tokens(entry) for path, entry in file_items}
+        # Spread the rendered size (line numbers, fences, headers) over the files.
+        estimated = sum(costs.values())
+        if files_tokens and estimated:
+            costs = {path: cost * files_tokens / estimated for path, cost in costs.items()}
+
+        groups: list[list[int]] = []
+        free: list[float] = []
+        for index in sorted(range(len(file_items)), key=lambda i: -costs[file_items[i][0]]):
+            cost = costs[file_items[index][0]]
+            for group, room in enumerate(free):
+                if cost <= room:
+                    groups[group].append(index)
+                    free[group] -= cost
+                    break
+            else:
+                groups.append([index])
+                free.append(capacity - cost)
+
+        if len(groups) == 1:
+            # The estimate says everything fits but the prompt did not: move the
+            # largest file out so every pass makes progress.
+            groups = [groups[0][:1], groups[0][1:]]
+        groups.sort(key=min)
+        return [[file_items[index] for index in sorted(group)] for group in groups]
+
+    def _entry_tokens(self, entry: FileContextEntry) -> int:
+        if entry.full_content:
+            return self.count_tokens(entry.full_content)
+        if entry.expanded_hunks:
+            return sum(self.count_tokens(hunk) for hunk in entry.expanded_hunks)
+        if entry.hunks:
+            return sum(self.count_tokens(hunk) for hunk in entry.hunks)
+        return self.count_tokens(entry.review_hint) + sum(
+            self.count_tokens(header) for header in entry.changed_hunk_headers
+        )
+
+
+def _group_suffix(index: int) -> str:
+    """Batch id suffix of the index-th packed group: a, b, ..., z, aa, ab, ..."""
+    suffix = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        suffix = chr(ord("a") + remainder) + suffix
+    return suffix
+
 
 _default_manager = PromptBudgetManager()
 
@@ -7,7 +7,9 @@ from pydantic import ValidationError
 from titan_cli.core.logging import get_logger
 
 from ..models.review_profile_models import ReviewProfile
+from ..operations.path_classifier_operations import PathClassifier, get_path_classifier
 from ..review_profiles import DEFAULT_REVIEW_PROFILE
+from .config_file_cache import ConfigFileCache
 
 
 logger = get_logger(__name__)
@@ -19,25 +21,30 @@ class ReviewProfileManager:
     def __init__(self, project_root: Path | None = None):
         self.project_root = project_root
 
+    _cache: ConfigFileCache[ReviewProfile] = ConfigFileCache()
+    _default_profile: ReviewProfile = DEFAULT_REVIEW_PROFILE.model_copy(deep=True)
+
     def get_effective_profile(self) -> ReviewProfile:
-        """Return project review profile or built-in defaults when absent."""
+        """
+        Return project review profile or built-in defaults when absent.
+
+        The profile is frozen and shared: every manager resolving the same
+        unchanged file gets the same instance, so the compiled path matchers
+        keyed on it are built once per process rather than once per review.
+        """
         config_path = self._profile_path()
         if not config_path or not config_path.exists():
-            profile = DEFAULT_REVIEW_PROFILE.model_copy(deep=True)
-            logger.debug(
-                "review_profile_resolved",
-                source="default",
-                path=str(config_path) if config_path else None,
-                change_patterns=sorted(profile.change_patterns.keys()),
-                file_roles=sorted(profile.file_roles.keys()),
-                candidate_scoring_rules=[rule.name for rule in profile.candidate_scoring],
-                review_axes=sorted(str(axis) for axis in profile.review_axes.keys()),
-            )
-            return profile
+            return self._default_profile
+        return self._cache.get(config_path, lambda content: self._load_profile(config_path, content))
+
+    def get_path_classifier(self) -> PathClassifier:
+        """Return the compiled path classifier for the effective profile."""
+        return get_path_classifier(self.get_effective_profile())
 
+    @staticmethod
+    def _load_profile(config_path: Path, content: bytes) -> ReviewProfile:
         try:
-            with config_path.open("r", encoding="utf-8") as handle:
-                data = yaml.safe_load(handle) or {}
+            data = yaml.safe_load(content) or {}
         except yaml.YAMLError as exc:
             raise ValueError(f"Invalid review profile YAML at {config_path}: {exc}") from exc
 
@@ -0,0 +1,134 @@
+"""Token estimation for prompt budgeting.
+
+Review prompts are budgeted against the model's context, which is counted in
+tokens, not characters. Characters are a poor proxy exactly where reviews get
+expensive: long camelCase identifiers, numeric tables, and minified or
+generated files all tokenize far denser than prose.
+
+``HeuristicTokenEstimator`` approximates a BPE tokenizer with one regex pass
+(word pieces, camelCase humps, digit groups, symbol pairs, whitespace runs)
+and needs nothing installed. When ``tiktoken`` is installed and its encoding
+loads, ``default_token_estimator`` counts exactly instead. Either way counts
+go through a ``TokenCounter``, which memoizes them per content hash: the same
+file context is measured again every time a batch is rebuilt.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Optional, Protocol
+
+from titan_cli.core.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+# Characters per token of typical source code, used to convert the char
+# budgets of review strategies into token budgets.
+CHARS_PER_TOKEN = 4
+
+_TOKEN_PIECES = re.compile(
+    r" ?[A-Z]?[a-z]{1,7}"  # a word or camelCase hump; long words split every 7 letters
+    r"| ?[A-Z]{1,4}(?![a-z])"  # acronyms, up to the capital that starts the next hump
+    r"| ?\d{1,3}"  # BPE vocabularies split numbers in groups of three digits
+    r"| ?[^\sA-Za-z\d]{1,2}"  # punctuation and operators, mostly merged in pairs
+    r"|\s+"  # newlines and indentation
+)
+_MEMO_SIZE = 4096
+_TIKTOKEN_ENCODING = "cl100k_base"
+
+
+class TokenEstimator(Protocol):
+    """Counts the tokens of a text."""
+
+    name: str
+
+    def count(self, text: str) -> int: ...
+
+
+class HeuristicTokenEstimator:
+    """Dependency-free approximation of a BPE tokenizer, one regex match per token."""
+
+    name = "heuristic"
+
+    def count(self, text: str) -> int:
+        return len(_TOKEN_PIECES.findall(text))
+
+
+class TiktokenEstimator:
+    """Exact counts with a local ``tiktoken`` encoding."""
+
+    name = "tiktoken"
+
+    def __init__(self, encoding) -> None:
+        self._encoding = encoding
+
+    @classmethod
+    def load(cls, encoding_name: str = _TIKTOKEN_ENCODING) -> Optional[TiktokenEstimator]:
+        """Return an estimator for ``encoding_name``, or None when tiktoken is unavailable."""
+        try:
+            import tiktoken
+        except ImportError:
+            return None
+        try:
+            return cls(tiktoken.get_encoding(encoding_name))
+        except Exception as e:  # encoding files are fetched on first use and may be unreachable
+            logger.debug("tiktoken_encoding_unavailable", encoding=encoding_name, error=str(e))
+            return None
+
+    def count(self, text: str) -> int:
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+def default_token_estimator() -> TokenEstimator:
+    """Return the exact tokenizer when installed, the heuristic otherwise."""
+    return TiktokenEstimator.load() or HeuristicTokenEstimator()
+
+
+class TokenCounter:
+    """A token estimator with its counts memoized by content hash.
+
+    Entries are keyed by a BLAKE2b digest of the text, so the memo holds no
+    prompt content, and bounded to the most recently used texts.
+    """
+
+    def __init__(self, estimator: TokenEstimator, max_entries: int = _MEMO_SIZE) -> None:
+        self.estimator = estimator
+        self._max_entries = max_entries
+        self._counts: OrderedDict[bytes, int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def count(self, text: str) -> int:
+        """Return the token count of ``text``."""
+        if not text:
+            return 0
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        with self._lock:
+            cached = self._counts.get(key)
+            if cached is not None:
+                self._counts.move_to_end(key)
+                return cached
+        tokens = self.estimator.count(text)
+        with self._lock:
+            self._counts[key] = tokens
+            if len(self._counts) > self._max_entries:
+                self._counts.popitem(last=False)
+        return tokens
+
+    def clear(self) -> None:
+        """Drop every memoized count."""
+        with self._lock:
+            self._counts.clear()
+
+
+__all__ = [
+    "CHARS_PER_TOKEN",
+    "HeuristicTokenEstimator",
+    "TiktokenEstimator",
+    "TokenCounter",
+    "TokenEstimator",
+    "default_token_estimator",
+]
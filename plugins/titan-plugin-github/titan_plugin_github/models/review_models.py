@@ -8,7 +8,7 @@ The new-findings flow is intentionally split into two concerns:
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .review_enums import (
     ChecklistCategory,
@@ -28,6 +28,15 @@ from .review_enums import (
 )
 
 
+class PathClassification(BaseModel):
+    """Review profile rules a path matches, computed once per manifest."""
+
+    change_patterns: list[str] = Field(default_factory=list, description="Matching change pattern names")
+    file_roles: list[str] = Field(default_factory=list, description="Matching profile file roles, in profile order")
+    scoring_rules: list[str] = Field(default_factory=list, description="Matching candidate scoring rule names")
+    review_axes: list[ChecklistCategory] = Field(default_factory=list, description="Review axes whose patterns match")
+
+
 class ChangedFileEntry(BaseModel):
     """Single file changed in the PR with cheap deterministic signals."""
 
@@ -42,6 +51,9 @@ class ChangedFileEntry(BaseModel):
     is_config: bool = Field(default=False, description="Configuration file")
     is_lockfile: bool = Field(default=False, description="Dependency lockfile")
     is_rename_only: bool = Field(default=False, description="Renamed without meaningful edits")
+    classification: Optional[PathClassification] = Field(
+        default=None, description="Review profile matches (set when the manifest was built with a profile)"
+    )
 
     @property
     def total_changes(self) -> int:
@@ -77,6 +89,8 @@ class ChangeManifest(BaseModel):
 class ReviewChecklistItem(BaseModel):
     """Single review category offered to AI."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: ChecklistCategory = Field(..., description="Unique checklist category ID")
     name: str = Field(..., description="Display name")
     description: str = Field(..., description="What this checklist item covers")
@@ -329,6 +343,7 @@ class FocusContextBatch(BaseModel):
     approximate_chars: int = 0
     prompt_budget_target_chars: int = 0
     prompt_actual_chars: int = 0
+    prompt_actual_tokens: int = 0
     prompt_still_too_large: bool = False
     degraded_context: bool = False
 
@@ -1,6 +1,6 @@
 """Pydantic models for project-specific review profile configuration."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .review_enums import ChecklistCategory
 
@@ -8,6 +8,8 @@ from .review_enums import ChecklistCategory
 class CandidateScoringRule(BaseModel):
     """Rule that adjusts candidate score when path patterns match."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Stable rule identifier")
     patterns: list[str] = Field(default_factory=list, description="Glob patterns to match")
     score_delta: int = Field(..., description="Positive or negative score adjustment")
@@ -17,6 +19,8 @@ class CandidateScoringRule(BaseModel):
 class CandidateExclusions(BaseModel):
     """Configurable low-signal exclusion thresholds."""
 
+    model_config = ConfigDict(frozen=True)
+
     low_signal_test_max_changes: int = Field(default=20)
     low_signal_config_max_changes: int = Field(default=10)
 
@@ -24,6 +28,8 @@ class CandidateExclusions(BaseModel):
 class ReviewAxisRule(BaseModel):
     """Rule that determines when a review axis should apply."""
 
+    model_config = ConfigDict(frozen=True)
+
     always_include: bool = Field(default=False)
     patterns: list[str] = Field(default_factory=list)
 
@@ -31,6 +37,8 @@ class ReviewAxisRule(BaseModel):
 class ReviewProfile(BaseModel):
     """Resolved review profile used by deterministic review strategy operations."""
 
+    model_config = ConfigDict(frozen=True)
+
     version: int = Field(default=1)
     change_patterns: dict[str, list[str]] = Field(default_factory=dict)
     file_roles: dict[str, list[str]] = Field(default_factory=dict)
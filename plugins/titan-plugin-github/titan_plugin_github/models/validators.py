@@ -132,16 +132,113 @@ def is_duplicate(
         existing.title.lower(),
     ).ratio()
 
+    return _is_duplicate_topic(new_finding, existing, similarity, title_similarity_threshold)
+
+
+_ADJUDICATED_SIMILARITY_THRESHOLD = 0.58
+
+
+def _is_duplicate_topic(
+    new_finding: Finding,
+    existing: ExistingCommentIndexEntry,
+    similarity: float,
+    title_similarity_threshold: float,
+) -> bool:
     same_category = new_finding.category.lower() == (existing.category or "").lower()
     if same_category and not existing.is_resolved:
         return True
 
-    if existing.is_adjudicated and similarity > 0.58:
+    if existing.is_adjudicated and similarity > _ADJUDICATED_SIMILARITY_THRESHOLD:
         return True
 
     return similarity > title_similarity_threshold
 
 
+class TitleMatcher:
+    """A lowercased title prepared for many similarity checks against it.
+
+    ``similarity(other, floor)`` equals
+    ``SequenceMatcher(None, other, title).ratio()`` whenever that ratio is above
+    ``floor``, and otherwise returns a value no higher than ``floor``. The
+    matcher's index of the title is built once, and pairs that cannot clear the
+    floor are rejected by ``SequenceMatcher``'s own upper bounds (length, then
+    character counts) before the full ratio is computed.
+    """
+
+    __slots__ = ("title", "_matcher")
+
+    def __init__(self, title: str):
+        self.title = title
+        self._matcher = SequenceMatcher(None, "", title)
+
+    def similarity(self, other: str, floor: float) -> float:
+        """Return the ratio of ``other`` to this title, or at most ``floor`` if it cannot exceed it."""
+        matcher = self._matcher
+        matcher.set_seq1(other)
+        if matcher.real_quick_ratio() <= floor or matcher.quick_ratio() <= floor:
+            return 0.0
+        return matcher.ratio()
+
+
+def line_bucket(line: int, window: int) -> int:
+    """Bucket of ``line`` such that lines within ``window`` are at most one bucket apart."""
+    return line // max(window, 1)
+
+
+class ExistingCommentMatcher:
+    """Existing PR comments indexed for ``is_duplicate`` lookups.
+
+    Comments are bucketed by path and line window, so a finding is only
+    compared with comments near it, and each comment title is prepared once.
+    ``matches`` returns exactly the entries for which ``is_duplicate`` is
+    True, in index order.
+    """
+
+    def __init__(
+        self,
+        existing: list[ExistingCommentIndexEntry],
+        line_proximity_window: int = 5,
+        title_similarity_threshold: float = 0.75,
+    ):
+        self._window = line_proximity_window
+        self._threshold = title_similarity_threshold
+        self._buckets: dict[tuple[str | None, int | None], list] = {}
+        for position, entry in enumerate(existing):
+            bucket = None if entry.line is None else line_bucket(entry.line, line_proximity_window)
+            self._buckets.setdefault((entry.path, bucket), []).append(
+                (position, entry, TitleMatcher(entry.title.lower()))
+            )
+
+    def matches(self, new_finding: Finding) -> list[ExistingCommentIndexEntry]:
+        """Return the existing comments that ``new_finding`` duplicates."""
+        if new_finding.line is None:
+            keys = [(new_finding.path, None)]
+        else:
+            bucket = line_bucket(new_finding.line, self._window)
+            keys = [(new_finding.path, bucket + offset) for offset in (-1, 0, 1)]
+
+        title = new_finding.title.lower()
+        category = new_finding.category.lower()
+        hits = []
+        for key in keys:
+            for position, entry, matcher in self._buckets.get(key, ()):
+                if not _lines_are_close(new_finding.line, entry.line, self._window):
+                    continue
+                floor = self._threshold
+                if entry.is_adjudicated:
+                    floor = min(floor, _ADJUDICATED_SIMILARITY_THRESHOLD)
+                # An open thread in the same category is a duplicate whatever
+                # the titles say; only compute similarity when it can matter.
+                similarity = (
+                    0.0
+                    if category == (entry.category or "").lower() and not entry.is_resolved
+                    else matcher.similarity(title, floor)
+                )
+                if _is_duplicate_topic(new_finding, entry, similarity, self._threshold):
+                    hits.append((position, entry))
+        return [entry for _, entry in sorted(hits, key=lambda hit: hit[0])]
+
+
 def _lines_are_close(line_a: int | None, line_b: int | None, window: int) -> bool:
     if line_a is None and line_b is None:
         return True
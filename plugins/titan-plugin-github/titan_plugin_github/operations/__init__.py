@@ -35,6 +35,11 @@ from .pr_selection_operations import (
 )
 
 from .worktree_operations import (
+    acquire_review_worktree,
+    disable_sparse_checkout,
+    evict_review_worktrees,
+    release_review_worktree,
+    review_sparse_dirs,
     setup_worktree,
     cleanup_worktree,
     clear_stale_worktree,
@@ -82,6 +87,11 @@ __all__ = [
     "format_review_status_badge",
 
     # Worktree operations
+    "acquire_review_worktree",
+    "disable_sparse_checkout",
+    "evict_review_worktrees",
+    "release_review_worktree",
+    "review_sparse_dirs",
     "setup_worktree",
     "cleanup_worktree",
     "clear_stale_worktree",
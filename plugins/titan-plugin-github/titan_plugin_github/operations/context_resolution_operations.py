@@ -7,6 +7,7 @@ from typing import Optional
 from titan_cli.core.logging import get_logger
 
 from ..managers.diff_context_manager import DiffContextManager, get_or_create_diff_manager
+from ..managers.file_snapshot_manager import FileSnapshotManager
 from ..managers.prompt_budget_manager import get_prompt_budget_manager
 from ..models.review_enums import ContextRequestType, FileReadMode, PRSizeClass
 from ..models.review_models import (
@@ -34,13 +35,24 @@ class FileReadAccess:
         allowed: True when reading files from ``root`` yields the code the diff
                  describes. False means only diff hunks may be used.
         source: Where the trusted content comes from — "worktree", "checkout",
-                or "none" when reads are not allowed.
+                "revision" (the head commit's git objects), or "none" when reads are
+                not allowed.
         reason: Short explanation, shown in the UI and logged.
     """
     allowed: bool
     source: str
     reason: str
 
+    @property
+    def disk_reads_allowed(self) -> bool:
+        """Whether the AI CLI may open files on disk itself (worktree_reference).
+
+        Only a worktree or verified checkout holds the PR head on disk. A "revision"
+        snapshot is readable through git, but the directory the CLI would Read/Grep
+        in is still at some other commit.
+        """
+        return self.allowed and self.source in ("worktree", "checkout")
+
 
 def resolve_file_read_access(
     worktree_path: Optional[str],
@@ -128,7 +140,16 @@ def read_file_content(path: str, cwd: Optional[str] = None) -> Optional[str]:
     return None
 
 
-def _find_related_tests(path: str, cwd: Optional[str] = None) -> Optional[str]:
+def _snapshot_for(cwd: Optional[str]) -> FileSnapshotManager:
+    return FileSnapshotManager.for_directory(cwd or str(Path.cwd()))
+
+
+def _find_related_tests(
+    path: str,
+    cwd: Optional[str] = None,
+    snapshot: Optional[FileSnapshotManager] = None,
+) -> Optional[str]:
+    snapshot = snapshot or _snapshot_for(cwd)
     p = Path(path)
     stem = p.stem
     candidates = [
@@ -140,13 +161,20 @@ def _find_related_tests(path: str, cwd: Optional[str] = None) -> Optional[str]:
     ]
 
     for candidate in candidates:
-        content = read_file_content(str(candidate), cwd)
+        if not snapshot.exists(candidate.as_posix()):
+            continue
+        content = snapshot.read(candidate.as_posix())
         if content:
             return content
     return None
 
 
-def _find_related_context(path: str, cwd: Optional[str] = None) -> Optional[str]:
+def _find_related_context(
+    path: str,
+    cwd: Optional[str] = None,
+    snapshot: Optional[FileSnapshotManager] = None,
+) -> Optional[str]:
+    snapshot = snapshot or _snapshot_for(cwd)
     p = Path(path)
     candidates = [
         p.parent / "__init__.py",
@@ -157,9 +185,9 @@ def _find_related_context(path: str, cwd: Optional[str] = None) -> Optional[str]
     ]
 
     for candidate in candidates:
-        if candidate == p:
+        if candidate == p or not snapshot.exists(candidate.as_posix()):
             continue
-        content = read_file_content(str(candidate), cwd)
+        content = snapshot.read(candidate.as_posix())
         if content:
             return content[:3000]
     return None
@@ -169,6 +197,7 @@ def resolve_context_requests(
     requests: list[ContextRequest],
     cwd: Optional[str] = None,
     allow_file_reads: bool = True,
+    snapshot: Optional[FileSnapshotManager] = None,
 ) -> dict[str, str]:
     """
     Resolve extra context requests by reading sibling files.
@@ -178,14 +207,15 @@ def resolve_context_requests(
     """
     if not allow_file_reads:
         return {}
+    snapshot = snapshot or _snapshot_for(cwd)
 
     result: dict[str, str] = {}
     for req in requests:
         key = f"{req.type}:{req.for_path}"
         if req.type == ContextRequestType.RELATED_TESTS:
-            content = _find_related_tests(req.for_path, cwd)
+            content = _find_related_tests(req.for_path, cwd, snapshot)
         else:
-            content = _find_related_context(req.for_path, cwd)
+            content = _find_related_context(req.for_path, cwd, snapshot)
         if content:
             result[key] = content
     return result
@@ -201,6 +231,8 @@ def build_review_context_package(
     cwd: Optional[str] = None,
     diff_manager: Optional[DiffContextManager] = None,
     allow_file_reads: bool = True,
+    snapshot: Optional[FileSnapshotManager] = None,
+    allow_disk_reads: Optional[bool] = None,
 ) -> ReviewContextPackage:
     """
     Build the batched review context package for the AI prompt.
@@ -208,8 +240,19 @@ def build_review_context_package(
     When ``allow_file_reads`` is False, no file is read from ``cwd``: every file falls
     back to its diff hunks. Callers set this when the content on disk cannot be proven to
     be the PR's head revision — see ``resolve_file_read_access``.
+
+    ``allow_disk_reads`` (defaults to ``allow_file_reads``) separately controls the
+    worktree_reference fallback, where the AI CLI reads the file from ``cwd`` itself.
+    It must be False when ``snapshot`` reads the head commit's git objects rather than
+    a directory at that commit.
+
+    Files are read through ``snapshot`` (a snapshot of ``cwd`` when not given), so a
+    file needed by several read modes or requests is read once.
     """
     manager = diff_manager or get_or_create_diff_manager(diff)
+    snapshot = snapshot or _snapshot_for(cwd)
+    if allow_disk_reads is None:
+        allow_disk_reads = allow_file_reads
     applicable_ids = set(plan.review_axes)
     checklist_applicable = [item for item in checklist if item.id in applicable_ids] or checklist[:2]
 
@@ -221,7 +264,7 @@ def build_review_context_package(
         )
 
     related_files = resolve_context_requests(
-        plan.extra_context_requests[:1], cwd, allow_file_reads=allow_file_reads
+        plan.extra_context_requests[:1], cwd, allow_file_reads=allow_file_reads, snapshot=snapshot
     )
     comment_context = comment_context[: strategy.max_comment_entries]
     content_budget = get_prompt_budget_manager().content_budget(strategy)
@@ -233,7 +276,14 @@ def build_review_context_package(
 
     for file_plan in plan.focus_files:
         entry = _resolve_file_context(
-            file_plan, diff, strategy, cwd, manager, allow_file_reads=allow_file_reads
+            file_plan,
+            diff,
+            strategy,
+            cwd,
+            manager,
+            allow_file_reads=allow_file_reads,
+            snapshot=snapshot,
+            allow_disk_reads=allow_disk_reads,
         )
         entry_chars = entry.approximate_chars or get_prompt_budget_manager().estimate_entry_chars(entry)
         # A worktree_reference file forces the CLI to read it from disk itself, which is
@@ -290,8 +340,13 @@ def _resolve_file_context(
     cwd: Optional[str] = None,
     diff_manager: Optional[DiffContextManager] = None,
     allow_file_reads: bool = True,
+    snapshot: Optional[FileSnapshotManager] = None,
+    allow_disk_reads: Optional[bool] = None,
 ) -> FileContextEntry:
     manager = diff_manager or DiffContextManager.from_diff(diff)
+    snapshot = snapshot or _snapshot_for(cwd)
+    if allow_disk_reads is None:
+        allow_disk_reads = allow_file_reads
     desired_mode = file_plan.read_mode
     # The model anchors comments inside the hunks it can see; a header it never saw
     # is a region it cannot anchor to, so those comments end up on unpublishable
@@ -312,7 +367,7 @@ def _resolve_file_context(
         desired_mode = FileReadMode.HUNKS_ONLY
 
     if desired_mode == FileReadMode.FULL_FILE:
-        content = read_file_content(file_plan.path, cwd)
+        content = snapshot.read(file_plan.path)
         if content and len(content) <= file_limits["max_file_chars"] and len(content.splitlines()) <= file_limits["max_file_lines"]:
             resolved_entry = FileContextEntry(
                 path=file_plan.path,
@@ -325,7 +380,7 @@ def _resolve_file_context(
         desired_mode = FileReadMode.EXPANDED_HUNKS
 
     if desired_mode == FileReadMode.EXPANDED_HUNKS:
-        file_content = read_file_content(file_plan.path, cwd)
+        file_content = snapshot.read(file_plan.path)
         expanded = (
             manager.build_expanded_hunks(
                 file_plan.path,
@@ -350,11 +405,11 @@ def _resolve_file_context(
     if desired_mode == FileReadMode.HUNKS_ONLY:
         hunks = manager.get_hunk_texts(file_plan.path)
         hunks_chars = sum(len(hunk) for hunk in hunks)
-        if hunks and (hunks_chars <= file_limits["max_file_chars"] or not allow_file_reads):
+        if hunks and (hunks_chars <= file_limits["max_file_chars"] or not allow_disk_reads):
             # Over-budget hunks are still preferable to the worktree_reference fallback
-            # when reads are not allowed: that mode has the CLI open the file itself, which
-            # is the same wrong-revision read, just delegated. The batching loop keeps the
-            # prompt bounded via approximate_chars.
+            # when the disk is not at the PR head: that mode has the CLI open the file
+            # itself, which is the same wrong-revision read, just delegated. The batching
+            # loop keeps the prompt bounded via approximate_chars.
             resolved_entry = FileContextEntry(
                 path=file_plan.path,
                 read_mode=FileReadMode.HUNKS_ONLY,
@@ -364,9 +419,9 @@ def _resolve_file_context(
             )
             return _log_file_context(resolved_entry, file_plan.path)
 
-    if not allow_file_reads:
-        # No hunks and no trustworthy file to read: headers only, so the AI still knows
-        # the file changed but is never handed content from another revision.
+    if not allow_disk_reads:
+        # No hunks and no trustworthy file on disk: headers only, so the AI still knows
+        # the file changed but is never pointed at content from another revision.
         resolved_entry = FileContextEntry(
             path=file_plan.path,
             read_mode=FileReadMode.HUNKS_ONLY,
@@ -596,9 +596,21 @@ def dedupe_synthesis_findings(
     resolved/adjudicated branches are meaningless between two fresh findings.
 
     Non-dict items in either list are tolerated: raw AI output is untrusted.
+
+    Accepted findings are indexed by path and line window, so each candidate is
+    only compared with the findings near it; the result is the same as
+    comparing every pair.
     """
     from difflib import SequenceMatcher
 
+    from ..models.validators import TitleMatcher, line_bucket
+
+    def _line_number(line) -> int | None:
+        try:
+            return int(line)
+        except (TypeError, ValueError, OverflowError):
+            return None
+
     def _is_duplicate_pair(candidate: dict, item: dict) -> bool:
         if candidate.get("path") != item.get("path"):
             return False
@@ -612,25 +624,77 @@ def dedupe_synthesis_findings(
             return title_a == title_b
         if line_a is None or line_b is None:
             return False
-        try:
-            lines_close = abs(int(line_a) - int(line_b)) <= line_window
-        except (TypeError, ValueError):
+        number_a, number_b = _line_number(line_a), _line_number(line_b)
+        if number_a is None or number_b is None:
             return False
-        if not lines_close:
+        if abs(number_a - number_b) > line_window:
             return False
         if title_a == title_b:
             return True
         similarity = SequenceMatcher(None, title_a, title_b).ratio()
+        return similarity > _similarity_threshold(candidate, item)
+
+    def _similarity_threshold(candidate: dict, item: dict) -> float:
         category_a = str(candidate.get("category", "")).lower()
         category_b = str(item.get("category", "")).lower()
         if category_a and category_a == category_b:
             # Same defect class at the same spot: accept a looser wording match (a
             # restatement in different words), but still require the titles to be
             # talking about the same thing.
-            return similarity > same_category_similarity_threshold
-        return similarity > title_similarity_threshold
+            return same_category_similarity_threshold
+        return title_similarity_threshold
+
+    # Titles of line-less findings per path, findings with a line per
+    # (path, line bucket), and findings whose path cannot be a dict key (raw
+    # AI output) kept aside for the plain pairwise check.
+    titles_without_line: dict[Any, set[str]] = {}
+    by_line: dict[tuple[Any, int], list[tuple[int, dict, TitleMatcher]]] = {}
+    unindexable: list[dict] = []
+
+    def _add(item: dict) -> None:
+        path, line = item.get("path"), item.get("line")
+        try:
+            hash(path)
+        except TypeError:
+            unindexable.append(item)
+            return
+        title = str(item.get("title", "")).lower()
+        if line is None:
+            titles_without_line.setdefault(path, set()).add(title)
+            return
+        number = _line_number(line)
+        if number is not None:  # an unreadable line is never close to anything
+            by_line.setdefault((path, line_bucket(number, line_window)), []).append(
+                (number, item, TitleMatcher(title))
+            )
 
-    existing = [item for item in existing_raw if isinstance(item, dict)]
+    def _is_duplicate(candidate: dict) -> bool:
+        path, line = candidate.get("path"), candidate.get("line")
+        try:
+            hash(path)
+        except TypeError:
+            return any(_is_duplicate_pair(candidate, item) for item in unindexable)
+        title = str(candidate.get("title", "")).lower()
+        if line is None:
+            return title in titles_without_line.get(path, ())
+        number = _line_number(line)
+        if number is None:
+            return False
+        bucket = line_bucket(number, line_window)
+        for offset in (-1, 0, 1):
+            for other_number, item, matcher in by_line.get((path, bucket + offset), ()):
+                if abs(number - other_number) > line_window:
+                    continue
+                if title == matcher.title:
+                    return True
+                threshold = _similarity_threshold(candidate, item)
+                if matcher.similarity(title, threshold) > threshold:
+                    return True
+        return False
+
+    for item in existing_raw:
+        if isinstance(item, dict):
+            _add(item)
     unique: list = []
     for candidate in synthesis_raw:
         if not isinstance(candidate, dict):
@@ -639,9 +703,10 @@ def dedupe_synthesis_findings(
             continue
         # Compare against the per-file findings AND the synthesis items already
         # accepted — the synthesis list can repeat itself too.
-        if any(_is_duplicate_pair(candidate, item) for item in existing + unique):
+        if _is_duplicate(candidate):
             continue
         unique.append(candidate)
+        _add(candidate)
     return unique
 
 
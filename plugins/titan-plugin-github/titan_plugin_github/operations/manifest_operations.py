@@ -1,7 +1,6 @@
 """Operations for building cheap PR context and compact comments context."""
 
 import re
-from pathlib import Path
 from typing import Optional
 
 from ..models.review_enums import CommentContextKind
@@ -14,7 +13,7 @@ from ..models.review_models import (
 )
 from ..models.review_profile_models import ReviewProfile
 from ..models.view import UICommentThread, UIFileChange, UIPullRequest
-from .review_profile_operations import path_matches_any
+from .path_classifier_operations import classify_path
 
 
 _TEST_PATH_PATTERNS = [
@@ -60,9 +59,22 @@ _LOCKFILE_NAMES = {
     "pubspec.lock",
 }
 
-_TEST_REGEXES = [re.compile(p) for p in _TEST_PATH_PATTERNS]
-_DOC_REGEXES = [re.compile(p) for p in _DOC_PATH_PATTERNS]
-_GENERATED_REGEXES = [re.compile(p) for p in _GENERATED_PATH_PATTERNS]
+# One alternation per flag: a single search per path instead of one per pattern.
+_TEST_REGEX = re.compile("|".join(f"(?:{p})" for p in _TEST_PATH_PATTERNS))
+_DOC_REGEX = re.compile("|".join(f"(?:{p})" for p in _DOC_PATH_PATTERNS))
+_GENERATED_REGEX = re.compile("|".join(f"(?:{p})" for p in _GENERATED_PATH_PATTERNS))
+
+
+def _file_name(path: str) -> str:
+    return path.rstrip("/").rsplit("/", 1)[-1]
+
+
+def _suffix(name: str) -> str:
+    # Same rule as PurePath.suffix: a leading dot starts a name, not a suffix.
+    index = name.rfind(".")
+    if 0 < index < len(name) - 1:
+        return name[index:]
+    return ""
 
 
 def is_test_file(path: str, review_profile: Optional[ReviewProfile] = None) -> bool:
@@ -72,34 +84,34 @@ def is_test_file(path: str, review_profile: Optional[ReviewProfile] = None) -> b
     declares ``file_roles.tests`` knows better than they do. The union is intentional:
     the profile adds its conventions without having to restate the built-in ones.
     """
-    if any(rx.search(path) for rx in _TEST_REGEXES):
+    if _TEST_REGEX.search(path):
         return True
     if review_profile is None:
         return False
-    return path_matches_any(path, review_profile.file_roles.get("tests", []))
+    return "tests" in classify_path(path, review_profile).file_roles
 
 
 def is_docs_file(path: str) -> bool:
-    return any(rx.search(path) for rx in _DOC_REGEXES)
+    return _DOC_REGEX.search(path) is not None
 
 
 def is_generated_file(path: str) -> bool:
-    return any(rx.search(path) for rx in _GENERATED_REGEXES)
+    return _GENERATED_REGEX.search(path) is not None
 
 
 def is_config_file(path: str) -> bool:
-    p = Path(path)
-    name = p.name.lower()
+    name = _file_name(path)
+    lower_name = name.lower()
     return (
-        p.suffix.lower() in _CONFIG_SUFFIXES
-        or p.name.startswith(".")
-        or name.startswith(("dockerfile", "makefile", "podfile", "fastfile"))
-        or name.endswith((".gradle.kts", ".xcconfig"))
+        _suffix(lower_name) in _CONFIG_SUFFIXES
+        or name.startswith(".")
+        or lower_name.startswith(("dockerfile", "makefile", "podfile", "fastfile"))
+        or lower_name.endswith((".gradle.kts", ".xcconfig"))
     )
 
 
 def is_lockfile(path: str) -> bool:
-    return Path(path).name.lower() in _LOCKFILE_NAMES
+    return _file_name(path).lower() in _LOCKFILE_NAMES
 
 
 def is_rename_only(file_change: UIFileChange) -> bool:
@@ -122,6 +134,8 @@ def build_change_manifest(
     churn_by_path = churn_by_path or {}
     entries: list[ChangedFileEntry] = []
     for f in files:
+        # Classified once here; later steps read it back from the entry.
+        classification = classify_path(f.path, review_profile) if review_profile is not None else None
         additions, deletions = f.additions, f.deletions
         # A pure rename also reports 0/0, but that IS the real churn — and the
         # numstat source uses --no-renames, which would report the new path as a
@@ -141,6 +155,7 @@ def build_change_manifest(
                 is_config=is_config_file(f.path),
                 is_lockfile=is_lockfile(f.path),
                 is_rename_only=is_rename_only(f),
+                classification=classification,
             )
         )
 
@@ -0,0 +1,189 @@
+"""Compiled path matching for review profile rules.
+
+A review profile is over a hundred globs spread over change patterns, file
+roles, scoring rules and review axes, and every deterministic review step asks
+about every changed file. Matching them one ``fnmatch`` at a time costs a full
+backtracking match per pattern per file per step.
+
+The classifier compiles a profile once: each distinct glob gets its regex and
+its longest literal fragment (``/core/`` for ``**/core/**``, ``.kt`` for
+``**/*.kt``). Globs are indexed by fragment, so classifying a path is one
+substring test per distinct fragment, and only globs whose fragment occurs in
+the path pay for a regex match. Every rule a path hits comes out of that one
+pass, and the answer is cached per path.
+
+Globs keep ``fnmatch`` semantics (``*`` also crosses ``/``) and are matched
+case-insensitively against the ``/``-normalized path, exactly as
+``path_matches_any`` always did.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from fnmatch import translate
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from ..models.review_models import PathClassification
+from ..models.review_profile_models import CandidateScoringRule, ReviewProfile
+
+_PATH_CACHE_SIZE = 8192
+_WILDCARDS = re.compile(r"[*?]")
+_PROFILE_CACHE_SIZE = 8
+
+
+def normalize_path(path: str) -> str:
+    """Normalize a path for glob matching: forward slashes, lowercase."""
+    return path.replace("\\", "/").lower()
+
+
+@lru_cache(maxsize=1024)
+def compile_globs(patterns: tuple[str, ...]) -> Optional[re.Pattern]:
+    """Compile globs into one regex that matches a normalized path if any glob does."""
+    unique = list(dict.fromkeys(pattern.lower() for pattern in patterns))
+    if not unique:
+        return None
+    return re.compile("|".join(f"(?:{translate(pattern)})" for pattern in unique))
+
+
+def glob_matches_any(path: str, patterns: Iterable[str]) -> bool:
+    """Return True when path matches any glob pattern."""
+    regex = compile_globs(tuple(patterns))
+    return regex is not None and regex.match(normalize_path(path)) is not None
+
+
+def _literal_fragment(pattern: str) -> str:
+    """Longest wildcard-free run of a glob: any path it matches contains it.
+
+    Only the part before the first ``[`` is considered; bracket expressions
+    have edge cases (``[]]``, ``[!]]``) not worth parsing for a prefilter.
+    """
+    return max(_WILDCARDS.split(pattern.split("[", 1)[0]), key=len)
+
+
+class PathClassifier:
+    """Every glob of a review profile compiled for a single pass over a path.
+
+    Results are cached per path, so asking again in a later step is a dict
+    lookup. A classifier describes the profile as it was when compiled; build
+    a new one (``get_path_classifier`` does) for a different profile.
+    """
+
+    def __init__(self, review_profile: ReviewProfile):
+        self._group_of: dict[str, int] = {}
+
+        def groups(patterns: list[str]) -> tuple[int, ...]:
+            indices = []
+            for pattern in patterns:
+                key = pattern.lower()
+                if key not in self._group_of:
+                    self._group_of[key] = len(self._group_of)
+                indices.append(self._group_of[key])
+            return tuple(dict.fromkeys(indices))
+
+        self._change_patterns = [
+            (name, groups(patterns)) for name, patterns in review_profile.change_patterns.items()
+        ]
+        self._file_roles = [
+            (role, groups(patterns)) for role, patterns in review_profile.file_roles.items()
+        ]
+        self._scoring_rules = [
+            (rule, groups(rule.patterns)) for rule in review_profile.candidate_scoring
+        ]
+        self._review_axes = [
+            (axis, groups(rule.patterns)) for axis, rule in review_profile.review_axes.items()
+        ]
+
+        globs = sorted(self._group_of, key=self._group_of.__getitem__)
+        self._regexes = [re.compile(translate(pattern)) for pattern in globs]
+        by_fragment: dict[str, list[int]] = {}
+        for index, pattern in enumerate(globs):
+            by_fragment.setdefault(_literal_fragment(pattern), []).append(index)
+        # "" is in every path, so globs without a literal are always tried.
+        self._by_fragment = list(by_fragment.items())
+        self._cache: OrderedDict[str, tuple[PathClassification, tuple[CandidateScoringRule, ...]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def classify(self, path: str) -> PathClassification:
+        """Every change pattern, file role, scoring rule and review axis matching ``path``."""
+        return self._lookup(path)[0]
+
+    def scoring_rules(self, path: str) -> list[CandidateScoringRule]:
+        """Scoring rules matching ``path``, in profile order."""
+        return list(self._lookup(path)[1])
+
+    def _lookup(self, path: str) -> tuple[PathClassification, tuple[CandidateScoringRule, ...]]:
+        normalized = normalize_path(path)
+        cached = self._cache.get(normalized)
+        if cached is not None:
+            return cached
+
+        hits = {
+            index
+            for fragment, indices in self._by_fragment
+            if fragment in normalized
+            for index in indices
+            if self._regexes[index].match(normalized)
+        }
+
+        def matched(indices: tuple[int, ...]) -> bool:
+            return any(index in hits for index in indices)
+
+        rules = tuple(rule for rule, indices in self._scoring_rules if matched(indices))
+        result = (
+            PathClassification(
+                change_patterns=[name for name, indices in self._change_patterns if matched(indices)],
+                file_roles=[role for role, indices in self._file_roles if matched(indices)],
+                scoring_rules=[rule.name for rule in rules],
+                review_axes=[axis for axis, indices in self._review_axes if matched(indices)],
+            ),
+            rules,
+        )
+        with self._lock:
+            if len(self._cache) >= _PATH_CACHE_SIZE:
+                self._cache.popitem(last=False)
+            self._cache[normalized] = result
+        return result
+
+
+_classifiers: OrderedDict[int, tuple[ReviewProfile, PathClassifier]] = OrderedDict()
+_classifiers_lock = threading.Lock()
+
+
+def get_path_classifier(review_profile: ReviewProfile) -> PathClassifier:
+    """Return the compiled classifier for a profile, compiling it on first use.
+
+    Keyed by object identity: profiles are frozen, and the review profile
+    manager hands out one shared instance per unchanged profile file, so the
+    classifier is compiled once per process (a copy compiles afresh).
+    """
+    key = id(review_profile)
+    with _classifiers_lock:
+        entry = _classifiers.get(key)
+        if entry is not None and entry[0] is review_profile:
+            _classifiers.move_to_end(key)
+            return entry[1]
+
+    classifier = PathClassifier(review_profile)
+    with _classifiers_lock:
+        _classifiers[key] = (review_profile, classifier)
+        if len(_classifiers) > _PROFILE_CACHE_SIZE:
+            _classifiers.popitem(last=False)
+    return classifier
+
+
+def classify_path(path: str, review_profile: ReviewProfile) -> PathClassification:
+    """Classify a path against every rule of a review profile in one pass."""
+    return get_path_classifier(review_profile).classify(path)
+
+
+__all__ = [
+    "PathClassifier",
+    "classify_path",
+    "compile_globs",
+    "get_path_classifier",
+    "glob_matches_any",
+    "normalize_path",
+]
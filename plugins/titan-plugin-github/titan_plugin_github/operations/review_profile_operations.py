@@ -1,19 +1,31 @@
 """Pure operations for applying review profile configuration."""
 
-from fnmatch import fnmatch
+from typing import Optional
 
 from ..models.review_enums import ChecklistCategory
-from ..models.review_models import ReviewChecklistItem, ScoredReviewCandidate
+from ..models.review_models import PathClassification, ReviewChecklistItem, ScoredReviewCandidate
 from ..models.review_profile_models import CandidateScoringRule, ReviewProfile
+from .path_classifier_operations import (
+    classify_path,
+    compile_globs,
+    get_path_classifier,
+    glob_matches_any,
+    normalize_path,
+)
 
 
-def match_change_patterns(path: str, review_profile: ReviewProfile) -> list[str]:
-    """Return all matching change pattern names for a path."""
-    matches: list[str] = []
-    for name, patterns in review_profile.change_patterns.items():
-        if path_matches_any(path, patterns):
-            matches.append(name)
-    return matches
+def match_change_patterns(
+    path: str,
+    review_profile: ReviewProfile,
+    classification: Optional[PathClassification] = None,
+) -> list[str]:
+    """Return all matching change pattern names for a path.
+
+    ``classification`` is the path's stored manifest classification, when the
+    caller has one; otherwise the path is classified against the profile.
+    """
+    classification = classification or classify_path(path, review_profile)
+    return list(classification.change_patterns)
 
 
 def classify_file_role(
@@ -24,6 +36,7 @@ def classify_file_role(
     is_docs: bool = False,
     is_generated: bool = False,
     is_config: bool = False,
+    classification: Optional[PathClassification] = None,
 ) -> str:
     """Classify a file into a functional role using manifest flags first."""
     if is_docs or is_generated:
@@ -33,23 +46,25 @@ def classify_file_role(
     if is_config:
         return "config_or_contracts"
 
-    for role, patterns in review_profile.file_roles.items():
-        if path_matches_any(path, patterns):
-            return role
-    return "other"
+    classification = classification or classify_path(path, review_profile)
+    return classification.file_roles[0] if classification.file_roles else "other"
 
 
 def matching_scoring_rules(path: str, review_profile: ReviewProfile) -> list[CandidateScoringRule]:
     """Return all configured scoring rules that match a path."""
-    return [rule for rule in review_profile.candidate_scoring if path_matches_any(path, rule.patterns)]
+    return get_path_classifier(review_profile).scoring_rules(path)
 
 
-def is_reviewable_documentation(path: str, review_profile: ReviewProfile) -> bool:
+def is_reviewable_documentation(
+    path: str,
+    review_profile: ReviewProfile,
+    classification: Optional[PathClassification] = None,
+) -> bool:
     """Return True when a documentation-like path should still be reviewed."""
-    documentation_rule = review_profile.review_axes.get(ChecklistCategory.DOCUMENTATION)
-    if not documentation_rule:
+    if ChecklistCategory.DOCUMENTATION not in review_profile.review_axes:
         return False
-    return path_matches_any(path, documentation_rule.patterns)
+    classification = classification or classify_path(path, review_profile)
+    return ChecklistCategory.DOCUMENTATION in classification.review_axes
 
 
 def select_review_axes(
@@ -64,7 +79,7 @@ def select_review_axes(
             ChecklistCategory.ERROR_HANDLING,
         ]
 
-    candidate_paths = [candidate.path for candidate in focus_candidates]
+    candidate_paths = [normalize_path(candidate.path) for candidate in focus_candidates]
     selected: list[ChecklistCategory] = []
 
     for item in checklist:
@@ -77,7 +92,8 @@ def select_review_axes(
         if axis_rule:
             patterns.extend(axis_rule.patterns)
 
-        if patterns and any(path_matches_any(path, patterns) for path in candidate_paths):
+        regex = compile_globs(tuple(patterns))
+        if regex is not None and any(regex.match(path) for path in candidate_paths):
             selected.append(item.id)
 
     if not selected:
@@ -87,5 +103,4 @@ def select_review_axes(
 
 def path_matches_any(path: str, patterns: list[str]) -> bool:
     """Return True when path matches any glob pattern."""
-    normalized_path = path.replace("\\", "/").lower()
-    return any(fnmatch(normalized_path, pattern.lower()) for pattern in patterns)
+    return glob_matches_any(path, patterns)
@@ -38,12 +38,16 @@ def classify_pr(
     total_lines = manifest.total_additions + manifest.total_deletions
     files_changed = len(manifest.files)
     repeated_callsite_files = sum(
-        1 for f in manifest.files if "repeated_callsite" in match_change_patterns(f.path, review_profile)
+        1
+        for f in manifest.files
+        if "repeated_callsite" in match_change_patterns(f.path, review_profile, f.classification)
     )
     high_signal_files = sum(
         1
         for f in manifest.files
-        if {"central_behavior", "entrypoint"}.intersection(match_change_patterns(f.path, review_profile))
+        if {"central_behavior", "entrypoint"}.intersection(
+            match_change_patterns(f.path, review_profile, f.classification)
+        )
     )
     repetition_ratio = (repeated_callsite_files / files_changed) if files_changed else 0.0
     roles = sorted(
@@ -55,6 +59,7 @@ def classify_pr(
                 is_docs=f.is_docs,
                 is_generated=f.is_generated,
                 is_config=f.is_config,
+                classification=f.classification,
             )
             for f in manifest.files
         }
@@ -213,7 +218,9 @@ def score_review_candidates(
         if entry.is_generated:
             excluded.append(ExcludedFileEntry(path=entry.path, reason=ExclusionReason.GENERATED))
             continue
-        if entry.is_docs and not is_reviewable_documentation(entry.path, review_profile):
+        if entry.is_docs and not is_reviewable_documentation(
+            entry.path, review_profile, entry.classification
+        ):
             excluded.append(ExcludedFileEntry(path=entry.path, reason=ExclusionReason.DOCS))
             continue
 
@@ -414,7 +421,8 @@ def _detect_repeated_callsite_paths(
     repeated: set[str] = set()
     callsite_like = [
         entry for entry in manifest.files
-        if "repeated_callsite" in match_change_patterns(entry.path, review_profile) and entry.total_changes <= 20
+        if "repeated_callsite" in match_change_patterns(entry.path, review_profile, entry.classification)
+        and entry.total_changes <= 20
     ]
     if len(callsite_like) < 4:
         return repeated
@@ -5,9 +5,18 @@ Pure business logic for git worktree operations.
 These functions wrap git worktree commands without UI dependencies.
 """
 
+import json
 import os
+import posixpath
 import shutil
-from typing import Tuple
+import time
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional, Tuple
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
 from titan_cli.core.result import ClientSuccess, ClientError
 
 
@@ -67,6 +76,288 @@ def setup_worktree(
         return ("", False)
 
 
+REVIEW_POOL_INDEX = "pool.json"
+REVIEW_POOL_LOCK = "pool.lock"
+REVIEW_POOL_PREFIX = "titan-review-pool"
+DEFAULT_POOL_SIZE = 3
+DEFAULT_POOL_DISK_BUDGET_BYTES = 2 * 1024**3
+
+
+def review_sparse_dirs(changed_paths: Iterable[str]) -> list[str]:
+    """
+    Directories a review needs checked out for the given changed files.
+
+    Each changed file's directory, plus the places related-file lookups probe:
+    the sibling ``tests`` directory and the top-level ``tests`` tree mirroring
+    the file's directory. Top-level files are always present in cone mode.
+    """
+    dirs = {"tests"}
+    for path in changed_paths:
+        parent = posixpath.dirname(path.replace("\\", "/"))
+        if not parent:
+            continue
+        dirs.add(parent)
+        dirs.add(f"{parent}/tests")
+        dirs.add(f"tests/{parent}")
+    return sorted(dirs)
+
+
+def acquire_review_worktree(
+    git_client,
+    pr_number: int,
+    sparse_dirs: Optional[list[str]] = None,
+    base_path: str = ".titan/worktrees",
+    remote: str = "origin",
+    pool_size: int = DEFAULT_POOL_SIZE,
+) -> Tuple[str, bool]:
+    """
+    Point a pooled review worktree at a PR's head, creating one only when needed.
+
+    Worktrees in the pool persist between reviews. Re-pointing one is a
+    ``git checkout --detach``, which only rewrites the files that differ,
+    instead of a full checkout per review. With ``sparse_dirs`` the worktree
+    is restricted (cone mode) to those directories plus top-level files;
+    without it the whole tree is checked out. Fetching uses the repository's
+    own settings, so a partial clone keeps its blob filter.
+
+    The slot used is, in order: the one that last held this PR, a new slot
+    while the pool has room, or the least recently used idle slot. Slots held
+    by another live titan process are never taken; the pool lock is held from
+    choosing the slot until it is recorded in the index, so two processes
+    starting a review at once never claim the same one.
+
+    Args:
+        git_client: Git client instance
+        pr_number: PR number
+        sparse_dirs: Directories to check out, or None for the full tree
+        base_path: Base directory for worktrees
+        remote: Remote name (default: "origin")
+        pool_size: Maximum number of pooled worktrees
+
+    Returns:
+        Tuple of (absolute_path, ready)
+    """
+    try:
+        review_ref = f"refs/titan/review/pr-{pr_number}"
+        fetch_result = git_client.fetch_refspec(remote, f"pull/{pr_number}/head:{review_ref}")
+        match fetch_result:
+            case ClientSuccess():
+                pass
+            case ClientError():
+                return ("", False)
+
+        repo_root = os.getcwd()
+        with _pool_lock(base_path):
+            index = _load_pool_index(base_path)
+            name = _choose_pool_slot(index, pr_number, pool_size)
+            index[name] = {"pr": pr_number, "pid": os.getpid(), "last_used": time.time(),
+                           "size": index.get(name, {}).get("size", 0)}
+            _save_pool_index(base_path, index)
+        worktree_path = f"{base_path}/{name}"
+        full_worktree_path = os.path.join(repo_root, worktree_path)
+
+        if not _is_live_worktree(git_client, full_worktree_path):
+            clear_stale_worktree(git_client, worktree_path, full_worktree_path)
+            if not _git_ok(git_client, repo_root, "worktree", "add", "--no-checkout", "--detach",
+                           worktree_path, review_ref):
+                _forget_pool_slot(base_path, name)
+                return ("", False)
+
+        if sparse_dirs:
+            configured = _git_ok(git_client, full_worktree_path, "sparse-checkout", "set", "--cone",
+                                 *sparse_dirs)
+        else:
+            configured = _git_ok(git_client, full_worktree_path, "sparse-checkout", "disable")
+        # --force: a previous review never edits files, but a crashed tool might have.
+        if configured and _git_ok(git_client, full_worktree_path, "checkout", "--force", "--detach",
+                                  review_ref):
+            return (full_worktree_path, True)
+
+        clear_stale_worktree(git_client, worktree_path, full_worktree_path)
+        _forget_pool_slot(base_path, name)
+        return ("", False)
+
+    except Exception:
+        return ("", False)
+
+
+def release_review_worktree(
+    git_client,
+    worktree_path: str,
+    base_path: str = ".titan/worktrees",
+    disk_budget_bytes: int = DEFAULT_POOL_DISK_BUDGET_BYTES,
+) -> bool:
+    """
+    Return a pooled worktree to the pool and evict idle ones over the disk budget.
+
+    The released worktree stays on disk for the next review. Idle worktrees are
+    then removed, least recently used first, while the pool's total size exceeds
+    ``disk_budget_bytes``; the one just released goes last.
+
+    Returns:
+        True if the worktree was returned to the pool
+    """
+    try:
+        name = os.path.basename(os.path.normpath(worktree_path))
+        size = _directory_size(worktree_path)
+        with _pool_lock(base_path):
+            index = _load_pool_index(base_path)
+            if name not in index:
+                return False
+            index[name].update(pid=None, last_used=time.time(), size=size)
+            _save_pool_index(base_path, index)
+        evict_review_worktrees(git_client, base_path, disk_budget_bytes)
+        return True
+    except Exception:
+        return False
+
+
+def evict_review_worktrees(
+    git_client,
+    base_path: str = ".titan/worktrees",
+    disk_budget_bytes: int = DEFAULT_POOL_DISK_BUDGET_BYTES,
+) -> list[str]:
+    """
+    Remove idle pooled worktrees, least recently used first, until within budget.
+
+    Runs under the pool lock, so a slot is never removed while another process
+    is claiming it.
+
+    Returns:
+        Names of the evicted worktrees
+    """
+    with _pool_lock(base_path):
+        index = _load_pool_index(base_path)
+        total = sum(slot.get("size", 0) for slot in index.values())
+        evicted = []
+        for name, slot in sorted(index.items(), key=lambda item: item[1].get("last_used", 0)):
+            if total <= disk_budget_bytes:
+                break
+            if _slot_in_use(slot):
+                continue
+            worktree_path = f"{base_path}/{name}"
+            clear_stale_worktree(git_client, worktree_path, os.path.join(os.getcwd(), worktree_path))
+            total -= slot.get("size", 0)
+            evicted.append(name)
+        for name in evicted:
+            index.pop(name, None)
+        if evicted:
+            _save_pool_index(base_path, index)
+    return evicted
+
+
+def disable_sparse_checkout(git_client, worktree_path: str) -> bool:
+    """
+    Check out the whole tree in a sparse review worktree.
+
+    Needed once the AI CLI is told to read files from the worktree itself
+    (worktree_reference): its cross-file lookups can reach any directory,
+    and in a sparse worktree those files are simply missing.
+
+    Returns:
+        True if the worktree now has the full tree checked out
+    """
+    return _git_ok(git_client, worktree_path, "sparse-checkout", "disable")
+
+
+def _choose_pool_slot(index: dict, pr_number: int, pool_size: int) -> str:
+    idle = {name: slot for name, slot in index.items() if not _slot_in_use(slot)}
+    for name, slot in idle.items():
+        if slot.get("pr") == pr_number:
+            return name
+    if len(index) < pool_size or not idle:
+        taken = set(index)
+        return next(
+            f"{REVIEW_POOL_PREFIX}-{number}"
+            for number in range(1, len(taken) + 2)
+            if f"{REVIEW_POOL_PREFIX}-{number}" not in taken
+        )
+    return min(idle, key=lambda name: idle[name].get("last_used", 0))
+
+
+def _slot_in_use(slot: dict) -> bool:
+    pid = slot.get("pid")
+    if not pid or pid == os.getpid():
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def _is_live_worktree(git_client, full_worktree_path: str) -> bool:
+    if not os.path.isfile(os.path.join(full_worktree_path, ".git")):
+        return False
+    return _git_ok(git_client, full_worktree_path, "rev-parse", "--is-inside-work-tree")
+
+
+def _git_ok(git_client, cwd: str, *args: str) -> bool:
+    match git_client.run_in_worktree(cwd, ["git", *args]):
+        case ClientSuccess():
+            return True
+        case _:
+            return False
+
+
+@contextmanager
+def _pool_lock(base_path: str) -> Iterator[None]:
+    """Hold an exclusive, cross-process lock on the pool index."""
+    os.makedirs(base_path, exist_ok=True)
+    with open(os.path.join(base_path, REVIEW_POOL_LOCK), "a+b") as handle:
+        if os.name == "nt":
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if os.name == "nt":
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _load_pool_index(base_path: str) -> dict:
+    try:
+        with open(os.path.join(base_path, REVIEW_POOL_INDEX), encoding="utf-8") as handle:
+            data = json.load(handle)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_pool_index(base_path: str, index: dict) -> None:
+    os.makedirs(base_path, exist_ok=True)
+    path = os.path.join(base_path, REVIEW_POOL_INDEX)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as handle:
+        json.dump(index, handle, indent=2, sort_keys=True)
+    os.replace(temp_path, path)
+
+
+def _forget_pool_slot(base_path: str, name: str) -> None:
+    with _pool_lock(base_path):
+        index = _load_pool_index(base_path)
+        if index.pop(name, None) is not None:
+            _save_pool_index(base_path, index)
+
+
+def _directory_size(path: str) -> int:
+    total = 0
+    for root, dirs, files in os.walk(path):
+        for file_name in files:
+            try:
+                total += os.lstat(os.path.join(root, file_name)).st_size
+            except OSError:
+                pass
+    return total
+
+
 def clear_stale_worktree(
     git_client,
     worktree_path: str,
@@ -4,6 +4,7 @@ Steps for AI-powered PR code review.
 This module contains steps for reviewing pull requests authored by others using
 AI analysis combined with project-specific skill guidelines.
 """
+import contextvars
 import re
 import threading
 import time
@@ -1708,9 +1709,9 @@ def _get_review_profile(ctx: WorkflowContext) -> ReviewProfile:
         return review_profile
     if ctx.github_managers:
         return ctx.github_managers.review_profile.get_effective_profile()
-    from ..review_profiles import DEFAULT_REVIEW_PROFILE
+    from ..managers import ReviewProfileManager
 
-    return DEFAULT_REVIEW_PROFILE.model_copy(deep=True)
+    return ReviewProfileManager().get_effective_profile()
 
 
 def _render_pr_classification(ctx: WorkflowContext, classification: PRClassification) -> None:
@@ -1875,7 +1876,7 @@ def _retry_timed_out_worktree_batch(ctx: WorkflowContext, batch, run, strategy)
     if not fallback:
         return None
     prompt = build_findings_prompt_parts(fallback)["prompt"]
-    if strategy and len(prompt) > strategy.max_prompt_chars:
+    if strategy and not get_prompt_budget_manager().prompt_fits(prompt, strategy.max_prompt_chars):
         return None
 
     ctx.textual.dim_text(
@@ -1911,19 +1912,54 @@ def _render_findings_batch_result(
     ctx.textual.warning_text(message)
 
 
-def _attach_content_provider(diff_manager, root: Optional[str]) -> None:
+def _attach_content_provider(diff_manager, snapshot) -> None:
     """
-    Give the diff manager a way to read whole files from ``root``.
+    Give the diff manager a way to read whole files through the review's snapshot.
 
-    Only call this with a root already verified to hold the PR's head revision — the
-    provider is trusted to return the code the diff describes.
+    Only call this with a snapshot already verified to hold the PR's head revision —
+    the provider is trusted to return the code the diff describes.
     """
-    if diff_manager is None or not root:
+    if diff_manager is None or snapshot is None:
         return
 
-    from ..operations.context_resolution_operations import read_file_content
+    diff_manager.attach_content_provider(snapshot.read, cache=False)
 
-    diff_manager.attach_content_provider(lambda path: read_file_content(path, root))
+
+def _get_file_snapshot(ctx: WorkflowContext, read_access, project_root: Optional[str]):
+    """
+    Return the review's file snapshot and the read access it provides.
+
+    A verified worktree or checkout is read directly. Without one, the PR head commit is
+    read from the local git objects when they are available, which is exactly the
+    reviewed revision without needing any checkout. The snapshot is kept in ctx so every
+    later step reads through the same one.
+    """
+    from ..managers.file_snapshot_manager import FileSnapshotManager
+    from ..operations.context_resolution_operations import FileReadAccess
+
+    head_sha = ctx.data.get("review_commit_sha")
+    if read_access.allowed:
+        if not project_root:
+            return None, read_access
+        key = ("directory", str(project_root))
+    elif head_sha and ctx.git:
+        key = ("revision", head_sha)
+    else:
+        return None, read_access
+
+    snapshot = ctx.data.get("review_file_snapshot")
+    if snapshot is None or snapshot.key != key:
+        if key[0] == "directory":
+            snapshot = FileSnapshotManager.for_directory(project_root)
+        else:
+            snapshot = FileSnapshotManager.for_revision(ctx.git.repo_path, head_sha)
+            if snapshot is None:
+                return None, read_access
+        ctx.data["review_file_snapshot"] = snapshot
+
+    if key[0] == "revision":
+        read_access = FileReadAccess(True, "revision", f"git objects at PR head {head_sha[:8]}")
+    return snapshot, read_access
 
 
 def _resolve_file_read_access(ctx: WorkflowContext, worktree_path: Optional[str]):
@@ -1978,9 +2014,11 @@ def resolve_review_context(ctx: WorkflowContext) -> WorkflowResult:
     For each file in the plan, extracts code using the chosen read_mode:
     - hunks_only: diff hunks as-is (already has 20 lines of context)
     - expanded_hunks: hunks + extra surrounding lines from the actual file
-    - full_file: reads the complete file from disk
+    - full_file: reads the complete file at the PR head
 
     Also resolves any extra context requests (related_tests, related_context).
+    Files come from the PR worktree, a checkout verified at the PR head, or the
+    head commit's git objects, all through one snapshot shared with later steps.
 
     Requires (from ctx.data):
         validated_review_plan (ReviewPlan)
@@ -1991,6 +2029,9 @@ def resolve_review_context(ctx: WorkflowContext) -> WorkflowResult:
 
     Outputs (saved to ctx.data):
         review_context_package (ReviewContextPackage)
+        review_file_snapshot (FileSnapshotManager): Files at the PR head, when readable
+        review_file_reads_allowed (bool): Whether file content at the PR head is readable
+        review_disk_reads_allowed (bool): Whether the AI CLI may read files from disk
 
     Returns:
         Success or Error
@@ -2023,11 +2064,12 @@ def resolve_review_context(ctx: WorkflowContext) -> WorkflowResult:
     diff_manager = ctx.get("review_diff_manager")
 
     read_access = _resolve_file_read_access(ctx, worktree_path)
+    snapshot, read_access = _get_file_snapshot(ctx, read_access, project_root)
     if read_access.allowed:
         ctx.textual.dim_text(f"Reading files from {read_access.source} ({read_access.reason})")
-        # Same verified root powers the comment-rendering path, so a finding about
+        # Same snapshot powers the comment-rendering path, so a finding about
         # pre-existing code can show that code instead of nothing.
-        _attach_content_provider(diff_manager, project_root)
+        _attach_content_provider(diff_manager, snapshot)
     else:
         ctx.textual.warning_text(
             f"Reviewing from the diff only — {read_access.reason}. "
@@ -2046,8 +2088,11 @@ def resolve_review_context(ctx: WorkflowContext) -> WorkflowResult:
                 cwd=project_root,
                 diff_manager=diff_manager,
                 allow_file_reads=read_access.allowed,
+                snapshot=snapshot,
+                allow_disk_reads=read_access.disk_reads_allowed,
             )
     except Exception as e:
+        _close_file_snapshot(ctx)
         ctx.textual.error_text(f"Failed to resolve review context: {e}")
         ctx.textual.end_step("error")
         return Error(f"Failed to resolve review context: {e}")
@@ -2055,6 +2100,7 @@ def resolve_review_context(ctx: WorkflowContext) -> WorkflowResult:
     ctx.data["review_context_package"] = package
     ctx.data["review_context_batches"] = package.batches
     ctx.data["review_file_reads_allowed"] = read_access.allowed
+    ctx.data["review_disk_reads_allowed"] = read_access.disk_reads_allowed
 
     batch_count = len(package.batches)
     files_count = sum(len(batch.files_context) for batch in package.batches)
@@ -2076,6 +2122,7 @@ def resolve_review_context(ctx: WorkflowContext) -> WorkflowResult:
             "review_context_package": package,
             "review_context_batches": package.batches,
             "review_file_reads_allowed": read_access.allowed,
+            "review_disk_reads_allowed": read_access.disk_reads_allowed,
         },
     )
 
@@ -2304,7 +2351,7 @@ def ai_review_findings(ctx: WorkflowContext) -> WorkflowResult:
             batch,
             prompt_parts,
             strategy.max_prompt_chars,
-            allow_file_reads=ctx.data.get("review_file_reads_allowed", True),
+            allow_file_reads=ctx.data.get("review_disk_reads_allowed", True),
         )
         if changed:
             logger.debug(
@@ -2343,17 +2390,19 @@ def ai_review_findings(ctx: WorkflowContext) -> WorkflowResult:
             strategy=str(strategy.strategy) if strategy else None,
             prompt_budget_target_chars=strategy.max_prompt_chars,
             prompt_actual_chars=len(prompt),
+            prompt_actual_tokens=get_prompt_budget_manager().count_tokens(prompt),
             prompt_still_too_large=batch.prompt_still_too_large,
             degraded_context=batch.degraded_context,
             **prompt_breakdown,
         )
-        if len(prompt) > strategy.max_prompt_chars:
+        if not get_prompt_budget_manager().prompt_fits(prompt, strategy.max_prompt_chars):
             findings_failed = True
             logger.error(
                 "findings_batch_over_budget",
                 batch_id=batch.batch_id,
                 prompt_budget_target_chars=strategy.max_prompt_chars,
                 prompt_actual_chars=len(prompt),
+                prompt_actual_tokens=get_prompt_budget_manager().count_tokens(prompt),
             )
             skipped_paths = ", ".join(sorted(batch.files_context)) or "unknown files"
             ctx.textual.warning_text(
@@ -2375,6 +2424,8 @@ def ai_review_findings(ctx: WorkflowContext) -> WorkflowResult:
         _render_findings_batch_started(ctx, batch)
         ready.append((batch, prompt, effort))
 
+    _ensure_full_worktree(ctx, [entry[0] for entry in ready])
+
     # Phase 2 — execute ready batches through a small worker pool. Adapter calls are
     # independent subprocesses, so the only sequential cost was the loop itself
     # (real baseline: 307s wall for 6 batches, PR #3596). Workers never touch the UI;
@@ -2412,7 +2463,10 @@ def ai_review_findings(ctx: WorkflowContext) -> WorkflowResult:
                 from concurrent.futures import ThreadPoolExecutor, as_completed
 
                 with ThreadPoolExecutor(max_workers=pool_size) as executor:
-                    future_to_batch = {executor.submit(_run, entry): entry[0] for entry in ready}
+                    future_to_batch = {
+                        executor.submit(contextvars.copy_context().run, _run, entry): entry[0]
+                        for entry in ready
+                    }
                     outcomes = [
                         (future_to_batch[future], future.result())
                         for future in as_completed(future_to_batch)
@@ -2492,10 +2546,11 @@ def ai_review_findings(ctx: WorkflowContext) -> WorkflowResult:
         )
         if rescue_batch:
             rescue_prompt = build_findings_prompt_parts(rescue_batch)["prompt"]
-            if len(rescue_prompt) > strategy.max_prompt_chars:
+            if not get_prompt_budget_manager().prompt_fits(rescue_prompt, strategy.max_prompt_chars):
                 logger.debug(
                     "rescue_batch_over_budget",
                     prompt_actual_chars=len(rescue_prompt),
+                    prompt_actual_tokens=get_prompt_budget_manager().count_tokens(rescue_prompt),
                     prompt_budget_target_chars=strategy.max_prompt_chars,
                 )
                 ctx.textual.dim_text(
@@ -2585,12 +2640,13 @@ def ai_review_findings(ctx: WorkflowContext) -> WorkflowResult:
             synthesis_prompt = build_findings_prompt_parts(
                 synthesis_batch, instructions_override=SYNTHESIS_INSTRUCTIONS
             )["prompt"]
-            if len(synthesis_prompt) > strategy.max_prompt_chars:
+            if not get_prompt_budget_manager().prompt_fits(synthesis_prompt, strategy.max_prompt_chars):
                 # No split/degrade machinery for this batch: the whole point is seeing
                 # every hunk together, so a partial synthesis is not worth the spend.
                 logger.debug(
                     "synthesis_batch_over_budget",
                     prompt_actual_chars=len(synthesis_prompt),
+                    prompt_actual_tokens=get_prompt_budget_manager().count_tokens(synthesis_prompt),
                     prompt_budget_target_chars=strategy.max_prompt_chars,
                 )
                 ctx.textual.dim_text("Cross-file synthesis skipped (combined hunks over budget).")
@@ -2735,10 +2791,11 @@ def dedupe_findings(ctx: WorkflowContext) -> WorkflowResult:
     """
     Remove findings that duplicate existing PR comments.
 
-    Uses the is_duplicate() validator to compare each finding against the
+    Applies the is_duplicate() rules to each finding against the
     existing_comments_index. A finding is a duplicate if it targets the same
     file, the same area (within 5 lines), and the same topic (same category
-    or similar title).
+    or similar title). Comments are indexed by path and line window, so each
+    finding is only compared with the comments near it.
 
     Requires (from ctx.data):
         normalized_findings (List[Finding])
@@ -2763,22 +2820,23 @@ def dedupe_findings(ctx: WorkflowContext) -> WorkflowResult:
         ctx.textual.end_step("error")
         return Error("No normalized_findings in context (run normalize_findings first)")
 
-    from ..models.validators import is_duplicate
+    from ..models.validators import ExistingCommentMatcher
 
     deduped: list = []
     removed = 0
     removed_existing = 0
     removed_adjudicated = 0
     seen_keys: set[tuple[str, int | None, str]] = set()
+    existing_matcher = ExistingCommentMatcher(existing_index)
 
     for finding in findings:
-        is_dup = any(is_duplicate(finding, ex) for ex in existing_index)
+        duplicated = existing_matcher.matches(finding)
         key = (finding.path, finding.line, finding.title.lower())
-        if is_dup or key in seen_keys:
+        if duplicated or key in seen_keys:
             removed += 1
-            if is_dup:
+            if duplicated:
                 removed_existing += 1
-                if any(ex.is_adjudicated and is_duplicate(finding, ex) for ex in existing_index):
+                if any(ex.is_adjudicated for ex in duplicated):
                     removed_adjudicated += 1
             logger.debug("Deduplicated finding: %s @ %s:%s", finding.title, finding.path, finding.line)
         else:
@@ -2906,12 +2964,13 @@ def verify_findings(ctx: WorkflowContext) -> WorkflowResult:
     prompt = prompt_parts["prompt"]
 
     max_prompt_chars = strategy.max_prompt_chars if strategy else None
-    if max_prompt_chars and len(prompt) > max_prompt_chars:
+    if max_prompt_chars and not get_prompt_budget_manager().prompt_fits(prompt, max_prompt_chars):
         # Fail-open on budget too: verification is an optional quality filter, never
         # worth degrading or splitting like the findings pass.
         logger.warning(
             "verification_prompt_over_budget",
             prompt_actual_chars=len(prompt),
+            prompt_actual_tokens=get_prompt_budget_manager().count_tokens(prompt),
             prompt_budget_target_chars=max_prompt_chars,
         )
         ctx.textual.dim_text(
@@ -3079,20 +3138,56 @@ def build_new_comment_actions(ctx: WorkflowContext) -> WorkflowResult:
     return Success("Actions built")
 
 
+def _ensure_full_worktree(ctx: WorkflowContext, batches: list) -> None:
+    """Disable the worktree's sparse checkout before any worktree_reference batch runs.
+
+    A worktree_reference file has the CLI Read/Grep the worktree itself, and its
+    cross-file lookups can land anywhere in the tree; in a sparse worktree those
+    files are missing and the review silently loses them.
+    """
+    if not ctx.get("worktree_sparse_checkout") or not ctx.get("worktree_path") or not ctx.git:
+        return
+    if not any(entry.worktree_reference for batch in batches for entry in batch.files_context.values()):
+        return
+    from ..operations import disable_sparse_checkout
+
+    with ctx.textual.loading("Checking out the full worktree…"):
+        disabled = disable_sparse_checkout(ctx.git, ctx.data["worktree_path"])
+    if disabled:
+        ctx.data["worktree_sparse_checkout"] = False
+    else:
+        logger.warning("worktree_sparse_checkout_disable_failed", worktree_path=ctx.data["worktree_path"])
+
+
+def _close_file_snapshot(ctx: WorkflowContext) -> None:
+    """Close the review's file snapshot, stopping its ``git cat-file`` process."""
+    snapshot = ctx.data.pop("review_file_snapshot", None)
+    if snapshot is not None:
+        snapshot.close()
+
+
 def _release_review_worktree(ctx: WorkflowContext) -> None:
-    """Remove the review worktree as soon as nothing will read from it again.
+    """Release the review worktree as soon as nothing will read from it again.
 
     The workflow's final cleanup step only runs when the workflow reaches it —
     abandoning the review at an interactive gate (exit button, quitting the app at
     the submit prompt) used to leave the worktree on disk. Failure here is fine:
-    the final cleanup step remains as backstop.
+    the final cleanup step remains as backstop. The file snapshot is closed too,
+    since it is the other reader of the reviewed files.
     """
+    _close_file_snapshot(ctx)
     if not ctx.get("worktree_created") or not ctx.get("worktree_path") or not ctx.git:
         return
     from ..operations import cleanup_worktree as cleanup_worktree_operation
+    from ..operations import release_review_worktree
 
-    if cleanup_worktree_operation(ctx.git, ctx.data["worktree_path"]):
-        ctx.textual.dim_text("Review worktree removed (no longer needed).")
+    if ctx.get("worktree_pooled"):
+        # A pooled worktree goes back to the pool for the next review.
+        released = release_review_worktree(ctx.git, ctx.data["worktree_path"])
+    else:
+        released = cleanup_worktree_operation(ctx.git, ctx.data["worktree_path"])
+    if released:
+        ctx.textual.dim_text("Review worktree released (no longer needed).")
         ctx.data["worktree_created"] = False
         ctx.data["worktree_path"] = None
     else:
@@ -3147,13 +3242,15 @@ def validate_review_actions(ctx: WorkflowContext) -> WorkflowResult:
     # quitting the app at the submit prompt) can no longer leave a stale worktree —
     # the final cleanup_worktree step becomes a no-op backstop.
     prepared: List[tuple] = []
-    for action in sorted_actions:
-        diff_hunk = extract_diff_hunk_for_action(action, diff, diff_manager=diff_manager)
-        # Unanchored findings have no diff hunk by definition — read the real file so the
-        # user judges the finding against its code instead of a bare assertion.
-        file_excerpt = extract_file_excerpt_for_action(action, diff_manager=diff_manager)
-        prepared.append((action, diff_hunk, file_excerpt))
-    _release_review_worktree(ctx)
+    try:
+        for action in sorted_actions:
+            diff_hunk = extract_diff_hunk_for_action(action, diff, diff_manager=diff_manager)
+            # Unanchored findings have no diff hunk by definition — read the real file so
+            # the user judges the finding against its code instead of a bare assertion.
+            file_excerpt = extract_file_excerpt_for_action(action, diff_manager=diff_manager)
+            prepared.append((action, diff_hunk, file_excerpt))
+    finally:
+        _release_review_worktree(ctx)
 
     approved: List[ReviewActionProposal] = []
     skipped = 0
@@ -6,19 +6,37 @@ Available for use in any workflow that needs isolated branch checkouts.
 """
 import os
 from titan_cli.engine import WorkflowContext, WorkflowResult, Success, Error, Skip
-from ..operations import setup_worktree, cleanup_worktree
+from ..operations import (
+    acquire_review_worktree,
+    cleanup_worktree,
+    release_review_worktree,
+    review_sparse_dirs,
+    setup_worktree,
+)
 
 def create_worktree_step(ctx: WorkflowContext) -> WorkflowResult:
     """
     Create a worktree for PR review.
 
+    By default the worktree comes from a pool of persistent review worktrees
+    that are re-pointed at the PR head, sparse-checked-out to the changed
+    directories when the change manifest is known.
+
     Requires (from ctx.data):
         selected_pr_number (int): The PR number
         selected_pr_head_branch (str): Branch to checkout in worktree
 
+    Optional (from ctx.data):
+        change_manifest (ChangeManifest): Changed files, used for the sparse checkout
+        worktree_pool (bool): Reuse pooled worktrees (default: True)
+        worktree_sparse (bool): Check out only the changed directories (default: True)
+        worktree_pool_size (int): Maximum pooled worktrees (default: 3)
+
     Outputs (saved to ctx.data):
         worktree_path (str): Absolute path to worktree
         worktree_created (bool): Whether worktree was created
+        worktree_pooled (bool): Whether the worktree belongs to the pool
+        worktree_sparse_checkout (bool): Whether only the changed directories are checked out
 
     Returns:
         Success: Worktree created
@@ -42,22 +60,45 @@ def create_worktree_step(ctx: WorkflowContext) -> WorkflowResult:
         ctx.textual.end_step("error")
         return Error("Git client not available")
 
+    pooled = ctx.get("worktree_pool", True)
+    manifest = ctx.get("change_manifest")
+    sparse_dirs = (
+        review_sparse_dirs(entry.path for entry in manifest.files)
+        if manifest and ctx.get("worktree_sparse", True)
+        else None
+    )
+
     with ctx.textual.loading(f"Creating worktree for PR #{pr_number}..."):
         remote = getattr(ctx.git, 'default_remote', 'origin')
-        worktree_path, worktree_created = setup_worktree(
-            ctx.git,
-            pr_number,
-            head_branch,
-            remote=remote
-        )
+        if pooled:
+            worktree_path, worktree_created = acquire_review_worktree(
+                ctx.git,
+                pr_number,
+                sparse_dirs=sparse_dirs,
+                remote=remote,
+                pool_size=ctx.get("worktree_pool_size", 3),
+            )
+        else:
+            worktree_path, worktree_created = setup_worktree(
+                ctx.git,
+                pr_number,
+                head_branch,
+                remote=remote
+            )
 
     if worktree_created:
         worktree_name = os.path.basename(worktree_path)
-        ctx.textual.success_text(f"✓ Worktree created: {worktree_name}")
+        detail = f" (sparse: {len(sparse_dirs)} dir(s))" if pooled and sparse_dirs else ""
+        ctx.textual.success_text(f"✓ Worktree ready: {worktree_name}{detail}")
         ctx.textual.end_step("success")
         return Success(
             "Worktree created",
-            metadata={"worktree_path": worktree_path, "worktree_created": True}
+            metadata={
+                "worktree_path": worktree_path,
+                "worktree_created": True,
+                "worktree_pooled": bool(pooled),
+                "worktree_sparse_checkout": bool(pooled and sparse_dirs),
+            }
         )
     else:
         ctx.textual.error_text("Failed to create worktree")
@@ -69,6 +110,9 @@ def cleanup_worktree_step(ctx: WorkflowContext) -> WorkflowResult:
     """
     Cleanup a worktree created for PR review.
 
+    A pooled worktree is returned to the pool (evicting idle ones over the
+    disk budget) instead of being removed.
+
     Requires (from ctx.data):
         worktree_created (bool): Whether worktree was created
         worktree_path (str): Absolute path to worktree
@@ -86,6 +130,12 @@ def cleanup_worktree_step(ctx: WorkflowContext) -> WorkflowResult:
 
     ctx.textual.begin_step("Cleanup PR Worktree")
 
+    # Backstop for a review that stopped before releasing its file snapshot: its
+    # git cat-file process would otherwise outlive the workflow.
+    snapshot = ctx.data.pop("review_file_snapshot", None)
+    if snapshot is not None:
+        snapshot.close()
+
     worktree_created = ctx.get("worktree_created", False)
     worktree_path = ctx.get("worktree_path")
 
@@ -100,7 +150,10 @@ def cleanup_worktree_step(ctx: WorkflowContext) -> WorkflowResult:
         return Skip("Git client not available")
 
     with ctx.textual.loading("Cleaning up worktree..."):
-        success = cleanup_worktree(ctx.git, worktree_path)
+        if ctx.get("worktree_pooled", False):
+            success = release_review_worktree(ctx.git, worktree_path)
+        else:
+            success = cleanup_worktree(ctx.git, worktree_path)
 
     if success:
         ctx.textual.success_text("✓ Worktree cleaned up")
@@ -248,6 +248,76 @@ def test_search_issues_api_error(issue_service, mock_network):
     assert result.error_code == "SEARCH_ERROR"
 
 
+def _search_page(sample, keys, token=None):
+    issues = []
+    for key in keys:
+        issue = dict(sample)
+        issue["key"] = key
+        issues.append(issue)
+    page = {"issues": issues}
+    if token:
+        page["nextPageToken"] = token
+    return page
+
+
+def test_search_issues_follows_next_page_token(issue_service, mock_network, sample_api_issue_response):
+    """Limits above one page are collected across pages instead of truncated"""
+    mock_network.make_request.side_effect = [
+        _search_page(sample_api_issue_response, [f"TEST-{i}" for i in range(100)], token="p2"),
+        _search_page(sample_api_issue_response, [f"TEST-{i}" for i in range(100, 150)]),
+    ]
+
+    result = issue_service.search_issues(jql="project=TEST", max_results=500)
+
+    assert isinstance(result, ClientSuccess)
+    assert len(result.data) == 150
+    first, second = mock_network.make_request.call_args_list
+    assert first.kwargs["json"]["maxResults"] == 100
+    assert "nextPageToken" not in first.kwargs["json"]
+    assert second.kwargs["json"]["nextPageToken"] == "p2"
+
+
+def test_iter_search_yields_pages_and_respects_limit(issue_service, mock_network, sample_api_issue_response):
+    mock_network.make_request.side_effect = [
+        _search_page(sample_api_issue_response, ["TEST-1", "TEST-2"], token="p2"),
+        _search_page(sample_api_issue_response, ["TEST-3", "TEST-4"], token="p3"),
+    ]
+
+    pages = list(issue_service.iter_search("project=TEST", page_size=2, limit=3, prefetch=False))
+
+    assert [[i.key for i in page.data] for page in pages] == [["TEST-1", "TEST-2"], ["TEST-3"]]
+    assert mock_network.make_request.call_args_list[1].kwargs["json"]["maxResults"] == 1
+
+
+def test_iter_search_stops_fetching_when_consumer_stops(issue_service, mock_network, sample_api_issue_response):
+    mock_network.make_request.side_effect = [
+        _search_page(sample_api_issue_response, ["TEST-1"], token="p2"),
+        _search_page(sample_api_issue_response, ["TEST-2"], token="p3"),
+        _search_page(sample_api_issue_response, ["TEST-3"]),
+    ]
+
+    pages = issue_service.iter_search("project=TEST", page_size=1, prefetch=False)
+    first = next(pages)
+    pages.close()
+
+    assert [i.key for i in first.data] == ["TEST-1"]
+    assert mock_network.make_request.call_count == 1
+
+
+def test_iter_search_prefetches_and_ends_with_error_on_failure(issue_service, mock_network, sample_api_issue_response):
+    mock_network.make_request.side_effect = [
+        _search_page(sample_api_issue_response, ["TEST-1"], token="p2"),
+        JiraAPIError("Rate limited"),
+    ]
+
+    pages = list(issue_service.iter_search("project=TEST", page_size=1))
+
+    assert isinstance(pages[0], ClientSuccess)
+    assert isinstance(pages[1], ClientError)
+    assert pages[1].error_code == "SEARCH_ERROR"
+    assert len(pages) == 2
+
+
 def test_create_issue_success(issue_service, mock_network, sample_api_issue_response):
     """Test successful issue creation"""
     # Setup mocks
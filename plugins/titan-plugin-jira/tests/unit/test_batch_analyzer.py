@@ -0,0 +1,223 @@
+"""
+Tests for the batch JQL analysis runner.
+"""
+
+import contextvars
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from titan_cli.core.result import ClientError, ClientSuccess
+from titan_plugin_jira.agents.batch_analyzer import (
+    BatchAnalyzer,
+    BatchCheckpoint,
+    BatchIssueResult,
+    BoundedJiraWriter,
+    RateLimiter,
+    issue_token_budget,
+)
+from titan_plugin_jira.agents.config_loader import JiraAgentConfig
+from titan_plugin_jira.agents.jira_agent import IssueAnalysis
+from titan_plugin_jira.agents.token_tracker import OperationType, TokenBudget, TokenTracker
+
+
+def _issues(count):
+    return [SimpleNamespace(key=f"PROJ-{i}", summary=f"Issue {i}") for i in range(1, count + 1)]
+
+
+def _config(**overrides):
+    values = {"name": "JiraAgent", "batch_requests_per_minute": 0}
+    values.update(overrides)
+    return JiraAgentConfig(**values)
+
+
+class _FakeAgent:
+    """Stands in for JiraAgent; records usage into a tracker like the real one."""
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self, tokens=100, delay=0.0, fail=()):
+        self.tokens = tokens
+        self.delay = delay
+        self.fail = fail
+        self.token_tracker = TokenTracker(TokenBudget(base_max_tokens=2000))
+        self.analyzed = []
+
+    def analyze_issue(self, issue_key, include_subtasks=True, issue=None):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        try:
+            time.sleep(self.delay)
+            self.token_tracker.reset()
+            self.analyzed.append(issue_key)
+            if issue_key in self.fail:
+                self.token_tracker.record_usage(
+                    OperationType.REQUIREMENTS_EXTRACTION, 0, issue_key, success=False, error="boom"
+                )
+                return IssueAnalysis()
+            self.token_tracker.record_usage(
+                OperationType.REQUIREMENTS_EXTRACTION, self.tokens, issue_key
+            )
+            return IssueAnalysis(
+                functional_requirements=[f"FR for {issue_key}"],
+                complexity_score="low",
+                total_tokens_used=self.tokens,
+            )
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+
+def _factory(agents, **kwargs):
+    def build(generator, jira):
+        agent = _FakeAgent(**kwargs)
+        agents.append(agent)
+        return agent
+    return build
+
+
+def _analyzed_keys(agents):
+    return sorted(key for agent in agents for key in agent.analyzed)
+
+
+def test_checkpointed_issues_are_not_analyzed_again(tmp_path):
+    checkpoint = BatchCheckpoint(tmp_path / "run.jsonl")
+    first_agents = []
+    interrupted = BatchAnalyzer(
+        MagicMock(), MagicMock(), checkpoint, _config(),
+        agent_factory=_factory(first_agents, fail=("PROJ-2",)),
+    )
+    interrupted.run(_issues(3)[:2])
+
+    second_agents = []
+    summary = BatchAnalyzer(
+        MagicMock(), MagicMock(), checkpoint, _config(),
+        agent_factory=_factory(second_agents),
+    ).run(_issues(3))
+
+    # PROJ-1 came from the checkpoint; the failed PROJ-2 is retried.
+    assert _analyzed_keys(second_agents) == ["PROJ-2", "PROJ-3"]
+    assert summary.resumed == 1
+    assert summary.analyzed == 3
+    assert summary.tokens_used == 200
+
+
+def test_workers_are_bounded_and_run_concurrently(tmp_path):
+    _FakeAgent.peak = 0
+    agents = []
+    analyzer = BatchAnalyzer(
+        MagicMock(), MagicMock(), BatchCheckpoint(tmp_path / "run.jsonl"),
+        _config(batch_max_workers=3),
+        agent_factory=_factory(agents, delay=0.05),
+    )
+
+    summary = analyzer.run(iter(_issues(9)))
+
+    assert summary.analyzed == 9
+    assert _FakeAgent.peak == 3
+    assert len(agents) == 3  # one agent per worker thread, reused
+
+
+def test_total_budget_stops_dispatch(tmp_path):
+    agents = []
+    analyzer = BatchAnalyzer(
+        MagicMock(), MagicMock(), BatchCheckpoint(tmp_path / "run.jsonl"),
+        _config(batch_max_workers=1, batch_max_tokens_per_issue=100, batch_max_total_tokens=250),
+        agent_factory=_factory(agents, tokens=100),
+    )
+
+    summary = analyzer.run(_issues(5))
+
+    assert summary.analyzed == 2
+    assert "token budget" in summary.stopped_reason
+    assert analyzer.token_tracker.get_total_tokens() == 200
+
+
+def test_comments_are_posted_except_over_budget_and_recorded(tmp_path):
+    jira = MagicMock()
+    jira.add_comment.return_value = ClientSuccess(data=None, message="ok")
+    checkpoint = BatchCheckpoint(tmp_path / "run.jsonl")
+    config = _config(batch_max_tokens_per_issue=150)
+
+    with BoundedJiraWriter(max_workers=2) as writer:
+        summary = BatchAnalyzer(
+            MagicMock(), jira, checkpoint, config,
+            writer=writer,
+            comment_builder=lambda result: f"analysis of {result.issue_key}",
+            agent_factory=_factory([], tokens=100),
+        ).run(_issues(2))
+
+    assert summary.comments_posted == 2
+    assert all(result.comment_posted for result in checkpoint.load().values())
+
+    # A resumed run does not post the same comments again.
+    jira.add_comment.reset_mock()
+    with BoundedJiraWriter() as writer:
+        BatchAnalyzer(
+            MagicMock(), jira, checkpoint, config,
+            writer=writer,
+            comment_builder=lambda result: "again",
+            agent_factory=_factory([], tokens=100),
+        ).run(_issues(2))
+    jira.add_comment.assert_not_called()
+
+    jira.add_comment.return_value = ClientError(error_message="forbidden")
+    with BoundedJiraWriter() as writer:
+        over = BatchAnalyzer(
+            MagicMock(), jira, BatchCheckpoint(tmp_path / "other.jsonl"), config,
+            writer=writer,
+            comment_builder=lambda result: "body",
+            agent_factory=_factory([], tokens=200),
+        ).run(_issues(1))
+    assert over.over_budget == 1
+    jira.add_comment.assert_not_called()
+
+
+def test_writes_run_in_the_submitters_context():
+    # Trace spans are tracked in a ContextVar; a write that lost the caller's
+    # context would record its Jira request as an orphan root span.
+    marker = contextvars.ContextVar("marker", default=None)
+    marker.set("batch run")
+
+    with BoundedJiraWriter() as writer:
+        seen = writer.submit(marker.get).result(5)
+
+    assert seen == "batch run"
+
+
+def test_checkpoint_ignores_torn_lines(tmp_path):
+    path = tmp_path / "run.jsonl"
+    checkpoint = BatchCheckpoint(path)
+    checkpoint.append(BatchIssueResult(issue_key="PROJ-1", analysis={"functional_requirements": []}))
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.write('{"issue_key": "PROJ-2", "anal')
+
+    assert list(checkpoint.load()) == ["PROJ-1"]
+
+
+def test_checkpoint_path_is_per_query(tmp_path):
+    first = BatchCheckpoint.for_query("project = A", tmp_path)
+    second = BatchCheckpoint.for_query("project = B", tmp_path)
+
+    assert first.path != second.path
+    assert first.path == BatchCheckpoint.for_query(" project = A ", tmp_path).path
+
+
+def test_rate_limiter_spaces_starts():
+    limiter = RateLimiter(per_minute=1200)  # one start every 50ms
+
+    start = time.monotonic()
+    for _ in range(4):
+        limiter.acquire()
+
+    assert time.monotonic() - start >= 0.14
+
+
+def test_issue_budget_defaults_to_facet_budgets():
+    assert issue_token_budget(_config(max_tokens=1000)) == 3250
+    assert issue_token_budget(_config(batch_max_tokens_per_issue=500)) == 500
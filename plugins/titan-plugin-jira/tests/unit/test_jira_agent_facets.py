@@ -0,0 +1,194 @@
+"""
+Tests for how JiraAgent runs its analysis facets (parallel, sequential, fused).
+"""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+from titan_cli.ai.models import AIResponse
+from titan_cli.core.interrupt import live_processes, run_process
+from titan_cli.core.result import ClientSuccess
+from titan_plugin_jira.agents.config_loader import JiraAgentConfig
+from titan_plugin_jira.agents.jira_agent import JiraAgent
+from titan_plugin_jira.agents.token_tracker import OperationType
+
+
+def _issue():
+    issue = MagicMock()
+    issue.key = "TEST-1"
+    issue.summary = "Add login"
+    issue.issue_type = "Story"
+    issue.priority = "High"
+    issue.description = "Users need to log in with their company account."
+    return issue
+
+
+def _agent(generator=None, **config):
+    jira = MagicMock()
+    jira.get_issue.return_value = ClientSuccess(data=_issue(), message="ok")
+    agent = JiraAgent(generator or MagicMock(), jira)
+    agent.config = JiraAgentConfig(name="JiraAgent", **config)
+    return agent
+
+
+def _slow_facets(agent, delay, slow=None):
+    """Replace every facet with one that sleeps; ``slow`` facets sleep ``slow[op]``."""
+    slow = slow or {}
+    calls = []
+
+    def facet(operation, payload):
+        def run(issue):
+            calls.append((operation, threading.current_thread().name))
+            time.sleep(slow.get(operation, delay))
+            return {**payload, "tokens_used": 10}
+        return run
+
+    agent._extract_requirements = facet(
+        OperationType.REQUIREMENTS_EXTRACTION, {"functional": ["FR1"]}
+    )
+    agent._analyze_risks = facet(OperationType.RISK_ANALYSIS, {"risks": ["R1"]})
+    agent._detect_dependencies = facet(
+        OperationType.DEPENDENCY_DETECTION, {"dependencies": ["D1"]}
+    )
+    agent._suggest_subtasks = facet(
+        OperationType.SUBTASK_SUGGESTION, {"subtasks": [{"summary": "S1", "description": ""}]}
+    )
+    return calls
+
+
+class _StructuredGenerator:
+    """A generator that enforces JSON schemas and answers every section."""
+
+    supports_structured_output = True
+
+    def __init__(self):
+        self.calls = 0
+
+    def is_available(self):
+        return True
+
+    def generate(self, messages, max_tokens=None, temperature=None, json_schema=None):
+        self.calls += 1
+        return AIResponse(
+            content=json.dumps({
+                "requirements": {"functional": ["FR1"], "acceptance_criteria": ["AC1"]},
+                "risks": {"risks": ["R1"], "complexity": "low"},
+                "dependencies": {"dependencies": ["D1"]},
+                "subtasks": {"subtasks": [{"summary": "S1"}, {"description": "no title"}]},
+            }),
+            model="test",
+            usage={"total_tokens": 401},
+        )
+
+
+def test_parallel_facets_overlap():
+    agent = _agent(analysis_mode="parallel", max_parallel_facets=4)
+    calls = _slow_facets(agent, delay=0.2)
+
+    start = time.monotonic()
+    analysis = agent.analyze_issue("TEST-1")
+    elapsed = time.monotonic() - start
+
+    assert len(calls) == 4
+    assert elapsed < 0.6
+    assert analysis.functional_requirements == ["FR1"]
+    assert analysis.risks == ["R1"]
+    assert analysis.dependencies == ["D1"]
+    assert analysis.suggested_subtasks == [{"summary": "S1", "description": ""}]
+    assert analysis.total_tokens_used == 40
+
+
+def test_sequential_mode_runs_in_caller_thread():
+    agent = _agent(analysis_mode="sequential")
+    calls = _slow_facets(agent, delay=0)
+
+    agent.analyze_issue("TEST-1")
+
+    assert [op for op, _ in calls] == [
+        OperationType.REQUIREMENTS_EXTRACTION,
+        OperationType.RISK_ANALYSIS,
+        OperationType.DEPENDENCY_DETECTION,
+        OperationType.SUBTASK_SUGGESTION,
+    ]
+    assert {thread for _, thread in calls} == {threading.current_thread().name}
+
+
+def test_timed_out_facet_is_dropped_and_recorded():
+    agent = _agent(analysis_mode="parallel", facet_timeout_seconds=0.2)
+    _slow_facets(agent, delay=0, slow={OperationType.RISK_ANALYSIS: 1.0})
+
+    start = time.monotonic()
+    analysis = agent.analyze_issue("TEST-1")
+
+    assert time.monotonic() - start < 0.8
+    assert analysis.risks == []
+    assert analysis.functional_requirements == ["FR1"]
+    failed = agent.token_tracker.get_failed_operations()
+    assert [usage.operation for usage in failed] == [OperationType.RISK_ANALYSIS]
+    assert "timed out" in failed[0].error
+
+
+def test_timed_out_facet_process_is_terminated():
+    agent = _agent(analysis_mode="parallel", facet_timeout_seconds=0.3)
+    _slow_facets(agent, delay=0)
+    finished = threading.Event()
+
+    def hung_cli(issue):
+        # Stands in for a headless CLI call that never answers
+        try:
+            run_process(["sleep", "30"], capture_output=True)
+        finally:
+            finished.set()
+        return {"risks": ["late"], "tokens_used": 10}
+
+    agent._analyze_risks = hung_cli
+
+    analysis = agent.analyze_issue("TEST-1")
+
+    assert analysis.risks == []
+    assert finished.wait(5), "the timed-out facet's process kept running"
+    assert live_processes() == []
+
+
+def test_failing_facet_does_not_sink_the_others():
+    agent = _agent(analysis_mode="parallel")
+    _slow_facets(agent, delay=0)
+
+    def broken(issue):
+        raise RuntimeError("boom")
+
+    agent._detect_dependencies = broken
+
+    analysis = agent.analyze_issue("TEST-1")
+
+    assert analysis.dependencies == []
+    assert analysis.risks == ["R1"]
+    assert agent.token_tracker.get_failed_operations()[0].error == "boom"
+
+
+def test_fused_mode_answers_every_facet_in_one_call():
+    generator = _StructuredGenerator()
+    agent = _agent(generator, analysis_mode="fused")
+
+    analysis = agent.analyze_issue("TEST-1")
+
+    assert generator.calls == 1
+    assert analysis.functional_requirements == ["FR1"]
+    assert analysis.acceptance_criteria == ["AC1"]
+    assert analysis.complexity_score == "low"
+    assert analysis.dependencies == ["D1"]
+    assert analysis.suggested_subtasks == [{"summary": "S1", "description": ""}]
+    assert analysis.total_tokens_used == 401
+
+
+def test_fused_mode_falls_back_without_structured_output():
+    generator = MagicMock()  # answers any attribute truthily; must not count as support
+    agent = _agent(generator, analysis_mode="fused")
+    calls = _slow_facets(agent, delay=0)
+
+    agent.analyze_issue("TEST-1")
+
+    assert len(calls) == 4
+    generator.generate.assert_not_called()
@@ -315,3 +315,136 @@ def test_network_uses_api_v3_endpoint(mock_session_class):
     url = call_args[0][1]  # Second positional argument is the URL
     assert "/rest/api/3/" in url, f"Expected API v3, got: {url}"
     assert "/rest/api/2/" not in url, f"Still using API v2: {url}"
+
+
+# ==================== RESPONSE CACHE ====================
+
+
+def _cached_network(mock_session_class, cache_dir=None, user="test@example.com"):
+    """JiraNetwork with a response cache over a mocked session."""
+    from titan_plugin_jira.clients.network import JiraResponseCache
+
+    mock_session = MagicMock()
+
+    def respond(method, url, **kwargs):
+        response = Mock()
+        response.status_code = 200
+        response.content = b"{}"
+        response.json.return_value = {"url": url, "method": method}
+        return response
+
+    mock_session.request.side_effect = respond
+    mock_session_class.return_value = mock_session
+    cache = JiraResponseCache(300, "https://test.atlassian.net", user, cache_dir=cache_dir)
+    network = JiraNetwork("https://test.atlassian.net", user, "token", cache=cache)
+    return network, mock_session
+
+
+@patch('titan_plugin_jira.clients.network.jira_network.requests.Session')
+def test_cache_serves_repeated_metadata_requests(mock_session_class):
+    network, session = _cached_network(mock_session_class)
+
+    first = network.make_request("GET", "project/TEST")
+    first["mutated"] = True
+    second = network.make_request("GET", "project/TEST")
+
+    assert session.request.call_count == 1
+    assert "mutated" not in second
+
+
+@patch('titan_plugin_jira.clients.network.jira_network.requests.Session')
+def test_cache_never_serves_issues_or_searches(mock_session_class):
+    network, session = _cached_network(mock_session_class)
+
+    network.make_request("GET", "issue/TEST-1")
+    network.make_request("GET", "issue/TEST-1")
+    network.make_request("POST", "search/jql", json={"jql": "project = TEST"})
+    network.make_request("POST", "search/jql", json={"jql": "project = TEST"})
+
+    assert session.request.call_count == 4
+
+
+@patch('titan_plugin_jira.clients.network.jira_network.requests.Session')
+def test_cache_keys_include_params(mock_session_class):
+    network, session = _cached_network(mock_session_class)
+
+    network.make_request("GET", "project/TEST", params={"expand": "lead"})
+    network.make_request("GET", "project/TEST")
+    network.make_request("GET", "project/TEST", params={"expand": "lead"})
+
+    assert session.request.call_count == 2
+
+
+@patch('titan_plugin_jira.clients.network.jira_network.requests.Session')
+def test_creating_a_version_invalidates_only_its_project(mock_session_class):
+    network, session = _cached_network(mock_session_class)
+    network.make_request("GET", "project/TEST")
+    network.make_request("GET", "project/OTHER")
+    network.make_request("GET", "priority")
+
+    network.make_request("POST", "version", json={"project": "TEST", "name": "1.0"})
+    network.make_request("GET", "project/TEST")
+    network.make_request("GET", "project/OTHER")
+    network.make_request("GET", "priority")
+
+    urls = [c.args[1] for c in session.request.call_args_list]
+    assert urls.count("https://test.atlassian.net/rest/api/3/project/TEST") == 2
+    assert urls.count("https://test.atlassian.net/rest/api/3/project/OTHER") == 1
+    assert urls.count("https://test.atlassian.net/rest/api/3/priority") == 1
+
+
+@patch('titan_plugin_jira.clients.network.jira_network.requests.Session')
+def test_disk_cache_warms_new_networks_for_the_same_user_only(mock_session_class, tmp_path):
+    network, _ = _cached_network(mock_session_class, cache_dir=tmp_path)
+    network.make_request("GET", "myself")
+
+    warm, warm_session = _cached_network(mock_session_class, cache_dir=tmp_path)
+    warm.make_request("GET", "myself")
+    assert warm_session.request.call_count == 0
+
+    other, other_session = _cached_network(
+        mock_session_class, cache_dir=tmp_path, user="someone@example.com"
+    )
+    other.make_request("GET", "myself")
+    assert other_session.request.call_count == 1
+
+
+@patch('titan_plugin_jira.clients.network.jira_network.requests.Session')
+def test_expired_entries_are_refetched(mock_session_class):
+    network, session = _cached_network(mock_session_class)
+    network.cache.ttl_seconds = 0
+
+    network.make_request("GET", "priority")
+    network.make_request("GET", "priority")
+
+    assert session.request.call_count == 2
+
+
+@patch('titan_plugin_jira.clients.network.jira_network.requests.Session')
+def test_read_only_posts_do_not_invalidate(mock_session_class):
+    network, session = _cached_network(mock_session_class)
+    network.cache.invalidate = Mock(wraps=network.cache.invalidate)
+
+    network.make_request("POST", "search/jql", json={"jql": "project = TEST"})
+    network.make_request("POST", "jql/parse", json={"queries": ["project = TEST"]})
+    network.make_request("POST", "issue/TEST-1/comment", json={"body": "hi"})
+
+    network.cache.invalidate.assert_called_once_with("issue/TEST-1")
+
+
+@patch('titan_plugin_jira.clients.network.jira_network.requests.Session')
+def test_disk_invalidation_removes_only_the_resource_directory(mock_session_class, tmp_path):
+    network, _ = _cached_network(mock_session_class, cache_dir=tmp_path)
+    network.make_request("GET", "project/TEST")
+    network.make_request("GET", "project/TEST/versions")
+    network.make_request("GET", "priority")
+
+    network.make_request("POST", "version", json={"project": "TEST", "name": "1.0"})
+
+    resources = sorted(path.name for path in network.cache.directory.iterdir())
+    assert resources == ["priority"]
+
+    warm, warm_session = _cached_network(mock_session_class, cache_dir=tmp_path)
+    warm.make_request("GET", "priority")
+    warm.make_request("GET", "project/TEST/versions")
+    assert warm_session.request.call_count == 1
@@ -179,3 +179,20 @@ class TestValidateToken:
         assert result["user"] is None
         assert result["email"] is None
         assert "No default_project configured." in result["warnings"][0]
+
+
+class TestSecretKeys:
+    """Tests for the secret keys declared for warm-up."""
+
+    def test_secret_keys_follow_token_resolution_order(self):
+        config = Mock()
+        config.get_project_name.return_value = "acme"
+
+        plugin = JiraPlugin()
+        plugin._get_plugin_config = Mock(return_value={"email": "dev@example.com"})
+
+        assert plugin.secret_keys(config) == [
+            "acme_jira_api_token",
+            "jira_api_token",
+            "dev@example.com_jira_api_token",
+        ]
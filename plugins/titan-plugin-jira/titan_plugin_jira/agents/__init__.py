@@ -2,5 +2,6 @@
 """AI agents for JIRA automation."""
 
 from .jira_agent import JiraAgent, IssueAnalysis
+from .batch_analyzer import BatchAnalyzer, BatchCheckpoint, BoundedJiraWriter
 
-__all__ = ["JiraAgent", "IssueAnalysis"]
+__all__ = ["JiraAgent", "IssueAnalysis", "BatchAnalyzer", "BatchCheckpoint", "BoundedJiraWriter"]
@@ -0,0 +1,403 @@
+# plugins/titan-plugin-jira/titan_plugin_jira/agents/batch_analyzer.py
+"""
+Batch analysis of a JQL result set with JiraAgent.
+
+Backlog grooming analyzes tens to hundreds of issues at once. Issues are
+consumed as the search streams them in, analyzed on a small worker pool
+under a start-rate limit and a token budget, and every result is appended to
+a local checkpoint as soon as it exists, so an interrupted run picks up where
+it stopped instead of paying for the same analyses again. Writes back to
+Jira (analysis comments) go through a bounded writer so a fast analysis pool
+cannot flood the Jira API.
+"""
+
+import contextvars
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from titan_cli.core.logging.config import get_logger
+from titan_cli.core.result import ClientError, ClientSuccess
+
+from .config_loader import JiraAgentConfig
+from .jira_agent import JiraAgent
+from .token_tracker import OperationType, TokenBudget, TokenTracker
+
+logger = get_logger(__name__)
+
+ANALYSIS_OPERATIONS = (
+    OperationType.REQUIREMENTS_EXTRACTION,
+    OperationType.RISK_ANALYSIS,
+    OperationType.DEPENDENCY_DETECTION,
+    OperationType.SUBTASK_SUGGESTION,
+)
+
+
+def issue_token_budget(config: JiraAgentConfig) -> int:
+    """Tokens one issue may use: the configured cap, or the sum of its facet budgets."""
+    if config.batch_max_tokens_per_issue:
+        return config.batch_max_tokens_per_issue
+    budget = TokenBudget(base_max_tokens=config.max_tokens)
+    return sum(budget.get_budget(operation) for operation in ANALYSIS_OPERATIONS)
+
+
+@dataclass
+class BatchIssueResult:
+    """Outcome of analyzing one issue in a batch run."""
+
+    issue_key: str
+    summary: str = ""
+    analysis: Optional[Dict[str, Any]] = None  # IssueAnalysis as a dict
+    tokens_used: int = 0
+    error: Optional[str] = None
+    over_budget: bool = False
+    comment_posted: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.analysis is not None
+
+
+@dataclass
+class BatchAnalysisSummary:
+    """Everything a batch run produced, including results restored from the checkpoint."""
+
+    results: List[BatchIssueResult] = field(default_factory=list)
+    resumed: int = 0  # results restored from the checkpoint
+    comments_posted: int = 0
+    comment_failures: int = 0
+    tokens_used: int = 0  # spent by this run only
+    stopped_reason: Optional[str] = None
+
+    @property
+    def analyzed(self) -> int:
+        return sum(1 for r in self.results if r.ok)
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for r in self.results if not r.ok)
+
+    @property
+    def over_budget(self) -> int:
+        return sum(1 for r in self.results if r.over_budget)
+
+
+class BatchCheckpoint:
+    """
+    Append-only JSONL record of finished issues for one query.
+
+    Each line is a BatchIssueResult; the last line for a key wins, so marking
+    a comment as posted is just another append. Failed analyses are not
+    restored, which makes a resumed run retry them. A torn last line (the
+    process died mid-write) is ignored.
+    """
+
+    CHECKPOINT_DIR = Path.home() / ".titan" / "cache" / "jira" / "batch"
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_query(cls, jql: str, directory: Optional[Path] = None) -> "BatchCheckpoint":
+        """Checkpoint file dedicated to a JQL query."""
+        digest = hashlib.sha256(jql.strip().encode()).hexdigest()[:16]
+        return cls((Path(directory) if directory else cls.CHECKPOINT_DIR) / f"{digest}.jsonl")
+
+    def load(self) -> Dict[str, BatchIssueResult]:
+        """Return the successful results recorded so far, keyed by issue key."""
+        if not self.path.exists():
+            return {}
+        results: Dict[str, BatchIssueResult] = {}
+        try:
+            with self._lock, open(self.path, encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        result = BatchIssueResult(**json.loads(line))
+                    except (ValueError, TypeError):
+                        continue
+                    results[result.issue_key] = result
+        except OSError as e:
+            logger.warning("jira_batch_checkpoint_load_failed", error=str(e))
+            return {}
+        return {key: result for key, result in results.items() if result.ok}
+
+    def append(self, result: BatchIssueResult) -> None:
+        """Durably record one result."""
+        line = json.dumps(asdict(result)) + "\n"
+        try:
+            with self._lock:
+                self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+                with open(self.path, "a", encoding="utf-8") as handle:
+                    handle.write(line)
+                    handle.flush()
+                    os.fsync(handle.fileno())
+        except OSError as e:
+            logger.warning("jira_batch_checkpoint_write_failed", issue_key=result.issue_key, error=str(e))
+
+    def clear(self) -> None:
+        """Forget every recorded result (the next run starts from scratch)."""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+
+
+class RateLimiter:
+    """Spaces calls evenly so no more than ``per_minute`` start in any minute."""
+
+    def __init__(self, per_minute: float):
+        self.interval = 60.0 / per_minute if per_minute > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the caller may start."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class BoundedJiraWriter:
+    """
+    Runs Jira write calls on a small pool with a cap on queued work.
+
+    ``submit`` blocks once ``max_pending`` writes are waiting, which pushes
+    back on whoever produces them instead of buffering an unbounded backlog.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: Optional[int] = None):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jira-writer")
+        self._slots = threading.BoundedSemaphore(max_pending or max_workers * 4)
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        self._slots.acquire()
+        try:
+            future = self._pool.submit(contextvars.copy_context().run, fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def close(self) -> None:
+        """Wait for queued writes and stop the pool."""
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> "BoundedJiraWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class BatchAnalyzer:
+    """
+    Analyzes a stream of issues concurrently with one JiraAgent per worker.
+
+    Agents are not shared between threads: each keeps a per-issue token
+    tracker that ``analyze_issue`` resets. Usage is copied into a run-level
+    TokenTracker for reporting.
+    """
+
+    def __init__(
+        self,
+        generator,
+        jira_client,
+        checkpoint: BatchCheckpoint,
+        config: JiraAgentConfig,
+        writer: Optional[BoundedJiraWriter] = None,
+        comment_builder: Optional[Callable[[BatchIssueResult], str]] = None,
+        include_subtasks: bool = True,
+        agent_factory: Callable[..., JiraAgent] = JiraAgent,
+    ):
+        """
+        Initialize the batch analyzer.
+
+        Args:
+            generator: AIGenerator handed to every worker's JiraAgent
+            jira_client: JiraClient used for analysis and write-back
+            checkpoint: Where finished results are recorded
+            config: Agent config (batch_* fields drive concurrency and budgets)
+            writer: Writer for posting analysis comments (None = read-only run)
+            comment_builder: Renders a result as a comment body (required with writer)
+            include_subtasks: Whether to suggest subtasks for each issue
+            agent_factory: Builds an agent from (generator, jira_client)
+        """
+        if writer is not None and comment_builder is None:
+            raise ValueError("comment_builder is required when a writer is given")
+        self.generator = generator
+        self.jira = jira_client
+        self.checkpoint = checkpoint
+        self.writer = writer
+        self.comment_builder = comment_builder
+        self.include_subtasks = include_subtasks
+        self.agent_factory = agent_factory
+        self.max_workers = config.batch_max_workers
+        self.max_total_tokens = config.batch_max_total_tokens
+        self.max_tokens_per_issue = issue_token_budget(config)
+        self.rate_limiter = RateLimiter(config.batch_requests_per_minute)
+        self.token_tracker = TokenTracker(TokenBudget(base_max_tokens=self.max_tokens_per_issue))
+        self._local = threading.local()
+
+    def run(
+        self,
+        issues: Iterable,
+        on_result: Optional[Callable[[BatchIssueResult, bool], None]] = None,
+    ) -> BatchAnalysisSummary:
+        """
+        Analyze every issue not already in the checkpoint.
+
+        Issues are pulled from ``issues`` only as workers free up, so a lazy
+        search stream is never read far ahead of the analysis.
+
+        Args:
+            issues: Issues to analyze (must carry their description)
+            on_result: Called on the calling thread with (result, resumed) as
+                each result is ready
+
+        Returns:
+            BatchAnalysisSummary for the whole query, resumed results included
+        """
+        done = self.checkpoint.load()
+        summary = BatchAnalysisSummary()
+        writes: Dict[Future, BatchIssueResult] = {}
+        in_flight: Dict[Future, Any] = {}
+
+        def finish(result: BatchIssueResult, resumed: bool = False) -> None:
+            summary.results.append(result)
+            if resumed:
+                summary.resumed += 1
+            else:
+                summary.tokens_used += result.tokens_used
+            if (
+                self.writer is not None
+                and result.ok
+                and not result.over_budget
+                and not result.comment_posted
+            ):
+                writes[self.writer.submit(self._post_comment, result)] = result
+            if on_result:
+                on_result(result, resumed)
+
+        def collect(return_when) -> None:
+            finished, _ = wait(list(in_flight), return_when=return_when)
+            for future in finished:
+                in_flight.pop(future)
+                finish(future.result())
+
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="jira-batch")
+        try:
+            for issue in issues:
+                previous = done.get(issue.key)
+                if previous is not None:
+                    finish(previous, resumed=True)
+                    continue
+
+                # Reserve a full per-issue budget for everything still running,
+                # so concurrent analyses cannot jointly overshoot the run budget.
+                if self.max_total_tokens:
+                    committed = summary.tokens_used + (
+                        (len(in_flight) + 1) * self.max_tokens_per_issue
+                    )
+                    if committed > self.max_total_tokens:
+                        summary.stopped_reason = (
+                            f"token budget of {self.max_total_tokens} would be exceeded"
+                        )
+                        break
+
+                while len(in_flight) >= self.max_workers:
+                    collect(FIRST_COMPLETED)
+                # Each analysis runs in a copy of the caller's context, so its
+                # trace spans nest under the batch run.
+                in_flight[pool.submit(contextvars.copy_context().run, self._analyze, issue)] = issue
+
+            while in_flight:
+                collect(FIRST_COMPLETED)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        for future, result in writes.items():
+            if future.result():
+                summary.comments_posted += 1
+                result.comment_posted = True
+            else:
+                summary.comment_failures += 1
+        return summary
+
+    def _agent(self) -> JiraAgent:
+        agent = getattr(self._local, "agent", None)
+        if agent is None:
+            agent = self._local.agent = self.agent_factory(self.generator, self.jira)
+        return agent
+
+    def _analyze(self, issue) -> BatchIssueResult:
+        self.rate_limiter.acquire()
+        agent = self._agent()
+        try:
+            analysis = agent.analyze_issue(
+                issue.key,
+                include_subtasks=self.include_subtasks,
+                issue=issue,
+            )
+        except Exception as e:
+            result = BatchIssueResult(issue_key=issue.key, summary=issue.summary, error=str(e))
+        else:
+            usage = list(agent.token_tracker.usage_history)
+            for record in usage:
+                self.token_tracker.record_usage(
+                    record.operation,
+                    record.tokens_used,
+                    issue_key=issue.key,
+                    success=record.success,
+                    error=record.error,
+                )
+            failed = [record for record in usage if not record.success]
+            result = BatchIssueResult(
+                issue_key=issue.key,
+                summary=issue.summary,
+                analysis=asdict(analysis),
+                tokens_used=analysis.total_tokens_used,
+                over_budget=analysis.total_tokens_used > self.max_tokens_per_issue,
+            )
+            if failed and len(failed) == len(usage):
+                result.analysis = None
+                result.error = "; ".join(f"{r.operation.value}: {r.error}" for r in failed)
+
+        self.checkpoint.append(result)
+        return result
+
+    def _post_comment(self, result: BatchIssueResult) -> bool:
+        try:
+            body = self.comment_builder(result)
+        except Exception as e:
+            logger.warning("jira_batch_comment_render_failed", issue_key=result.issue_key, error=str(e))
+            return False
+        match self.jira.add_comment(result.issue_key, body):
+            case ClientSuccess():
+                self.checkpoint.append(replace(result, comment_posted=True))
+                return True
+            case ClientError(error_message=err):
+                logger.warning("jira_batch_comment_failed", issue_key=result.issue_key, error=err)
+                return False
+        return False
+
+
+__all__ = [
+    "BatchAnalysisSummary",
+    "BatchAnalyzer",
+    "BatchCheckpoint",
+    "BatchIssueResult",
+    "BoundedJiraWriter",
+    "RateLimiter",
+    "issue_token_budget",
+]
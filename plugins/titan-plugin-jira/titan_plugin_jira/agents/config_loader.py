@@ -3,7 +3,7 @@
 
 import tomli
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Literal
 from pydantic import BaseModel, Field, ConfigDict
 
 try:
@@ -38,6 +38,30 @@ class JiraAgentConfig(BaseModel):
     temperature: float = Field(0.7, ge=0.0, le=2.0, description="AI temperature for generation")
     max_tokens: int = Field(2000, ge=1, description="Maximum tokens per AI request")
 
+    # Analysis execution
+    analysis_mode: Literal["parallel", "sequential", "fused"] = Field(
+        "parallel",
+        description="How analysis facets run: concurrently, one after another, "
+                    "or as one structured call when the generator enforces schemas",
+    )
+    max_parallel_facets: int = Field(4, ge=1, description="Facets generated at the same time")
+    facet_timeout_seconds: float = Field(
+        180, gt=0, description="Seconds a single facet may run before it is dropped"
+    )
+
+    # Batch analysis
+    batch_max_workers: int = Field(4, ge=1, description="Issues analyzed at the same time in a batch run")
+    batch_requests_per_minute: float = Field(
+        20, ge=0, description="Issue analyses started per minute in a batch run (0 = unlimited)"
+    )
+    batch_max_tokens_per_issue: int = Field(
+        0, ge=0, description="Token budget per issue (0 = sum of the facet budgets)"
+    )
+    batch_max_total_tokens: int = Field(
+        0, ge=0, description="Stop dispatching once a batch run has used this many tokens (0 = unlimited)"
+    )
+    batch_write_concurrency: int = Field(2, ge=1, description="Concurrent Jira writes in a batch run")
+
     # Features (Active)
     enable_requirement_extraction: bool = Field(True, description="Enable requirement extraction")
     enable_subtasks: bool = Field(True, description="Enable subtask suggestion")
@@ -118,6 +142,7 @@ def load_agent_config(
     limits = data.get("agent", {}).get("limits", {})
     features = data.get("agent", {}).get("features", {})
     formatting = data.get("agent", {}).get("formatting", {})
+    batch = data.get("agent", {}).get("batch", {})
 
     # Build JiraAgentConfig
     return JiraAgentConfig(
@@ -138,6 +163,16 @@ def load_agent_config(
         # AI Parameters
         temperature=limits.get("temperature", agent_meta.get("temperature", 0.7)),
         max_tokens=limits.get("max_tokens", agent_meta.get("max_tokens", 2000)),
+        # Analysis execution
+        analysis_mode=features.get("analysis_mode", "parallel"),
+        max_parallel_facets=limits.get("max_parallel_facets", 4),
+        facet_timeout_seconds=limits.get("facet_timeout_seconds", 180),
+        # Batch analysis
+        batch_max_workers=batch.get("max_workers", 4),
+        batch_requests_per_minute=batch.get("requests_per_minute", 20),
+        batch_max_tokens_per_issue=batch.get("max_tokens_per_issue", 0),
+        batch_max_total_tokens=batch.get("max_total_tokens", 0),
+        batch_write_concurrency=batch.get("write_concurrency", 2),
         # Features (Active)
         enable_requirement_extraction=features.get("enable_requirement_extraction", True),
         enable_subtasks=features.get("enable_subtasks", True),
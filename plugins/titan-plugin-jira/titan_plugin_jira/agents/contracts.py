@@ -79,6 +79,32 @@ SUBTASK_CONTRACT = JsonContract(
 )
 
 
+FUSED_SECTIONS = {
+    "requirements": REQUIREMENTS_CONTRACT,
+    "risks": RISK_CONTRACT,
+    "dependencies": DEPENDENCY_CONTRACT,
+    "subtasks": SUBTASK_CONTRACT,
+}
+"""Section name in a fused analysis answer -> the contract of the facet it replaces."""
+
+
+def fused_analysis_contract(sections: list[str]) -> JsonContract:
+    """
+    One contract covering several analysis facets, each under its own key.
+
+    Used only with generators that enforce a JSON schema: without enforcement
+    a single large answer is more likely to come back malformed, and then
+    every facet is lost instead of one.
+    """
+    return JsonContract(
+        schema={
+            "type": "object",
+            "properties": {name: FUSED_SECTIONS[name].schema for name in sections},
+        },
+        defaults={name: dict(FUSED_SECTIONS[name].defaults) for name in sections},
+    )
+
+
 # A comment is prose written for a human to read, so there is nothing to parse.
 COMMENT_CONTRACT = TextContract()
 
@@ -86,7 +112,9 @@ COMMENT_CONTRACT = TextContract()
 __all__ = [
     "COMMENT_CONTRACT",
     "DEPENDENCY_CONTRACT",
+    "FUSED_SECTIONS",
     "REQUIREMENTS_CONTRACT",
     "RISK_CONTRACT",
     "SUBTASK_CONTRACT",
+    "fused_analysis_contract",
 ]
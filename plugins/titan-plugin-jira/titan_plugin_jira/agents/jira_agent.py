@@ -10,9 +10,13 @@ This agent analyzes JIRA issues and automatically:
 5. Identifies risks and dependencies
 """
 
+import contextvars
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
+from titan_cli.core.interrupt import CancellationToken, cancellation_scope
 from titan_cli.core.logging import get_logger
 from titan_cli.ai.agents.base import BaseAIAgent, AgentRequest
 from titan_cli.core.result import ClientSuccess, ClientError
@@ -23,6 +27,7 @@ from .contracts import (
     REQUIREMENTS_CONTRACT,
     RISK_CONTRACT,
     SUBTASK_CONTRACT,
+    fused_analysis_contract,
 )
 from .validators import IssueValidator
 from .token_tracker import TokenTracker, TokenBudget, OperationType
@@ -31,6 +36,17 @@ from .prompts import JiraAgentPrompts
 # Set up logger
 logger = get_logger(__name__)
 
+# Analysis facet -> section name in a fused answer
+_FUSED_SECTION_BY_FACET = {
+    OperationType.REQUIREMENTS_EXTRACTION: "requirements",
+    OperationType.RISK_ANALYSIS: "risks",
+    OperationType.DEPENDENCY_DETECTION: "dependencies",
+    OperationType.SUBTASK_SUGGESTION: "subtasks",
+}
+
+# (result, error) for one facet; exactly one of the two is set
+FacetOutcome = Tuple[Optional[Dict[str, Any]], Optional[str]]
+
 
 @dataclass
 class IssueAnalysis:
@@ -125,7 +141,8 @@ class JiraAgent(BaseAIAgent):
         issue_key: str,
         include_subtasks: bool = True,
         include_comments: bool = False,
-        include_linked_issues: bool = False
+        include_linked_issues: bool = False,
+        issue=None
     ) -> IssueAnalysis:
         """
         Analyze a JIRA issue and extract requirements, risks, and suggestions.
@@ -135,11 +152,13 @@ class JiraAgent(BaseAIAgent):
             include_subtasks: Whether to suggest subtasks
             include_comments: Whether to analyze existing comments
             include_linked_issues: Whether to consider linked issues
+            issue: Already-fetched issue (skips the get_issue call); it must
+                carry the description, as search results only do when asked
 
         Returns:
             IssueAnalysis with complete analysis (gracefully handles errors)
         """
-        if not self.jira:
+        if issue is None and not self.jira:
             logger.error("JiraClient not available for issue analysis")
             return IssueAnalysis()
 
@@ -162,113 +181,35 @@ class JiraAgent(BaseAIAgent):
 
         # 1. Get issue from JIRA (with error handling)
         try:
-            result = self.jira.get_issue(issue_key)
-
-            # Handle Result
-            match result:
-                case ClientSuccess(data=issue):
-                    pass  # Continue with issue
-                case ClientError(error_message=err):
-                    logger.error(f"Failed to get issue {issue_key}: {err}")
-                    return IssueAnalysis()
-
-            # 2. Analyze requirements (with AI error handling)
-            if self.config.enable_requirement_extraction:
-                try:
-                    requirements_result = self._extract_requirements(issue)
-                    functional_reqs = requirements_result.get("functional", [])
-                    non_functional_reqs = requirements_result.get("non_functional", [])
-                    acceptance_criteria = requirements_result.get("acceptance_criteria", [])
-                    technical_approach = requirements_result.get("technical_approach")
-                    # Track tokens
-                    tokens_used = requirements_result.get("tokens_used", 0)
-                    self.token_tracker.record_usage(
-                        OperationType.REQUIREMENTS_EXTRACTION,
-                        tokens_used,
-                        issue_key=issue_key,
-                        success=True
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to extract requirements: {e}")
-                    self.token_tracker.record_usage(
-                        OperationType.REQUIREMENTS_EXTRACTION,
-                        0,
-                        issue_key=issue_key,
-                        success=False,
-                        error=str(e)
-                    )
-
-            # 3. Analyze risks and dependencies (with AI error handling)
-            if self.config.enable_risk_analysis:
-                try:
-                    risk_result = self._analyze_risks(issue)
-                    risks = risk_result.get("risks", [])
-                    edge_cases = risk_result.get("edge_cases", [])
-                    complexity_score = risk_result.get("complexity")
-                    estimated_effort = risk_result.get("effort")
-                    # Track tokens
-                    tokens_used = risk_result.get("tokens_used", 0)
-                    self.token_tracker.record_usage(
-                        OperationType.RISK_ANALYSIS,
-                        tokens_used,
-                        issue_key=issue_key,
-                        success=True
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to analyze risks: {e}")
-                    self.token_tracker.record_usage(
-                        OperationType.RISK_ANALYSIS,
-                        0,
-                        issue_key=issue_key,
-                        success=False,
-                        error=str(e)
-                    )
-
-            # 4. Detect dependencies (with AI error handling)
-            if self.config.enable_dependency_detection:
-                try:
-                    dep_result = self._detect_dependencies(issue)
-                    dependencies = dep_result.get("dependencies", [])
-                    # Track tokens
-                    tokens_used = dep_result.get("tokens_used", 0)
-                    self.token_tracker.record_usage(
-                        OperationType.DEPENDENCY_DETECTION,
-                        tokens_used,
-                        issue_key=issue_key,
-                        success=True
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to detect dependencies: {e}")
-                    self.token_tracker.record_usage(
-                        OperationType.DEPENDENCY_DETECTION,
-                        0,
-                        issue_key=issue_key,
-                        success=False,
-                        error=str(e)
-                    )
-
-            # 5. Suggest subtasks (with AI error handling)
-            if include_subtasks and self.config.enable_subtasks:
-                try:
-                    subtask_result = self._suggest_subtasks(issue)
-                    suggested_subtasks = subtask_result.get("subtasks", [])
-                    # Track tokens
-                    tokens_used = subtask_result.get("tokens_used", 0)
-                    self.token_tracker.record_usage(
-                        OperationType.SUBTASK_SUGGESTION,
-                        tokens_used,
-                        issue_key=issue_key,
-                        success=True
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to suggest subtasks: {e}")
-                    self.token_tracker.record_usage(
-                        OperationType.SUBTASK_SUGGESTION,
-                        0,
-                        issue_key=issue_key,
-                        success=False,
-                        error=str(e)
-                    )
+            if issue is None:
+                result = self.jira.get_issue(issue_key)
+
+                # Handle Result
+                match result:
+                    case ClientSuccess(data=issue):
+                        pass  # Continue with issue
+                    case ClientError(error_message=err):
+                        logger.error(f"Failed to get issue {issue_key}: {err}")
+                        return IssueAnalysis()
+
+            # 2. Run the enabled analysis facets (independent AI calls)
+            facets = self._enabled_facets(include_subtasks)
+            results = self._run_facets(issue, facets)
+
+            requirements_result = results.get(OperationType.REQUIREMENTS_EXTRACTION, {})
+            functional_reqs = requirements_result.get("functional", [])
+            non_functional_reqs = requirements_result.get("non_functional", [])
+            acceptance_criteria = requirements_result.get("acceptance_criteria", [])
+            technical_approach = requirements_result.get("technical_approach")
+
+            risk_result = results.get(OperationType.RISK_ANALYSIS, {})
+            risks = risk_result.get("risks", [])
+            edge_cases = risk_result.get("edge_cases", [])
+            complexity_score = risk_result.get("complexity")
+            estimated_effort = risk_result.get("effort")
+
+            dependencies = results.get(OperationType.DEPENDENCY_DETECTION, {}).get("dependencies", [])
+            suggested_subtasks = results.get(OperationType.SUBTASK_SUGGESTION, {}).get("subtasks", [])
 
         except Exception as e:
             logger.error(f"Failed to get issue {issue_key}: {e}")
@@ -290,6 +231,200 @@ class JiraAgent(BaseAIAgent):
             estimated_effort=estimated_effort
         )
 
+    def _enabled_facets(self, include_subtasks: bool) -> List[OperationType]:
+        """Analysis facets switched on by config, in report order."""
+        facets = []
+        if self.config.enable_requirement_extraction:
+            facets.append(OperationType.REQUIREMENTS_EXTRACTION)
+        if self.config.enable_risk_analysis:
+            facets.append(OperationType.RISK_ANALYSIS)
+        if self.config.enable_dependency_detection:
+            facets.append(OperationType.DEPENDENCY_DETECTION)
+        if include_subtasks and self.config.enable_subtasks:
+            facets.append(OperationType.SUBTASK_SUGGESTION)
+        return facets
+
+    def _facet_runner(self, operation: OperationType):
+        return {
+            OperationType.REQUIREMENTS_EXTRACTION: self._extract_requirements,
+            OperationType.RISK_ANALYSIS: self._analyze_risks,
+            OperationType.DEPENDENCY_DETECTION: self._detect_dependencies,
+            OperationType.SUBTASK_SUGGESTION: self._suggest_subtasks,
+        }[operation]
+
+    def _run_facets(self, issue, facets: List[OperationType]) -> Dict[OperationType, Dict[str, Any]]:
+        """
+        Run the facets and record their token usage.
+
+        Each facet is an independent generation over the same issue, so by
+        default they run concurrently and the analysis costs roughly the
+        slowest facet instead of the sum. In ``fused`` mode, generators that
+        enforce a JSON schema answer every facet in a single call. A facet
+        that fails or times out is recorded as failed and left out; the rest
+        of the analysis still completes.
+
+        Returns:
+            Results of the facets that succeeded
+        """
+        if not facets:
+            return {}
+
+        outcomes: Optional[Dict[OperationType, FacetOutcome]] = None
+        mode = self.config.analysis_mode
+        if mode == "fused" and len(facets) > 1:
+            if self._supports_structured_output():
+                outcomes = self._run_fused(issue, facets)
+            else:
+                logger.info("jira_agent_fused_unsupported", fallback="parallel")
+
+        if outcomes is None:
+            if mode == "sequential" or self.config.max_parallel_facets <= 1 or len(facets) == 1:
+                outcomes = {op: self._run_facet(op, issue) for op in facets}
+            else:
+                outcomes = self._run_parallel(issue, facets)
+
+        results = {}
+        for operation in facets:
+            result, error = outcomes[operation]
+            if error is None:
+                results[operation] = result
+                self.token_tracker.record_usage(
+                    operation,
+                    result.get("tokens_used", 0),
+                    issue_key=issue.key,
+                    success=True
+                )
+            else:
+                logger.warning(f"Failed to run {operation.value}: {error}")
+                self.token_tracker.record_usage(
+                    operation,
+                    0,
+                    issue_key=issue.key,
+                    success=False,
+                    error=error
+                )
+        return results
+
+    def _run_facet(self, operation: OperationType, issue) -> FacetOutcome:
+        try:
+            return self._facet_runner(operation)(issue), None
+        except Exception as e:
+            return None, str(e)
+
+    def _run_parallel(self, issue, facets: List[OperationType]) -> Dict[OperationType, FacetOutcome]:
+        """
+        Run facets on a bounded thread pool, each limited to facet_timeout_seconds.
+
+        A facet's clock starts when a worker picks it up, not when it is
+        queued. Each facet runs under its own cancellation token: at its
+        deadline the token is cancelled, which kills its headless CLI process
+        group and aborts its HTTP requests, and the facet is reported as a
+        timeout. Cancelling the workflow cancels every facet.
+        """
+        timeout = self.config.facet_timeout_seconds
+        workers = min(len(facets), self.config.max_parallel_facets)
+        started: Dict[OperationType, float] = {}
+        tokens = {op: CancellationToken() for op in facets}
+
+        def run(operation: OperationType):
+            started[operation] = time.monotonic()
+            with cancellation_scope(tokens[operation]):
+                return self._facet_runner(operation)(issue)
+
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="jira-agent-facet")
+        try:
+            # Each facet runs in a copy of the caller's context, so it inherits
+            # the workflow's token and its trace spans nest under the caller's.
+            futures = {pool.submit(contextvars.copy_context().run, run, op): op for op in facets}
+            pending = set(futures)
+            outcomes: Dict[OperationType, FacetOutcome] = {}
+            while pending:
+                now = time.monotonic()
+                for future in [f for f in pending if futures[f] in started]:
+                    if not future.done() and now - started[futures[future]] >= timeout:
+                        outcomes[futures[future]] = (None, f"timed out after {timeout:g}s")
+                        tokens[futures[future]].cancel(f"Facet timed out after {timeout:g}s")
+                        pending.discard(future)
+                if not pending:
+                    break
+
+                deadlines = [
+                    started[futures[f]] + timeout - now
+                    for f in pending
+                    if futures[f] in started
+                ]
+                done, pending = wait(
+                    pending,
+                    timeout=max(0.0, min(deadlines)) if deadlines else timeout,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    try:
+                        outcomes[futures[future]] = (future.result(), None)
+                    except Exception as e:
+                        outcomes[futures[future]] = (None, str(e))
+            return outcomes
+        finally:
+            # Stop whatever is still running (facets left behind by an
+            # exception, including the workflow being cancelled)
+            for token in tokens.values():
+                token.cancel("Facet analysis finished")
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _supports_structured_output(self) -> bool:
+        # Strict identity check: a mock generator answers any attribute truthily.
+        return getattr(self.generator, "supports_structured_output", False) is True
+
+    def _run_fused(self, issue, facets: List[OperationType]) -> Optional[Dict[OperationType, FacetOutcome]]:
+        """
+        Ask for every facet in one structured-output call.
+
+        Returns None when the call itself fails, so the caller falls back to
+        separate calls. Tokens are split evenly across the facets it answered.
+        """
+        sections = [_FUSED_SECTION_BY_FACET[op] for op in facets]
+        description = self.validator.sanitize_description(
+            issue.description or "",
+            self.config.max_description_length
+        )
+        prompt = JiraAgentPrompts.fused_analysis(
+            issue_key=issue.key,
+            summary=issue.summary,
+            issue_type=issue.issue_type,
+            priority=issue.priority,
+            description=description,
+            sections=sections,
+            max_subtasks=self.config.max_subtasks
+        )
+        request = AgentRequest(
+            context=prompt,
+            max_tokens=self.config.max_tokens * len(facets),
+            temperature=self.config.temperature,
+            system_prompt=self.config.requirements_system_prompt,
+            operation="fused_analysis",
+            contract=fused_analysis_contract(sections),
+        )
+
+        try:
+            response = self.generate(request)
+        except Exception as e:
+            logger.warning("jira_agent_fused_failed", error=str(e), fallback="parallel")
+            return None
+
+        share, remainder = divmod(response.tokens_used, len(facets))
+        outcomes: Dict[OperationType, FacetOutcome] = {}
+        for index, (operation, section) in enumerate(zip(facets, sections)):
+            result = response.parsed.get(section) or {}
+            if not isinstance(result, dict):
+                outcomes[operation] = (None, f"fused answer has no '{section}' object")
+                continue
+            result = dict(result)
+            if operation == OperationType.SUBTASK_SUGGESTION:
+                result = {"subtasks": self._valid_subtasks(result)}
+            result["tokens_used"] = share + (remainder if index == 0 else 0)
+            outcomes[operation] = (result, None)
+        return outcomes
+
     def _extract_requirements(self, issue) -> Dict[str, Any]:
         """
         Extract functional and non-functional requirements from issue.
@@ -6,7 +6,7 @@ All prompts are defined here for easy reuse, maintenance, and future externaliza
 Addresses PR #74 comment: "Prompt hardcoded" (Comment #9)
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
 import re
 
 
@@ -183,6 +183,51 @@ SUBTASK_2:
 Summary: <concise summary>
 Description: <brief technical description>"""
 
+    @staticmethod
+    def fused_analysis(
+        issue_key: str,
+        summary: str,
+        issue_type: str,
+        priority: str,
+        description: str,
+        sections: List[str],
+        max_subtasks: int = 5
+    ) -> str:
+        """
+        Prompt asking for several analysis facets in one structured answer.
+
+        Each requested section uses the same keys as the facet's own prompt,
+        nested under the section name (requirements, risks, dependencies,
+        subtasks).
+        """
+        # Sanitize all user inputs to prevent prompt injection
+        safe_summary = JiraAgentPrompts.sanitize_for_prompt(summary, max_length=500)
+        safe_description = JiraAgentPrompts.sanitize_for_prompt(description, max_length=5000)
+
+        guidance = {
+            "requirements": "requirements: functional and non-functional requirements, "
+                            "acceptance criteria and a brief technical approach",
+            "risks": "risks: potential risks, edge cases, complexity "
+                     "(low|medium|high|very high) and effort "
+                     "(1-2 days|3-5 days|1-2 weeks|2+ weeks)",
+            "dependencies": "dependencies: external APIs, libraries, services or systems",
+            "subtasks": f"subtasks: up to {max_subtasks} subtasks, each with a concise "
+                        "summary and a brief technical description",
+        }
+        requested = "\n".join(f"- {guidance[name]}" for name in sections)
+
+        return f"""Analyze this JIRA issue.
+
+Issue: {issue_key} - {safe_summary}
+Type: {issue_type}
+Priority: {priority}
+
+Description:
+{safe_description}
+
+Provide each of the following, each under its own key:
+{requested}"""
+
     @staticmethod
     def comment_generation(
         issue_key: str,
@@ -6,6 +6,7 @@ Addresses PR #74 comment: "Token Tracking Inconsistente"
 Provides consistent, transparent token usage tracking across all AI operations.
 """
 
+import threading
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 from enum import Enum
@@ -81,6 +82,9 @@ class TokenTracker:
     """
     Tracks token usage across all AI operations in a session.
 
+    Safe to record into from several threads: analysis facets may run
+    concurrently.
+
     Features:
     - Consistent tracking across all operations
     - Budget enforcement
@@ -98,6 +102,7 @@ class TokenTracker:
         self.budget = budget
         self.usage_history: List[TokenUsage] = []
         self._total_tokens = 0
+        self._lock = threading.Lock()
 
     def record_usage(
         self,
@@ -125,8 +130,9 @@ class TokenTracker:
             error=error
         )
 
-        self.usage_history.append(usage)
-        self._total_tokens += tokens_used
+        with self._lock:
+            self.usage_history.append(usage)
+            self._total_tokens += tokens_used
 
     def get_total_tokens(self) -> int:
         """Get total tokens used across all operations."""
@@ -140,7 +146,9 @@ class TokenTracker:
             Dict mapping operation type to total tokens used
         """
         result = {}
-        for usage in self.usage_history:
+        with self._lock:
+            history = list(self.usage_history)
+        for usage in history:
             op_type = usage.operation
             result[op_type] = result.get(op_type, 0) + usage.tokens_used
 
@@ -219,5 +227,6 @@ class TokenTracker:
 
     def reset(self) -> None:
         """Reset tracker (useful for new analysis session)."""
-        self.usage_history = []
-        self._total_tokens = 0
+        with self._lock:
+            self.usage_history = []
+            self._total_tokens = 0
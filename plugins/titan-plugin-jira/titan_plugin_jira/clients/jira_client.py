@@ -5,11 +5,12 @@ Public API for Jira plugin.
 Delegates to internal services.
 """
 
-from typing import List, Optional
+from pathlib import Path
+from typing import Iterator, List, Optional
 
 from titan_cli.core.result import ClientResult, ClientSuccess, ClientError
 
-from .network import JiraNetwork
+from .network import JiraNetwork, JiraResponseCache
 from .services import (
     IssueService,
     ProjectService,
@@ -50,7 +51,8 @@ class JiraClient:
         project_key: Optional[str] = None,
         timeout: int = 30,
         enable_cache: bool = False,
-        cache_ttl: int = 300
+        cache_ttl: int = 300,
+        cache_dir: Optional[Path] = None,
     ):
         """
         Initialize Jira client.
@@ -61,8 +63,11 @@ class JiraClient:
             api_token: Jira API token (Personal Access Token)
             project_key: Default project key (optional)
             timeout: Request timeout in seconds
-            enable_cache: Enable response caching (optional, not implemented yet)
-            cache_ttl: Cache time-to-live in seconds (optional, not implemented yet)
+            enable_cache: Cache metadata responses (issue types, statuses,
+                versions, priorities, current user, projects)
+            cache_ttl: Cache time-to-live in seconds
+            cache_dir: Also persist cached responses under this directory
+                (scoped per instance and user); memory only when None
         """
         self.base_url = base_url.rstrip("/")
         self.project_key = project_key
@@ -70,7 +75,12 @@ class JiraClient:
         self.cache_ttl = cache_ttl
 
         # Internal dependencies (private)
-        self._network = JiraNetwork(base_url, email, api_token, timeout)
+        cache = (
+            JiraResponseCache(cache_ttl, base_url, email, cache_dir=cache_dir)
+            if enable_cache
+            else None
+        )
+        self._network = JiraNetwork(base_url, email, api_token, timeout, cache=cache)
         self._metadata_service = MetadataService(self._network)
         self._issue_service = IssueService(self._network, self._metadata_service)
         self._project_service = ProjectService(self._network)
@@ -78,6 +88,11 @@ class JiraClient:
         self._transition_service = TransitionService(self._network)
         self._link_service = LinkService(self._network)
 
+    def clear_cache(self) -> None:
+        """Drop every cached metadata response so the next calls hit Jira."""
+        if self._network.cache is not None:
+            self._network.cache.invalidate()
+
     # ==================== ISSUE OPERATIONS ====================
 
     def get_issue(
@@ -116,6 +131,35 @@ class JiraClient:
         """
         return self._issue_service.search_issues(jql, max_results, fields)
 
+    def iter_search(
+        self,
+        jql: str,
+        fields: Optional[List[str]] = None,
+        page_size: int = 100,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> Iterator[ClientResult[List[UIJiraIssue]]]:
+        """
+        Stream JQL search results one page at a time.
+
+        Follows Jira's ``nextPageToken`` until the results (or ``limit``) are
+        exhausted, so callers can render the first page before the rest
+        arrives.
+
+        Args:
+            jql: JQL query string
+            fields: List of fields to return
+            page_size: Issues requested per page
+            limit: Stop after this many issues (None = all results)
+            prefetch: Fetch the next page on a background thread meanwhile
+
+        Yields:
+            ClientResult[List[UIJiraIssue]] - one Success per page, or a final Error
+        """
+        return self._issue_service.iter_search(
+            jql, fields=fields, page_size=page_size, limit=limit, prefetch=prefetch
+        )
+
     # ==================== PROJECT OPERATIONS ====================
 
     def get_project(self, key: Optional[str] = None) -> ClientResult[UIJiraProject]:
@@ -6,5 +6,6 @@ Returns raw JSON responses (dicts).
 """
 
 from .jira_network import JiraNetwork
+from .response_cache import JiraResponseCache
 
-__all__ = ["JiraNetwork"]
+__all__ = ["JiraNetwork", "JiraResponseCache"]
@@ -9,13 +9,16 @@ NO model parsing, NO business logic.
 import base64
 import json
 import time
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Union
 
 import requests
 
 from titan_cli.core.logging.config import get_logger
+from titan_cli.core.interrupt import interruptible_io
+from titan_cli.core.tracing import span
 
 from ...exceptions import JiraAPIError
+from .response_cache import JiraResponseCache, invalidation_prefixes, is_cacheable
 
 
 class JiraNetwork:
@@ -31,7 +34,8 @@ class JiraNetwork:
         base_url: str,
         email: str,
         api_token: str,
-        timeout: int = 30
+        timeout: int = 30,
+        cache: Optional[JiraResponseCache] = None,
     ):
         """
         Initialize Jira network layer.
@@ -41,6 +45,7 @@ class JiraNetwork:
             email: User email for authentication
             api_token: Jira API token (Personal Access Token)
             timeout: Request timeout in seconds
+            cache: Response cache for metadata endpoints (None disables caching)
 
         Raises:
             JiraAPIError: If required parameters are missing
@@ -57,6 +62,7 @@ class JiraNetwork:
         self.email = email
         self.api_token = api_token
         self.timeout = timeout
+        self.cache = cache
         self._logger = get_logger(__name__)
 
         # Setup session with Basic Auth (email:api_token)
@@ -88,6 +94,31 @@ class JiraNetwork:
         Raises:
             JiraAPIError: If request fails
         """
+        cache_key = None
+        if self.cache is not None and is_cacheable(method, endpoint):
+            cache_key = self.cache.make_key(endpoint, kwargs.get("params"))
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self._logger.debug("jira_request_cached", method=method.upper(), endpoint=endpoint)
+                return cached
+
+        data = self._send(method, endpoint, **kwargs)
+
+        if self.cache is not None:
+            if cache_key is not None:
+                self.cache.put(cache_key, data)
+            else:
+                for prefix in invalidation_prefixes(method, endpoint, kwargs.get("json")):
+                    self.cache.invalidate(prefix)
+        return data
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs
+    ) -> Union[Dict, List]:
+        """Perform the HTTP request, bypassing the cache."""
         # Build full URL (Jira Cloud uses API v3)
         url = f"{self.base_url}/rest/api/3/{endpoint.lstrip('/')}"
 
@@ -101,12 +132,14 @@ class JiraNetwork:
         start = time.time()
 
         try:
-            response = self.session.request(
-                method,
-                url,
-                timeout=self.timeout,
-                **kwargs
-            )
+            # interruptible_io aborts the request if the workflow is cancelled
+            with span(f"{method.upper()} {endpoint}", "http"), interruptible_io():
+                response = self.session.request(
+                    method,
+                    url,
+                    timeout=self.timeout,
+                    **kwargs
+                )
 
             # Handle 204 No Content
             if response.status_code == 204:
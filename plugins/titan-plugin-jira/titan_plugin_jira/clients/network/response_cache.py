@@ -0,0 +1,234 @@
+"""
+Jira Response Cache
+
+TTL cache for raw JSON responses of Jira metadata endpoints.
+In-memory, optionally mirrored to disk so new processes start warm.
+Entries are scoped per Jira instance and user.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import quote, unquote, urlencode
+
+from titan_cli.core.logging.config import get_logger
+
+logger = get_logger(__name__)
+
+CACHEABLE_ENDPOINTS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"^project/[^/]+$",
+        r"^project/[^/]+/statuses$",
+        r"^project/[^/]+/versions$",
+        r"^myself$",
+        r"^priority$",
+        r"^issuetype$",
+        r"^issueLinkType$",
+        r"^field$",
+    )
+)
+"""GET endpoints whose responses are metadata that rarely changes. Issues and
+searches are never cached."""
+
+READ_ONLY_POST_ENDPOINTS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"^search(/.*)?$",
+        r"^jql/.+$",
+    )
+)
+"""POST endpoints that only read (JQL searches and parsing): they change
+nothing, so they invalidate nothing."""
+
+
+def is_cacheable(method: str, endpoint: str) -> bool:
+    """Whether a request's response may be served from the cache."""
+    if method.upper() != "GET":
+        return False
+    endpoint = endpoint.strip("/")
+    return any(pattern.match(endpoint) for pattern in CACHEABLE_ENDPOINTS)
+
+
+def invalidation_prefixes(method: str, endpoint: str, payload: Any = None) -> Tuple[str, ...]:
+    """
+    Cached endpoints a successful write may have made stale.
+
+    A write invalidates its own resource (``issue/PROJ-1/transitions`` drops
+    everything under ``issue/PROJ-1``). Version writes also drop the owning
+    project, whose response embeds the version list.
+    """
+    if method.upper() == "GET":
+        return ()
+    endpoint = endpoint.strip("/")
+    if method.upper() == "POST" and any(pattern.match(endpoint) for pattern in READ_ONLY_POST_ENDPOINTS):
+        return ()
+    parts = endpoint.split("/")
+    prefixes = ["/".join(parts[:2])]
+    if parts[0] == "version":
+        project = payload.get("project") if isinstance(payload, dict) else None
+        prefixes.append(f"project/{project}" if project else "project/")
+    return tuple(prefixes)
+
+
+class JiraResponseCache:
+    """
+    Thread-safe TTL cache of raw Jira responses keyed by endpoint + params.
+
+    Disk entries live under ``<cache_dir>/<scope>/<resource>/`` where the
+    scope is a hash of base URL and user, so two accounts never see each
+    other's data, and the resource is the first two segments of the endpoint
+    (``project/PROJ``), so invalidation removes whole directories instead of
+    reading every entry. Disk failures are logged and ignored; the cache
+    never fails a request.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int,
+        base_url: str,
+        user: str,
+        cache_dir: Optional[Path] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: How long an entry stays valid
+            base_url: Jira instance URL (scopes the cache)
+            user: Authenticated user (scopes the cache)
+            cache_dir: Directory for the on-disk mirror (None = memory only)
+        """
+        self.ttl_seconds = ttl_seconds
+        scope = hashlib.sha256(f"{base_url.rstrip('/')}\0{user}".encode()).hexdigest()[:16]
+        self.directory = Path(cache_dir) / scope if cache_dir is not None else None
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """Build the cache key for an endpoint and its query params."""
+        key = endpoint.strip("/")
+        if params:
+            key += "?" + urlencode(sorted((str(k), str(v)) for k, v in params.items()))
+        return key
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a copy of the cached payload, or None when missing or expired."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._read_disk(key)
+                if entry is not None:
+                    self._entries[key] = entry
+            if entry is None:
+                return None
+            expires_at, payload = entry
+            if expires_at <= now:
+                self._entries.pop(key, None)
+                return None
+            return copy.deepcopy(payload)
+
+    def put(self, key: str, payload: Any) -> None:
+        """Store a payload for ``ttl_seconds``."""
+        if self.ttl_seconds <= 0:
+            return
+        entry = (time.time() + self.ttl_seconds, copy.deepcopy(payload))
+        with self._lock:
+            self._entries[key] = entry
+            self._write_disk(key, entry)
+
+    @staticmethod
+    def _matches(key: str, prefix: str) -> bool:
+        # "project/AB" must not drop "project/ABC"; a trailing slash or an
+        # empty prefix matches everything beneath it.
+        if not prefix or prefix.endswith("/"):
+            return key.startswith(prefix)
+        return key == prefix or key.startswith((f"{prefix}/", f"{prefix}?"))
+
+    def invalidate(self, prefix: str = "") -> None:
+        """Drop every entry for ``prefix`` and the resources beneath it (everything by default)."""
+        with self._lock:
+            for key in [k for k in self._entries if self._matches(k, prefix)]:
+                del self._entries[key]
+            if self.directory is None or not self.directory.exists():
+                return
+            try:
+                resource_dirs = [path for path in self.directory.iterdir() if path.is_dir()]
+            except OSError as e:
+                logger.debug("jira_cache_invalidate_failed", error=str(e))
+                return
+            for resource_dir in resource_dirs:
+                resource = unquote(resource_dir.name)
+                if self._matches(resource, prefix):
+                    self._remove_dir(resource_dir)
+                elif prefix.startswith(f"{resource}/"):
+                    # A prefix deeper than the resource: only some of its entries match
+                    self._remove_matching(resource_dir, prefix)
+
+    @staticmethod
+    def _resource(key: str) -> str:
+        return "/".join(key.split("?", 1)[0].split("/")[:2])
+
+    def _path_for(self, key: str) -> Path:
+        resource_dir = self.directory / quote(self._resource(key), safe="")
+        return resource_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    @staticmethod
+    def _remove_dir(resource_dir: Path) -> None:
+        try:
+            for path in resource_dir.iterdir():
+                path.unlink(missing_ok=True)
+            resource_dir.rmdir()
+        except OSError as e:
+            logger.debug("jira_cache_invalidate_failed", error=str(e))
+
+    def _remove_matching(self, resource_dir: Path, prefix: str) -> None:
+        for path in resource_dir.glob("*.json"):
+            try:
+                stored_key = json.loads(path.read_text(encoding="utf-8")).get("key", "")
+                if self._matches(stored_key, prefix):
+                    path.unlink(missing_ok=True)
+            except (OSError, ValueError):
+                path.unlink(missing_ok=True)
+
+    def _read_disk(self, key: str) -> Optional[Tuple[float, Any]]:
+        if self.directory is None:
+            return None
+        path = self._path_for(key)
+        if not path.exists():
+            return None
+        try:
+            stored = json.loads(path.read_text(encoding="utf-8"))
+            if stored.get("key") != key:
+                return None
+            return float(stored["expires_at"]), stored["payload"]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("jira_cache_read_failed", error=str(e))
+            return None
+
+    def _write_disk(self, key: str, entry: Tuple[float, Any]) -> None:
+        if self.directory is None:
+            return
+        try:
+            path = self._path_for(key)
+            self.directory.mkdir(parents=True, exist_ok=True, mode=0o700)
+            path.parent.mkdir(exist_ok=True, mode=0o700)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(
+                json.dumps({"key": key, "expires_at": entry[0], "payload": entry[1]}),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("jira_cache_write_failed", error=str(e))
+
+
+__all__ = ["JiraResponseCache", "is_cacheable", "invalidation_prefixes"]
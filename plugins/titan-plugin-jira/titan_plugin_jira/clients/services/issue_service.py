@@ -5,7 +5,9 @@ Handles issue-related operations.
 Network → NetworkModel → UIModel → ClientResult
 """
 
-from typing import List, Optional
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator, List, Optional
 
 from titan_cli.core.result import ClientResult, ClientSuccess, ClientError
 from titan_cli.core.logging import log_client_operation
@@ -25,6 +27,11 @@ from ...models import (
 from ...models.network.rest.issue import NetworkJiraComponent, NetworkJiraVersion
 from ...exceptions import JiraAPIError
 
+DEFAULT_SEARCH_FIELDS = ["summary", "status", "assignee", "priority", "created", "updated"]
+
+SEARCH_PAGE_SIZE = 100
+"""Largest page Jira Cloud returns from search/jql when fields are requested."""
+
 
 class IssueService:
     """
@@ -100,6 +107,9 @@ class IssueService:
         """
         Search issues using JQL.
 
+        Follows ``nextPageToken`` until ``max_results`` issues are collected,
+        so limits above Jira's page size are honoured instead of truncated.
+
         Args:
             jql: JQL query string
             max_results: Maximum number of results
@@ -108,35 +118,132 @@ class IssueService:
         Returns:
             ClientResult[List[UIJiraIssue]]
         """
-        try:
-            # 1. Network call
-            payload = {
-                "jql": jql,
-                "maxResults": max_results,
-                "fields": fields or ["summary", "status", "assignee", "priority", "created", "updated"]
-            }
+        ui_issues: List[UIJiraIssue] = []
+        pages = self.iter_search(
+            jql,
+            fields=fields,
+            page_size=min(max_results, SEARCH_PAGE_SIZE),
+            limit=max_results,
+        )
+        for page in pages:
+            match page:
+                case ClientSuccess(data=issues):
+                    ui_issues.extend(issues)
+                case ClientError() as error:
+                    return error
+
+        return ClientSuccess(
+            data=ui_issues,
+            message=f"Found {len(ui_issues)} issues"
+        )
 
-            data = self.network.make_request("POST", "search/jql", json=payload)
+    def iter_search(
+        self,
+        jql: str,
+        fields: Optional[List[str]] = None,
+        page_size: int = SEARCH_PAGE_SIZE,
+        limit: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> Iterator[ClientResult[List[UIJiraIssue]]]:
+        """
+        Stream JQL search results page by page.
 
-            # 2. Parse and map each issue
-            ui_issues = []
-            for issue_data in data.get("issues", []):
-                network_issue = self._parse_network_issue(issue_data)
-                # Pass raw data to mapper for custom fields access
-                ui_issue = from_network_issue(network_issue, raw=issue_data)
-                ui_issues.append(ui_issue)
+        Each page is parsed and mapped only when the consumer reaches it. With
+        ``prefetch``, the request for the next page is issued on a background
+        thread as soon as the current page's token is known, so network time
+        overlaps with mapping and rendering.
 
-            # 3. Wrap in Result
-            return ClientSuccess(
-                data=ui_issues,
-                message=f"Found {len(ui_issues)} issues"
-            )
+        Args:
+            jql: JQL query string
+            fields: List of fields to return
+            page_size: Issues requested per page
+            limit: Stop after this many issues (None = all results)
+            prefetch: Fetch the next page while the current one is consumed
+
+        Yields:
+            ClientSuccess with one page of issues; on failure a single
+            ClientError, after which the stream ends
+        """
+        fields = fields or DEFAULT_SEARCH_FIELDS
+        remaining = limit
+        executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="jira-search")
+            if prefetch
+            else None
+        )
+        pending: Optional[Future] = None
+
+        def next_size() -> int:
+            return page_size if remaining is None else max(1, min(page_size, remaining))
+
+        try:
+            data = self._fetch_search_page(jql, fields, next_size(), None)
+            while True:
+                issues_data = data.get("issues", [])
+                if remaining is not None:
+                    issues_data = issues_data[:remaining]
+                    remaining -= len(issues_data)
+                token = data.get("nextPageToken")
+                has_more = (
+                    bool(token)
+                    and bool(issues_data)
+                    and not data.get("isLast", False)
+                    and (remaining is None or remaining > 0)
+                )
+                if has_more and executor is not None:
+                    pending = executor.submit(
+                        contextvars.copy_context().run,
+                        self._fetch_search_page,
+                        jql,
+                        fields,
+                        next_size(),
+                        token,
+                    )
+
+                ui_issues = [
+                    # Pass raw data to mapper for custom fields access
+                    from_network_issue(self._parse_network_issue(issue_data), raw=issue_data)
+                    for issue_data in issues_data
+                ]
+                yield ClientSuccess(
+                    data=ui_issues,
+                    message=f"Fetched {len(ui_issues)} issues"
+                )
+
+                if not has_more:
+                    return
+                if pending is not None:
+                    data, pending = pending.result(), None
+                else:
+                    data = self._fetch_search_page(jql, fields, next_size(), token)
 
         except JiraAPIError as e:
-            return ClientError(
+            yield ClientError(
                 error_message=f"Failed to search issues: {e.message}",
                 error_code="SEARCH_ERROR"
             )
+        finally:
+            if pending is not None:
+                pending.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def _fetch_search_page(
+        self,
+        jql: str,
+        fields: List[str],
+        page_size: int,
+        next_page_token: Optional[str],
+    ) -> dict:
+        """Request one page of search/jql results."""
+        payload = {
+            "jql": jql,
+            "maxResults": page_size,
+            "fields": fields,
+        }
+        if next_page_token:
+            payload["nextPageToken"] = next_page_token
+        return self.network.make_request("POST", "search/jql", json=payload)
 
     @log_client_operation()
     def create_issue(
@@ -110,6 +110,19 @@ class Messages:
             NO_ISSUE_FOUND: str = "No issue found to analyze"
             ANALYZING: str = "Analyzing issue with AI..."
 
+        class AIBatch:
+            """Batch AI analysis step messages"""
+            JQL_REQUIRED: str = "Either 'jql' or 'query_name' is required for batch analysis"
+            RESUMING: str = "Resuming: {count} issue(s) already analyzed for this query"
+            ISSUE_DONE: str = "{key}: complexity {complexity}, effort {effort} ({tokens} tokens)"
+            ISSUE_RESUMED: str = "{key}: restored from checkpoint"
+            ISSUE_FAILED: str = "{key}: analysis failed - {error}"
+            ISSUE_OVER_BUDGET: str = "{key}: used {tokens} tokens (budget {budget}), not written back"
+            SEARCH_FAILED: str = "Search stopped early: {error}"
+            STOPPED: str = "Stopped dispatching: {reason}"
+            SUMMARY: str = "Analyzed {analyzed} issue(s), {failed} failed, {tokens} tokens this run"
+            COMMENTS_POSTED: str = "Posted {posted} analysis comment(s), {failed} failed"
+
         class ExtractKey:
             """Extract issue key step messages"""
             EXTRACTING_KEY: str = "Extracting JIRA key from branch: {branch}"
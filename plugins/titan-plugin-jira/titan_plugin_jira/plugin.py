@@ -27,6 +27,8 @@ class JiraPlugin(TitanPlugin):
     Provides a JiraClient for interacting with JIRA REST API.
     """
 
+    RESPONSE_CACHE_DIR = Path.home() / ".titan" / "cache" / "jira"
+
     @property
     def name(self) -> str:
         return "jira"
@@ -87,12 +89,37 @@ class JiraPlugin(TitanPlugin):
                 timeout=validated_config.timeout,
                 enable_cache=validated_config.enable_cache,
                 cache_ttl=validated_config.cache_ttl,
+                cache_dir=(
+                    self.RESPONSE_CACHE_DIR if validated_config.persist_cache else None
+                ),
             ),
         )
 
         # Token source info for diagnostics (the key that resolved, no value)
         self._token_source = token_source
 
+    def secret_keys(self, config: TitanConfig) -> list[str]:
+        """Token candidates `initialize` checks, in the order it checks them."""
+        email = self._get_plugin_config(config).get("email") or ""
+        return [key for key, _ in self._token_key_candidates(config.get_project_name(), email)]
+
+    @staticmethod
+    def _token_key_candidates(project_name: Optional[str], email: str) -> list[tuple[str, dict]]:
+        """Token keys by priority, each with the source label it reports."""
+        candidates = []
+        if project_name:
+            candidates.append((
+                f"{project_name}_jira_api_token",
+                {"type": "project-specific", "details": f"Token for project '{project_name}'"},
+            ))
+        candidates.extend([
+            ("jira_api_token",
+             {"type": "global", "details": "Global JIRA token (recommended)"}),
+            (f"{email}_jira_api_token",
+             {"type": "email-specific", "details": f"Token for email '{email}'"}),
+        ])
+        return candidates
+
     def _resolve_token_key(
         self, broker: SecretBroker, project_name: Optional[str], email: str
     ) -> tuple[Optional[str], dict]:
@@ -111,20 +138,7 @@ class JiraPlugin(TitanPlugin):
             (key, source_info) — key is None when nothing resolves; source_info
             describes where the token comes from, for diagnostics (no value).
         """
-        candidates = []
-        if project_name:
-            candidates.append((
-                f"{project_name}_jira_api_token",
-                {"type": "project-specific", "details": f"Token for project '{project_name}'"},
-            ))
-        candidates.extend([
-            ("jira_api_token",
-             {"type": "global", "details": "Global JIRA token (recommended)"}),
-            (f"{email}_jira_api_token",
-             {"type": "email-specific", "details": f"Token for email '{email}'"}),
-        ])
-
-        for key, source in candidates:
+        for key, source in self._token_key_candidates(project_name, email):
             origin = broker.source(key)
             if origin is None:
                 continue
@@ -222,7 +236,7 @@ class JiraPlugin(TitanPlugin):
         """
         Return JSON schema for plugin configuration.
 
-        Technical fields (timeout, enable_cache, cache_ttl) are excluded from the wizard
+        Technical fields (timeout, enable_cache, cache_ttl, persist_cache) are excluded from the wizard
         since they have sensible defaults and most users don't need to change them.
 
         Returns:
@@ -232,7 +246,7 @@ class JiraPlugin(TitanPlugin):
 
         # Exclude technical fields from wizard (they have good defaults)
         # Users can still manually edit config.toml if needed
-        technical_fields = ["timeout", "enable_cache", "cache_ttl"]
+        technical_fields = ["timeout", "enable_cache", "cache_ttl", "persist_cache"]
         for field in technical_fields:
             schema.get("properties", {}).pop(field, None)
             if field in schema.get("required", []):
@@ -272,6 +286,7 @@ class JiraPlugin(TitanPlugin):
         from .steps.build_jira_task_context_step import build_jira_task_context_step
         from .steps.confirm_and_assign_issue_step import confirm_and_assign_issue
         from .steps.ai_analyze_issue_step import ai_analyze_issue_requirements_step
+        from .steps.ai_analyze_issues_batch_step import ai_analyze_issues_batch_step
         from .steps.list_versions_step import list_versions_step
         from .steps.issue_management_steps import (
             get_transitions_step,
@@ -303,6 +318,7 @@ class JiraPlugin(TitanPlugin):
             "build_jira_task_context": build_jira_task_context_step,
             "confirm_and_assign_issue": confirm_and_assign_issue,
             "ai_analyze_issue_requirements": ai_analyze_issue_requirements_step,
+            "ai_analyze_issues_batch": ai_analyze_issues_batch_step,
             "list_versions": list_versions_step,
             "get_transitions": get_transitions_step,
             "transition_issue": transition_issue_step,
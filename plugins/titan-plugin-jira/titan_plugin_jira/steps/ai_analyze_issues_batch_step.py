@@ -0,0 +1,217 @@
+"""
+AI-powered batch analysis of every issue matched by a JQL query
+"""
+
+from titan_cli.ai.router.declaration import declare_ai_usage
+from titan_cli.ai.router.enums import AIProviderType, AITask
+from titan_cli.ai.router.models import AIExecutionError, AIExecutionSuccess
+from titan_cli.core.result import ClientError, ClientSuccess
+from titan_cli.engine import WorkflowContext, WorkflowResult, Success, Error, Skip
+from ..messages import msg
+from ..agents import BatchAnalyzer, BatchCheckpoint, BoundedJiraWriter, IssueAnalysis
+from ..agents.config_loader import load_agent_config
+from ..formatters import IssueAnalysisMarkdownFormatter
+from ..operations import format_jql_with_project, merge_query_collections
+from ..utils import SAVED_QUERIES
+
+BATCH_SEARCH_FIELDS = [
+    "summary", "description", "status", "issuetype", "priority",
+    "assignee", "labels", "components", "created", "updated",
+]
+"""Search fields the analysis needs, so issues are not fetched a second time."""
+
+
+def _resolve_jql(ctx: WorkflowContext):
+    """Return the JQL to analyze: ``jql`` as given, or a saved query by name."""
+    jql = ctx.get("jql")
+    if jql:
+        return jql, None
+
+    query_name = ctx.get("query_name")
+    if not query_name:
+        return None, msg.Steps.AIBatch.JQL_REQUIRED
+
+    custom_queries = {}
+    try:
+        if hasattr(ctx, 'plugin_manager') and ctx.plugin_manager is not None:
+            jira_plugin = ctx.plugin_manager.get_plugin('jira')
+            if jira_plugin and hasattr(jira_plugin, '_config') and jira_plugin._config is not None:
+                custom_queries = jira_plugin._config.saved_queries or {}
+    except Exception:
+        pass
+
+    all_queries = merge_query_collections(SAVED_QUERIES.get_all(), custom_queries)
+    if query_name not in all_queries:
+        return None, msg.Steps.Search.QUERY_NOT_FOUND.format(query_name=query_name)
+
+    project = ctx.get("project") or getattr(ctx.jira, "project_key", None)
+    jql, format_error = format_jql_with_project(all_queries[query_name], project)
+    if format_error:
+        return None, msg.Steps.Search.PROJECT_REQUIRED.format(query_name=query_name, jql=jql)
+    return jql, None
+
+
+def _stream_issues(jira, jql: str, limit, errors: list):
+    """Yield issues page by page; a search error ends the stream and is kept in ``errors``."""
+    for page in jira.iter_search(jql, fields=BATCH_SEARCH_FIELDS, limit=limit):
+        match page:
+            case ClientSuccess(data=issues):
+                yield from issues
+            case ClientError(error_message=err):
+                errors.append(err)
+                return
+
+
+@declare_ai_usage(
+    task=AITask.JIRA_ANALYSIS,
+    # Same agent as the single-issue analysis; a batch makes many more calls,
+    # which is exactly where a subprocess per call hurts most.
+    executes=[AIProviderType.REMOTE, AIProviderType.CLI_HEADLESS],
+    preferred=[AIProviderType.REMOTE],
+    enforces=True,
+)
+def ai_analyze_issues_batch_step(ctx: WorkflowContext) -> WorkflowResult:
+    """
+    Analyze every issue matched by a JQL query with AI.
+
+    Issues are streamed from the search and analyzed concurrently under the
+    limits in the agent config ([agent.batch]). Results are checkpointed per
+    query, so running the step again after an interruption only analyzes what
+    is left.
+
+    Inputs (from ctx.data):
+        jql (str, optional): JQL query to analyze
+        query_name (str, optional): Saved query to use when no jql is given
+        project (str, optional): Project key for parameterized saved queries
+        max_results (int, optional): Stop after this many issues (default: all)
+        post_comments (bool, optional): Post each analysis as an issue comment (default: False)
+        restart (bool, optional): Discard the checkpoint and analyze everything again
+
+    Outputs (saved to ctx.data):
+        batch_analysis (dict): Structured analysis per issue key
+        batch_analysis_failed (list): Issue keys whose analysis failed
+
+    Returns:
+        Success: If the batch ran (individual failures are reported, not fatal).
+        Skip: If AI is not configured or not available.
+        Error: If there is no JIRA client or no query to run.
+    """
+    if not ctx.textual:
+        return Error("Textual UI context is not available for this step.")
+
+    ctx.textual.begin_step("AI Analyze Issues")
+
+    if not ctx.jira:
+        ctx.textual.error_text(msg.Plugin.CLIENT_NOT_AVAILABLE_IN_CONTEXT)
+        ctx.textual.end_step("error")
+        return Error(msg.Plugin.CLIENT_NOT_AVAILABLE_IN_CONTEXT)
+
+    generator = ctx.ai
+    if ctx.ai_router:
+        match ctx.ai_router.resolve_generator(
+            policy=ai_analyze_issues_batch_step,
+            cwd=ctx.git.repo_path if ctx.git else None,
+            announce=ctx.textual.ai_chip,
+        ):
+            case AIExecutionSuccess(data=resolved):
+                generator = resolved
+            case AIExecutionError(error_code="AI_DISABLED", error_message=disabled_message):
+                ctx.textual.dim_text(disabled_message)
+                ctx.textual.end_step("skip")
+                return Skip(disabled_message)
+            case AIExecutionError(error_message=err):
+                ctx.textual.error_text(err)
+                ctx.textual.end_step("error")
+                return Error(err)
+
+    if not generator or not generator.is_available():
+        ctx.textual.dim_text(msg.Steps.AIIssue.AI_NOT_CONFIGURED_SKIP)
+        ctx.textual.end_step("skip")
+        return Skip(msg.Steps.AIIssue.AI_NOT_CONFIGURED)
+
+    jql, jql_error = _resolve_jql(ctx)
+    if jql_error:
+        ctx.textual.error_text(jql_error)
+        ctx.textual.end_step("error")
+        return Error(jql_error)
+
+    ctx.textual.dim_text(f"JQL: {jql}")
+
+    config = load_agent_config("jira_agent")
+    checkpoint = BatchCheckpoint.for_query(jql)
+    if ctx.get("restart", False):
+        checkpoint.clear()
+
+    formatter = IssueAnalysisMarkdownFormatter(template_path=config.template or None)
+
+    def comment_body(result):
+        return formatter.format(IssueAnalysis(**result.analysis))
+
+    def report(result, resumed):
+        if resumed:
+            ctx.textual.dim_text(msg.Steps.AIBatch.ISSUE_RESUMED.format(key=result.issue_key))
+        elif not result.ok:
+            ctx.textual.warning_text(
+                msg.Steps.AIBatch.ISSUE_FAILED.format(key=result.issue_key, error=result.error)
+            )
+        elif result.over_budget:
+            ctx.textual.warning_text(msg.Steps.AIBatch.ISSUE_OVER_BUDGET.format(
+                key=result.issue_key, tokens=result.tokens_used, budget=analyzer.max_tokens_per_issue
+            ))
+        else:
+            ctx.textual.text(msg.Steps.AIBatch.ISSUE_DONE.format(
+                key=result.issue_key,
+                complexity=result.analysis.get("complexity_score") or "?",
+                effort=result.analysis.get("estimated_effort") or "?",
+                tokens=result.tokens_used,
+            ))
+
+    search_errors: list = []
+    post_comments = ctx.get("post_comments", False)
+    writer = BoundedJiraWriter(max_workers=config.batch_write_concurrency) if post_comments else None
+    analyzer = BatchAnalyzer(
+        generator,
+        ctx.jira,
+        checkpoint,
+        config,
+        writer=writer,
+        comment_builder=comment_body if post_comments else None,
+    )
+    try:
+        summary = analyzer.run(
+            _stream_issues(ctx.jira, jql, ctx.get("max_results"), search_errors),
+            on_result=report,
+        )
+    finally:
+        if writer:
+            writer.close()
+
+    ctx.textual.text("")
+    if summary.resumed:
+        ctx.textual.dim_text(msg.Steps.AIBatch.RESUMING.format(count=summary.resumed))
+    if search_errors:
+        ctx.textual.warning_text(msg.Steps.AIBatch.SEARCH_FAILED.format(error=search_errors[0]))
+    if summary.stopped_reason:
+        ctx.textual.warning_text(msg.Steps.AIBatch.STOPPED.format(reason=summary.stopped_reason))
+    ctx.textual.success_text(msg.Steps.AIBatch.SUMMARY.format(
+        analyzed=summary.analyzed, failed=summary.failed, tokens=summary.tokens_used
+    ))
+    if post_comments:
+        ctx.textual.dim_text(msg.Steps.AIBatch.COMMENTS_POSTED.format(
+            posted=summary.comments_posted, failed=summary.comment_failures
+        ))
+
+    ctx.textual.end_step("success")
+    return Success(
+        msg.Steps.AIBatch.SUMMARY.format(
+            analyzed=summary.analyzed, failed=summary.failed, tokens=summary.tokens_used
+        ),
+        metadata={
+            "batch_analysis": {r.issue_key: r.analysis for r in summary.results if r.ok},
+            "batch_analysis_failed": [r.issue_key for r in summary.results if not r.ok],
+            "tokens_used": summary.tokens_used,
+        },
+    )
+
+
+__all__ = ["ai_analyze_issues_batch_step"]
@@ -2,6 +2,7 @@ from unittest.mock import MagicMock
 
 from titan_cli.core.result import ClientError, ClientSuccess
 from titan_plugin_slack.clients.services.directory_service import DirectoryService
+from titan_plugin_slack.clients.services.directory_store import DirectorySnapshotStore
 from titan_plugin_slack.models import UISlackChannel, UISlackUser
 
 
@@ -225,3 +226,111 @@ def test_search_users_returns_error_without_caching_partial_results() -> None:
     result = service.search_users("alex", max_matches=10, page_size=100, max_pages=5)
 
     assert isinstance(result, ClientError)
+
+
+def test_search_users_persists_complete_scan_and_warms_new_service(tmp_path) -> None:
+    store = DirectorySnapshotStore(tmp_path / "T123.sqlite")
+    first_service = DirectoryService(MagicMock(), snapshot_store=store)
+    first_service.list_users = MagicMock(
+        side_effect=[
+            ClientSuccess(
+                data=([UISlackUser(id="U1", name="sam", real_name="Sam One")], "cursor-1")
+            ),
+            ClientSuccess(
+                data=([UISlackUser(id="U2", name="alex", real_name="Alex Smith")], None)
+            ),
+        ]
+    )
+
+    first_service.search_users("alex", max_matches=10, page_size=100, max_pages=5)
+
+    second_service = DirectoryService(MagicMock(), snapshot_store=store)
+    second_service.list_users = MagicMock()
+
+    result = second_service.search_users("sam", max_matches=10, page_size=100, max_pages=5)
+
+    assert isinstance(result, ClientSuccess)
+    assert [user.id for user in result.data] == ["U1"]
+    assert result.data[0].real_name == "Sam One"
+    second_service.list_users.assert_not_called()
+
+
+def test_search_users_does_not_persist_partial_scan(tmp_path) -> None:
+    store = DirectorySnapshotStore(tmp_path / "T123.sqlite")
+    service = DirectoryService(MagicMock(), snapshot_store=store)
+    service.list_users = MagicMock(
+        return_value=ClientSuccess(
+            data=([UISlackUser(id="U1", name="alex", real_name="Alex One")], "cursor-1")
+        )
+    )
+
+    service.search_users("alex", max_matches=1, page_size=100, max_pages=5)
+
+    assert store.load("users") is None
+
+
+def test_stale_snapshot_is_served_while_refresh_replaces_it(tmp_path) -> None:
+    store = DirectorySnapshotStore(tmp_path / "T123.sqlite")
+    store.save(
+        "channels",
+        [UISlackChannel(id="C1", name="eng-old")],
+        fetched_at=0.0,
+    )
+    web_client = MagicMock()
+    web_client.conversations_list.return_value = {
+        "ok": True,
+        "channels": [{"id": "C2", "name": "eng-new"}],
+        "response_metadata": {"next_cursor": None},
+    }
+    service = DirectoryService(
+        web_client,
+        snapshot_store=store,
+        refresh_in_background=False,
+    )
+
+    result = service.search_channels("eng", max_matches=10, page_size=100, max_pages=5)
+
+    assert [channel.id for channel in result.data] == ["C2"]
+    assert [channel.id for channel in store.load("channels").items] == ["C2"]
+
+
+def test_failed_refresh_keeps_previous_snapshot(tmp_path) -> None:
+    store = DirectorySnapshotStore(tmp_path / "T123.sqlite")
+    store.save("users", [UISlackUser(id="U1", name="sam")], fetched_at=0.0)
+    service = DirectoryService(
+        MagicMock(),
+        snapshot_store=store,
+        refresh_in_background=False,
+    )
+    service.list_users = MagicMock(
+        return_value=ClientError(error_message="Slack list_users failed: ratelimited")
+    )
+
+    result = service.search_users("sam", max_matches=10, page_size=100, max_pages=5)
+
+    assert [user.id for user in result.data] == ["U1"]
+    assert [user.id for user in store.load("users").items] == ["U1"]
+
+
+def test_candidates_narrow_by_trigram_without_losing_matches() -> None:
+    service = DirectoryService(MagicMock())
+    service.list_users = MagicMock(
+        return_value=ClientSuccess(
+            data=(
+                [
+                    UISlackUser(id="U1", name="sam", real_name="Sam One"),
+                    UISlackUser(id="U2", name="alexandra", real_name="Álex Smith"),
+                    UISlackUser(id="U3", name="al", real_name=None),
+                ],
+                None,
+            )
+        )
+    )
+
+    service.search_users("zzz", max_matches=10, page_size=100, max_pages=5)
+    cache = service._caches["users"]
+
+    assert [user.id for user in cache.candidates("alex")] == ["U2"]
+    assert [user.id for user in cache.candidates("al")] == ["U1", "U2", "U3"]
+    assert cache.candidates("qqq") == []
+    assert [user.id for user in service.search_users("ALEX", max_matches=10).data] == ["U2"]
@@ -1,23 +1,48 @@
 """Internal service for Slack directory and discovery operations."""
 
+import threading
 import time
+from typing import Callable
 
+from titan_cli.core.logging import get_logger
 from titan_cli.core.result import ClientError, ClientSuccess, ClientResult
 
 from ..sdk import SlackApiError
-from ...operations import filter_channels_for_query, filter_users_for_query
+from ...operations import (
+    filter_channels_for_query,
+    filter_users_for_query,
+    normalize_search_query,
+    search_trigrams,
+)
 from ...models import (
     NetworkSlackChannel,
     NetworkSlackUser,
     UISlackChannel,
     UISlackUser,
 )
+from .directory_store import DirectorySnapshotStore
+
+logger = get_logger(__name__)
 
 DEFAULT_DIRECTORY_PAGE_SIZE = 1000
 """Slack's documented max `limit` for `users.list` and `conversations.list`."""
 
 DEFAULT_DIRECTORY_CACHE_TTL_SECONDS = 300.0
 
+DEFAULT_SNAPSHOT_REFRESH_MAX_PAGES = 200
+"""Upper bound on pages walked by a full background directory refresh."""
+
+
+def _user_search_keys(user: UISlackUser) -> tuple[str, ...]:
+    return (
+        normalize_search_query(user.name),
+        normalize_search_query(user.real_name or ""),
+    )
+
+
+def _channel_search_keys(channel: UISlackChannel) -> tuple[str, ...]:
+    return (normalize_search_query(channel.name).lstrip("#"),)
+
 
 class _DirectoryScanCache:
     """Incremental cache of a paginated Slack directory scan (users or channels).
@@ -25,34 +50,75 @@ class _DirectoryScanCache:
     Search queries against the same directory reuse whatever pages a previous
     search already fetched instead of restarting from `cursor=None`, and only
     fetch further pages if more matches are still needed.
+
+    Cached entries are indexed by the trigrams of their normalized search keys,
+    so `candidates()` narrows a query to the few entries that can possibly
+    contain it before the ranking filters run.
     """
 
-    def __init__(self, ttl_seconds: float):
+    def __init__(
+        self,
+        ttl_seconds: float,
+        search_keys: Callable[[object], tuple[str, ...]],
+    ):
         self._ttl_seconds = ttl_seconds
+        self._search_keys = search_keys
+        self._clear()
+
+    def _clear(self) -> None:
         self._items: list = []
         self._seen_ids: set[str] = set()
+        self._trigrams: dict[str, set[int]] = {}
         self._cursor: str | None = None
         self._exhausted: bool = False
         self._fetched_at: float | None = None
 
+    def is_stale(self) -> bool:
+        return self._fetched_at is None or (time.monotonic() - self._fetched_at) > self._ttl_seconds
+
     def reset_if_stale(self) -> None:
-        if self._fetched_at is None or (time.monotonic() - self._fetched_at) > self._ttl_seconds:
-            self._items = []
-            self._seen_ids = set()
-            self._cursor = None
-            self._exhausted = False
-            self._fetched_at = None
+        if self.is_stale():
+            self._clear()
+
+    def _index(self, item) -> None:
+        position = len(self._items)
+        self._items.append(item)
+        for key in self._search_keys(item):
+            for gram in search_trigrams(key):
+                self._trigrams.setdefault(gram, set()).add(position)
 
     def extend(self, items: list, next_cursor: str | None, item_id) -> None:
         for item in items:
             entry_id = item_id(item)
             if entry_id not in self._seen_ids:
                 self._seen_ids.add(entry_id)
-                self._items.append(item)
+                self._index(item)
         self._cursor = next_cursor
         self._exhausted = next_cursor is None
         self._fetched_at = time.monotonic()
 
+    def load_snapshot(self, items: list, age_seconds: float, item_id) -> None:
+        """Replace the cache with a complete scan that finished `age_seconds` ago."""
+        self._clear()
+        self.extend(items, None, item_id)
+        self._fetched_at = time.monotonic() - age_seconds
+
+    def candidates(self, query: str) -> list:
+        """Return cached entries whose search keys may contain `query`, in scan order."""
+        grams = search_trigrams(normalize_search_query(query).lstrip("#"))
+        if not grams:
+            return self._items
+
+        positions: set[int] | None = None
+        for gram in sorted(grams, key=lambda g: len(self._trigrams.get(g, ()))):
+            bucket = self._trigrams.get(gram)
+            if not bucket:
+                return []
+            positions = set(bucket) if positions is None else positions & bucket
+            if not positions:
+                return []
+        return [self._items[position] for position in sorted(positions)]
+
     @property
     def items(self) -> list:
         return self._items
@@ -67,13 +133,176 @@ class _DirectoryScanCache:
 
 
 class DirectoryService:
-    """Service for Slack user and public channel discovery."""
+    """Service for Slack user and public channel discovery.
+
+    When a `DirectorySnapshotStore` is supplied, complete scans are persisted
+    per workspace. A new process then answers searches from the stored snapshot
+    immediately; a snapshot older than the TTL is still served while a
+    background thread re-walks the directory and swaps the result in.
+    """
 
-    def __init__(self, web_client, cache_ttl_seconds: float = DEFAULT_DIRECTORY_CACHE_TTL_SECONDS):
+    _SEARCH_KEYS = {
+        "users": _user_search_keys,
+        "public_channels": _channel_search_keys,
+        "channels": _channel_search_keys,
+    }
+
+    def __init__(
+        self,
+        web_client,
+        cache_ttl_seconds: float = DEFAULT_DIRECTORY_CACHE_TTL_SECONDS,
+        snapshot_store: DirectorySnapshotStore | None = None,
+        refresh_in_background: bool = True,
+    ):
         self.web_client = web_client
-        self._users_cache = _DirectoryScanCache(cache_ttl_seconds)
-        self._public_channels_cache = _DirectoryScanCache(cache_ttl_seconds)
-        self._channels_cache = _DirectoryScanCache(cache_ttl_seconds)
+        self._cache_ttl_seconds = cache_ttl_seconds
+        self._snapshot_store = snapshot_store
+        self._refresh_in_background = refresh_in_background
+        self._caches: dict[str, _DirectoryScanCache] = {
+            kind: self._new_cache(kind) for kind in self._SEARCH_KEYS
+        }
+        self._snapshot_loaded: set[str] = set()
+        self._refreshing: set[str] = set()
+        self._state_lock = threading.Lock()
+
+    @staticmethod
+    def _item_id(item) -> str:
+        return item.id
+
+    def _new_cache(self, kind: str) -> _DirectoryScanCache:
+        return _DirectoryScanCache(self._cache_ttl_seconds, self._SEARCH_KEYS[kind])
+
+    def _prepare_cache(self, kind: str) -> _DirectoryScanCache:
+        """Return the cache for `kind`, warming it from disk and scheduling refreshes."""
+        with self._state_lock:
+            cache = self._caches[kind]
+            if self._snapshot_store is None:
+                cache.reset_if_stale()
+                return cache
+
+            if kind not in self._snapshot_loaded:
+                self._snapshot_loaded.add(kind)
+                snapshot = self._snapshot_store.load(kind)
+                if snapshot is not None:
+                    cache.load_snapshot(snapshot.items, snapshot.age_seconds, self._item_id)
+
+            if not cache.is_stale():
+                return cache
+            if not cache.exhausted:
+                # A partial live scan is never served stale; start over.
+                cache.reset_if_stale()
+                return cache
+
+        # Stale but complete: keep answering from it while a refresh runs.
+        self._schedule_refresh(kind)
+        with self._state_lock:
+            return self._caches[kind]
+
+    def _remember_scan(self, kind: str, cache: _DirectoryScanCache) -> None:
+        """Persist a cache once a live search has walked the whole directory."""
+        if self._snapshot_store is not None and cache.exhausted:
+            self._snapshot_store.save(kind, list(cache.items))
+
+    def _schedule_refresh(self, kind: str) -> None:
+        with self._state_lock:
+            if kind in self._refreshing:
+                return
+            self._refreshing.add(kind)
+
+        if not self._refresh_in_background:
+            try:
+                self.refresh_snapshot(kind)
+            finally:
+                with self._state_lock:
+                    self._refreshing.discard(kind)
+            return
+
+        def _run() -> None:
+            try:
+                result = self.refresh_snapshot(kind)
+                if isinstance(result, ClientError):
+                    logger.warning(
+                        "slack_directory_refresh_failed",
+                        kind=kind,
+                        error=result.error_message,
+                    )
+            finally:
+                with self._state_lock:
+                    self._refreshing.discard(kind)
+
+        threading.Thread(
+            target=_run,
+            name=f"slack-directory-refresh-{kind}",
+            daemon=True,
+        ).start()
+
+    def _fetch_page(
+        self,
+        kind: str,
+        page_size: int,
+        cursor: str | None,
+        exclude_archived: bool,
+    ) -> ClientResult[tuple[list, str | None]]:
+        if kind == "users":
+            return self.list_users(limit=page_size, cursor=cursor)
+        if kind == "public_channels":
+            return self.list_public_channels(
+                limit=page_size,
+                cursor=cursor,
+                exclude_archived=exclude_archived,
+            )
+        return self._list_accessible_channels(
+            limit=page_size,
+            cursor=cursor,
+            exclude_archived=exclude_archived,
+        )
+
+    def refresh_snapshot(
+        self,
+        kind: str,
+        *,
+        page_size: int = DEFAULT_DIRECTORY_PAGE_SIZE,
+        max_pages: int = DEFAULT_SNAPSHOT_REFRESH_MAX_PAGES,
+        exclude_archived: bool = True,
+    ) -> ClientResult[int]:
+        """Walk the whole directory for `kind` and atomically replace the cached snapshot.
+
+        The previous snapshot keeps serving searches until the new scan has
+        completed; a failed or truncated scan leaves it untouched.
+        """
+        if kind not in self._SEARCH_KEYS:
+            return ClientError(
+                error_message=f"Unknown Slack directory kind: {kind}",
+                error_code="UNKNOWN_DIRECTORY_KIND",
+            )
+
+        fresh = self._new_cache(kind)
+        cursor = None
+        for _ in range(max_pages):
+            match self._fetch_page(kind, page_size, cursor, exclude_archived):
+                case ClientSuccess(data=(items, next_cursor)):
+                    fresh.extend(items, next_cursor, self._item_id)
+                    if fresh.exhausted:
+                        break
+                    cursor = next_cursor
+                case ClientError() as err:
+                    return err
+
+        if not fresh.exhausted:
+            return ClientError(
+                error_message=f"Slack {kind} directory exceeds {max_pages} pages",
+                error_code="DIRECTORY_REFRESH_TRUNCATED",
+            )
+
+        with self._state_lock:
+            self._caches[kind] = fresh
+            self._snapshot_loaded.add(kind)
+        if self._snapshot_store is not None:
+            self._snapshot_store.save(kind, list(fresh.items))
+        return ClientSuccess(
+            data=len(fresh.items),
+            message=f"Refreshed {len(fresh.items)} Slack {kind} entries",
+        )
 
     @staticmethod
     def _build_api_error(exc: SlackApiError, operation: str, error_code_name: str) -> ClientError:
@@ -212,38 +441,86 @@ class DirectoryService:
             message=f"Retrieved {len(ui_channels)} public Slack channels",
         )
 
-    def search_users(
+    def _list_accessible_channels(
         self,
+        limit: int,
+        cursor: str | None,
+        exclude_archived: bool,
+    ) -> ClientResult[tuple[list[UISlackChannel], str | None]]:
+        """List one page of public and private channels the current token can see."""
+        try:
+            response = self.web_client.conversations_list(
+                limit=limit,
+                cursor=cursor,
+                exclude_archived=exclude_archived,
+                types="public_channel,private_channel",
+            )
+        except SlackApiError as exc:
+            return self._build_api_error(
+                exc,
+                "search_channels",
+                "SEARCH_CHANNELS_ERROR",
+            )
+        except Exception as exc:
+            if hasattr(exc, "response"):
+                return self._build_api_error(
+                    exc,
+                    "search_channels",
+                    "SEARCH_CHANNELS_ERROR",
+                )
+            return ClientError(
+                error_message=f"Slack channel search request failed: {exc}",
+                error_code="SEARCH_CHANNELS_REQUEST_ERROR",
+            )
+
+        if not response.get("ok", False):
+            error_code = response.get("error", "unknown_error")
+            return ClientError(
+                error_message=f"Slack search_channels failed: {error_code}",
+                error_code="SEARCH_CHANNELS_ERROR",
+                details={"slack_error": error_code},
+            )
+
+        channels = [self._map_channel(channel) for channel in response.get("channels", [])]
+        ui_channels = [self._to_ui_channel(channel) for channel in channels]
+        next_cursor = response.get("response_metadata", {}).get("next_cursor") or None
+        return ClientSuccess(data=(ui_channels, next_cursor))
+
+    def _search(
+        self,
+        kind: str,
         query: str,
+        filter_for_query: Callable[[list, str, int], list],
+        label: str,
         *,
-        max_matches: int = 20,
-        page_size: int = DEFAULT_DIRECTORY_PAGE_SIZE,
-        max_pages: int = 50,
-    ) -> ClientResult[list[UISlackUser]]:
-        """Search Slack users by paging through visible users and filtering locally."""
-        cache = self._users_cache
-        cache.reset_if_stale()
+        max_matches: int,
+        page_size: int,
+        max_pages: int,
+        exclude_archived: bool = True,
+    ) -> ClientResult[list]:
+        cache = self._prepare_cache(kind)
 
-        matches = filter_users_for_query(cache.items, query, limit=max_matches)
+        matches = filter_for_query(cache.candidates(query), query, max_matches)
         if len(matches) >= max_matches or cache.exhausted:
             return ClientSuccess(
                 data=matches,
-                message=f"Found {len(matches)} Slack users for query",
+                message=f"Found {len(matches)} {label} for query",
             )
 
         cursor = cache.cursor
         scanned_pages = 0
         while scanned_pages < max_pages:
-            page_result = self.list_users(limit=page_size, cursor=cursor)
+            page_result = self._fetch_page(kind, page_size, cursor, exclude_archived)
             match page_result:
-                case ClientSuccess(data=(users, next_cursor)):
-                    cache.extend(users, next_cursor, item_id=lambda u: u.id)
+                case ClientSuccess(data=(items, next_cursor)):
+                    cache.extend(items, next_cursor, item_id=self._item_id)
 
-                    matches = filter_users_for_query(cache.items, query, limit=max_matches)
+                    matches = filter_for_query(cache.candidates(query), query, max_matches)
                     if len(matches) >= max_matches or cache.exhausted:
+                        self._remember_scan(kind, cache)
                         return ClientSuccess(
                             data=matches,
-                            message=f"Found {len(matches)} Slack users for query",
+                            message=f"Found {len(matches)} {label} for query",
                         )
 
                     cursor = next_cursor
@@ -253,7 +530,26 @@ class DirectoryService:
 
         return ClientSuccess(
             data=matches,
-            message=f"Found {len(matches)} Slack users for query",
+            message=f"Found {len(matches)} {label} for query",
+        )
+
+    def search_users(
+        self,
+        query: str,
+        *,
+        max_matches: int = 20,
+        page_size: int = DEFAULT_DIRECTORY_PAGE_SIZE,
+        max_pages: int = 50,
+    ) -> ClientResult[list[UISlackUser]]:
+        """Search Slack users by paging through visible users and filtering locally."""
+        return self._search(
+            "users",
+            query,
+            filter_users_for_query,
+            "Slack users",
+            max_matches=max_matches,
+            page_size=page_size,
+            max_pages=max_pages,
         )
 
     def search_public_channels(
@@ -266,43 +562,15 @@ class DirectoryService:
         exclude_archived: bool = True,
     ) -> ClientResult[list[UISlackChannel]]:
         """Search Slack public channels by paging through visible channels and filtering locally."""
-        cache = self._public_channels_cache
-        cache.reset_if_stale()
-
-        matches = filter_channels_for_query(cache.items, query, limit=max_matches)
-        if len(matches) >= max_matches or cache.exhausted:
-            return ClientSuccess(
-                data=matches,
-                message=f"Found {len(matches)} Slack channels for query",
-            )
-
-        cursor = cache.cursor
-        scanned_pages = 0
-        while scanned_pages < max_pages:
-            page_result = self.list_public_channels(
-                limit=page_size,
-                cursor=cursor,
-                exclude_archived=exclude_archived,
-            )
-            match page_result:
-                case ClientSuccess(data=(channels, next_cursor)):
-                    cache.extend(channels, next_cursor, item_id=lambda c: c.id)
-
-                    matches = filter_channels_for_query(cache.items, query, limit=max_matches)
-                    if len(matches) >= max_matches or cache.exhausted:
-                        return ClientSuccess(
-                            data=matches,
-                            message=f"Found {len(matches)} Slack channels for query",
-                        )
-
-                    cursor = next_cursor
-                    scanned_pages += 1
-                case ClientError() as err:
-                    return err
-
-        return ClientSuccess(
-            data=matches,
-            message=f"Found {len(matches)} Slack channels for query",
+        return self._search(
+            "public_channels",
+            query,
+            filter_channels_for_query,
+            "Slack channels",
+            max_matches=max_matches,
+            page_size=page_size,
+            max_pages=max_pages,
+            exclude_archived=exclude_archived,
         )
 
     def search_channels(
@@ -315,68 +583,13 @@ class DirectoryService:
         exclude_archived: bool = True,
     ) -> ClientResult[list[UISlackChannel]]:
         """Search accessible public and private Slack channels by paging and filtering locally."""
-        cache = self._channels_cache
-        cache.reset_if_stale()
-
-        matches = filter_channels_for_query(cache.items, query, limit=max_matches)
-        if len(matches) >= max_matches or cache.exhausted:
-            return ClientSuccess(
-                data=matches,
-                message=f"Found {len(matches)} Slack channels for query",
-            )
-
-        cursor = cache.cursor
-        scanned_pages = 0
-        while scanned_pages < max_pages:
-            try:
-                response = self.web_client.conversations_list(
-                    limit=page_size,
-                    cursor=cursor,
-                    exclude_archived=exclude_archived,
-                    types="public_channel,private_channel",
-                )
-            except SlackApiError as exc:
-                return self._build_api_error(
-                    exc,
-                    "search_channels",
-                    "SEARCH_CHANNELS_ERROR",
-                )
-            except Exception as exc:
-                if hasattr(exc, "response"):
-                    return self._build_api_error(
-                        exc,
-                        "search_channels",
-                        "SEARCH_CHANNELS_ERROR",
-                    )
-                return ClientError(
-                    error_message=f"Slack channel search request failed: {exc}",
-                    error_code="SEARCH_CHANNELS_REQUEST_ERROR",
-                )
-
-            if not response.get("ok", False):
-                error_code = response.get("error", "unknown_error")
-                return ClientError(
-                    error_message=f"Slack search_channels failed: {error_code}",
-                    error_code="SEARCH_CHANNELS_ERROR",
-                    details={"slack_error": error_code},
-                )
-
-            channels = [self._map_channel(channel) for channel in response.get("channels", [])]
-            ui_channels = [self._to_ui_channel(channel) for channel in channels]
-            next_cursor = response.get("response_metadata", {}).get("next_cursor") or None
-            cache.extend(ui_channels, next_cursor, item_id=lambda c: c.id)
-
-            matches = filter_channels_for_query(cache.items, query, limit=max_matches)
-            if len(matches) >= max_matches or cache.exhausted:
-                return ClientSuccess(
-                    data=matches,
-                    message=f"Found {len(matches)} Slack channels for query",
-                )
-
-            cursor = next_cursor
-            scanned_pages += 1
-
-        return ClientSuccess(
-            data=matches,
-            message=f"Found {len(matches)} Slack channels for query",
+        return self._search(
+            "channels",
+            query,
+            filter_channels_for_query,
+            "Slack channels",
+            max_matches=max_matches,
+            page_size=page_size,
+            max_pages=max_pages,
+            exclude_archived=exclude_archived,
         )
@@ -0,0 +1,192 @@
+"""On-disk snapshots of Slack directory scans, one SQLite file per workspace."""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from titan_cli.core.logging import get_logger
+
+from ...models import UISlackChannel, UISlackUser
+
+logger = get_logger(__name__)
+
+SNAPSHOT_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshot_meta (
+    kind TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL,
+    schema_version INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS users (
+    kind TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    real_name TEXT,
+    is_bot INTEGER NOT NULL,
+    is_active INTEGER NOT NULL,
+    PRIMARY KEY (kind, position)
+);
+CREATE TABLE IF NOT EXISTS channels (
+    kind TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    is_channel INTEGER NOT NULL,
+    is_private INTEGER NOT NULL,
+    PRIMARY KEY (kind, position)
+);
+"""
+
+
+@dataclass
+class DirectorySnapshot:
+    """A complete directory scan restored from disk."""
+
+    items: list
+    fetched_at: float
+    """Wall-clock time (``time.time()``) at which the scan completed."""
+
+    @property
+    def age_seconds(self) -> float:
+        return max(0.0, time.time() - self.fetched_at)
+
+
+class DirectorySnapshotStore:
+    """Persist complete Slack directory scans so new processes start warm.
+
+    Each snapshot kind (``users``, ``public_channels``, ``channels``) is
+    replaced inside a single SQLite transaction, so readers always see either
+    the previous snapshot or the new one, never a mix. Storage failures are
+    logged and swallowed: the directory cache is an optimization and must never
+    break a search.
+    """
+
+    USER_KINDS = frozenset({"users"})
+    CHANNEL_KINDS = frozenset({"public_channels", "channels"})
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.path), timeout=5.0)
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def load(self, kind: str) -> DirectorySnapshot | None:
+        """Return the stored snapshot for ``kind``, or None when absent or unreadable."""
+        if not self.path.exists():
+            return None
+        try:
+            with self._lock:
+                connection = self._connect()
+                try:
+                    return self._load(connection, kind)
+                finally:
+                    connection.close()
+        except sqlite3.Error as exc:
+            logger.warning("slack_directory_snapshot_load_failed", kind=kind, error=str(exc))
+            return None
+
+    def _load(self, connection: sqlite3.Connection, kind: str) -> DirectorySnapshot | None:
+        meta = connection.execute(
+            "SELECT fetched_at, schema_version FROM snapshot_meta WHERE kind = ?",
+            (kind,),
+        ).fetchone()
+        if meta is None or meta[1] != SNAPSHOT_SCHEMA_VERSION:
+            return None
+
+        if kind in self.USER_KINDS:
+            rows = connection.execute(
+                "SELECT id, name, real_name, is_bot, is_active FROM users "
+                "WHERE kind = ? ORDER BY position",
+                (kind,),
+            ).fetchall()
+            items = [
+                UISlackUser(
+                    id=row[0],
+                    name=row[1],
+                    real_name=row[2],
+                    is_bot=bool(row[3]),
+                    is_active=bool(row[4]),
+                )
+                for row in rows
+            ]
+        else:
+            rows = connection.execute(
+                "SELECT id, name, is_channel, is_private FROM channels "
+                "WHERE kind = ? ORDER BY position",
+                (kind,),
+            ).fetchall()
+            items = [
+                UISlackChannel(
+                    id=row[0],
+                    name=row[1],
+                    is_channel=bool(row[2]),
+                    is_private=bool(row[3]),
+                )
+                for row in rows
+            ]
+        return DirectorySnapshot(items=items, fetched_at=meta[0])
+
+    def save(self, kind: str, items: list, fetched_at: float | None = None) -> bool:
+        """Atomically replace the snapshot for ``kind``. Returns whether it was written."""
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        try:
+            with self._lock:
+                connection = self._connect()
+                try:
+                    with connection:
+                        self._replace(connection, kind, items, fetched_at)
+                finally:
+                    connection.close()
+        except sqlite3.Error as exc:
+            logger.warning("slack_directory_snapshot_save_failed", kind=kind, error=str(exc))
+            return False
+        return True
+
+    def _replace(
+        self,
+        connection: sqlite3.Connection,
+        kind: str,
+        items: list,
+        fetched_at: float,
+    ) -> None:
+        if kind in self.USER_KINDS:
+            connection.execute("DELETE FROM users WHERE kind = ?", (kind,))
+            connection.executemany(
+                "INSERT INTO users (kind, position, id, name, real_name, is_bot, is_active) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (kind, position, u.id, u.name, u.real_name, int(u.is_bot), int(u.is_active))
+                    for position, u in enumerate(items)
+                ),
+            )
+        elif kind in self.CHANNEL_KINDS:
+            connection.execute("DELETE FROM channels WHERE kind = ?", (kind,))
+            connection.executemany(
+                "INSERT INTO channels (kind, position, id, name, is_channel, is_private) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (kind, position, c.id, c.name, int(c.is_channel), int(c.is_private))
+                    for position, c in enumerate(items)
+                ),
+            )
+        else:
+            raise ValueError(f"Unknown Slack directory snapshot kind: {kind}")
+
+        connection.execute(
+            "INSERT OR REPLACE INTO snapshot_meta (kind, fetched_at, schema_version) "
+            "VALUES (?, ?, ?)",
+            (kind, fetched_at, SNAPSHOT_SCHEMA_VERSION),
+        )
+
+    def clear(self) -> None:
+        """Delete every stored snapshot for this workspace."""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
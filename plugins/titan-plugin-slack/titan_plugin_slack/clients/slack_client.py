@@ -1,6 +1,7 @@
 """Slack client facade backed by internal services."""
 
 import threading
+from pathlib import Path
 from typing import Callable, TypeVar
 
 from . import sdk as slack_sdk_module
@@ -11,6 +12,7 @@ from .services import (
     IdentityResolver,
     MessageService,
 )
+from .services.directory_store import DirectorySnapshotStore
 from titan_cli.core.logging import get_logger
 from titan_cli.core.result import ClientError, ClientResult
 
@@ -56,6 +58,7 @@ class SlackClient:
         default_channels: list[str] | None = None,
         max_rate_limit_retries: int = DEFAULT_MAX_RATE_LIMIT_RETRIES,
         token_refresher: Callable[[], str] | None = None,
+        directory_cache_dir: Path | None = None,
     ):
         if not user_token:
             raise SlackClientError("Slack client requires a user token.")
@@ -73,7 +76,17 @@ class SlackClient:
         )
 
         self.auth_service = AuthService(self._web_client)
-        self.directory_service = DirectoryService(self._web_client)
+        # Directory snapshots are only persisted when the workspace is known,
+        # so two workspaces never share (or overwrite) each other's index.
+        snapshot_store = (
+            DirectorySnapshotStore(directory_cache_dir / f"{team_id}.sqlite")
+            if directory_cache_dir is not None and team_id
+            else None
+        )
+        self.directory_service = DirectoryService(
+            self._web_client,
+            snapshot_store=snapshot_store,
+        )
         self.conversation_service = ConversationService(self._web_client)
         self.identity_resolver = IdentityResolver(self._web_client)
         self.message_service = MessageService(self._web_client)
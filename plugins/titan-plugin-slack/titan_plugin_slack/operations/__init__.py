@@ -6,6 +6,7 @@ from .target_resolution_operations import (
     filter_channels_for_query,
     filter_users_for_query,
     normalize_search_query,
+    search_trigrams,
 )
 from .identity_resolution_operations import (
     extract_identity_ids_from_messages,
@@ -22,6 +23,7 @@ from .message_summary_operations import (
 
 __all__ = [
     "normalize_search_query",
+    "search_trigrams",
     "filter_users_for_query",
     "filter_channels_for_query",
     "build_user_target",
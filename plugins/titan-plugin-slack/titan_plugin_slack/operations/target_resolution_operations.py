@@ -15,6 +15,16 @@ def normalize_search_query(query: str) -> str:
     )
 
 
+def search_trigrams(normalized: str) -> set[str]:
+    """Return the character trigrams of an already-normalized search string.
+
+    Any string containing ``query`` also contains every trigram of ``query``, so
+    intersecting trigram postings yields a superset of substring matches that
+    the regular filters can then rank.
+    """
+    return {normalized[i : i + 3] for i in range(len(normalized) - 2)}
+
+
 def _score_match(query: str, *candidates: str) -> int | None:
     """Score a normalized query against one or more normalized candidate strings."""
     best_score: int | None = None
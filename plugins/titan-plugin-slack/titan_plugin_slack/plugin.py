@@ -38,6 +38,7 @@ class SlackPlugin(TitanPlugin):
     """Titan CLI plugin for Slack operations."""
 
     TOKEN_REFRESH_MARGIN_SECONDS = 300
+    DIRECTORY_CACHE_DIR = Path.home() / ".titan" / "cache" / "slack"
 
     @property
     def name(self) -> str:
@@ -188,6 +189,15 @@ class SlackPlugin(TitanPlugin):
 
         return _refresh
 
+    def secret_keys(self, config: TitanConfig) -> list[str]:
+        """The project's user token, refresh token and token expiry."""
+        project_name = config.get_project_name()
+        return [
+            build_project_slack_token_key(project_name),
+            build_project_slack_refresh_token_key(project_name),
+            build_project_slack_token_expires_at_key(project_name),
+        ]
+
     def initialize(self, config: TitanConfig, broker: SecretBroker) -> None:
         """Initialize the Slack client using the current user's personal token."""
         plugin_config_data = self._get_plugin_config(config)
@@ -252,6 +262,7 @@ class SlackPlugin(TitanPlugin):
                 team_id=validated_config.default_team_id,
                 default_channels=validated_config.default_channels,
                 token_refresher=token_refresher,
+                directory_cache_dir=self.DIRECTORY_CACHE_DIR,
             )
 
         if refreshed_token is not None:
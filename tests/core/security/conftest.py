@@ -0,0 +1,11 @@
+import pytest
+
+from titan_cli.core.security._vault import clear_secret_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_secret_cache():
+    """Keyring resolutions are cached process-wide; every test starts without them."""
+    clear_secret_cache()
+    yield
+    clear_secret_cache()
@@ -5,7 +5,13 @@ from unittest.mock import patch
 
 import pytest
 
-from titan_cli.core.security import SecretBroker, SecretLeakError, SecretRef, redaction
+from titan_cli.core.security import (
+    SecretBroker,
+    SecretBrokerFactory,
+    SecretLeakError,
+    SecretRef,
+    redaction,
+)
 from titan_cli.core.security._vault import SecretManager
 
 
@@ -396,3 +402,21 @@ def test_delete_when_shadowed_still_removes_keyring_copy(keyring_store, tmp_path
     broker = SecretBroker(SecretManager(project_path=tmp_path), "titan.plugins.demo")
     assert broker.delete("token") is False  # env shadow survives...
     assert keyring_store == {}              # ...but the keyring copy is gone
+
+
+# --- Warm-up ---
+
+def test_warm_up_resolves_declared_keys_in_the_background(keyring_store, tmp_path):
+    keyring_store[("titan.plugins.demo", "token")] = "v"
+    factory = SecretBrokerFactory(SecretManager(project_path=tmp_path))
+
+    with patch('keyring.get_password', side_effect=lambda ns, k: keyring_store.get((ns, k))) as mock_get:
+        thread = factory.warm_up({"demo": ["token"], "core": ["missing_api_key"]})
+        thread.join(timeout=5)
+        mock_get.reset_mock()
+
+        assert factory.for_plugin("demo").exists("token") is True
+        assert factory.for_plugin("core").exists("missing_api_key") is False
+
+    assert thread.daemon
+    mock_get.assert_not_called()
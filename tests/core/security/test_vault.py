@@ -1,10 +1,11 @@
 import os
+import threading
 from unittest.mock import patch
 
 import pytest
 
 from titan_cli.core.security import redaction
-from titan_cli.core.security._vault import SecretManager
+from titan_cli.core.security._vault import LEGACY_NAMESPACES, SecretManager, clear_secret_cache
 
 
 @pytest.fixture(autouse=True)
@@ -537,3 +538,139 @@ def test_blank_value_at_higher_level_falls_through(tmp_project_path, mock_env, m
 
     sm = SecretManager(project_path=tmp_project_path)
     assert sm.resolve("token") == ("real-keyring-value", "keyring")
+
+
+# --- Process-wide keyring cache ---
+
+def test_keyring_hit_is_cached_across_instances(keyring_store, tmp_path):
+    keyring_store[("titan.core", "k")] = "v"
+
+    with patch('keyring.get_password', side_effect=lambda ns, k: keyring_store.get((ns, k))) as mock_get:
+        assert SecretManager(project_path=tmp_path).get("k", namespace="titan.core") == "v"
+        assert SecretManager(project_path=tmp_path).get("k", namespace="titan.core") == "v"
+
+    mock_get.assert_called_once_with("titan.core", "k")
+
+
+def test_keyring_miss_is_cached_including_legacy_fallback(keyring_store, tmp_path):
+    with patch('keyring.get_password', return_value=None) as mock_get:
+        sm = SecretManager(project_path=tmp_path)
+        assert sm.get("k", namespace="titan.core") is None
+        assert sm.get("k", namespace="titan.core") is None
+
+    # Scoped namespace plus every legacy one, once
+    assert mock_get.call_count == 1 + len(LEGACY_NAMESPACES)
+
+
+def test_cached_value_is_still_registered_for_redaction(keyring_store, tmp_path):
+    keyring_store[("titan.core", "k")] = "sk-cached-value"
+    sm = SecretManager(project_path=tmp_path)
+    sm.get("k", namespace="titan.core")
+
+    redaction.clear_registry()
+    sm.get("k", namespace="titan.core")
+
+    assert redaction.redact("token sk-cached-value") == f"token {redaction.REDACTED}"
+
+
+def test_env_still_wins_over_cached_keyring_value(keyring_store, tmp_path):
+    keyring_store[("titan.core", "token")] = "from-keyring"
+    sm = SecretManager(project_path=tmp_path)
+    assert sm.resolve("token", namespace="titan.core") == ("from-keyring", "keyring")
+
+    os.environ["TOKEN"] = "from-env"
+    assert sm.resolve("token", namespace="titan.core") == ("from-env", "env")
+
+
+def test_set_invalidates_cached_miss(keyring_store, tmp_path):
+    first = SecretManager(project_path=tmp_path)
+    assert first.get("k", namespace="titan.core") is None
+
+    SecretManager(project_path=tmp_path).set("k", "new", namespace="titan.core")
+
+    assert first.get("k", namespace="titan.core") == "new"
+
+
+def test_legacy_write_invalidates_other_namespaces(keyring_store, tmp_path):
+    sm = SecretManager(project_path=tmp_path)
+    assert sm.get("k", namespace="titan.plugins.jira") is None
+
+    sm.set("k", "legacy", namespace="titan")
+
+    assert sm.get("k", namespace="titan.plugins.jira") == "legacy"
+
+
+def test_delete_invalidates_cached_value(keyring_store, tmp_path):
+    keyring_store[("titan.core", "k")] = "v"
+    sm = SecretManager(project_path=tmp_path)
+    assert sm.get("k", namespace="titan.core") == "v"
+
+    sm.delete("k", namespace="titan.core")
+
+    assert sm.get("k", namespace="titan.core") is None
+
+
+def test_keyring_error_is_not_cached_as_a_miss(mock_env, tmp_path):
+    calls = []
+
+    def get_password(ns, k):
+        calls.append(ns)
+        if len(calls) == 1:
+            raise RuntimeError("keyring locked")
+        return "v" if ns == "titan.core" else None
+
+    with patch('keyring.get_password', side_effect=get_password), \
+         patch('keyring.set_password'):
+        sm = SecretManager(project_path=tmp_path)
+        assert sm.get("k", namespace="titan.core") is None
+        assert sm.get("k", namespace="titan.core") == "v"
+
+
+def test_clear_secret_cache_forces_a_fresh_read(keyring_store, tmp_path):
+    keyring_store[("titan.core", "k")] = "old"
+    sm = SecretManager(project_path=tmp_path)
+    assert sm.get("k", namespace="titan.core") == "old"
+
+    keyring_store[("titan.core", "k")] = "changed-outside-titan"
+    clear_secret_cache()
+
+    assert sm.get("k", namespace="titan.core") == "changed-outside-titan"
+
+
+def test_prefetch_skips_keys_satisfied_by_env(keyring_store, tmp_path):
+    os.environ["FROM_ENV"] = "x"
+    keyring_store[("titan.core", "stored")] = "v"
+
+    with patch('keyring.get_password', side_effect=lambda ns, k: keyring_store.get((ns, k))) as mock_get:
+        sm = SecretManager(project_path=tmp_path)
+        sm.prefetch([("titan.core", "from_env"), ("titan.core", "stored")])
+        assert sm.get("stored", namespace="titan.core") == "v"
+
+    mock_get.assert_called_once_with("titan.core", "stored")
+
+
+def test_concurrent_lookups_share_one_keyring_read(mock_env, tmp_path):
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def get_password(ns, k):
+        calls.append(ns)
+        started.set()
+        release.wait(timeout=5)
+        return "v"
+
+    with patch('keyring.get_password', side_effect=get_password):
+        sm = SecretManager(project_path=tmp_path)
+        results = []
+        first = threading.Thread(target=lambda: results.append(sm.get("k", namespace="titan.core")))
+        first.start()
+        started.wait(timeout=5)
+        second = threading.Thread(target=lambda: results.append(sm.get("k", namespace="titan.core")))
+        second.start()
+        release.set()
+        first.join(timeout=5)
+        second.join(timeout=5)
+
+    assert results == ["v", "v"]
+    assert calls == ["titan.core"]
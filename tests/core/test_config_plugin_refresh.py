@@ -4,7 +4,7 @@ When reloading config rebuilds the plugin registry, and when it declines to.
 Rebuilding imports and initializes every installed plugin - about a second,
 against ten milliseconds for rereading the files - and every screen reloads on
 resume. So the rule is: rebuild when something the registry depends on changed,
-and not otherwise.
+and not otherwise - and when only some plugins changed, rebuild only those.
 """
 
 from unittest.mock import MagicMock, patch
@@ -55,7 +55,17 @@ def config(config_paths, monkeypatch):
 
 
 def _rebuilds(config) -> int:
-    return config.registry.initialize_plugins.call_count
+    """Full rebuilds plus partial reloads."""
+    return (
+        config.registry.initialize_plugins.call_count
+        + config.registry.reload_plugins.call_count
+    )
+
+
+def _reloaded(config) -> set:
+    """The plugin names passed to the most recent partial reload."""
+    args, kwargs = config.registry.reload_plugins.call_args
+    return set(args[0])
 
 
 def test_the_first_load_builds_the_registry(config):
@@ -166,3 +176,47 @@ def test_config_values_are_reread_even_when_the_registry_is_reused(config, confi
 
     assert config.config.ai.default_connection == "work"
     assert _rebuilds(config) == before
+
+
+def test_changing_one_plugins_settings_reloads_only_that_plugin(config, config_paths):
+    """The rest of the registry keeps its initialized instances."""
+    _, _, project_path = config_paths
+    full_before = config.registry.initialize_plugins.call_count
+
+    _write_plugins(project_path, {"git": {"enabled": True, "main_branch": "develop"}})
+    config.load()
+
+    assert config.registry.initialize_plugins.call_count == full_before
+    assert config.registry.reset.call_count == 1
+    assert _reloaded(config) == {"git"}
+
+
+def test_enabling_a_plugin_reloads_only_the_new_one(config, config_paths):
+    _, _, project_path = config_paths
+
+    _write_plugins(project_path, {"git": {"enabled": True}, "github": {"enabled": True}})
+    config.load()
+
+    assert _reloaded(config) == {"github"}
+
+
+def test_upgrading_an_installed_plugin_reloads_only_it(config):
+    """Same plugin set, new version: discovery is unchanged, the plugin is not."""
+    old = MagicMock()
+    old.name = "git"
+    old.value = "titan_plugin_git.plugin:GitPlugin"
+    old.dist.version = "1.0.0"
+    new = MagicMock()
+    new.name = "git"
+    new.value = "titan_plugin_git.plugin:GitPlugin"
+    new.dist.version = "1.1.0"
+
+    with patch("importlib.metadata.entry_points", return_value=[old]):
+        config.load()
+    full_before = config.registry.initialize_plugins.call_count
+
+    with patch("importlib.metadata.entry_points", return_value=[new]):
+        config.load()
+
+    assert config.registry.initialize_plugins.call_count == full_before
+    assert _reloaded(config) == {"git"}
@@ -1,29 +1,168 @@
-"""Tests for cooperative interruption of blocking workflow calls."""
+"""Tests for cooperative cancellation of blocking workflow calls."""
 
+import contextvars
+import http.client
+import http.server
+import os
+import subprocess
+import sys
 import threading
 import time
 
 import pytest
 
+from titan_cli.core import interrupt
 from titan_cli.core.interrupt import (
+    CancellationToken,
     WorkflowAborted,
     abort_requested,
-    clear_abort_check,
+    cancellation_scope,
+    clear_cancellation_token,
+    current_token,
+    interruptible_io,
+    live_interruptible_calls,
+    live_processes,
+    raise_if_aborted,
     run_interruptible,
-    set_abort_check,
+    run_process,
+    set_cancellation_token,
 )
 
+posix_only = pytest.mark.skipif(os.name == "nt", reason="process groups are POSIX-only")
+
 
 @pytest.fixture(autouse=True)
-def _clean_abort_check():
-    clear_abort_check()
+def _no_leftovers():
+    clear_cancellation_token()
     yield
-    clear_abort_check()
+    clear_cancellation_token()
+    # Whatever a test started must be gone once it returns
+    assert live_interruptible_calls() == []
+    assert live_processes() == []
+
+
+@pytest.fixture
+def token():
+    token = CancellationToken()
+    set_cancellation_token(token)
+    return token
+
+
+def _cancel_after(token, delay, reason="Workflow cancelled"):
+    timer = threading.Timer(delay, token.cancel, args=(reason,))
+    timer.daemon = True
+    timer.start()
+    return timer
+
+
+def _pid_alive(pid):
+    # An orphaned grandchild may linger as a zombie until init reaps it;
+    # that is dead for our purposes.
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+    except OSError:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        return True
+
+
+def _wait_until_dead(pid, timeout=5.0):
+    # The pipes close as soon as the group is killed, but the kernel may take
+    # a moment more before the process stops showing as alive.
+    deadline = time.monotonic() + timeout
+    while _pid_alive(pid):
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.02)
+    return True
+
+
+def _start_in_context(target):
+    """Start target on a thread that inherits the test's cancellation token."""
+    thread = threading.Thread(target=contextvars.copy_context().run, args=(target,), daemon=True)
+    thread.start()
+    return thread
+
+
+def _wait_for_pid_file(path, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if path.exists() and path.read_text().strip():
+            return int(path.read_text())
+        time.sleep(0.02)
+    raise AssertionError("child never wrote its pid")
+
+
+class TestCancellationToken:
+    def test_cancel_runs_callbacks_once(self):
+        token = CancellationToken()
+        calls = []
+        token.on_cancel(lambda: calls.append("a"))
+
+        token.cancel("stop")
+        token.cancel("again")
+
+        assert calls == ["a"]
+        assert token.cancelled
+        assert token.reason == "stop"
+
+    def test_callback_registered_after_cancel_runs_immediately(self):
+        token = CancellationToken()
+        token.cancel()
+        calls = []
+
+        token.on_cancel(lambda: calls.append("late"))
+
+        assert calls == ["late"]
+
+    def test_unregistered_callback_does_not_run(self):
+        token = CancellationToken()
+        calls = []
+        unregister = token.on_cancel(lambda: calls.append("a"))
+
+        unregister()
+        token.cancel()
+
+        assert calls == []
+
+    def test_failing_callback_does_not_stop_the_others(self):
+        token = CancellationToken()
+        calls = []
+
+        def broken():
+            raise RuntimeError("socket already gone")
 
+        token.on_cancel(broken)
+        token.on_cancel(lambda: calls.append("b"))
+        token.cancel()
 
-class TestWithoutAbortCheck:
+        assert calls == ["b"]
+
+    def test_raise_if_cancelled(self):
+        token = CancellationToken()
+        token.raise_if_cancelled()
+
+        token.cancel("user pressed escape")
+
+        with pytest.raises(WorkflowAborted, match="user pressed escape"):
+            token.raise_if_cancelled()
+
+    def test_workflow_aborted_is_not_an_exception_subclass(self):
+        # Transports and the step loop catch `Exception` broadly; an abort must
+        # pass through those handlers untouched.
+        assert not issubclass(WorkflowAborted, Exception)
+        assert issubclass(WorkflowAborted, BaseException)
+
+
+class TestWithoutToken:
     def test_runs_inline_and_returns_result(self):
         assert run_interruptible(lambda: 42) == 42
+        assert live_interruptible_calls() == []
 
     def test_propagates_exception(self):
         with pytest.raises(ValueError, match="boom"):
@@ -31,49 +170,261 @@ class TestWithoutAbortCheck:
 
     def test_abort_requested_is_false(self):
         assert abort_requested() is False
+        raise_if_aborted()
 
+    def test_run_process_behaves_like_subprocess_run(self):
+        result = run_process(
+            [sys.executable, "-c", "import sys; print(sys.stdin.read() + 'out'); sys.exit(3)"],
+            input="in-",
+            capture_output=True,
+            text=True,
+        )
 
-class TestWithAbortCheck:
-    def test_returns_result_when_not_aborted(self):
-        set_abort_check(lambda: False)
-        assert run_interruptible(lambda: "ok") == "ok"
+        assert result.returncode == 3
+        assert result.stdout.strip() == "in-out"
+
+    def test_run_process_check_raises_called_process_error(self):
+        with pytest.raises(subprocess.CalledProcessError):
+            run_process([sys.executable, "-c", "raise SystemExit(1)"], capture_output=True, check=True)
 
-    def test_propagates_exception_when_not_aborted(self):
-        set_abort_check(lambda: False)
+    def test_run_process_stdin_defaults_to_devnull(self):
+        result = run_process(
+            [sys.executable, "-c", "import sys; print(repr(sys.stdin.read()))"],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.stdout.strip() == "''"
+
+
+class TestTokenBinding:
+    def test_token_is_bound_to_the_thread_that_set_it(self, token):
+        seen = {}
+        thread = threading.Thread(target=lambda: seen.setdefault("token", current_token()))
+        thread.start()
+        thread.join(5)
+
+        assert current_token() is token
+        assert seen["token"] is None
+
+    def test_a_new_run_does_not_revive_a_cancelled_one(self, token):
+        # A cancelled workflow still unwinding keeps seeing its own token even
+        # after another workflow binds a fresh one on its own thread.
+        token.cancel()
+        started = threading.Event()
+        finished = threading.Event()
+
+        def next_workflow():
+            set_cancellation_token(CancellationToken())
+            started.set()
+            finished.wait(5)
+
+        thread = threading.Thread(target=next_workflow, daemon=True)
+        thread.start()
+        started.wait(5)
+        try:
+            with pytest.raises(WorkflowAborted):
+                raise_if_aborted()
+        finally:
+            finished.set()
+            thread.join(5)
+
+    def test_cancellation_scope_follows_the_enclosing_token(self, token):
+        with cancellation_scope() as scope:
+            assert current_token() is scope
+            token.cancel("run cancelled")
+            assert scope.cancelled
+            assert scope.reason == "run cancelled"
+        assert current_token() is token
+
+    def test_cancelling_a_scope_leaves_the_enclosing_token_alone(self, token):
+        with cancellation_scope() as scope:
+            scope.cancel("facet timed out")
+            with pytest.raises(WorkflowAborted, match="facet timed out"):
+                raise_if_aborted()
+        assert not token.cancelled
+        raise_if_aborted()
+
+
+class TestRunInterruptible:
+    def test_returns_result_when_not_cancelled(self, token):
+        assert run_interruptible(lambda: "ok") == "ok"
 
+    def test_propagates_exception_when_not_cancelled(self, token):
         def fail():
             raise RuntimeError("provider down")
 
         with pytest.raises(RuntimeError, match="provider down"):
             run_interruptible(fail)
 
-    def test_raises_workflow_aborted_while_call_is_blocked(self):
-        aborted = threading.Event()
-        set_abort_check(aborted.is_set)
+    def test_wakes_immediately_on_cancel(self, token):
+        # The call unwinds as soon as the token fires (as an aborted request
+        # does), so the caller is released at once - no polling interval.
+        _cancel_after(token, 0.1)
+        started = time.monotonic()
+
+        with pytest.raises(WorkflowAborted):
+            run_interruptible(lambda: token.wait(30))
+
+        assert time.monotonic() - started < 1.0
 
+    def test_abandons_a_call_that_does_not_unwind(self, token, monkeypatch):
+        monkeypatch.setattr(interrupt, "_ABANDON_GRACE_SECONDS", 0.1)
         release = threading.Event()
+        _cancel_after(token, 0.1)
+
+        with pytest.raises(WorkflowAborted):
+            run_interruptible(lambda: release.wait(30))
+
+        # Still running on its daemon thread until released
+        assert len(live_interruptible_calls()) == 1
+        release.set()
+        for thread in live_interruptible_calls():
+            thread.join(5)
+
+    def test_already_cancelled_token_does_not_start_the_call(self, token):
+        token.cancel()
+        calls = []
+
+        with pytest.raises(WorkflowAborted):
+            run_interruptible(lambda: calls.append("ran"))
+
+        assert calls == []
+
+
+@posix_only
+class TestProcessGroups:
+    def test_cancel_terminates_the_whole_process_group(self, token, tmp_path):
+        pid_file = tmp_path / "grandchild.pid"
+        script = f"sleep 30 & echo $! > {pid_file}; wait"
+        box = {}
+
+        def target():
+            try:
+                run_process(["sh", "-c", script], capture_output=True, text=True)
+            except WorkflowAborted as e:
+                box["aborted"] = e
+
+        thread = _start_in_context(target)
+        grandchild = _wait_for_pid_file(pid_file)
+
+        started = time.monotonic()
+        token.cancel()
+        thread.join(5)
+
+        assert not thread.is_alive()
+        assert "aborted" in box
+        assert time.monotonic() - started < 1.0
+        assert _wait_until_dead(grandchild)
+
+    def test_sigterm_resistant_group_is_killed_after_grace_period(self, token, tmp_path, monkeypatch):
+        monkeypatch.setattr(interrupt, "_TERMINATE_GRACE_SECONDS", 0.2)
+        pid_file = tmp_path / "child.pid"
+        script = f"trap '' TERM; echo $$ > {pid_file}; while :; do sleep 0.1; done"
+        box = {}
+
+        def target():
+            try:
+                run_process(["sh", "-c", script], capture_output=True, text=True)
+            except WorkflowAborted as e:
+                box["aborted"] = e
+
+        thread = _start_in_context(target)
+        child = _wait_for_pid_file(pid_file)
+
+        token.cancel()
+        thread.join(5)
+
+        assert not thread.is_alive()
+        assert "aborted" in box
+        assert _wait_until_dead(child)
+
+    def test_timeout_kills_the_whole_process_group(self, tmp_path):
+        pid_file = tmp_path / "grandchild.pid"
+        script = f"sleep 30 & echo $! > {pid_file}; echo partial; wait"
 
-        def blocking_call():
-            release.wait(timeout=30)
-            return "too late"
+        with pytest.raises(subprocess.TimeoutExpired) as exc_info:
+            run_process(["sh", "-c", script], capture_output=True, text=True, timeout=0.5)
 
-        aborted.set()
+        assert "partial" in exc_info.value.stdout
+        assert _wait_until_dead(_wait_for_pid_file(pid_file))
+
+
+class _SlowHandler(http.server.BaseHTTPRequestHandler):
+    release = threading.Event()
+
+    def do_GET(self):
+        self.release.wait(30)
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def slow_server():
+    _SlowHandler.release = threading.Event()
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address
+    _SlowHandler.release.set()
+    server.shutdown()
+    server.server_close()
+    thread.join(5)
+
+
+class TestInterruptibleIO:
+    def test_cancel_aborts_an_in_flight_request(self, token, slow_server):
+        host, port = slow_server
+        _cancel_after(token, 0.2)
         started = time.monotonic()
+
         with pytest.raises(WorkflowAborted):
-            run_interruptible(blocking_call)
-        # It escaped by polling, not by waiting the call out.
-        assert time.monotonic() - started < 5
-        release.set()
+            with interruptible_io():
+                connection = http.client.HTTPConnection(host, port, timeout=30)
+                try:
+                    connection.request("GET", "/")
+                    connection.getresponse()
+                finally:
+                    connection.close()
 
-    def test_workflow_aborted_is_not_an_exception_subclass(self):
-        # Transports and the step loop catch `Exception` broadly; an abort must
-        # pass through those handlers untouched.
-        assert not issubclass(WorkflowAborted, Exception)
-        assert issubclass(WorkflowAborted, BaseException)
+        assert time.monotonic() - started < 2.0
+
+    def test_run_interruptible_aborts_requests_made_by_the_call(self, token, slow_server):
+        host, port = slow_server
+
+        def call():
+            connection = http.client.HTTPConnection(host, port, timeout=30)
+            try:
+                connection.request("GET", "/")
+                return connection.getresponse().status
+            finally:
+                connection.close()
+
+        _cancel_after(token, 0.2)
+        started = time.monotonic()
+
+        with pytest.raises(WorkflowAborted):
+            run_interruptible(call)
+
+        assert time.monotonic() - started < 2.0
+
+    def test_new_connections_are_refused_once_cancelled(self, token, slow_server):
+        host, port = slow_server
+
+        with pytest.raises(WorkflowAborted):
+            with interruptible_io():
+                token.cancel()
+                http.client.HTTPConnection(host, port, timeout=30).connect()
 
-    def test_failing_check_counts_as_abort(self):
-        def broken_check():
-            raise RuntimeError("app torn down")
+    def test_without_token_the_block_runs_unchanged(self, slow_server):
+        _SlowHandler.release.set()
+        host, port = slow_server
 
-        set_abort_check(broken_check)
-        assert abort_requested() is True
+        with interruptible_io():
+            connection = http.client.HTTPConnection(host, port, timeout=30)
+            connection.request("GET", "/")
+            assert connection.getresponse().status == 200
+            connection.close()
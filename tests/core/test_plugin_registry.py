@@ -212,6 +212,76 @@ def test_plugin_registry_plugin_initialization_context(mocker):
     mock_broker_factory.for_plugin.assert_called_once_with("test_plugin")
 
 
+def test_reload_plugins_reinitializes_changed_plugin_and_its_dependents_only(mocker):
+    """
+    Reloading a plugin also reloads whatever depends on it; unrelated plugins
+    keep their already-initialized instances.
+    """
+    PluginOne = type("PluginOne", (MockPlugin,), {"_name": "plugin_one"})
+    PluginTwo = type("PluginTwo", (MockDependentPlugin,), {"_name": "plugin_two"})
+    PluginThree = type("PluginThree", (MockPlugin,), {"_name": "plugin_three"})
+    eps = []
+    for name, cls in (("plugin_one", PluginOne), ("plugin_two", PluginTwo), ("plugin_three", PluginThree)):
+        ep = MagicMock()
+        ep.name = name
+        ep.load.return_value = cls
+        eps.append(ep)
+
+    mocker.patch(
+        "titan_cli.core.plugins.plugin_registry.entry_points",
+        return_value=eps,
+    )
+
+    registry = PluginRegistry(discover_on_init=False)
+    registry.discover()
+    mock_config = MagicMock(spec=TitanConfig)
+    mock_broker_factory = MagicMock(spec=SecretBrokerFactory)
+    registry.initialize_plugins(mock_config, mock_broker_factory)
+
+    old_one = registry.get_plugin("plugin_one")
+    old_two = registry.get_plugin("plugin_two")
+    old_three = registry.get_plugin("plugin_three")
+
+    reloaded = registry.reload_plugins(["plugin_one"], mock_config, mock_broker_factory)
+
+    assert reloaded == {"plugin_one", "plugin_two"}
+    assert registry.get_plugin("plugin_one") is not old_one
+    assert registry.get_plugin("plugin_two") is not old_two
+    assert registry.get_plugin("plugin_one")._initialized
+    assert registry.get_plugin("plugin_two")._initialized
+    assert registry.get_plugin("plugin_three") is old_three
+    assert registry.list_failed() == {}
+
+
+def test_reload_plugins_treats_untouched_dependencies_as_initialized(mocker):
+    """Reloading only a dependent must not trip the unresolved-dependency check."""
+    PluginOne = type("PluginOne", (MockPlugin,), {"_name": "plugin_one"})
+    PluginTwo = type("PluginTwo", (MockDependentPlugin,), {"_name": "plugin_two"})
+    eps = []
+    for name, cls in (("plugin_one", PluginOne), ("plugin_two", PluginTwo)):
+        ep = MagicMock()
+        ep.name = name
+        ep.load.return_value = cls
+        eps.append(ep)
+
+    mocker.patch(
+        "titan_cli.core.plugins.plugin_registry.entry_points",
+        return_value=eps,
+    )
+
+    registry = PluginRegistry(discover_on_init=False)
+    registry.discover()
+    mock_config = MagicMock(spec=TitanConfig)
+    mock_broker_factory = MagicMock(spec=SecretBrokerFactory)
+    registry.initialize_plugins(mock_config, mock_broker_factory)
+    old_one = registry.get_plugin("plugin_one")
+
+    assert registry.reload_plugins(["plugin_two"], mock_config, mock_broker_factory) == {"plugin_two"}
+    assert registry.get_plugin("plugin_one") is old_one
+    assert registry.get_plugin("plugin_two")._initialized
+    assert "plugin_two" not in registry.list_failed()
+
+
 def test_apply_source_overrides_loads_dev_local_plugin(tmp_path, mocker):
     plugin_dir = tmp_path / "plugin_repo"
     plugin_dir.mkdir()
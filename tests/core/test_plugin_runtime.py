@@ -1,6 +1,16 @@
+import os
+import shutil
+import subprocess
+import threading
 from pathlib import Path
 
-from titan_cli.core.plugins.runtime import PluginRuntimeManager
+import pytest
+
+from titan_cli.core.plugins.runtime import (
+    PluginRuntimeError,
+    PluginRuntimeManager,
+    PluginRuntimeRequest,
+)
 
 
 def test_get_runtime_paths_returns_expected_layout(tmp_path: Path):
@@ -41,7 +51,7 @@ def test_ensure_stable_runtime_prepares_and_moves_runtime(tmp_path: Path, mocker
     mocker.patch.object(manager, "_is_runtime_ready", return_value=False)
     mocker.patch("titan_cli.core.plugins.runtime.mkdtemp", return_value=str(temp_dir))
 
-    def fake_prepare(paths, repo_url, resolved_commit, token):
+    def fake_prepare(plugin_name, paths, repo_url, resolved_commit, token):
         paths.source_dir.mkdir(parents=True, exist_ok=True)
         paths.site_packages.mkdir(parents=True, exist_ok=True)
         pip_executable = manager._get_venv_executable(paths.venv_dir, "pip")
@@ -74,3 +84,226 @@ def test_build_authenticated_repo_url_adds_token():
     )
 
     assert result == "https://abc123@github.com/example/sample-plugin"
+
+
+PYPROJECT = """
+[tool.poetry]
+name = "titan-plugin-sample"
+version = "{version}"
+
+[tool.poetry.dependencies]
+python = ">=3.11"
+requests = "{requests}"
+
+[build-system]
+requires = ["poetry-core>=1.0.0"]
+build-backend = "poetry.core.masonry.api"
+"""
+
+
+def _write_source(source_dir: Path, version: str = "1.0.0", requests: str = ">=2.31") -> None:
+    source_dir.mkdir(parents=True, exist_ok=True)
+    (source_dir / "pyproject.toml").write_text(
+        PYPROJECT.format(version=version, requests=requests), encoding="utf-8"
+    )
+
+
+def _fake_environment(venv_dir: Path, *_args) -> None:
+    """Stand-in for venv creation: just the layout readiness checks look at."""
+    (venv_dir / "lib" / "python3.11" / "site-packages").mkdir(parents=True)
+    (venv_dir / "bin").mkdir()
+    (venv_dir / "bin" / "pip").write_text("", encoding="utf-8")
+
+
+@pytest.fixture
+def offline_manager(tmp_path: Path, mocker):
+    """A manager whose checkout writes a pyproject and whose environments are fake."""
+    manager = PluginRuntimeManager(cache_root=tmp_path, offline=True)
+    sources = {}
+
+    def checkout(plugin_name, repo_url, resolved_commit, source_dir, token):
+        version, requests = sources[resolved_commit]
+        _write_source(source_dir, version=version, requests=requests)
+
+    mocker.patch.object(manager, "_checkout_source", side_effect=checkout)
+    mocker.patch.object(manager, "_create_virtualenv", side_effect=_fake_environment)
+    install = mocker.patch.object(manager, "_install_dependencies")
+    return manager, sources, install
+
+
+def test_dependency_key_ignores_version_bump(tmp_path: Path):
+    manager = PluginRuntimeManager(cache_root=tmp_path)
+    _write_source(tmp_path / "a", version="1.0.0")
+    _write_source(tmp_path / "b", version="1.1.0")
+    _write_source(tmp_path / "c", requests=">=2.32")
+
+    key = manager._dependency_key(tmp_path / "a", "a" * 40)
+
+    assert manager._dependency_key(tmp_path / "b", "b" * 40) == key
+    assert manager._dependency_key(tmp_path / "c", "c" * 40) != key
+
+
+def test_dependency_key_follows_lock_file(tmp_path: Path):
+    manager = PluginRuntimeManager(cache_root=tmp_path)
+    _write_source(tmp_path / "src")
+    key = manager._dependency_key(tmp_path / "src", "a" * 40)
+
+    (tmp_path / "src" / "poetry.lock").write_text("requests 2.32.3", encoding="utf-8")
+
+    assert manager._dependency_key(tmp_path / "src", "a" * 40) != key
+
+
+def test_new_commit_with_same_dependencies_reuses_environment(offline_manager):
+    manager, sources, install = offline_manager
+    sources["a" * 40] = ("1.0.0", ">=2.31")
+    sources["b" * 40] = ("1.1.0", ">=2.31")
+
+    first = manager.ensure_stable_runtime("sample", "https://example.com/sample", "a" * 40)
+    second = manager.ensure_stable_runtime("sample", "https://example.com/sample", "b" * 40)
+
+    assert first.created and second.created
+    install.assert_called_once()
+    assert first.paths.venv_dir.resolve() == second.paths.venv_dir.resolve()
+    assert second.paths.site_packages.is_dir()
+
+
+def test_changed_dependencies_get_their_own_environment(offline_manager):
+    manager, sources, install = offline_manager
+    sources["a" * 40] = ("1.0.0", ">=2.31")
+    sources["b" * 40] = ("1.1.0", ">=2.32")
+
+    first = manager.ensure_stable_runtime("sample", "https://example.com/sample", "a" * 40)
+    second = manager.ensure_stable_runtime("sample", "https://example.com/sample", "b" * 40)
+
+    assert install.call_count == 2
+    assert first.paths.venv_dir.resolve() != second.paths.venv_dir.resolve()
+
+
+def test_creating_a_runtime_prunes_least_recently_used_ones(offline_manager):
+    manager, sources, _ = offline_manager
+    manager.max_runtimes_per_plugin = 2
+    commits = ["a" * 40, "b" * 40, "c" * 40]
+    for index, commit in enumerate(commits):
+        # A distinct dependency set per commit, so each has its own environment
+        sources[commit] = ("1.0.0", f">=2.{index}")
+
+    for last_used, commit in ((100, commits[0]), (200, commits[1])):
+        manager.ensure_stable_runtime("sample", "https://example.com/sample", commit)
+        marker = manager.get_runtime_paths("sample", commit).cache_dir / ".last-used"
+        os.utime(marker, (last_used, last_used))
+    manager.ensure_stable_runtime("sample", "https://example.com/sample", commits[2])
+
+    remaining = sorted(p.name for p in (manager.cache_root / "sample").iterdir())
+    assert remaining == [commits[1], commits[2]]
+    assert len(list(manager.envs_dir.iterdir())) == 2
+
+
+def test_offline_without_mirrored_commit_fails(tmp_path: Path):
+    manager = PluginRuntimeManager(cache_root=tmp_path, offline=True)
+
+    with pytest.raises(PluginRuntimeError, match="Offline mode"):
+        manager.ensure_stable_runtime("sample", "https://example.com/sample", "a" * 40)
+
+    assert not (tmp_path / "sample" / ("a" * 40)).exists()
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+def test_checkout_goes_through_the_mirror_and_works_offline_afterwards(tmp_path: Path):
+    env = {**os.environ, "GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@t",
+           "GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@t"}
+    upstream = tmp_path / "upstream"
+    _write_source(upstream)
+    for command in (["init", "-q"], ["add", "."], ["commit", "-q", "-m", "init"]):
+        subprocess.run(["git", *command], cwd=upstream, env=env, check=True)
+    commit = subprocess.run(
+        ["git", "rev-parse", "HEAD"], cwd=upstream, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+    manager = PluginRuntimeManager(cache_root=tmp_path / "cache")
+    manager._checkout_source("sample", upstream.as_uri(), commit, tmp_path / "first", None)
+    shutil.rmtree(upstream)
+    manager.offline = True
+    manager._checkout_source("sample", upstream.as_uri(), commit, tmp_path / "second", None)
+
+    assert (tmp_path / "second" / "pyproject.toml").is_file()
+    remotes = subprocess.run(
+        ["git", "-C", str(tmp_path / "second"), "remote"], capture_output=True, text=True
+    ).stdout
+    assert remotes.strip() == ""
+
+
+def test_ensure_stable_runtimes_prepares_plugins_concurrently(tmp_path: Path, mocker):
+    manager = PluginRuntimeManager(cache_root=tmp_path)
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_ensure(plugin_name, repo_url, resolved_commit, token=None):
+        # Both plugins must be in flight at once to get past the barrier
+        barrier.wait()
+        if plugin_name == "broken":
+            raise PluginRuntimeError("install failed")
+        return plugin_name
+
+    mocker.patch.object(manager, "ensure_stable_runtime", side_effect=fake_ensure)
+
+    results = manager.ensure_stable_runtimes([
+        PluginRuntimeRequest("sample", "https://example.com/sample", "a" * 40),
+        PluginRuntimeRequest("broken", "https://example.com/broken", "b" * 40),
+    ])
+
+    assert list(results) == ["sample", "broken"]
+    assert results["sample"] == "sample"
+    assert isinstance(results["broken"], PluginRuntimeError)
+
+
+def test_environment_being_built_elsewhere_is_waited_for_not_rebuilt(offline_manager, mocker):
+    # Two managers share nothing in memory, like two titan processes
+    first, sources, first_install = offline_manager
+    second = PluginRuntimeManager(cache_root=first.cache_root, offline=True)
+    mocker.patch.object(second, "_checkout_source", side_effect=first._checkout_source)
+    second_create = mocker.patch.object(second, "_create_virtualenv", side_effect=_fake_environment)
+    second_install = mocker.patch.object(second, "_install_dependencies")
+    sources["a" * 40] = ("1.0.0", ">=2.31")
+    sources["b" * 40] = ("1.1.0", ">=2.31")
+    installing, release = threading.Event(), threading.Event()
+
+    def slow_install(*_args):
+        installing.set()
+        assert release.wait(timeout=5)
+
+    first_install.side_effect = slow_install
+    building = threading.Thread(
+        target=first.ensure_stable_runtime, args=("sample", "https://example.com/sample", "a" * 40)
+    )
+    building.start()
+    assert installing.wait(timeout=5)
+    (env_dir,) = first.envs_dir.iterdir()
+    waiting = threading.Thread(
+        target=second.ensure_stable_runtime, args=("sample", "https://example.com/sample", "b" * 40)
+    )
+    waiting.start()
+
+    second.prune()
+    assert env_dir.is_dir()
+
+    release.set()
+    building.join(timeout=5)
+    waiting.join(timeout=5)
+
+    assert (env_dir / ".titan-env-ready").is_file()
+    second_create.assert_not_called()
+    second_install.assert_not_called()
+
+
+def test_prune_skips_an_environment_locked_by_another_manager(tmp_path: Path):
+    first = PluginRuntimeManager(cache_root=tmp_path)
+    second = PluginRuntimeManager(cache_root=tmp_path)
+    # Not yet referenced by any runtime, as right after a crash or mid-link
+    env_dir = tmp_path / "_envs" / "key"
+    env_dir.mkdir(parents=True)
+
+    with first._env_lock("key"):
+        second.prune()
+        assert env_dir.is_dir()
+    second.prune()
+
+    assert not env_dir.exists()
@@ -163,3 +163,75 @@ def test_null_byte_file_becomes_finding(tmp_path):
     (tmp_path / "weird.py").write_bytes(b"x = 1\x00\nimport keyring\n")
     findings = scan_plugin_source(tmp_path)
     assert [f.code for f in findings] == ["unparseable"]
+
+
+# --- Cached and parallel scan ----------------------------------------------
+
+def test_cached_scan_reparses_only_changed_files(tmp_path, mocker):
+    from titan_cli.core.plugins import trust
+    from titan_cli.core.plugins.trust_cache import TrustScanCache
+
+    source = tmp_path / "src"
+    _write(source, "a.py", "import keyring\n")
+    _write(source, "b.py", "x = 1\n")
+    cache = TrustScanCache(tmp_path / "cache.sqlite")
+
+    first = scan_plugin_source(source, cache=cache, max_workers=1)
+
+    spy = mocker.spy(trust, "_scan_source")
+    assert scan_plugin_source(source, cache=cache, max_workers=1) == first
+    assert spy.call_count == 0
+
+    _write(source, "b.py", "from titan_cli.core import SecretManager\n")
+    findings = scan_plugin_source(source, cache=cache, max_workers=1)
+    assert spy.call_count == 1
+    assert [(f.file, f.code) for f in findings] == [
+        ("a.py", "keyring-import"),
+        ("b.py", "secret-manager"),
+    ]
+
+
+def test_cache_ignores_results_from_other_rule_versions(tmp_path, mocker):
+    from titan_cli.core.plugins import trust
+    from titan_cli.core.plugins.trust_cache import TrustScanCache
+
+    _write(tmp_path / "src", "a.py", "import keyring\n")
+    cache = TrustScanCache(tmp_path / "cache.sqlite")
+    scan_plugin_source(tmp_path / "src", cache=cache, max_workers=1)
+
+    mocker.patch.object(trust, "SCAN_RULES_VERSION", trust.SCAN_RULES_VERSION + 1)
+    spy = mocker.spy(trust, "_scan_source")
+    scan_plugin_source(tmp_path / "src", cache=cache, max_workers=1)
+    assert spy.call_count == 1
+
+
+def test_parallel_cold_scan_matches_sequential(tmp_path):
+    from titan_cli.core.plugins.trust import PARALLEL_SCAN_MIN_FILES
+
+    for i in range(PARALLEL_SCAN_MIN_FILES + 4):
+        body = "import keyring\n" if i % 5 == 0 else f"value = {i}\n"
+        _write(tmp_path, f"pkg/mod_{i:03d}.py", body)
+    _write(tmp_path, "pkg/broken.py", "def f(:\n")
+
+    sequential = scan_plugin_source(tmp_path, max_workers=1)
+    parallel = scan_plugin_source(tmp_path, max_workers=2)
+
+    assert parallel == sequential
+    assert {f.code for f in parallel} == {"keyring-import", "unparseable"}
+
+
+def test_cache_hit_refreshes_retention(tmp_path):
+    import sqlite3
+
+    from titan_cli.core.plugins.trust_cache import TrustScanCache
+
+    cache = TrustScanCache(tmp_path / "cache.sqlite")
+    cache.put_many({"abc": []}, rules_version=1)
+    with sqlite3.connect(str(cache.path)) as connection:
+        connection.execute("UPDATE scan_results SET stored_at = 0")
+
+    assert cache.get_many(["abc"], rules_version=1) == {"abc": []}
+
+    with sqlite3.connect(str(cache.path)) as connection:
+        (stored_at,) = connection.execute("SELECT stored_at FROM scan_results").fetchone()
+    assert stored_at > 0
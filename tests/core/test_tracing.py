@@ -0,0 +1,196 @@
+"""
+Tests for workflow tracing: span recording, the Chrome trace file, and its analysis.
+"""
+import json
+import threading
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from titan_cli.core import tracing
+from titan_cli.core.tracing import (
+    critical_path,
+    format_report,
+    load_trace,
+    span,
+    summarize_spans,
+    trace_workflow,
+)
+
+
+@pytest.fixture
+def enabled():
+    tracing.enable_tracing()
+    yield
+    tracing.enable_tracing(False)
+
+
+def _events(path):
+    return [e for e in json.loads(path.read_text())["traceEvents"] if e["ph"] == "X"]
+
+
+def test_span_is_a_no_op_without_an_active_trace(tmp_path):
+    with span("gh pr view", "subprocess") as current:
+        assert current is None
+
+    with trace_workflow("disabled", trace_dir=tmp_path) as workflow_span:
+        assert workflow_span is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_trace_workflow_writes_nested_spans(tmp_path, enabled):
+    with trace_workflow("demo", trace_dir=tmp_path):
+        with span("step one", "step", step_id="one"):
+            with span("gh pr view", "subprocess"):
+                pass
+        # A nested workflow only opens a span in the running trace
+        with trace_workflow("nested", trace_dir=tmp_path):
+            pass
+
+    files = list(tmp_path.glob("*.json"))
+    assert len(files) == 1
+    events = {e["name"]: e for e in _events(files[0])}
+    assert set(events) == {"demo", "step one", "gh pr view", "nested"}
+    assert events["demo"]["args"]["parent_id"] is None
+    assert events["step one"]["args"]["parent_id"] == events["demo"]["args"]["span_id"]
+    assert events["gh pr view"]["args"]["parent_id"] == events["step one"]["args"]["span_id"]
+    assert events["nested"]["args"]["parent_id"] == events["demo"]["args"]["span_id"]
+    assert events["step one"]["args"]["step_id"] == "one"
+    assert events["gh pr view"]["cat"] == "subprocess"
+
+
+def test_span_records_the_exception_type(tmp_path, enabled):
+    with pytest.raises(RuntimeError):
+        with trace_workflow("demo", trace_dir=tmp_path):
+            with span("failing", "step"):
+                raise RuntimeError("boom")
+
+    events = {e["name"]: e for e in _events(next(tmp_path.glob("*.json")))}
+    assert events["failing"]["args"]["error"] == "RuntimeError"
+
+
+def test_parallel_branch_spans_nest_under_the_group(tmp_path, enabled):
+    from titan_cli.core.workflows.models import WorkflowStepModel
+    from titan_cli.engine.context import WorkflowContext
+    from titan_cli.engine.parallel import execute_parallel_group
+    from titan_cli.engine.results import Success
+
+    def run_branch(step, ctx):
+        with span(step.id, "step"):
+            return Success("ok")
+
+    group = WorkflowStepModel(id="group", parallel=[{"command": "a"}, {"command": "b"}])
+    with trace_workflow("demo", trace_dir=tmp_path):
+        with span("group", "step"):
+            execute_parallel_group(group, WorkflowContext(), run_branch)
+
+    events = {e["name"]: e for e in _events(next(tmp_path.glob("*.json")))}
+    group_id = events["group"]["args"]["span_id"]
+    assert events["command_step_1"]["args"]["parent_id"] == group_id
+    assert events["command_step_2"]["args"]["parent_id"] == group_id
+
+
+def _write_trace(tmp_path, spans):
+    """Write a trace of (span_id, parent_id, name, category, start_us, duration_us)."""
+    events = [
+        {
+            "name": name, "cat": category, "ph": "X", "ts": start, "dur": duration,
+            "pid": 1, "tid": 1, "args": {"span_id": span_id, "parent_id": parent_id},
+        }
+        for span_id, parent_id, name, category, start, duration in spans
+    ]
+    path = tmp_path / "trace.json"
+    path.write_text(json.dumps({"traceEvents": events, "otherData": {"workflow": "wf"}}))
+    return path
+
+
+def test_critical_path_follows_the_slowest_branch(tmp_path):
+    path = _write_trace(tmp_path, [
+        (1, None, "wf", "workflow", 0, 1000),
+        (2, 1, "fetch", "step", 0, 100),
+        (3, 1, "group", "step", 100, 900),
+        (4, 3, "fast branch", "step", 100, 200),
+        (5, 3, "slow branch", "step", 100, 880),
+        (6, 5, "ai generate (default)", "ai", 150, 800),
+    ])
+
+    names = [node.name for _, node in critical_path(load_trace(path).roots[0])]
+
+    assert names == ["wf", "fetch", "group", "slow branch", "ai generate (default)"]
+
+
+def test_self_time_counts_overlapping_children_once(tmp_path):
+    path = _write_trace(tmp_path, [
+        (1, None, "wf", "workflow", 0, 1000),
+        (2, 1, "gh pr view", "subprocess", 0, 300),
+        (3, 1, "gh pr view", "subprocess", 200, 300),
+        (4, 1, "gh pr view", "subprocess", 600, 100),
+    ])
+
+    summaries = {s.name: s for s in summarize_spans(load_trace(path).roots)}
+
+    # Children cover 0-500 and 600-700
+    assert summaries["wf"].self_total == pytest.approx(400)
+    assert summaries["gh pr view"].count == 3
+    assert summaries["gh pr view"].self_total == pytest.approx(700)
+
+
+def test_report_lists_critical_path_and_call_counts(tmp_path):
+    path = _write_trace(tmp_path, [
+        (1, None, "wf", "workflow", 0, 2_000_000),
+        *[(i, 1, "gh pr view", "subprocess", i * 10_000, 5_000) for i in range(2, 42)],
+    ])
+
+    report = format_report(load_trace(path))
+
+    assert "Trace: wf" in report
+    assert "2.00s  workflow   wf" in report
+    assert "    40  [subprocess] gh pr view" in report
+
+
+def test_load_trace_rejects_other_files(tmp_path):
+    path = tmp_path / "not-a-trace.json"
+    path.write_text("[1, 2]")
+
+    with pytest.raises(ValueError):
+        load_trace(path)
+
+
+def test_trace_show_prints_latest_trace(tmp_path, monkeypatch, enabled):
+    monkeypatch.setattr("titan_cli.core.tracing.analysis.get_trace_dir", lambda: tmp_path)
+    with trace_workflow("demo", trace_dir=tmp_path):
+        with span("git status", "subprocess"):
+            time.sleep(0.001)
+
+    from titan_cli.cli import app
+    result = CliRunner().invoke(app, ["trace", "show", "--top", "5"])
+
+    assert result.exit_code == 0, result.output
+    assert "Trace: demo" in result.output
+    assert "[subprocess] git status" in result.output
+
+
+def test_trace_show_without_traces(tmp_path, monkeypatch):
+    monkeypatch.setattr("titan_cli.core.tracing.analysis.get_trace_dir", lambda: tmp_path)
+
+    from titan_cli.cli import app
+    result = CliRunner().invoke(app, ["trace", "show"])
+
+    assert result.exit_code == 1
+    assert "No traces recorded yet" in result.output
+
+
+def test_spans_from_threads_record_their_thread(tmp_path, enabled):
+    def work():
+        with span("in thread", "function"):
+            pass
+
+    with trace_workflow("demo", trace_dir=tmp_path):
+        worker = threading.Thread(target=work, name="worker")
+        worker.start()
+        worker.join()
+
+    document = json.loads(next(tmp_path.glob("*.json")).read_text())
+    thread_names = {e["args"]["name"] for e in document["traceEvents"] if e["ph"] == "M"}
+    assert "worker" in thread_names
@@ -0,0 +1,236 @@
+"""
+Tests for parallel step groups: model validation, concurrency, data merging and error rules.
+"""
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from titan_cli.core.workflows import ParsedWorkflow
+from titan_cli.core.workflows.models import WorkflowStepModel
+from titan_cli.engine.context import WorkflowContext
+from titan_cli.engine.results import Error, Exit, Skip, Success
+from titan_cli.engine.workflow_executor import WorkflowExecutor
+
+
+def make_executor(steps: dict) -> WorkflowExecutor:
+    plugin = MagicMock()
+    plugin.get_steps.return_value = steps
+
+    plugin_registry = MagicMock()
+    plugin_registry.get_plugin.return_value = plugin
+    return WorkflowExecutor(plugin_registry, MagicMock())
+
+
+def make_workflow(*steps: dict) -> ParsedWorkflow:
+    return ParsedWorkflow(name="wf", description="", source="test", steps=list(steps), params={})
+
+
+def branch(step: str, **extra) -> dict:
+    return {"plugin": "test", "step": step, **extra}
+
+
+# --- Model validation ---
+
+def test_parallel_group_parses_branches_and_generates_ids():
+    group = WorkflowStepModel(
+        name="Checks",
+        parallel=[{"command": "ruff"}, {"command": "pytest"}, branch("lint")],
+        max_parallel=2,
+    )
+
+    assert group.id == "checks"
+    assert [b.id for b in group.parallel] == ["command_step_1", "command_step_2", "test_lint"]
+    # Dumped steps parse back to the same ids, as the registry round-trips them
+    assert [b.id for b in WorkflowStepModel(**group.model_dump()).parallel] == [
+        "command_step_1", "command_step_2", "test_lint"
+    ]
+
+
+@pytest.mark.parametrize("bad_branch", [
+    {"hook": "before"},
+    {"workflow": "other"},
+    {"parallel": [{"command": "ruff"}]},
+])
+def test_parallel_group_rejects_hooks_workflows_and_nested_groups(bad_branch):
+    with pytest.raises(ValidationError, match="can only run plugin or command steps"):
+        WorkflowStepModel(parallel=[{"command": "ruff"}, bad_branch])
+
+
+def test_parallel_group_needs_branches_and_a_single_action():
+    with pytest.raises(ValidationError, match="at least one branch"):
+        WorkflowStepModel(parallel=[])
+    with pytest.raises(ValidationError, match="only have one action type"):
+        WorkflowStepModel(command="ruff", parallel=[{"command": "pytest"}])
+    with pytest.raises(ValidationError, match="not a parallel group"):
+        WorkflowStepModel(command="ruff", max_parallel=2)
+
+
+# --- Execution ---
+
+def test_branches_run_concurrently():
+    # Each branch waits for the other: only passes if both run at once
+    barrier = threading.Barrier(2, timeout=5)
+
+    def wait(ctx):
+        barrier.wait()
+        return Success("ok")
+
+    executor = make_executor({"a": wait, "b": wait})
+    result = executor.execute(make_workflow({"parallel": [branch("a"), branch("b")]}), WorkflowContext())
+
+    assert isinstance(result, Success)
+
+
+def test_max_parallel_bounds_running_branches():
+    lock = threading.Lock()
+    running = {"now": 0, "peak": 0}
+
+    def track(ctx):
+        with lock:
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+        threading.Event().wait(0.02)
+        with lock:
+            running["now"] -= 1
+        return Success("ok")
+
+    executor = make_executor({"track": track})
+    group = {"max_parallel": 2, "parallel": [branch("track") for _ in range(6)]}
+    executor.execute(make_workflow(group), WorkflowContext())
+
+    assert running["peak"] <= 2
+
+
+def test_branch_writes_are_isolated_and_merged_in_declaration_order():
+    seen = {}
+    first_done = threading.Event()
+
+    def first(ctx):
+        ctx.set("shared", "first")
+        ctx.set("only_first", 1)
+        ctx.data.pop("to_remove")
+        first_done.set()
+        return Success("ok", metadata={"first_meta": True})
+
+    def second(ctx):
+        first_done.wait(5)
+        seen["shared"] = ctx.get("shared")
+        ctx.set("shared", "second")
+        return Success("ok")
+
+    executor = make_executor({"first": first, "second": second})
+    ctx = WorkflowContext(data={"shared": "before", "to_remove": "x"})
+    workflow = make_workflow(
+        {"parallel": [branch("first"), branch("second")]},
+        branch("after"),
+    )
+    executor._plugin_registry.get_plugin.return_value.get_steps.return_value["after"] = (
+        lambda c: Success("ok", metadata={"after_saw": c.get("shared")})
+    )
+
+    executor.execute(workflow, ctx)
+
+    # The second branch never saw the first branch's write...
+    assert seen["shared"] == "before"
+    # ...and wins on the shared key because it is declared last, though it finished last too
+    assert ctx.data["shared"] == "second"
+    assert ctx.data["after_saw"] == "second"
+    assert ctx.data["only_first"] == 1
+    assert ctx.data["first_meta"] is True
+    assert "to_remove" not in ctx.data
+
+
+def test_merge_order_does_not_depend_on_finish_order():
+    second_done = threading.Event()
+
+    def first(ctx):
+        second_done.wait(5)
+        return Success("ok", metadata={"key": "first"})
+
+    def second(ctx):
+        second_done.set()
+        return Success("ok", metadata={"key": "second"})
+
+    executor = make_executor({"first": first, "second": second})
+    ctx = WorkflowContext()
+    executor.execute(make_workflow({"parallel": [branch("first"), branch("second")]}), ctx)
+
+    assert ctx.data["key"] == "second"
+
+
+def test_failing_branch_fails_group_after_running_branches_finish():
+    finished = []
+
+    def fail(ctx):
+        return Error("boom")
+
+    def slow(ctx):
+        threading.Event().wait(0.05)
+        finished.append("slow")
+        return Success("ok", metadata={"slow": True})
+
+    executor = make_executor({"fail": fail, "slow": slow, "never": MagicMock()})
+    ctx = WorkflowContext()
+    group = {
+        "name": "Checks",
+        "max_parallel": 2,
+        "parallel": [branch("slow"), branch("fail"), branch("never")],
+    }
+    result = executor.execute(make_workflow(group, branch("never")), ctx)
+
+    assert isinstance(result, Error)
+    assert "Checks" in result.message
+    assert finished == ["slow"]
+    assert ctx.data["slow"] is True
+    executor._plugin_registry.get_plugin.return_value.get_steps.return_value["never"].assert_not_called()
+
+
+def test_branch_on_error_continue_is_ignored():
+    after = MagicMock(return_value=Success("ok"))
+    executor = make_executor({"fail": lambda ctx: Error("boom"), "ok": lambda ctx: Success("ok"), "after": after})
+
+    group = {"parallel": [branch("fail", on_error="continue"), branch("ok")]}
+    result = executor.execute(make_workflow(group, branch("after")), WorkflowContext())
+
+    assert isinstance(result, Success)
+    after.assert_called_once()
+
+
+def test_group_on_error_continue_keeps_workflow_running():
+    after = MagicMock(return_value=Success("ok"))
+    executor = make_executor({"fail": lambda ctx: Error("boom"), "after": after})
+
+    group = {"on_error": "continue", "parallel": [branch("fail")]}
+    result = executor.execute(make_workflow(group, branch("after")), WorkflowContext())
+
+    assert isinstance(result, Success)
+    after.assert_called_once()
+
+
+def test_exit_in_branch_exits_workflow_after_group():
+    after = MagicMock(return_value=Success("ok"))
+    executor = make_executor({
+        "exit": lambda ctx: Exit("nothing to do", metadata={"status": "clean"}),
+        "ok": lambda ctx: Success("ok", metadata={"ok": True}),
+        "after": after,
+    })
+    ctx = WorkflowContext()
+
+    result = executor.execute(make_workflow({"parallel": [branch("exit"), branch("ok")]}, branch("after")), ctx)
+
+    assert isinstance(result, Success)
+    assert result.message == "nothing to do"
+    assert ctx.data["status"] == "clean"
+    assert ctx.data["ok"] is True
+    after.assert_not_called()
+
+
+def test_group_of_skipped_branches_is_skipped():
+    from titan_cli.engine.parallel import execute_parallel_group
+
+    group = WorkflowStepModel(parallel=[branch("a"), branch("b")])
+    result = execute_parallel_group(group, WorkflowContext(), lambda step, ctx: Skip("not needed"))
+
+    assert isinstance(result, Skip)
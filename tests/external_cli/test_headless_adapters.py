@@ -60,7 +60,7 @@ class TestClaudeHeadlessAdapter(unittest.TestCase):
     def test_is_available_false(self, _):
         self.assertFalse(self.adapter.is_available())
 
-    @patch("subprocess.run")
+    @patch("titan_cli.external_cli.adapters.claude.run_process")
     def test_execute_success(self, mock_run):
         mock_run.return_value = MagicMock(
             stdout="Analysis complete\n",
@@ -80,26 +80,26 @@ class TestClaudeHeadlessAdapter(unittest.TestCase):
         self.assertEqual(response.exit_code, 0)
         self.assertTrue(response.succeeded)
 
-    @patch("subprocess.run")
+    @patch("titan_cli.external_cli.adapters.claude.run_process")
     def test_execute_failure_exit_code(self, mock_run):
         mock_run.return_value = MagicMock(stdout="", stderr="error", returncode=1)
         response = self.adapter.execute("prompt")
         self.assertFalse(response.succeeded)
         self.assertEqual(response.exit_code, 1)
 
-    @patch("subprocess.run", side_effect=subprocess.TimeoutExpired(cmd="claude", timeout=60))
+    @patch("titan_cli.external_cli.adapters.claude.run_process", side_effect=subprocess.TimeoutExpired(cmd="claude", timeout=60))
     def test_execute_timeout(self, _):
         response = self.adapter.execute("prompt", timeout=60)
         self.assertEqual(response.exit_code, 124)
         self.assertIn("timed out", response.stderr)
 
-    @patch("subprocess.run", side_effect=FileNotFoundError)
+    @patch("titan_cli.external_cli.adapters.claude.run_process", side_effect=FileNotFoundError)
     def test_execute_cli_not_found(self, _):
         response = self.adapter.execute("prompt")
         self.assertEqual(response.exit_code, 127)
         self.assertIn("not found", response.stderr)
 
-    @patch("subprocess.run")
+    @patch("titan_cli.external_cli.adapters.claude.run_process")
     def test_execute_strips_ansi_codes(self, mock_run):
         mock_run.return_value = MagicMock(
             stdout="\x1b[32mGreen text\x1b[0m\n",
@@ -112,7 +112,7 @@ class TestClaudeHeadlessAdapter(unittest.TestCase):
     def test_supports_structured_output(self):
         self.assertTrue(self.adapter.supports_structured_output)
 
-    @patch("subprocess.run")
+    @patch("titan_cli.external_cli.adapters.claude.run_process")
     def test_execute_with_json_schema_adds_output_format_flags(self, mock_run):
         mock_run.return_value = MagicMock(
             stdout=json.dumps({"structured_output": {"findings": []}}),
@@ -130,7 +130,7 @@ class TestClaudeHeadlessAdapter(unittest.TestCase):
             timeout=45,
         )
 
-    @patch("subprocess.run")
+    @patch("titan_cli.external_cli.adapters.claude.run_process")
     def test_execute_with_json_schema_unwraps_structured_output(self, mock_run):
         mock_run.return_value = MagicMock(
             stdout=json.dumps({"structured_output": {"findings": [{"title": "Bug"}]}, "is_error": False}),
@@ -142,7 +142,7 @@ class TestClaudeHeadlessAdapter(unittest.TestCase):
         self.assertEqual(json.loads(response.stdout), {"findings": [{"title": "Bug"}]})
         self.assertTrue(response.succeeded)
 
-    @patch("subprocess.run")
+    @patch("titan_cli.external_cli.adapters.claude.run_process")
     def test_execute_with_json_schema_falls_back_to_result_text_when_tool_not_called(self, mock_run):
         mock_run.return_value = MagicMock(
             stdout=json.dumps({"result": "I won't call that tool.", "is_error": False}),
@@ -154,7 +154,7 @@ class TestClaudeHeadlessAdapter(unittest.TestCase):
         self.assertEqual(response.stdout, "I won't call that tool.")
         self.assertTrue(response.succeeded)
 
-    @patch("subprocess.run")
+    @patch("titan_cli.external_cli.adapters.claude.run_process")
     def test_execute_with_json_schema_surfaces_cli_error(self, mock_run):
         mock_run.return_value = MagicMock(
             stdout=json.dumps({"is_error": True, "result": "API Error: 400 bad schema"}),
@@ -166,7 +166,7 @@ class TestClaudeHeadlessAdapter(unittest.TestCase):
         self.assertFalse(response.succeeded)
         self.assertIn("bad schema", response.stderr)
 
-    @patch("subprocess.run")
+    @patch("titan_cli.external_cli.adapters.claude.run_process")
     def test_execute_with_json_schema_falls_back_on_unparseable_envelope(self, mock_run):
         mock_run.return_value = MagicMock(stdout="not json at all", stderr="", returncode=0)
         response = self.adapter.execute("prompt", json_schema={"type": "object"})
@@ -177,7 +177,7 @@ class TestClaudeHeadlessAdapter(unittest.TestCase):
     def test_supports_tool_restriction(self):
         self.assertTrue(self.adapter.supports_tool_restriction)
 
-    @patch("subprocess.run")
+    @patch("titan_cli.external_cli.adapters.claude.run_process")
     def test_execute_with_disallowed_tools_adds_flag(self, mock_run):
         mock_run.return_value = MagicMock(stdout="ok", stderr="", returncode=0)
         self.adapter.execute(
@@ -192,7 +192,7 @@ class TestClaudeHeadlessAdapter(unittest.TestCase):
             timeout=45,
         )
 
-    @patch("subprocess.run")
+    @patch("titan_cli.external_cli.adapters.claude.run_process")
     def test_execute_without_disallowed_tools_omits_flag(self, mock_run):
         mock_run.return_value = MagicMock(stdout="ok", stderr="", returncode=0)
         self.adapter.execute("review this")
@@ -203,7 +203,7 @@ class TestClaudeHeadlessAdapter(unittest.TestCase):
     def test_supports_effort_control(self):
         self.assertTrue(self.adapter.supports_effort_control)
 
-    @patch("subprocess.run")
+    @patch("titan_cli.external_cli.adapters.claude.run_process")
     def test_execute_with_effort_adds_flag(self, mock_run):
         mock_run.return_value = MagicMock(stdout="ok", stderr="", returncode=0)
         self.adapter.execute("review this", cwd="/tmp", timeout=45, effort="medium")
@@ -216,7 +216,7 @@ class TestClaudeHeadlessAdapter(unittest.TestCase):
             timeout=45,
         )
 
-    @patch("subprocess.run")
+    @patch("titan_cli.external_cli.adapters.claude.run_process")
     def test_execute_without_effort_omits_flag(self, mock_run):
         mock_run.return_value = MagicMock(stdout="ok", stderr="", returncode=0)
         self.adapter.execute("review this")
@@ -236,7 +236,7 @@ class TestCodexHeadlessAdapterStructuredOutput(unittest.TestCase):
     def test_supports_structured_output_is_false(self):
         self.assertFalse(self.adapter.supports_structured_output)
 
-    @patch("subprocess.run")
+    @patch("titan_cli.external_cli.adapters.codex.run_process")
     def test_execute_ignores_json_schema(self, mock_run):
         mock_run.return_value = MagicMock(stdout="", stderr="", returncode=0)
         self.adapter.execute("prompt", json_schema={"type": "object"})
@@ -247,7 +247,7 @@ class TestCodexHeadlessAdapterStructuredOutput(unittest.TestCase):
     def test_supports_tool_restriction_is_false(self):
         self.assertFalse(self.adapter.supports_tool_restriction)
 
-    @patch("subprocess.run")
+    @patch("titan_cli.external_cli.adapters.codex.run_process")
     def test_execute_ignores_disallowed_tools(self, mock_run):
         mock_run.return_value = MagicMock(stdout="", stderr="", returncode=0)
         self.adapter.execute("prompt", disallowed_tools=["Bash", "Agent"])
@@ -258,7 +258,7 @@ class TestCodexHeadlessAdapterStructuredOutput(unittest.TestCase):
     def test_supports_effort_control_is_false(self):
         self.assertFalse(self.adapter.supports_effort_control)
 
-    @patch("subprocess.run")
+    @patch("titan_cli.external_cli.adapters.codex.run_process")
     def test_execute_ignores_effort(self, mock_run):
         mock_run.return_value = MagicMock(stdout="", stderr="", returncode=0)
         self.adapter.execute("prompt", effort="medium")
@@ -288,7 +288,7 @@ class TestGeminiHeadlessAdapter(unittest.TestCase):
     def test_supports_structured_output_is_false(self):
         self.assertFalse(self.adapter.supports_structured_output)
 
-    @patch("subprocess.run")
+    @patch("titan_cli.external_cli.adapters.gemini.run_process")
     def test_execute_passes_prompt_with_flag(self, mock_run):
         mock_run.return_value = MagicMock(stdout="response\n", stderr="", returncode=0)
         self.adapter.execute("my prompt", cwd="/repo", timeout=45)
@@ -301,7 +301,7 @@ class TestGeminiHeadlessAdapter(unittest.TestCase):
             timeout=45,
         )
 
-    @patch("subprocess.run")
+    @patch("titan_cli.external_cli.adapters.gemini.run_process")
     def test_execute_ignores_json_schema(self, mock_run):
         mock_run.return_value = MagicMock(stdout="response\n", stderr="", returncode=0)
         self.adapter.execute("my prompt", json_schema={"type": "object"})
@@ -314,12 +314,12 @@ class TestGeminiHeadlessAdapter(unittest.TestCase):
             timeout=60,
         )
 
-    @patch("subprocess.run", side_effect=subprocess.TimeoutExpired(cmd="gemini", timeout=60))
+    @patch("titan_cli.external_cli.adapters.gemini.run_process", side_effect=subprocess.TimeoutExpired(cmd="gemini", timeout=60))
     def test_execute_timeout(self, _):
         response = self.adapter.execute("prompt", timeout=60)
         self.assertEqual(response.exit_code, 124)
 
-    @patch("subprocess.run", side_effect=FileNotFoundError)
+    @patch("titan_cli.external_cli.adapters.gemini.run_process", side_effect=FileNotFoundError)
     def test_execute_cli_not_found(self, _):
         response = self.adapter.execute("prompt")
         self.assertEqual(response.exit_code, 127)
@@ -327,7 +327,7 @@ class TestGeminiHeadlessAdapter(unittest.TestCase):
     def test_supports_tool_restriction_is_false(self):
         self.assertFalse(self.adapter.supports_tool_restriction)
 
-    @patch("subprocess.run")
+    @patch("titan_cli.external_cli.adapters.gemini.run_process")
     def test_execute_ignores_disallowed_tools(self, mock_run):
         mock_run.return_value = MagicMock(stdout="response\n", stderr="", returncode=0)
         self.adapter.execute("my prompt", disallowed_tools=["Bash", "Agent"])
@@ -343,7 +343,7 @@ class TestGeminiHeadlessAdapter(unittest.TestCase):
     def test_supports_effort_control_is_false(self):
         self.assertFalse(self.adapter.supports_effort_control)
 
-    @patch("subprocess.run")
+    @patch("titan_cli.external_cli.adapters.gemini.run_process")
     def test_execute_ignores_effort(self, mock_run):
         mock_run.return_value = MagicMock(stdout="response\n", stderr="", returncode=0)
         self.adapter.execute("my prompt", effort="medium")
@@ -14,12 +14,23 @@ only ever delivered to the main thread, never to the worker.
 These tests run each prompt on a plain thread against an app that reports
 `is_running = False`. A regression hangs that thread, which the join timeout
 converts into a failure instead of a stuck test run.
+
+With a cancellation token registered (as the workflow screen does), a prompt
+must wake as soon as the token is cancelled rather than on its next app check.
 """
 
+import contextvars
 import threading
+import time
 
 import pytest
 
+from titan_cli.core.interrupt import (
+    CancellationToken,
+    WorkflowAborted,
+    clear_cancellation_token,
+    set_cancellation_token,
+)
 from titan_cli.engine.option_item import OptionItem
 from titan_cli.ui.tui.textual_components import TextualComponents
 from titan_cli.ui.tui.widgets import ChoiceOption, SelectionOption
@@ -87,3 +98,41 @@ def test_ask_choice_returns_none_when_app_stops(components):
         lambda: components.ask_choice("pick", [ChoiceOption(value="y", label="Yes")])
     )
     assert result is None
+
+
+class _RunningApp:
+    """An app still running whose widgets never answer."""
+
+    is_running = True
+
+    def call_from_thread(self, fn, *args, **kwargs):
+        return None
+
+
+def test_prompt_wakes_immediately_when_workflow_is_cancelled():
+    components = TextualComponents(app=_RunningApp(), output_widget=None)
+    token = CancellationToken()
+    set_cancellation_token(token)
+    box = {}
+
+    def target():
+        try:
+            components.ask_text("name?")
+        except WorkflowAborted as e:
+            box["aborted"] = e
+
+    try:
+        # The workflow thread inherits the token, as a worker started from it would
+        thread = threading.Thread(target=contextvars.copy_context().run, args=(target,), daemon=True)
+        thread.start()
+        time.sleep(0.1)
+        started = time.monotonic()
+        token.cancel()
+        thread.join(timeout=5.0)
+    finally:
+        clear_cancellation_token()
+
+    assert not thread.is_alive()
+    assert "aborted" in box
+    # Woken by the token, not by the periodic app check
+    assert time.monotonic() - started < 1.0
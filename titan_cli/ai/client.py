@@ -11,6 +11,7 @@ from titan_cli.core.models import (
     AIGatewayBackend,
 )
 from titan_cli.core.interrupt import run_interruptible
+from titan_cli.core.tracing import span
 from .exceptions import AIConfigurationError
 from .models import AIMessage, AIRequest, AIResponse
 from .providers import (
@@ -165,7 +166,8 @@ class AIClient:
         # The SDK's HTTP request blocks with no way to poll for app exit, so it
         # runs interruptibly: if the TUI closes mid-request, the workflow thread
         # aborts instead of hanging interpreter shutdown until the response lands.
-        return run_interruptible(lambda: self.provider.generate(request))
+        with span(f"ai generate ({self.connection_id})", "ai"):
+            return run_interruptible(lambda: self.provider.generate(request))
 
     def chat(
         self,
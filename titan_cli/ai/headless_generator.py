@@ -18,6 +18,7 @@ from titan_cli.ai.exceptions import AIProviderError
 from titan_cli.ai.models import AIMessage, AIResponse
 from titan_cli.core.interrupt import run_interruptible
 from titan_cli.core.logging.config import get_logger
+from titan_cli.core.tracing import span
 from titan_cli.external_cli.adapters.base import HeadlessCliAdapter
 
 logger = get_logger(__name__)
@@ -77,6 +78,11 @@ class HeadlessGenerator:
         self.model = model
         self.disallowed_tools = list(disallowed_tools)
 
+    @property
+    def supports_structured_output(self) -> bool:
+        """Whether the CLI enforces a JSON schema on its answer."""
+        return self.adapter.supports_structured_output
+
     def generate(
         self,
         messages: List[AIMessage],
@@ -105,18 +111,19 @@ class HeadlessGenerator:
         # The subprocess blocks for up to `self.timeout` seconds with no way to poll
         # for app exit; run it interruptibly so quitting the TUI mid-call aborts the
         # workflow thread instead of hanging interpreter shutdown.
-        response = run_interruptible(
-            lambda: self.adapter.execute(
-                prompt,
-                cwd=self.cwd,
-                timeout=self.timeout,
-                json_schema=json_schema if self.adapter.supports_structured_output else None,
-                disallowed_tools=(
-                    self.disallowed_tools if self.adapter.supports_tool_restriction else None
-                ),
-                model=self.model,
+        with span(f"ai generate ({cli})", "ai"):
+            response = run_interruptible(
+                lambda: self.adapter.execute(
+                    prompt,
+                    cwd=self.cwd,
+                    timeout=self.timeout,
+                    json_schema=json_schema if self.adapter.supports_structured_output else None,
+                    disallowed_tools=(
+                        self.disallowed_tools if self.adapter.supports_tool_restriction else None
+                    ),
+                    model=self.model,
+                )
             )
-        )
         duration = round(time.monotonic() - started, 3)
 
         if not response.succeeded:
@@ -5,6 +5,9 @@ Combines all tool commands into a single CLI interface.
 """
 import os
 import sys
+from pathlib import Path
+from typing import Optional
+
 import typer
 
 from titan_cli import __version__
@@ -18,6 +21,7 @@ from titan_cli.utils.autoupdate import (
     update_plugins,
 )
 from titan_cli.core.logging import setup_logging, get_logger
+from titan_cli.core.tracing import TRACE_ENV_VAR, enable_tracing, format_report, latest_trace_file, load_trace
 
 
 # Main Typer Application
@@ -29,6 +33,10 @@ app = typer.Typer(
 )
 
 
+trace_app = typer.Typer(help="Inspect workflow timing traces.")
+app.add_typer(trace_app, name="trace")
+
+
 # --- Helper function for version retrieval ---
 def get_version() -> str:
     """Retrieves the package version."""
@@ -55,6 +63,11 @@ def main(
         "--devtools",
         help="Enable Textual devtools (visual debugging for TUI, requires 'textual console' in another terminal)",
     ),
+    trace: bool = typer.Option(
+        False,
+        "--trace",
+        help=f"Record a timing trace of each workflow run (same as {TRACE_ENV_VAR}=1); inspect with 'titan trace show'",
+    ),
 ):
     """Titan CLI - Main entry point"""
     # Auto-enable debug if running as titan-dev (detected via TITAN_ENV set by the script)
@@ -65,6 +78,9 @@ def main(
     setup_logging(verbose=verbose, debug=debug)
     logger = get_logger("titan.cli")
 
+    if trace:
+        enable_tracing()
+
     # Store devtools flag in context for other commands
     ctx.ensure_object(dict)
     ctx.obj["devtools"] = devtools
@@ -180,3 +196,26 @@ def tui(
     debug = ctx.parent.params.get("debug", False) if ctx.parent else False
     devtools = ctx.parent.obj.get("devtools", False) if ctx.parent and ctx.parent.obj else False
     launch_tui(debug=debug, devtools=devtools)
+
+
+@trace_app.command("show")
+def trace_show(
+    trace_file: Optional[Path] = typer.Argument(
+        None,
+        help="Trace file to show (default: the most recent trace)",
+    ),
+    top: int = typer.Option(15, "--top", "-n", min=1, help="Number of spans to list by self time"),
+):
+    """Print the critical path and the spans with the most self time of a workflow trace."""
+    path = trace_file or latest_trace_file()
+    if path is None:
+        typer.echo(f"No traces recorded yet. Run a workflow with 'titan --trace' or {TRACE_ENV_VAR}=1.")
+        raise typer.Exit(1)
+
+    try:
+        loaded = load_trace(path)
+    except (OSError, ValueError) as e:
+        typer.echo(f"❌ Could not read trace: {e}")
+        raise typer.Exit(1)
+
+    typer.echo(format_report(loaded, top=top))
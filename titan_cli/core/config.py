@@ -41,7 +41,7 @@ class TitanConfig:
         self._workflow_registry = None  # Set by load()
         self._plugin_warnings = []
         self._plugin_sync_events = []
-        self._plugin_fingerprint = None  # Set by load(); see _compute_plugin_fingerprint
+        self._plugin_fingerprints = None  # Set by load(); see _compute_plugin_fingerprints
 
         # Use custom global config path if provided (for testing), otherwise use default
         self._global_config_path = global_config_path or self.GLOBAL_CONFIG
@@ -98,6 +98,9 @@ class TitanConfig:
 
         # Reset and re-initialize plugins (unless skipped during setup)
         if not skip_plugin_init:
+            # Keyring reads start now, in the background, and overlap with
+            # plugin discovery and init instead of running one by one inside it
+            self.broker_factory.warm_up(self._declared_secrets())
             self._refresh_plugins(merged, force=force_plugin_init)
 
         # Re-initialize WorkflowRegistry using project root
@@ -114,37 +117,77 @@ class TitanConfig:
 
     def _refresh_plugins(self, merged: dict, force: bool = False) -> None:
         """
-        Rebuild the plugin registry, but only when it would come out different.
+        Rebuild the plugin registry, but only the parts that would come out different.
 
         Every screen reloads config on resume, and rebuilding means importing and
         initializing every installed plugin - about a second, against ten
         milliseconds for rereading the files. Skipping the rebuild when nothing
         plugin-related changed is what keeps that from being paid on every
-        screen transition.
+        screen transition; when one plugin's settings change, only that plugin
+        and the plugins depending on it are re-initialized.
         """
-        fingerprint = self._compute_plugin_fingerprint(merged)
+        fingerprints = self._compute_plugin_fingerprints(merged)
+        previous = self._plugin_fingerprints
+
+        if (
+            force
+            or previous is None
+            or previous.get(self._INSTALLED_FINGERPRINT) != fingerprints[self._INSTALLED_FINGERPRINT]
+        ):
+            self.registry.reset()
+            self.registry.initialize_plugins(config=self, broker_factory=self.broker_factory)
+            self._plugin_warnings = self.registry.list_failed()
+            self._plugin_sync_events = self.registry.list_sync_events()
+            self._plugin_fingerprints = fingerprints
+            logger.debug("plugin_registry_rebuilt", forced=force)
+            return
 
-        if not force and fingerprint == self._plugin_fingerprint:
+        changed = {
+            name for name in previous.keys() | fingerprints.keys()
+            if previous.get(name) != fingerprints.get(name)
+        }
+        if not changed:
             logger.debug("plugin_registry_reused")
             return
 
-        self.registry.reset()
-        self.registry.initialize_plugins(config=self, broker_factory=self.broker_factory)
+        reloaded = self.registry.reload_plugins(
+            changed, config=self, broker_factory=self.broker_factory
+        )
         self._plugin_warnings = self.registry.list_failed()
         self._plugin_sync_events = self.registry.list_sync_events()
-        self._plugin_fingerprint = fingerprint
-        logger.debug("plugin_registry_rebuilt", forced=force)
+        self._plugin_fingerprints = fingerprints
+        logger.debug("plugin_registry_partially_rebuilt", plugins=sorted(reloaded or changed))
+
+    def _declared_secrets(self) -> dict[str, list[str]]:
+        """Secret keys to warm up: AI connection keys and each enabled plugin's declared keys."""
+        connections = self.config.ai.connections if self.config.ai else {}
+        declared = {"core": [f"{connection_id}_api_key" for connection_id in connections]}
+        for name in self.registry.list_installed():
+            plugin = self.registry.get_plugin(name)
+            if plugin is None or not self.is_plugin_enabled(name):
+                continue
+            try:
+                declared[name] = list(plugin.secret_keys(self))
+            except Exception:
+                # A declaration is only a hint; init reports real config errors
+                logger.debug("plugin_secret_keys_failed", name=name, exc_info=True)
+        return declared
 
-    @staticmethod
-    def _compute_plugin_fingerprint(merged: dict) -> str:
+    _INSTALLED_FINGERPRINT = "*installed*"
+    """Key holding the fingerprint of the installed plugin set as a whole."""
+
+    @classmethod
+    def _compute_plugin_fingerprints(cls, merged: dict) -> dict[str, str]:
         """
-        Everything the built registry depends on, as one comparable value.
+        Everything the built registry depends on, as one comparable value per plugin.
 
         Two inputs: the `[plugins.*]` configuration (which plugins are enabled
-        and how each is configured) and the set of installed entry points (so a
-        plugin installed or removed mid-session is noticed). Enumerating entry
+        and how each is configured) and the installed entry points (so a plugin
+        installed, removed or upgraded mid-session is noticed). Enumerating entry
         points costs a few milliseconds against the second a rebuild costs, which
-        is what makes checking cheaper than assuming.
+        is what makes checking cheaper than assuming. The installed set as a
+        whole gets its own key: a plugin appearing or disappearing changes
+        discovery itself, which only a full rebuild redoes.
 
         A credential a plugin reads while initializing is deliberately NOT here -
         secrets live outside the config files and hashing them to compare would
@@ -154,14 +197,27 @@ class TitanConfig:
         from importlib.metadata import entry_points
 
         plugins_config = merged.get("plugins", {})
-        installed = sorted(ep.name for ep in entry_points(group="titan.plugins"))
+        installed = {}
+        for ep in entry_points(group="titan.plugins"):
+            dist = getattr(ep, "dist", None)
+            installed[ep.name] = {
+                "value": getattr(ep, "value", None),
+                "version": getattr(dist, "version", None) if dist else None,
+            }
 
-        payload = json.dumps(
-            {"plugins": plugins_config, "installed": installed},
-            sort_keys=True,
-            default=str,
-        )
-        return hashlib.sha256(payload.encode()).hexdigest()
+        def digest(payload) -> str:
+            encoded = json.dumps(payload, sort_keys=True, default=str)
+            return hashlib.sha256(encoded.encode()).hexdigest()
+
+        fingerprints = {
+            name: digest({
+                "config": plugins_config.get(name),
+                "installed": installed.get(name),
+            })
+            for name in set(plugins_config) | set(installed)
+        }
+        fingerprints[cls._INSTALLED_FINGERPRINT] = digest(sorted(installed))
+        return fingerprints
 
     def _find_project_config(self, start_path: Optional[Path] = None) -> Optional[Path]:
         """Search for .titan/config.toml up the directory tree"""
@@ -1,40 +1,75 @@
 """
-Cooperative interruption for blocking calls made from workflow threads.
+Cooperative cancellation for workflow threads.
 
 A workflow runs on a non-daemon executor thread that the interpreter joins at
-exit. The ask_* prompts already poll `app.is_running` so they unblock when the
-user quits mid-prompt, but a call that blocks inside foreign code - an AI SDK's
-HTTP request, a headless CLI subprocess - has no loop to poll from. Quitting
-the TUI while one is in flight used to hang the console until the call
-finished, needing a second Ctrl+C to kill the join.
-
-`run_interruptible` closes that gap: it moves the blocking call onto a daemon
-thread (which the interpreter never joins) and polls an abort check from the
-workflow thread. When the TUI closes, the workflow thread raises
-`WorkflowAborted` and dies cleanly; the abandoned call finishes alone on the
-daemon thread and its result is discarded.
-
-The abort check is process-global rather than threaded through every layer
-because only one workflow runs at a time and the transports that need it
-(AIClient, headless adapters) sit four layers below the screen that knows
-whether the app is alive. When no check is registered - unit tests, headless
-usage outside the TUI - `run_interruptible` calls the function inline and
-behaves exactly like not being there.
+exit. Whatever that thread blocks on - a prompt, an AI SDK's HTTP request, a
+headless CLI subprocess, a Jira call - has to be released when the user
+cancels the workflow or quits the TUI, or the console hangs until the call
+finishes on its own.
+
+The screen running a workflow registers a `CancellationToken` and cancels it
+when the workflow is cancelled or the screen goes away (which includes app
+exit). Cancelling wakes every waiter at once - nothing polls - and runs the
+cleanup registered by the work in flight:
+
+- `run_process` and `communicate` start children in their own process group
+  and terminate the whole group, so no grandchild outlives the workflow.
+  `watch_process` does the same for a child whose output is read by hand.
+- `interruptible_io` shuts down the sockets connected inside it, which aborts
+  in-flight HTTP requests whatever the client library (requests, httpx, the
+  AI SDKs), and refuses new connections once cancelled.
+- `run_interruptible` runs a foreign blocking call on a daemon thread inside
+  `interruptible_io` and returns to the caller as soon as the token fires.
+
+The token lives in a context variable rather than being threaded through
+every layer, because the transports that need it (AIClient, headless
+adapters, plugin clients) sit four layers below the screen that owns it. It
+is bound to the workflow thread: code running elsewhere - including a
+cancelled workflow still unwinding while the next one starts - never sees
+another run's token. Threads a workflow starts must run in a copy of its
+context (`contextvars.copy_context().run`) to inherit it, as the parallel
+executor and `run_interruptible` do. With no token bound - unit tests,
+headless usage outside the TUI - every helper here behaves exactly like the
+plain call.
+
+`cancellation_scope` gives one piece of work its own token, cancelled along
+with the workflow's, so a caller can stop that work alone (a timed-out call)
+without cancelling the run.
+
+`live_processes` and `live_interruptible_calls` expose what is still running,
+so tests can check that a cancelled workflow leaves nothing behind.
 """
 
+import contextvars
+import os
+import signal
+import socket
+import subprocess
+import sys
 import threading
-from typing import Callable, Optional, TypeVar
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, TypeVar
+
+from titan_cli.core.logging import get_logger
+
+logger = get_logger(__name__)
 
 T = TypeVar("T")
 
-_POLL_INTERVAL_SECONDS = 0.5
+# Time a cancelled process group gets to exit after SIGTERM before SIGKILL
+_TERMINATE_GRACE_SECONDS = 2.0
 
-_abort_check: Optional[Callable[[], bool]] = None
+# Time an aborted call gets to unwind before run_interruptible abandons it
+_ABANDON_GRACE_SECONDS = 2.0
+
+_INTERRUPTIBLE_THREAD_NAME = "titan-interruptible-call"
+
+_DEFAULT_REASON = "Workflow cancelled"
 
 
 class WorkflowAborted(BaseException):
     """
-    The TUI closed while a workflow call was in flight.
+    The workflow was cancelled, or the TUI closed, while a call was in flight.
 
     Inherits `BaseException` deliberately: transports and the step loop catch
     `Exception` broadly to convert failures into step errors, and an abort must
@@ -43,63 +78,472 @@ class WorkflowAborted(BaseException):
     """
 
 
-def set_abort_check(check: Callable[[], bool]) -> None:
-    """Register the check consulted by `run_interruptible` (True = abort)."""
-    global _abort_check
-    _abort_check = check
+class CancellationToken:
+    """
+    One-shot cancellation signal shared by everything a workflow run starts.
+
+    `cancel()` is idempotent and may be called from any thread. It runs the
+    registered callbacks right away on the cancelling thread, so callbacks
+    must be quick and must not block: send a signal, shut down a socket, set
+    an event.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: Dict[int, Callable[[], None]] = {}
+        self._next_id = 0
+        self.reason: Optional[str] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = _DEFAULT_REASON) -> None:
+        """Cancel the token and run its callbacks (once; later calls do nothing)."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks = list(self._callbacks.values())
+            self._callbacks.clear()
+
+        logger.debug("cancellation_requested", reason=reason, callbacks=len(callbacks))
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.debug("cancellation_callback_failed", error=str(e))
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the token is cancelled or the timeout expires; True if cancelled."""
+        return self._event.wait(timeout)
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        Run `callback` when the token is cancelled, or right away if it already is.
+
+        Returns:
+            A function that unregisters the callback
+        """
+        with self._lock:
+            if not self._event.is_set():
+                key = self._next_id
+                self._next_id += 1
+                self._callbacks[key] = callback
+
+                def _unregister() -> None:
+                    with self._lock:
+                        self._callbacks.pop(key, None)
+
+                return _unregister
+
+        callback()
+        return lambda: None
+
+    def raise_if_cancelled(self) -> None:
+        """Raise `WorkflowAborted` if the token has been cancelled."""
+        if self.cancelled:
+            raise WorkflowAborted(self.reason or _DEFAULT_REASON)
+
+
+_current_token: contextvars.ContextVar[Optional[CancellationToken]] = contextvars.ContextVar(
+    "titan_cancellation_token", default=None
+)
+
+
+def set_cancellation_token(token: CancellationToken) -> None:
+    """Bind the token of the workflow about to run to the current thread's context."""
+    _current_token.set(token)
+
 
+def clear_cancellation_token() -> None:
+    """Unbind the current context's token."""
+    _current_token.set(None)
 
-def clear_abort_check() -> None:
-    """Remove the registered abort check."""
-    global _abort_check
-    _abort_check = None
+
+def current_token() -> Optional[CancellationToken]:
+    """The token bound to the current context, or None outside a cancellable workflow run."""
+    return _current_token.get()
 
 
 def abort_requested() -> bool:
-    """Whether the registered check currently asks to abort."""
-    check = _abort_check
-    if check is None:
-        return False
+    """Whether the current context's token has been cancelled."""
+    token = _current_token.get()
+    return token is not None and token.cancelled
+
+
+def raise_if_aborted() -> None:
+    """Raise `WorkflowAborted` if the current context's token has been cancelled."""
+    token = _current_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
+@contextmanager
+def cancellation_scope(token: Optional[CancellationToken] = None) -> Iterator[CancellationToken]:
+    """
+    Run the block under its own token, cancelled along with the enclosing one.
+
+    Cancelling the scope's token stops only the work inside the block (its
+    processes, sockets and interruptible calls); cancelling the enclosing
+    token still stops everything.
+
+    Args:
+        token: Token for the block (default: a new one)
+    """
+    parent = _current_token.get()
+    token = token or CancellationToken()
+    unlink = (
+        parent.on_cancel(lambda: token.cancel(parent.reason or _DEFAULT_REASON))
+        if parent is not None
+        else (lambda: None)
+    )
+    reset = _current_token.set(token)
     try:
-        return bool(check())
+        yield token
+    finally:
+        _current_token.reset(reset)
+        unlink()
+
+
+# --- Sockets ---------------------------------------------------------------
+
+
+class _SocketScope:
+    """Sockets connected inside one `interruptible_io` block."""
+
+    def __init__(self, token: CancellationToken) -> None:
+        self.token = token
+        self._lock = threading.Lock()
+        self._sockets: List[Tuple[int, Any]] = []
+
+    def track(self, fd: int, address: Any) -> None:
+        with self._lock:
+            self._sockets.append((fd, address))
+
+    def abort(self) -> None:
+        with self._lock:
+            sockets = list(self._sockets)
+        for fd, address in sockets:
+            _shutdown_socket(fd, address)
+
+
+_socket_scope: contextvars.ContextVar[Optional[_SocketScope]] = contextvars.ContextVar(
+    "titan_socket_scope", default=None
+)
+
+_audit_hook_lock = threading.Lock()
+_audit_hook_installed = False
+
+
+def _audit_socket_connect(event: str, args: Tuple[Any, ...]) -> None:
+    if event != "socket.connect":
+        return
+    scope = _socket_scope.get()
+    if scope is None:
+        return
+    # Refusing the connection also stops SDK retry loops after an abort
+    scope.token.raise_if_cancelled()
+    try:
+        fd = args[0].fileno()
     except Exception:
-        # A check that can no longer answer (app torn down mid-call) means the
-        # app is gone, which is exactly the abort condition.
-        return True
+        return
+    scope.track(fd, args[1])
+
+
+def _install_audit_hook() -> None:
+    # Audit hooks cannot be removed, so there is one for the whole process and
+    # it returns immediately outside interruptible_io blocks.
+    global _audit_hook_installed
+    with _audit_hook_lock:
+        if not _audit_hook_installed:
+            sys.addaudithook(_audit_socket_connect)
+            _audit_hook_installed = True
+
+
+def _shutdown_socket(fd: int, address: Any) -> None:
+    # The socket object seen at connect time may since have been wrapped for
+    # TLS (which detaches it) or closed, so work on a duplicate of its file
+    # descriptor - and only while it is still connected to the same peer, as a
+    # closed descriptor number can be reused by an unrelated socket.
+    if not isinstance(address, tuple):
+        return
+    try:
+        dup = os.dup(fd)
+    except OSError:
+        return
+    try:
+        sock = socket.socket(fileno=dup)
+    except OSError:
+        os.close(dup)
+        return
+    try:
+        if sock.getpeername()[:2] == address[:2]:
+            sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    finally:
+        sock.close()
+
+
+@contextmanager
+def interruptible_io(token: Optional[CancellationToken] = None) -> Iterator[None]:
+    """
+    Abort the network calls made inside the block when the workflow is cancelled.
+
+    Sockets connected inside the block - on this thread or in contexts copied
+    from it - are shut down as soon as the token is cancelled, so a blocked
+    request fails at once instead of running into its timeout, and new
+    connections fail with `WorkflowAborted`. Whatever exception the aborted
+    call raises is replaced by `WorkflowAborted`.
+
+    Args:
+        token: Token to honour (default: the registered one); with none,
+            the block runs unchanged
+    """
+    token = token or _current_token.get()
+    if token is None:
+        yield
+        return
+
+    _install_audit_hook()
+    token.raise_if_cancelled()
+    scope = _SocketScope(token)
+    unregister = token.on_cancel(scope.abort)
+    reset = _socket_scope.set(scope)
+    try:
+        yield
+    except Exception as e:
+        if token.cancelled:
+            raise WorkflowAborted(token.reason or _DEFAULT_REASON) from e
+        raise
+    finally:
+        _socket_scope.reset(reset)
+        unregister()
 
 
 def run_interruptible(fn: Callable[[], T]) -> T:
     """
-    Run a blocking call so the calling thread can abandon it on app exit.
+    Run a blocking call so the calling thread is released as soon as the workflow is cancelled.
 
-    Runs `fn` on a daemon thread and polls the abort check every half second.
-    Returns `fn`'s result or re-raises its exception. Raises `WorkflowAborted`
-    if the check fires first; `fn` keeps running on the daemon thread but its
-    outcome is discarded and the thread cannot block interpreter shutdown.
+    Runs `fn` on a daemon thread inside `interruptible_io` and waits for
+    whichever comes first, its outcome or the token - there is no polling.
+    Returns `fn`'s result or re-raises its exception. On cancellation the
+    call's sockets are shut down and its processes terminated, so it normally
+    unwinds at once; it gets a short grace period to do so before
+    `WorkflowAborted` is raised. A call that still has not finished is
+    abandoned on its daemon thread, which cannot block interpreter shutdown.
 
-    With no abort check registered, calls `fn` inline.
+    With no token registered, calls `fn` inline.
     """
-    if _abort_check is None:
+    token = _current_token.get()
+    if token is None:
         return fn()
+    token.raise_if_cancelled()
 
     outcome: dict = {}
     done = threading.Event()
 
     def _target() -> None:
         try:
-            outcome["result"] = fn()
+            with interruptible_io(token):
+                outcome["result"] = fn()
         except BaseException as e:
             outcome["error"] = e
         finally:
             done.set()
 
-    thread = threading.Thread(target=_target, name="titan-interruptible-call", daemon=True)
-    thread.start()
+    # The call runs in a copy of the caller's context, so its trace spans
+    # nest under the caller's.
+    context = contextvars.copy_context()
+    thread = threading.Thread(
+        target=context.run, args=(_target,), name=_INTERRUPTIBLE_THREAD_NAME, daemon=True
+    )
+    unregister = token.on_cancel(done.set)
+    try:
+        thread.start()
+        done.wait()
+    finally:
+        unregister()
 
-    while not done.wait(timeout=_POLL_INTERVAL_SECONDS):
-        if abort_requested():
-            raise WorkflowAborted("Application closed while a blocking call was in flight")
+    if token.cancelled:
+        thread.join(_ABANDON_GRACE_SECONDS)
+        if thread.is_alive():
+            logger.warning("interruptible_call_abandoned", reason=token.reason)
+        raise WorkflowAborted(token.reason or _DEFAULT_REASON)
 
     if "error" in outcome:
         raise outcome["error"]
     return outcome["result"]
+
+
+def live_interruptible_calls() -> List[threading.Thread]:
+    """Threads of `run_interruptible` calls that are still running (test hook)."""
+    return [
+        thread for thread in threading.enumerate()
+        if thread.name == _INTERRUPTIBLE_THREAD_NAME and thread.is_alive()
+    ]
+
+
+# --- Processes -------------------------------------------------------------
+
+
+_live_processes_lock = threading.Lock()
+_live_processes: Set[subprocess.Popen] = set()
+
+
+def process_group_kwargs() -> Dict[str, Any]:
+    """Popen arguments that start the child in its own process group."""
+    if os.name == "nt":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def _signal_group(pid: int, sig: int) -> bool:
+    try:
+        os.killpg(pid, sig)
+    except (ProcessLookupError, PermissionError):
+        return False
+    return True
+
+
+class _ProcessGuard:
+    """Terminates a child's process group on cancellation or timeout."""
+
+    def __init__(self, process: subprocess.Popen) -> None:
+        self.process = process
+        self._escalation: Optional[threading.Timer] = None
+
+    def terminate(self) -> None:
+        """SIGTERM the group now and SIGKILL whatever is left after a grace period."""
+        if os.name == "nt":
+            self.kill()
+            return
+        if not _signal_group(self.process.pid, signal.SIGTERM):
+            return
+        self._escalation = threading.Timer(
+            _TERMINATE_GRACE_SECONDS, _signal_group, args=(self.process.pid, signal.SIGKILL)
+        )
+        self._escalation.name = f"titan-terminate-{self.process.pid}"
+        self._escalation.daemon = True
+        self._escalation.start()
+
+    def kill(self) -> None:
+        """SIGKILL the group (only the child itself on Windows)."""
+        if os.name == "nt":
+            try:
+                self.process.kill()
+            except OSError:
+                pass
+            return
+        _signal_group(self.process.pid, signal.SIGKILL)
+
+    def release(self) -> None:
+        # Pipes close once every process holding them has exited; cancel the
+        # pending SIGKILL when nothing of the group is left.
+        if self._escalation is not None and not _signal_group(self.process.pid, 0):
+            self._escalation.cancel()
+
+
+@contextmanager
+def watch_process(process: subprocess.Popen) -> Iterator[_ProcessGuard]:
+    """
+    Terminate the child's process group if the workflow is cancelled while the block runs.
+
+    For callers that consume a child's output themselves (e.g. line by line)
+    instead of through `communicate`. The process must have been started with
+    `process_group_kwargs()`, or only the child itself is signalled. Killing the
+    group closes its pipes, so a reader blocked on them returns. If the block
+    raises, the group is killed and reaped before the exception propagates.
+
+    Raises:
+        WorkflowAborted: On leaving the block, if the token was cancelled
+    """
+    token = _current_token.get()
+    guard = _ProcessGuard(process)
+    unregister = token.on_cancel(guard.terminate) if token is not None else (lambda: None)
+    with _live_processes_lock:
+        _live_processes.add(process)
+    try:
+        try:
+            yield guard
+        except BaseException:
+            guard.kill()
+            process.wait()
+            raise
+    finally:
+        unregister()
+        guard.release()
+        with _live_processes_lock:
+            _live_processes.discard(process)
+
+    if token is not None and token.cancelled:
+        raise WorkflowAborted(token.reason or _DEFAULT_REASON)
+
+
+def communicate(
+    process: subprocess.Popen,
+    input: Any = None,
+    timeout: Optional[float] = None,
+) -> Tuple[Any, Any]:
+    """
+    `process.communicate()` that terminates the child's process group when the workflow is cancelled.
+
+    The process must have been started with `process_group_kwargs()`, or only
+    the child itself is signalled.
+
+    Raises:
+        WorkflowAborted: The token was cancelled while waiting
+        subprocess.TimeoutExpired: The timeout expired; the whole group has
+            been killed and its output is attached
+    """
+    with watch_process(process) as guard:
+        try:
+            output = process.communicate(input, timeout=timeout)
+        except subprocess.TimeoutExpired as e:
+            guard.kill()
+            e.stdout, e.stderr = process.communicate()
+            raise
+    return output
+
+
+def run_process(
+    args: Any,
+    *,
+    input: Any = None,
+    capture_output: bool = False,
+    timeout: Optional[float] = None,
+    check: bool = False,
+    **kwargs: Any,
+) -> subprocess.CompletedProcess:
+    """
+    `subprocess.run` for workflow code.
+
+    Takes the same arguments and returns the same result, but the child runs
+    in its own process group, which is terminated when the workflow is
+    cancelled (raising `WorkflowAborted`) or the timeout expires. Unless
+    `input` or `stdin` is given, stdin is /dev/null: a workflow child must
+    never read from the TUI's terminal.
+    """
+    if capture_output:
+        kwargs["stdout"] = subprocess.PIPE
+        kwargs["stderr"] = subprocess.PIPE
+    if input is not None:
+        kwargs["stdin"] = subprocess.PIPE
+    kwargs.setdefault("stdin", subprocess.DEVNULL)
+
+    with subprocess.Popen(args, **{**process_group_kwargs(), **kwargs}) as process:
+        stdout, stderr = communicate(process, input, timeout)
+        returncode = process.poll()
+
+    if check and returncode:
+        raise subprocess.CalledProcessError(returncode, process.args, output=stdout, stderr=stderr)
+    return subprocess.CompletedProcess(process.args, returncode, stdout, stderr)
+
+
+def live_processes() -> List[subprocess.Popen]:
+    """Processes waited on by `communicate`/`run_process` that have not exited yet (test hook)."""
+    with _live_processes_lock:
+        return list(_live_processes)
@@ -53,6 +53,7 @@ def log_client_operation(operation_name: str = None):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             # Lazy import to avoid circular dependency
+            from titan_cli.core.tracing import span
 
             logger = get_logger(func.__module__)
             op_name = operation_name or func.__name__
@@ -66,7 +67,8 @@ def log_client_operation(operation_name: str = None):
             start_time = time.time()
 
             try:
-                result = func(*args, **kwargs)
+                with span(op_name, "client"):
+                    result = func(*args, **kwargs)
                 duration = time.time() - start_time
 
                 # Log based on ClientResult type
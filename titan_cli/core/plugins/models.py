@@ -41,6 +41,14 @@ class GitPluginConfig(BaseModel):
     """Configuration for Git plugin."""
     main_branch: str = Field("main", description="Main/default branch name")
     default_remote: str = Field("origin", description="Default remote name")
+    status_untracked_cache: bool = Field(
+        False,
+        description="Use git's untracked cache when reading status (speeds up large worktrees).",
+    )
+    status_fsmonitor: bool = Field(
+        False,
+        description="Use git's builtin fsmonitor daemon when reading status (macOS/Windows).",
+    )
 
 class GitHubPluginConfig(BaseModel):
     """Configuration for GitHub plugin."""
@@ -95,6 +103,11 @@ class JiraPluginConfig(BaseModel):
         description="Cache time-to-live in seconds",
         json_schema_extra={"config_scope": "global"}
     )
+    persist_cache: bool = Field(
+        False,
+        description="Keep cached API responses on disk between sessions",
+        json_schema_extra={"config_scope": "global"}
+    )
 
     @field_validator('base_url')
     @classmethod
@@ -220,3 +233,31 @@ class DockerPluginConfig(BaseModel):
         default_factory=list,
         description="Docker images this project knows how to build/push.",
     )
+    build_concurrency: int = Field(
+        1,
+        ge=1,
+        description=(
+            "Maximum number of build targets built at the same time. BuildKit runs "
+            "concurrent builds in parallel and shares their cache; 1 builds one "
+            "target after another."
+        ),
+    )
+    build_fail_fast: bool = Field(
+        True,
+        description=(
+            "Stop starting new builds after the first failed one. When false, every "
+            "target is built and failures are reported together at the end."
+        ),
+    )
+    engine_api: bool = Field(
+        False,
+        description=(
+            "Read container/compose status and disk usage, and prune, through the Docker "
+            "Engine API over its unix socket instead of starting a docker CLI process per "
+            "call. Falls back to the CLI when the socket cannot be reached."
+        ),
+    )
+    engine_socket: Optional[str] = Field(
+        None,
+        description="Engine API unix socket path. Defaults to the unix:// path in DOCKER_HOST, else /var/run/docker.sock.",
+    )
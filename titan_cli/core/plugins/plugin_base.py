@@ -70,6 +70,23 @@ class TitanPlugin(ABC):
         """
         pass
 
+    def secret_keys(self, config: Any) -> list[str]:
+        """
+        Keys this plugin reads through its broker while initializing.
+
+        Titan resolves them ahead of `initialize()` on a background thread,
+        so slow keyring lookups overlap with the rest of startup. Only the
+        key names are declared; a wrong or missing entry costs a lookup,
+        never correctness.
+
+        Args:
+            config: TitanConfig instance
+
+        Returns:
+            Key names in this plugin's namespace (default: none)
+        """
+        return []
+
     def get_client(self) -> Optional[Any]:
         """
         Get the main client instance for this plugin.
@@ -3,12 +3,13 @@ import importlib
 import sys
 from importlib.metadata import entry_points
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
 from ..errors import PluginLoadError, PluginInitializationError
 from .plugin_base import TitanPlugin
 from .community_sources import PluginChannel, get_github_token, parse_plugin_metadata
 from .trust import PluginTrust, TrustFinding, classify_plugin, scan_plugin_source
-from .runtime import PluginRuntimeManager
+from .trust_cache import TrustScanCache
+from .runtime import PluginRuntimeManager, PluginRuntimeRequest
 from titan_cli.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -87,7 +88,11 @@ def _reject_reserved_plugin_name(plugin_name: str) -> None:
 class PluginRegistry:
     """Discovers and manages installed plugins."""
 
-    def __init__(self, discover_on_init: bool = True):
+    def __init__(
+        self,
+        discover_on_init: bool = True,
+        trust_scan_cache: Optional[TrustScanCache] = None,
+    ):
         self._plugins: Dict[str, TitanPlugin] = {}
         self._failed_plugins: Dict[str, Exception] = {}
         self._discovered_plugin_names: List[str] = []
@@ -95,9 +100,16 @@ class PluginRegistry:
         self._plugin_trust: Dict[str, PluginTrust] = {}
         self._security_findings: Dict[str, list[TrustFinding]] = {}
         self._plugin_sync_events: list[str] = []
-        self._dev_local_sys_paths: set[str] = set()
-        self._dev_local_package_roots: set[str] = set()
+        self._entry_points: Dict[str, Any] = {}
+        self._initialized_plugins: set[str] = set()
+        # sys.path entries and package roots each source-overridden plugin
+        # brought in, so one plugin can be torn down without touching others
+        self._plugin_sys_paths: Dict[str, set[str]] = {}
+        self._plugin_package_roots: Dict[str, str] = {}
         self._runtime_manager = PluginRuntimeManager()
+        # Persistent scan cache, supplied by the CLI entry point; without one
+        # every trust scan parses the plugin sources afresh
+        self._trust_scan_cache = trust_scan_cache
         if discover_on_init:
             self.discover()
 
@@ -117,28 +129,38 @@ class PluginRegistry:
         logger.info("plugins_discovered", count=len(self._discovered_plugin_names), plugins=self._discovered_plugin_names)
 
         for ep in unique_eps:
-            try:
-                logger.debug("plugin_loading", name=ep.name)
-                _reject_reserved_plugin_name(ep.name)
-                plugin_class = ep.load()
-                if not issubclass(plugin_class, TitanPlugin):
-                    raise TypeError("Plugin class must inherit from TitanPlugin")
-                self._plugins[ep.name] = plugin_class()
-                self._plugin_versions[ep.name] = ep.dist.version if ep.dist else "unknown"
-                self._plugin_trust[ep.name] = classify_plugin(
-                    ep.name,
-                    channel=None,
-                    dist_name=ep.dist.name if ep.dist else None,
-                )
-                logger.debug("plugin_loaded", name=ep.name)
-            except Exception as e:
-                logger.exception("plugin_load_failed", name=ep.name)
-                error = PluginLoadError(plugin_name=ep.name, original_exception=e)
-                self._failed_plugins[ep.name] = error
+            self._entry_points[ep.name] = ep
+            self._load_entry_point(ep)
 
         logger.info("plugin_discovery_completed", loaded=len(self._plugins), failed=len(self._failed_plugins), failed_plugins=list(self._failed_plugins.keys()))
 
-    def initialize_plugins(self, config: Any, broker_factory: Any) -> None:
+    def _load_entry_point(self, ep: Any) -> None:
+        """Instantiate the plugin behind an installed entry point."""
+        try:
+            logger.debug("plugin_loading", name=ep.name)
+            _reject_reserved_plugin_name(ep.name)
+            plugin_class = ep.load()
+            if not issubclass(plugin_class, TitanPlugin):
+                raise TypeError("Plugin class must inherit from TitanPlugin")
+            self._plugins[ep.name] = plugin_class()
+            self._plugin_versions[ep.name] = ep.dist.version if ep.dist else "unknown"
+            self._plugin_trust[ep.name] = classify_plugin(
+                ep.name,
+                channel=None,
+                dist_name=ep.dist.name if ep.dist else None,
+            )
+            logger.debug("plugin_loaded", name=ep.name)
+        except Exception as e:
+            logger.exception("plugin_load_failed", name=ep.name)
+            error = PluginLoadError(plugin_name=ep.name, original_exception=e)
+            self._failed_plugins[ep.name] = error
+
+    def initialize_plugins(
+        self,
+        config: Any,
+        broker_factory: Any,
+        only: Optional[Iterable[str]] = None,
+    ) -> None:
         """
         Initializes all discovered plugins in dependency order.
 
@@ -146,12 +168,20 @@ class PluginRegistry:
             config: TitanConfig instance
             broker_factory: SecretBrokerFactory; each plugin receives a broker
                 already scoped to its own namespace, never the factory itself.
+            only: Restrict initialization to these plugins. Every other plugin
+                keeps its current instance and counts as already initialized.
         """
-        self._apply_source_overrides(config)
+        selected = set(only) if only is not None else None
+        self._apply_source_overrides(config, only=selected)
 
         # Create a copy of plugin names to iterate over, as _plugins might change
-        plugins_to_initialize = list(self._plugins.keys())
-        initialized = set()
+        plugins_to_initialize = [
+            name for name in self._plugins
+            if selected is None or name in selected
+        ]
+        if selected is None:
+            self._initialized_plugins.clear()
+        initialized = self._initialized_plugins
 
         # Simple dependency resolution loop
         while plugins_to_initialize:
@@ -222,14 +252,100 @@ class PluginRegistry:
                             del self._plugins[name]
                 break # Exit the loop if no progress is made
 
-    def _apply_source_overrides(self, config: Any) -> None:
+    def reload_plugins(
+        self,
+        names: Iterable[str],
+        config: Any,
+        broker_factory: Any,
+    ) -> set[str]:
+        """
+        Tear down and re-initialize only the given plugins and their dependents.
+
+        A plugin that depends on a reloaded one (github on git) holds on to the
+        old instance's client, so dependents are invalidated transitively.
+        Everything else keeps its initialized instance.
+
+        Args:
+            names: Plugins whose configuration or source changed
+            config: TitanConfig instance
+            broker_factory: SecretBrokerFactory for the re-initialized plugins
+
+        Returns:
+            The full set of plugins that were reloaded
+        """
+        affected = self.dependents_closure(names)
+        self._plugin_sync_events.clear()
+
+        for name in affected:
+            self._teardown_plugin(name)
+        if any(self._plugin_package_roots.get(name) for name in affected):
+            importlib.invalidate_caches()
+
+        for name in affected:
+            ep = self._entry_points.get(name)
+            if ep is not None:
+                self._load_entry_point(ep)
+
+        self.initialize_plugins(config, broker_factory, only=affected)
+        logger.info("plugins_reloaded", plugins=sorted(affected))
+        return affected
+
+    def dependents_closure(self, names: Iterable[str]) -> set[str]:
+        """Return names plus every plugin that depends on them, transitively."""
+        affected = set(names)
+        pending = list(affected)
+        while pending:
+            changed = pending.pop()
+            for name, plugin in self._plugins.items():
+                if name in affected:
+                    continue
+                try:
+                    dependencies = plugin.dependencies
+                except Exception:
+                    continue
+                if changed in dependencies:
+                    affected.add(name)
+                    pending.append(name)
+        return affected
+
+    def _teardown_plugin(self, name: str) -> None:
+        """Forget one plugin, including any sys.path/module state its source override added."""
+        for path_entry in self._plugin_sys_paths.pop(name, set()):
+            still_used = any(path_entry in paths for paths in self._plugin_sys_paths.values())
+            while not still_used and path_entry in sys.path:
+                sys.path.remove(path_entry)
+
+        package_root = self._plugin_package_roots.pop(name, None)
+        if package_root:
+            stale_modules = [
+                module for module in list(sys.modules)
+                if module == package_root or module.startswith(f"{package_root}.")
+            ]
+            for module in stale_modules:
+                sys.modules.pop(module, None)
+
+        self._plugins.pop(name, None)
+        self._failed_plugins.pop(name, None)
+        self._plugin_versions.pop(name, None)
+        self._plugin_trust.pop(name, None)
+        self._security_findings.pop(name, None)
+        self._initialized_plugins.discard(name)
+
+    def _apply_source_overrides(
+        self,
+        config: Any,
+        only: Optional[set[str]] = None,
+    ) -> None:
         """Apply effective per-project plugin sources before initialization."""
         config_model = getattr(config, "config", None)
         plugins = getattr(config_model, "plugins", None)
         if not config or not plugins:
             return
 
+        stable_requests: list[PluginRuntimeRequest] = []
         for plugin_name in config.get_enabled_plugins():
+            if only is not None and plugin_name not in only:
+                continue
             channel = config.get_plugin_source_channel(plugin_name)
 
             if channel == PluginChannel.DEV_LOCAL:
@@ -246,10 +362,10 @@ class PluginRegistry:
                 try:
                     plugin = _load_dev_local_plugin(repo_path, plugin_name)
                     self._plugins[plugin_name] = plugin
-                    self._dev_local_sys_paths.add(str(repo_path))
+                    self._plugin_sys_paths[plugin_name] = {str(repo_path)}
                     package_root = getattr(plugin, "_dev_local_package_root", None)
                     if package_root:
-                        self._dev_local_package_roots.add(package_root)
+                        self._plugin_package_roots[plugin_name] = package_root
                     self._plugin_versions[plugin_name] = PluginChannel.DEV_LOCAL
                     self._record_trust_scan(plugin_name, PluginChannel.DEV_LOCAL, Path(repo_path))
                     if plugin_name not in self._discovered_plugin_names:
@@ -274,25 +390,37 @@ class PluginRegistry:
             resolved_commit = config.get_project_plugin_resolved_commit(plugin_name)
             if not repo_url or not resolved_commit:
                 continue
+            stable_requests.append(PluginRuntimeRequest(plugin_name, repo_url, resolved_commit))
+
+        if not stable_requests:
+            return
 
+        # Runtimes prepare concurrently; loading stays sequential because it
+        # rewrites sys.path and sys.modules.
+        runtimes = self._runtime_manager.ensure_stable_runtimes(
+            stable_requests, token=get_github_token()
+        )
+        for request in stable_requests:
+            plugin_name = request.plugin_name
+            repo_url = request.repo_url
+            resolved_commit = request.resolved_commit
             try:
-                runtime = self._runtime_manager.ensure_stable_runtime(
-                    plugin_name=plugin_name,
-                    repo_url=repo_url,
-                    resolved_commit=resolved_commit,
-                    token=get_github_token(),
-                )
+                runtime = runtimes[plugin_name]
+                if isinstance(runtime, Exception):
+                    raise runtime
                 plugin = _load_local_plugin(
                     runtime.paths.source_dir,
                     plugin_name,
                     extra_sys_paths=[runtime.paths.site_packages],
                 )
                 self._plugins[plugin_name] = plugin
-                self._dev_local_sys_paths.add(str(runtime.paths.site_packages))
-                self._dev_local_sys_paths.add(str(runtime.paths.source_dir))
+                self._plugin_sys_paths[plugin_name] = {
+                    str(runtime.paths.site_packages),
+                    str(runtime.paths.source_dir),
+                }
                 package_root = getattr(plugin, "_dev_local_package_root", None)
                 if package_root:
-                    self._dev_local_package_roots.add(package_root)
+                    self._plugin_package_roots[plugin_name] = package_root
                 self._plugin_versions[plugin_name] = f"stable@{resolved_commit[:12]}"
                 self._record_trust_scan(
                     plugin_name, PluginChannel.STABLE, Path(runtime.paths.source_dir)
@@ -387,7 +515,7 @@ class PluginRegistry:
         """
         self._plugin_trust[plugin_name] = classify_plugin(plugin_name, channel)
         try:
-            findings = scan_plugin_source(source_dir)
+            findings = scan_plugin_source(source_dir, cache=self._trust_scan_cache)
         except OSError as e:
             logger.warning(
                 "plugin_security_scan_failed", name=plugin_name, error=str(e)
@@ -405,19 +533,8 @@ class PluginRegistry:
 
     def reset(self):
         """Resets the registry, clearing all loaded plugins and re-discovering."""
-        for repo_path in list(self._dev_local_sys_paths):
-            while repo_path in sys.path:
-                sys.path.remove(repo_path)
-        self._dev_local_sys_paths.clear()
-
-        for package_root in list(self._dev_local_package_roots):
-            stale_modules = [
-                name for name in list(sys.modules)
-                if name == package_root or name.startswith(f"{package_root}.")
-            ]
-            for name in stale_modules:
-                sys.modules.pop(name, None)
-        self._dev_local_package_roots.clear()
+        for name in list(self._plugin_sys_paths) + list(self._plugin_package_roots):
+            self._teardown_plugin(name)
 
         importlib.invalidate_caches()
 
@@ -427,4 +544,6 @@ class PluginRegistry:
         self._plugin_trust.clear()
         self._security_findings.clear()
         self._plugin_sync_events.clear()
+        self._entry_points.clear()
+        self._initialized_plugins.clear()
         self.discover()
@@ -1,19 +1,76 @@
-"""Runtime management for project-pinned community plugins."""
+"""
+Runtime management for project-pinned community plugins.
+
+Cache layout under `CACHE_ROOT`:
+
+    <plugin>/repo.git            bare mirror of every commit fetched for the plugin
+    <plugin>/<commit>/src        checkout the plugin is imported from
+    <plugin>/<commit>/venv       link to (or copy of) the shared environment below
+    _envs/<dependency key>/      virtualenv holding the plugin's dependencies only
+    _wheels/                     every wheel ever built or downloaded for a runtime
+    _locks/                      lock files guarding environments, mirrors and pruning
+
+A runtime only gets a new environment when its dependency declaration
+changes: a new commit of a plugin with the same dependencies, or two plugins
+with identical ones, share a single environment. Environments are installed
+from the wheelhouse, so a dependency is downloaded and built once per machine,
+and offline mode installs from it without touching the network.
+
+The cache is shared by every titan process on the machine, so environment
+builds, mirror fetches and pruning are serialized with file locks rather
+than in-process locks: a process starting while another is installing an
+environment waits for it instead of taking the half-built directory for the
+leftovers of a crash.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import re
 import shutil
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from tempfile import mkdtemp
+from typing import BinaryIO, Iterator
 from urllib.parse import urlsplit, urlunsplit
 
+import tomli
+
 from titan_cli.core.logging import get_logger
 
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
 logger = get_logger(__name__)
 
+# Files whose content defines which dependencies a plugin installs.
+# pyproject.toml is handled apart: only its dependency tables count, so a
+# version bump does not invalidate the environment.
+_DEPENDENCY_FILES = ("poetry.lock", "uv.lock", "pdm.lock", "requirements.txt", "setup.py", "setup.cfg")
+
+_ENV_READY_MARKER = ".titan-env-ready"
+_LAST_USED_MARKER = ".last-used"
+_ENV_KEY_FILE = ".env-key"
+_LOCKS_DIR = "_locks"
+_PRUNE_LOCK = "prune.lock"
+
+# PEP 517's default when a project has no [build-system] table
+_DEFAULT_BUILD_REQUIRES = ["setuptools>=40.8.0", "wheel"]
+
+# Runtime directories are named after the commit; anything else under a
+# plugin's directory (its mirror, runtimes still being prepared) is not
+# subject to pruning.
+_COMMIT_DIR = re.compile(r"^[0-9a-f]{7,64}$")
+
 
 @dataclass(frozen=True)
 class PluginRuntimePaths:
@@ -33,22 +90,113 @@ class PluginRuntimeResult:
     created: bool
 
 
+@dataclass(frozen=True)
+class PluginRuntimeRequest:
+    """A plugin runtime to prepare: which plugin, from where, at which commit."""
+
+    plugin_name: str
+    repo_url: str
+    resolved_commit: str
+
+
 class PluginRuntimeError(RuntimeError):
     """Raised when a plugin runtime cannot be prepared."""
 
 
+def _lock_handle(handle: BinaryIO, blocking: bool) -> None:
+    if os.name != "nt":
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return
+    handle.seek(0)
+    while True:
+        try:
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            return
+        except OSError:
+            if not blocking:
+                raise
+            time.sleep(0.1)
+
+
+def _unlock_handle(handle: BinaryIO) -> None:
+    if os.name != "nt":
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        return
+    handle.seek(0)
+    msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def _file_lock(path: Path, blocking: bool = True) -> Iterator[bool]:
+    """
+    Hold an exclusive lock on `path`, shared with every process (and every thread).
+
+    Yields:
+        True once the lock is held; False if `blocking` is off and another
+        holder has it, in which case the block runs without the lock
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as handle:
+        try:
+            _lock_handle(handle, blocking)
+        except OSError:
+            if blocking:
+                raise
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            _unlock_handle(handle)
+
+
+def _offline_from_env() -> bool:
+    return os.environ.get("TITAN_PLUGIN_OFFLINE", "").strip().lower() in ("1", "true", "yes")
+
+
 class PluginRuntimeManager:
     """Prepare and reuse isolated runtimes for community plugins."""
 
     CACHE_ROOT = Path.home() / ".titan" / "plugin-cache"
 
+    MAX_RUNTIMES_PER_PLUGIN = 3
+    """Runtimes kept per plugin; the least recently used ones beyond this are pruned."""
+
+    MAX_PARALLEL_PREPARES = 4
+
     def __init__(
         self,
         cache_root: Path | None = None,
         python_executable: str | None = None,
+        offline: bool | None = None,
+        max_runtimes_per_plugin: int | None = None,
     ) -> None:
+        """
+        Args:
+            cache_root: Where runtimes, environments and wheels are kept.
+            python_executable: Interpreter the runtime virtualenvs are created from.
+            offline: Never touch the network: sources come from the plugin's
+                mirror and dependencies from the wheelhouse. Defaults to the
+                TITAN_PLUGIN_OFFLINE environment variable.
+            max_runtimes_per_plugin: LRU budget per plugin (default:
+                MAX_RUNTIMES_PER_PLUGIN).
+        """
         self.cache_root = (cache_root or self.CACHE_ROOT).expanduser().resolve()
         self.python_executable = python_executable or sys.executable
+        self.offline = _offline_from_env() if offline is None else offline
+        self.max_runtimes_per_plugin = max_runtimes_per_plugin or self.MAX_RUNTIMES_PER_PLUGIN
+
+    @property
+    def envs_dir(self) -> Path:
+        return self.cache_root / "_envs"
+
+    @property
+    def wheelhouse(self) -> Path:
+        return self.cache_root / "_wheels"
+
+    @property
+    def locks_dir(self) -> Path:
+        return self.cache_root / _LOCKS_DIR
 
     def get_runtime_paths(self, plugin_name: str, resolved_commit: str) -> PluginRuntimePaths:
         """Return the cache layout for a plugin runtime."""
@@ -72,6 +220,7 @@ class PluginRuntimeManager:
         """Ensure a stable plugin runtime exists and return its paths."""
         paths = self.get_runtime_paths(plugin_name, resolved_commit)
         if self._is_runtime_ready(paths):
+            self._touch(paths.cache_dir)
             return PluginRuntimeResult(paths=paths, created=False)
 
         paths.cache_dir.parent.mkdir(parents=True, exist_ok=True)
@@ -84,54 +233,344 @@ class PluginRuntimeManager:
         )
 
         try:
-            self._prepare_runtime(temp_paths, repo_url, resolved_commit, token)
+            self._prepare_runtime(plugin_name, temp_paths, repo_url, resolved_commit, token)
             if paths.cache_dir.exists():
                 shutil.rmtree(paths.cache_dir)
             temp_dir.replace(paths.cache_dir)
-            return PluginRuntimeResult(
-                paths=self.get_runtime_paths(plugin_name, resolved_commit),
-                created=True,
-            )
         except Exception as e:
             shutil.rmtree(temp_dir, ignore_errors=True)
             raise PluginRuntimeError(str(e)) from e
 
+        self._touch(paths.cache_dir)
+        try:
+            self.prune(keep={paths.cache_dir})
+        except OSError:
+            # Housekeeping only: the runtime itself is ready
+            logger.warning("plugin_runtime_prune_failed", exc_info=True)
+        return PluginRuntimeResult(
+            paths=self.get_runtime_paths(plugin_name, resolved_commit),
+            created=True,
+        )
+
+    def ensure_stable_runtimes(
+        self,
+        requests: list[PluginRuntimeRequest],
+        token: str | None = None,
+    ) -> dict[str, PluginRuntimeResult | PluginRuntimeError]:
+        """
+        Prepare several plugin runtimes concurrently.
+
+        Checkouts, virtualenvs and installs are subprocess-bound, so different
+        plugins prepare side by side; plugins sharing a dependency set wait
+        for one another on that environment only.
+
+        Returns:
+            Result or error per plugin name, in request order
+        """
+        if not requests:
+            return {}
+
+        def prepare(request: PluginRuntimeRequest) -> PluginRuntimeResult | PluginRuntimeError:
+            try:
+                return self.ensure_stable_runtime(
+                    plugin_name=request.plugin_name,
+                    repo_url=request.repo_url,
+                    resolved_commit=request.resolved_commit,
+                    token=token,
+                )
+            except PluginRuntimeError as e:
+                return e
+            except Exception as e:
+                error = PluginRuntimeError(str(e))
+                error.__cause__ = e
+                return error
+
+        workers = min(self.MAX_PARALLEL_PREPARES, len(requests))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="titan-plugin-runtime") as pool:
+            outcomes = list(pool.map(prepare, requests))
+        return {request.plugin_name: outcome for request, outcome in zip(requests, outcomes)}
+
+    def prune(self, keep: set[Path] | None = None) -> None:
+        """
+        Remove least recently used runtimes beyond the per-plugin budget, then
+        environments no remaining runtime uses.
+
+        Mirrors and the wheelhouse are kept: they are what makes a pruned
+        runtime cheap to recreate, online or not. An environment is only
+        removed under its lock, after checking again that nothing references
+        it, so one being built or just linked by another process survives. A
+        sweep already running in another process makes this one a no-op.
+        """
+        keep = keep or set()
+        if not self.cache_root.is_dir():
+            return
+
+        with _file_lock(self.locks_dir / _PRUNE_LOCK, blocking=False) as acquired:
+            if not acquired:
+                return
+            self._prune_runtimes(keep)
+            if not self.envs_dir.is_dir():
+                return
+            referenced_envs = self._referenced_envs()
+            for env_dir in self.envs_dir.iterdir():
+                if env_dir.name in referenced_envs:
+                    continue
+                with self._env_lock(env_dir.name, blocking=False) as unused:
+                    # Runtimes record their key before taking the lock
+                    if not unused or env_dir.name in self._referenced_envs():
+                        continue
+                    logger.info("plugin_environment_pruned", env=env_dir.name)
+                    shutil.rmtree(env_dir, ignore_errors=True)
+
+    def _prune_runtimes(self, keep: set[Path]) -> None:
+        for plugin_dir in self._plugin_dirs():
+            runtimes = [entry for entry in plugin_dir.iterdir() if entry.is_dir() and _COMMIT_DIR.match(entry.name)]
+            runtimes.sort(key=self._last_used, reverse=True)
+            for index, runtime in enumerate(runtimes):
+                if index < self.max_runtimes_per_plugin or runtime in keep:
+                    continue
+                logger.info("plugin_runtime_pruned", plugin=plugin_dir.name, runtime=runtime.name)
+                shutil.rmtree(runtime, ignore_errors=True)
+
+    def _referenced_envs(self) -> set[str]:
+        """Environments used by a runtime, including runtimes still being prepared."""
+        referenced: set[str] = set()
+        for plugin_dir in self._plugin_dirs():
+            for entry in plugin_dir.iterdir():
+                env_key = self._read_env_key(entry) if entry.is_dir() else None
+                if env_key:
+                    referenced.add(env_key)
+        return referenced
+
+    def _plugin_dirs(self) -> list[Path]:
+        return [path for path in self.cache_root.iterdir() if not path.name.startswith("_") and path.is_dir()]
+
     def _prepare_runtime(
         self,
+        plugin_name: str,
         paths: PluginRuntimePaths,
         repo_url: str,
         resolved_commit: str,
         token: str | None,
     ) -> None:
         paths.cache_dir.mkdir(parents=True, exist_ok=True)
-        self._checkout_source(repo_url, resolved_commit, paths.source_dir, token)
-        self._create_virtualenv(paths.venv_dir)
-        self._install_plugin(paths.venv_dir, paths.source_dir)
+        self._checkout_source(plugin_name, repo_url, resolved_commit, paths.source_dir, token)
+        env_key = self._dependency_key(paths.source_dir, resolved_commit)
+        # Recorded before the environment lock is taken, so a prune running
+        # meanwhile sees it as in use
+        (paths.cache_dir / _ENV_KEY_FILE).write_text(env_key, encoding="utf-8")
+        with self._env_lock(env_key):
+            env_dir = self._ensure_environment(env_key, paths.source_dir)
+            self._link_environment(env_dir, paths.venv_dir)
+
+    # ------------------------------------------------------------------
+    # Sources
+    # ------------------------------------------------------------------
 
     def _checkout_source(
         self,
+        plugin_name: str,
         repo_url: str,
         resolved_commit: str,
         source_dir: Path,
         token: str | None,
     ) -> None:
-        auth_url = self._build_authenticated_repo_url(repo_url, token)
+        mirror = self.cache_root / plugin_name / "repo.git"
+        ref = f"refs/titan/{resolved_commit}"
+        with self._mirror_lock(plugin_name):
+            if not self._git_succeeds(["-C", str(mirror), "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"]):
+                if self.offline:
+                    raise PluginRuntimeError(
+                        f"Offline mode: commit {resolved_commit[:12]} of plugin '{plugin_name}' "
+                        "has never been fetched on this machine."
+                    )
+                if not mirror.is_dir():
+                    self._run_git(["init", "--bare", str(mirror)])
+                # The authenticated URL is only passed to this fetch: it is never
+                # stored as a remote, in the mirror or in the checkout.
+                auth_url = self._build_authenticated_repo_url(repo_url, token)
+                self._run_git(["-C", str(mirror), "fetch", "--depth", "1", auth_url, resolved_commit])
+                self._run_git(["-C", str(mirror), "update-ref", ref, resolved_commit])
+
         self._run_git(["init", str(source_dir)])
-        self._run_git(["-C", str(source_dir), "remote", "add", "origin", auth_url])
-        self._run_git(["-C", str(source_dir), "fetch", "--depth", "1", "origin", resolved_commit])
+        self._run_git(["-C", str(source_dir), "fetch", "--depth", "1", mirror.as_uri(), ref])
         self._run_git(["-C", str(source_dir), "checkout", "--detach", "FETCH_HEAD"])
 
+    # ------------------------------------------------------------------
+    # Shared environments
+    # ------------------------------------------------------------------
+
+    def _dependency_key(self, source_dir: Path, resolved_commit: str) -> str:
+        """
+        Hash of everything that decides what gets installed for `source_dir`.
+
+        Covers the interpreter, pyproject's dependency and build tables (not
+        its version or metadata), and any lock or requirements file. Without a
+        distribution name the plugin cannot be removed from a shared
+        environment, so the key falls back to one environment per commit.
+        """
+        digest = hashlib.sha256()
+        digest.update(os.path.realpath(self.python_executable).encode())
+        pyproject = self._read_pyproject(source_dir)
+        if pyproject is None:
+            digest.update(f"commit:{resolved_commit}".encode())
+        else:
+            project = pyproject.get("project", {})
+            poetry = pyproject.get("tool", {}).get("poetry", {})
+            declaration = {
+                "build-system": pyproject.get("build-system", {}),
+                "dependencies": project.get("dependencies", []),
+                "optional-dependencies": project.get("optional-dependencies", {}),
+                "poetry-dependencies": poetry.get("dependencies", {}),
+            }
+            if not self._distribution_name(pyproject):
+                declaration["commit"] = resolved_commit
+            digest.update(json.dumps(declaration, sort_keys=True, default=str).encode())
+        for name in _DEPENDENCY_FILES:
+            path = source_dir / name
+            if path.is_file():
+                digest.update(name.encode())
+                digest.update(hashlib.sha256(path.read_bytes()).digest())
+        return digest.hexdigest()[:32]
+
+    def _ensure_environment(self, env_key: str, source_dir: Path) -> Path:
+        """
+        Return the environment for `env_key`, installing it on first use.
+
+        The caller holds the environment's lock, so no other process is
+        building it: a directory without the ready marker is what an
+        interrupted install left behind.
+        """
+        env_dir = self.envs_dir / env_key
+        if (env_dir / _ENV_READY_MARKER).exists():
+            logger.info("plugin_environment_reused", env=env_key)
+            return env_dir
+        shutil.rmtree(env_dir, ignore_errors=True)
+        env_dir.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self._create_virtualenv(env_dir)
+            self._install_dependencies(env_dir, source_dir)
+        except Exception:
+            shutil.rmtree(env_dir, ignore_errors=True)
+            raise
+        (env_dir / _ENV_READY_MARKER).write_text(str(time.time()), encoding="utf-8")
+        logger.info("plugin_environment_created", env=env_key)
+        return env_dir
+
     def _create_virtualenv(self, venv_dir: Path) -> None:
         self._run_checked([self.python_executable, "-m", "venv", str(venv_dir)], "create plugin virtualenv")
 
-    def _install_plugin(self, venv_dir: Path, source_dir: Path) -> None:
-        pip_executable = self._get_venv_executable(venv_dir, "pip")
-        self._run_checked([str(pip_executable), "install", str(source_dir)], "install plugin runtime")
+    def _install_dependencies(self, venv_dir: Path, source_dir: Path) -> None:
+        """
+        Install the plugin and its dependencies from the wheelhouse, then
+        remove the plugin itself: it is imported from its checkout, and a
+        copy in a shared environment would shadow other commits' sources.
+
+        pip gives the isolated build environment the same index options, so
+        the build backend comes from the wheelhouse as well.
+        """
+        python = str(self._get_venv_executable(venv_dir, "python"))
+        pyproject = self._read_pyproject(source_dir) or {}
+
+        if not self.offline:
+            build_requires = list(pyproject.get("build-system", {}).get("requires", _DEFAULT_BUILD_REQUIRES))
+            self._fill_wheelhouse(python, build_requires, source_dir)
+
+        self._run_checked(
+            [python, "-m", "pip", "install", "--no-index", "--find-links", str(self.wheelhouse), str(source_dir)],
+            "install plugin runtime",
+        )
+        distribution = self._distribution_name(pyproject)
+        if distribution:
+            self._run_checked(
+                [python, "-m", "pip", "uninstall", "--yes", distribution],
+                "separate plugin from its environment",
+            )
+
+    def _fill_wheelhouse(self, python: str, build_requires: list[str], source_dir: Path) -> None:
+        """
+        Download or build wheels for everything the plugin needs.
+
+        Wheels already in the wheelhouse are found through --find-links and
+        not fetched again. Each call builds into its own directory and moves
+        the results in, so concurrent installs never write the same file.
+        The plugin's own wheel is dropped: it is specific to one commit.
+        """
+        self.wheelhouse.mkdir(parents=True, exist_ok=True)
+        staging = Path(mkdtemp(prefix="wheels-", dir=str(self.cache_root)))
+        try:
+            pip_wheel = [python, "-m", "pip", "wheel", "--wheel-dir", str(staging),
+                         "--find-links", str(self.wheelhouse)]
+            if build_requires:
+                self._run_checked([*pip_wheel, *build_requires], "download plugin build requirements")
+            self._run_checked([*pip_wheel, str(source_dir)], "download plugin dependencies")
+
+            distribution = self._distribution_name(self._read_pyproject(source_dir) or {})
+            own_prefix = f"{_normalize_wheel_name(distribution)}-" if distribution else None
+            for wheel in staging.glob("*.whl"):
+                if own_prefix and wheel.name.lower().startswith(own_prefix):
+                    continue
+                target = self.wheelhouse / wheel.name
+                if not target.exists():
+                    os.replace(wheel, target)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def _link_environment(self, env_dir: Path, venv_dir: Path) -> None:
+        """Point the runtime's venv at the shared environment, copying where links are unavailable."""
+        try:
+            venv_dir.symlink_to(env_dir, target_is_directory=True)
+        except OSError:
+            shutil.copytree(env_dir, venv_dir, symlinks=True)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
 
     def _is_runtime_ready(self, paths: PluginRuntimePaths) -> bool:
         pip_executable = self._get_venv_executable(paths.venv_dir, "pip")
         return paths.source_dir.is_dir() and paths.site_packages.is_dir() and pip_executable.exists()
 
+    def _read_pyproject(self, source_dir: Path) -> dict | None:
+        path = source_dir / "pyproject.toml"
+        if not path.is_file():
+            return None
+        try:
+            return tomli.loads(path.read_text(encoding="utf-8"))
+        except (OSError, tomli.TOMLDecodeError):
+            return None
+
+    @staticmethod
+    def _distribution_name(pyproject: dict) -> str | None:
+        return pyproject.get("project", {}).get("name") or pyproject.get("tool", {}).get("poetry", {}).get("name")
+
+    def _touch(self, cache_dir: Path) -> None:
+        try:
+            (cache_dir / _LAST_USED_MARKER).write_text(str(time.time()), encoding="utf-8")
+        except OSError:
+            pass
+
+    @staticmethod
+    def _last_used(runtime_dir: Path) -> float:
+        marker = runtime_dir / _LAST_USED_MARKER
+        try:
+            return marker.stat().st_mtime if marker.exists() else runtime_dir.stat().st_mtime
+        except OSError:
+            return 0.0
+
+    @staticmethod
+    def _read_env_key(runtime_dir: Path) -> str | None:
+        try:
+            return (runtime_dir / _ENV_KEY_FILE).read_text(encoding="utf-8").strip() or None
+        except OSError:
+            return None
+
+    def _env_lock(self, env_key: str, blocking: bool = True):
+        return _file_lock(self.locks_dir / f"env-{env_key}.lock", blocking)
+
+    def _mirror_lock(self, plugin_name: str):
+        return _file_lock(self.locks_dir / f"mirror-{plugin_name}.lock")
+
     def _get_site_packages_path(self, venv_dir: Path) -> Path:
         if sys.platform == "win32":
             return venv_dir / "Lib" / "site-packages"
@@ -160,6 +599,9 @@ class PluginRuntimeManager:
     def _run_git(self, command: list[str]) -> None:
         self._run_checked(["git", *command], "prepare plugin source")
 
+    def _git_succeeds(self, command: list[str]) -> bool:
+        return subprocess.run(["git", *command], capture_output=True, text=True).returncode == 0
+
     def _run_checked(self, command: list[str], description: str) -> None:
         result = subprocess.run(command, capture_output=True, text=True)
         if result.returncode != 0:
@@ -172,3 +614,8 @@ class PluginRuntimeManager:
             )
             output = result.stderr or result.stdout or "Unknown error"
             raise PluginRuntimeError(f"Failed to {description}: {output.strip()}")
+
+
+def _normalize_wheel_name(name: str) -> str:
+    """Distribution name as it appears in wheel filenames (PEP 427)."""
+    return "_".join(part for part in name.lower().replace("-", "_").replace(".", "_").split("_") if part)
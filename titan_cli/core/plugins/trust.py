@@ -13,13 +13,23 @@ scanned source is immutable until the user explicitly updates it.
 """
 
 import ast
+import hashlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from enum import StrEnum
 from pathlib import Path
 from typing import Optional
 
+from titan_cli.core.logging import get_logger
+
 from .available import KNOWN_PLUGINS
 from .community_sources import PluginChannel
+from .trust_cache import RawFinding, TrustScanCache
+
+logger = get_logger(__name__)
 
 
 class PluginTrust(StrEnum):
@@ -92,19 +102,102 @@ _SKIPPED_DIRS = {".git", "__pycache__", ".venv", "venv"}
 _VAULT_MODULE = "titan_cli.core.security._vault"
 
 
-def _findings_for_module(module: Optional[str], node: ast.AST, rel: str) -> list[TrustFinding]:
+SCAN_RULES_VERSION = 1
+"""Bump whenever the scan rules change, so cached results from older rules are ignored."""
+
+PARALLEL_SCAN_MIN_FILES = 32
+"""Below this many uncached files, process start-up costs more than it saves."""
+
+
+def _findings_for_module(module: Optional[str], node: ast.AST) -> list[RawFinding]:
     if not module:
         return []
     if module == "keyring" or module.startswith("keyring."):
-        return [TrustFinding(rel, node.lineno, "keyring-import",
-                             f"imports '{module}' (direct OS keyring access)")]
+        return [(node.lineno, "keyring-import",
+                 f"imports '{module}' (direct OS keyring access)")]
     if module == _VAULT_MODULE or module.startswith(f"{_VAULT_MODULE}."):
-        return [TrustFinding(rel, node.lineno, "vault-import",
-                             f"imports '{module}' (Titan's private vault)")]
+        return [(node.lineno, "vault-import",
+                 f"imports '{module}' (Titan's private vault)")]
     return []
 
 
-def scan_plugin_source(source_dir: Path) -> list[TrustFinding]:
+def _scan_source(source: str) -> list[RawFinding]:
+    """
+    Scan one file's source. Pure and picklable, so cold scans can run in a
+    process pool; the file path is attached by the caller.
+    """
+    # SyntaxError covers null bytes on Python >= 3.12; ValueError covers
+    # older versions.
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError, RecursionError, MemoryError) as e:
+        # RecursionError/MemoryError included on purpose: the tree is
+        # untrusted plugin source, and one crafted file must degrade to
+        # a finding, not abort the scan for the whole plugin.
+        lineno = getattr(e, "lineno", 0) or 0
+        msg = getattr(e, "msg", None) or str(e)
+        return [(lineno, "unparseable", f"could not parse file: {msg}")]
+
+    findings: list[RawFinding] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                findings.extend(_findings_for_module(alias.name, node))
+        elif isinstance(node, ast.ImportFrom):
+            # Relative imports (level > 0) resolve inside the plugin's own
+            # package — `from .keyring import X` is the plugin's module,
+            # not the OS keyring — so absolute-name matching only applies
+            # to level-0 imports.
+            if node.level != 0:
+                continue
+            findings.extend(_findings_for_module(node.module, node))
+            if node.module and node.module.startswith("titan_cli"):
+                for alias in node.names:
+                    if alias.name == "SecretManager":
+                        findings.append((
+                            node.lineno, "secret-manager",
+                            f"imports SecretManager from '{node.module}'"))
+                    # `from titan_cli.core.security import _vault` carries
+                    # the vault module in `names`, not in `module`.
+                    elif alias.name == "_vault":
+                        findings.append((
+                            node.lineno, "vault-import",
+                            f"imports '_vault' from '{node.module}' (Titan's private vault)"))
+        elif isinstance(node, ast.Name) and node.id == "SecretManager":
+            findings.append((node.lineno, "secret-manager", "references SecretManager"))
+        elif isinstance(node, ast.Attribute) and node.attr == "SecretManager":
+            findings.append((node.lineno, "secret-manager", "references SecretManager"))
+    return findings
+
+
+def _scan_sources(sources: list[str], max_workers: Optional[int]) -> list[list[RawFinding]]:
+    """
+    Scan uncached sources, across a process pool when there are enough of them.
+
+    AST parsing is CPU-bound and holds the GIL, so threads would not help.
+    The pool uses the spawn start method because the registry can be rebuilt
+    from inside the TUI, whose worker threads make fork unsafe. Any failure to
+    run the pool falls back to scanning in-process.
+    """
+    workers = max_workers if max_workers is not None else min(os.cpu_count() or 1, 8)
+    if workers > 1 and len(sources) >= PARALLEL_SCAN_MIN_FILES:
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+                chunksize = max(1, len(sources) // (workers * 4))
+                return list(pool.map(_scan_source, sources, chunksize=chunksize))
+        except (BrokenProcessPool, OSError, RuntimeError) as e:
+            logger.warning("plugin_security_scan_pool_failed", error=str(e))
+    return [_scan_source(source) for source in sources]
+
+
+def scan_plugin_source(
+    source_dir: Path,
+    cache: Optional[TrustScanCache] = None,
+    max_workers: Optional[int] = None,
+) -> list[TrustFinding]:
     """
     Statically scan a plugin source tree for secret-access constructs.
 
@@ -113,9 +206,14 @@ def scan_plugin_source(source_dir: Path) -> list[TrustFinding]:
     access (importlib, getattr chains) is out of scope — the goal is that
     *plain* access can never claim to be accidental. Unparseable files are
     reported as findings too, so a syntax error cannot hide code from the scan.
+
+    With a `cache`, only files whose content hash is not already stored are
+    parsed; `max_workers` caps the process pool used for those (1 disables it).
     """
-    findings: list[TrustFinding] = []
     source_dir = Path(source_dir)
+    # rel -> findings once known; pending holds rel -> (content hash, source)
+    per_file: dict[str, list[RawFinding]] = {}
+    pending: dict[str, tuple[str, str]] = {}
 
     for path in sorted(source_dir.rglob("*.py")):
         rel_parts = path.relative_to(source_dir).parts
@@ -125,57 +223,37 @@ def scan_plugin_source(source_dir: Path) -> list[TrustFinding]:
 
         # A file the scan cannot inspect must become a finding, never an
         # exception: one unreadable or unparseable file aborting the scan
-        # would hide every other file from it. (SyntaxError covers null
-        # bytes on Python >= 3.12; ValueError covers older versions.)
+        # would hide every other file from it.
         try:
-            source = path.read_text(encoding="utf-8", errors="replace")
+            data = path.read_bytes()
         except OSError as e:
-            findings.append(TrustFinding(rel, 0, "unparseable",
-                                         f"could not read file: {e}"))
-            continue
-        try:
-            tree = ast.parse(source)
-        except (SyntaxError, ValueError, RecursionError, MemoryError) as e:
-            # RecursionError/MemoryError included on purpose: the tree is
-            # untrusted plugin source, and one crafted file must degrade to
-            # a finding, not abort the scan for the whole plugin.
-            lineno = getattr(e, "lineno", 0) or 0
-            msg = getattr(e, "msg", None) or str(e)
-            findings.append(TrustFinding(rel, lineno, "unparseable",
-                                         f"could not parse file: {msg}"))
+            per_file[rel] = [(0, "unparseable", f"could not read file: {e}")]
             continue
+        content_hash = hashlib.sha256(data).hexdigest()
+        pending[rel] = (content_hash, data.decode("utf-8", errors="replace"))
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    findings.extend(_findings_for_module(alias.name, node, rel))
-            elif isinstance(node, ast.ImportFrom):
-                # Relative imports (level > 0) resolve inside the plugin's own
-                # package — `from .keyring import X` is the plugin's module,
-                # not the OS keyring — so absolute-name matching only applies
-                # to level-0 imports.
-                if node.level != 0:
-                    continue
-                findings.extend(_findings_for_module(node.module, node, rel))
-                if node.module and node.module.startswith("titan_cli"):
-                    for alias in node.names:
-                        if alias.name == "SecretManager":
-                            findings.append(TrustFinding(
-                                rel, node.lineno, "secret-manager",
-                                f"imports SecretManager from '{node.module}'"))
-                        # `from titan_cli.core.security import _vault` carries
-                        # the vault module in `names`, not in `module`.
-                        elif alias.name == "_vault":
-                            findings.append(TrustFinding(
-                                rel, node.lineno, "vault-import",
-                                f"imports '_vault' from '{node.module}' (Titan's private vault)"))
-            elif isinstance(node, ast.Name) and node.id == "SecretManager":
-                findings.append(TrustFinding(
-                    rel, node.lineno, "secret-manager",
-                    "references SecretManager"))
-            elif isinstance(node, ast.Attribute) and node.attr == "SecretManager":
-                findings.append(TrustFinding(
-                    rel, node.lineno, "secret-manager",
-                    "references SecretManager"))
+    cached = (
+        cache.get_many((h for h, _ in pending.values()), SCAN_RULES_VERSION)
+        if cache is not None and pending
+        else {}
+    )
+    cold = []
+    for rel, (content_hash, source) in pending.items():
+        if content_hash in cached:
+            per_file[rel] = cached[content_hash]
+        else:
+            cold.append((rel, content_hash, source))
 
-    return findings
+    scanned = _scan_sources([source for _, _, source in cold], max_workers)
+    fresh: dict[str, list[RawFinding]] = {}
+    for (rel, content_hash, _), findings in zip(cold, scanned):
+        per_file[rel] = findings
+        fresh[content_hash] = findings
+    if cache is not None:
+        cache.put_many(fresh, SCAN_RULES_VERSION)
+
+    return [
+        TrustFinding(rel, line, code, detail)
+        for rel in sorted(per_file)
+        for line, code, detail in per_file[rel]
+    ]
@@ -0,0 +1,138 @@
+"""
+On-disk cache of plugin trust scan results, keyed by file content hash.
+
+Parsing and walking every `.py` file of a large community plugin on each
+registry rebuild is pure repeated work: a pinned stable checkout does not
+change until the user updates it, and a dev_local tree changes a handful of
+files at a time. Results are stored per SHA-256 of the file bytes together
+with the scan rules version, so a changed file (or a change to the rules
+themselves) misses the cache and is scanned again.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable
+
+from titan_cli.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+RawFinding = tuple[int, str, str]
+"""(line, code, detail) — a TrustFinding without its file path."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scan_results (
+    content_hash TEXT NOT NULL,
+    rules_version INTEGER NOT NULL,
+    findings TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (content_hash, rules_version)
+);
+"""
+
+_SQLITE_MAX_VARIABLES = 900
+
+
+class TrustScanCache:
+    """
+    Persist per-file trust scan results across processes.
+
+    Storage failures are logged and swallowed: the cache is an optimization
+    and must never turn into a reason a plugin goes unscanned.
+    """
+
+    CACHE_PATH = Path.home() / ".titan" / "cache" / "trust-scan.sqlite"
+    RETENTION_SECONDS = 90 * 24 * 3600
+
+    def __init__(self, path: Path | None = None):
+        self.path = Path(path) if path is not None else self.CACHE_PATH
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.path), timeout=5.0)
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def get_many(
+        self, content_hashes: Iterable[str], rules_version: int
+    ) -> dict[str, list[RawFinding]]:
+        """Return cached findings for every hash that has an entry."""
+        hashes = list(dict.fromkeys(content_hashes))
+        if not hashes or not self.path.exists():
+            return {}
+        results: dict[str, list[RawFinding]] = {}
+        try:
+            with self._lock:
+                connection = self._connect()
+                try:
+                    for start in range(0, len(hashes), _SQLITE_MAX_VARIABLES):
+                        chunk = hashes[start:start + _SQLITE_MAX_VARIABLES]
+                        placeholders = ",".join("?" * len(chunk))
+                        rows = connection.execute(
+                            "SELECT content_hash, findings FROM scan_results "
+                            f"WHERE rules_version = ? AND content_hash IN ({placeholders})",
+                            (rules_version, *chunk),
+                        ).fetchall()
+                        for content_hash, payload in rows:
+                            results[content_hash] = [
+                                (int(line), str(code), str(detail))
+                                for line, code, detail in json.loads(payload)
+                            ]
+                    # A hit keeps its entry alive: retention counts from the
+                    # last time a result was used, not when it was stored.
+                    self._touch(connection, list(results), rules_version)
+                finally:
+                    connection.close()
+        except (sqlite3.Error, ValueError, TypeError) as exc:
+            logger.warning("trust_scan_cache_load_failed", error=str(exc))
+            return {}
+        return results
+
+    def _touch(self, connection: sqlite3.Connection, content_hashes: list[str], rules_version: int) -> None:
+        now = time.time()
+        with connection:
+            for start in range(0, len(content_hashes), _SQLITE_MAX_VARIABLES):
+                chunk = content_hashes[start:start + _SQLITE_MAX_VARIABLES]
+                placeholders = ",".join("?" * len(chunk))
+                connection.execute(
+                    "UPDATE scan_results SET stored_at = ? "
+                    f"WHERE rules_version = ? AND content_hash IN ({placeholders})",
+                    (now, rules_version, *chunk),
+                )
+
+    def put_many(self, results: dict[str, list[RawFinding]], rules_version: int) -> None:
+        """Store findings for freshly scanned files and drop entries past retention."""
+        if not results:
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                connection = self._connect()
+                try:
+                    with connection:
+                        connection.executemany(
+                            "INSERT OR REPLACE INTO scan_results "
+                            "(content_hash, rules_version, findings, stored_at) "
+                            "VALUES (?, ?, ?, ?)",
+                            (
+                                (content_hash, rules_version, json.dumps(findings), now)
+                                for content_hash, findings in results.items()
+                            ),
+                        )
+                        connection.execute(
+                            "DELETE FROM scan_results WHERE stored_at < ? OR rules_version != ?",
+                            (now - self.RETENTION_SECONDS, rules_version),
+                        )
+                finally:
+                    connection.close()
+        except sqlite3.Error as exc:
+            logger.warning("trust_scan_cache_save_failed", error=str(exc))
+
+    def clear(self) -> None:
+        """Delete every cached result."""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
@@ -1,10 +1,12 @@
 # Private vault: the only module in Titan allowed to touch raw secret strings
 # or the OS keyring. Nothing outside titan_cli/core/security/ may import it —
 # enforced by tests/core/security/test_architecture.py.
+import atexit
 import os
 import re
+import threading
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Callable, Iterable, Literal, Optional
 
 import keyring
 from dotenv import dotenv_values
@@ -29,6 +31,90 @@ OriginType = Literal["env", "project", "keyring"]
 LEGACY_NAMESPACES = ("titan", "ragnarok")
 
 
+class _KeyringCache:
+    """
+    Process-wide memo of what the keyring levels resolved, misses included.
+
+    Every keyring read is an IPC round trip (a D-Bus call to the Secret
+    Service on Linux), and a miss pays one more per legacy namespace. Plugin
+    init, the AI availability probe and every screen reload ask for the same
+    handful of keys, from fresh `SecretManager` instances — so the memo lives
+    at module level, not on the instance.
+
+    Only the keyring levels are cached: env and project secrets are already
+    in memory and must keep winning the moment they appear. Any write or
+    delete of a key drops its entries in every namespace, since a legacy
+    write changes what every namespace's fallback would find. A read that
+    failed with a keyring error is not cached, so an unavailable keyring is
+    retried instead of remembered as "no secret".
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str], Optional[str]] = {}
+        # One lock per key being read, so concurrent lookups of the same key
+        # (warm-up thread and plugin init) share a single keyring round trip
+        self._loading: dict[tuple[str, str], threading.Lock] = {}
+        # Bumped on every invalidation: a read that started before it must
+        # not store what it found.
+        self._generation = 0
+
+    def lookup(
+        self,
+        namespace: str,
+        key: str,
+        load: Callable[[], tuple[Optional[str], bool]],
+    ) -> Optional[str]:
+        """
+        Cached value for (`namespace`, `key`), calling `load` on a miss.
+
+        `load` returns the value (None when absent) and whether the answer
+        is definitive enough to cache.
+        """
+        entry = (namespace, key)
+        with self._lock:
+            if entry in self._entries:
+                return self._entries[entry]
+            loading = self._loading.setdefault(entry, threading.Lock())
+
+        with loading:
+            with self._lock:
+                if entry in self._entries:
+                    return self._entries[entry]
+                generation = self._generation
+            try:
+                value, cacheable = load()
+                with self._lock:
+                    if cacheable and generation == self._generation:
+                        self._entries[entry] = value
+                return value
+            finally:
+                with self._lock:
+                    self._loading.pop(entry, None)
+
+    def invalidate(self, key: str) -> None:
+        """Forget `key` in every namespace."""
+        with self._lock:
+            self._generation += 1
+            for entry in [entry for entry in self._entries if entry[1] == key]:
+                del self._entries[entry]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+_keyring_cache = _KeyringCache()
+# Resolved values should not outlive their use any longer than necessary
+atexit.register(_keyring_cache.clear)
+
+
+def clear_secret_cache() -> None:
+    """Forget every cached keyring resolution (tests, or after external keyring edits)."""
+    _keyring_cache.clear()
+
+
 def _quote_env_value(value: str) -> str:
     """
     Serialize a value for a dotenv line so it round-trips through
@@ -133,31 +219,73 @@ class SecretManager:
                 register_secret(value)
                 return value, "project"
 
+        value = _keyring_cache.lookup(namespace, key, lambda: self._read_keyring(key, namespace))
+        if value is not None:
+            # Again on every hit: the value may have been cached before the
+            # redaction registry was last cleared.
+            register_secret(value)
+            return value, "keyring"
+
+        return None, None
+
+    def prefetch(self, entries: Iterable[tuple[str, str]]) -> None:
+        """
+        Resolve (`namespace`, `key`) pairs into the process-wide cache.
+
+        Meant for a background thread ahead of plugin init: later reads of the
+        same keys are answered from memory. Keys an env var or the project
+        secrets already satisfy are skipped, since their reads never reach
+        the keyring.
+        """
+        for namespace, key in entries:
+            env_key = key.upper()
+            if os.environ.get(env_key, "").strip() or self._project_secrets.get(env_key, "").strip():
+                continue
+            self.resolve(key, namespace=namespace)
+
+    def _read_keyring(self, key: str, namespace: str) -> tuple[Optional[str], bool]:
+        """
+        Keyring level of the cascade, legacy fallback included.
+
+        Returns:
+            (value, cacheable): cacheable is False when a keyring error may
+            have hidden the key.
+        """
+        complete = True
         try:
             value = keyring.get_password(namespace, key)
         except Exception:
             # Keyring might not be available for THIS read; the legacy
             # fallback below gets its own attempt, same as a miss.
             value = None
+            complete = False
         if value and value.strip():
             register_secret(value)
-            return value, "keyring"
+            return value, True
 
         if namespace not in LEGACY_NAMESPACES:
-            legacy = self._get_legacy_and_migrate(key, namespace)
+            legacy, legacy_complete = self._get_legacy_and_migrate(key, namespace)
             if legacy is not None:
-                return legacy, "keyring"
+                return legacy, True
+            complete = complete and legacy_complete
 
-        return None, None
+        return None, complete
 
-    def _get_legacy_and_migrate(self, key: str, namespace: str) -> Optional[str]:
-        """Look `key` up under the legacy service names; copy to `namespace` on a hit."""
+    def _get_legacy_and_migrate(self, key: str, namespace: str) -> tuple[Optional[str], bool]:
+        """
+        Look `key` up under the legacy service names; copy to `namespace` on a hit.
+
+        Returns:
+            (value, complete): complete is False when a legacy lookup failed.
+        """
+        complete = True
         for legacy in LEGACY_NAMESPACES:
             try:
                 value = keyring.get_password(legacy, key)
             except Exception:
                 # One namespace failing must not abort the whole fallback:
                 # the next legacy service may still hold the key.
+                complete = False
                 continue
             if value:
                 register_secret(value)
@@ -167,8 +295,8 @@ class SecretManager:
                     keyring.set_password(namespace, key, value)
                 except Exception:
                     pass
-                return value
-        return None
+                return value, True
+        return None, complete
 
     def set(
         self,
@@ -197,7 +325,10 @@ class SecretManager:
             # Store in system keyring (most secure). A keyring failure raises:
             # falling back to the project file would silently move a personal
             # credential into a team-shared location.
-            keyring.set_password(namespace, key, value)
+            try:
+                keyring.set_password(namespace, key, value)
+            finally:
+                _keyring_cache.invalidate(key)
 
         elif scope == "project":
             secrets_file = self.project_path / ".titan" / "secrets.env"
@@ -273,6 +404,7 @@ class SecretManager:
                     keyring.delete_password(target, key)
                 except Exception:
                     pass  # Keyring might not be available / entry absent
+            _keyring_cache.invalidate(key)
 
         elif scope == "project":
             key_upper = key.upper()
@@ -11,8 +11,9 @@ subprocess stdin, a scoped tempfile — see sessions.py and the use-primitives).
 
 import os
 import tempfile
+import threading
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Optional, TypeVar
+from typing import TYPE_CHECKING, Callable, Iterable, Mapping, Optional, TypeVar
 
 from .execution import (
     CANCELLED_RESULT,
@@ -378,6 +379,34 @@ class SecretBrokerFactory:
         """Broker scoped to the namespace derived from `plugin_name`."""
         return SecretBroker(self._vault, derive_namespace(plugin_name), self._prompter)
 
+    def warm_up(self, declared: Mapping[Optional[str], Iterable[str]]) -> threading.Thread:
+        """
+        Resolve every declared secret in one pass on a background thread.
+
+        Each keyring read is a round trip to the OS secret store; doing them
+        all up front, off the calling thread, means plugin init and the
+        screens that follow find them in the vault's cache. A broker that
+        asks for a key the warm-up is still reading waits for that read
+        instead of repeating it.
+
+        Args:
+            declared: Keys per plugin identity, namespaced the same way as
+                `for_plugin` ("core" or None for Titan's own secrets).
+
+        Returns:
+            The started daemon thread; nothing needs to join it.
+        """
+        entries = [
+            (derive_namespace(plugin_name), key)
+            for plugin_name, keys in declared.items()
+            for key in keys
+        ]
+        thread = threading.Thread(
+            target=self._vault.prefetch, args=(entries,), name="titan-secrets-warm-up", daemon=True
+        )
+        thread.start()
+        return thread
+
 
 def create_broker_factory(
     project_path: Optional[Path] = None,
@@ -10,6 +10,8 @@ import os
 import subprocess
 from dataclasses import dataclass
 
+from titan_cli.core.interrupt import run_process
+
 from .redaction import redact
 
 # Environment for run_with_secret_env. Unlike regular command steps (which
@@ -73,7 +75,7 @@ def run_redacted(
 ) -> SecureCommandResult:
     """Run `command`, optionally feeding a secret on stdin, redacting output."""
     try:
-        completed = subprocess.run(
+        completed = run_process(
             command,
             input=stdin_value,
             # Without an explicit stdin the child would inherit the parent's,
@@ -0,0 +1,48 @@
+"""
+Tracing subsystem for Titan CLI.
+
+Records where the time of a workflow run goes, as nested spans:
+workflow → step → client call → subprocess / HTTP / AI request.
+Traces are local Chrome trace files (open them in chrome://tracing,
+Perfetto or speedscope), summarized by `titan trace show`.
+
+Usage:
+    from titan_cli.core.tracing import span
+
+    with span("gh pr view", "subprocess"):
+        subprocess.run(...)
+
+    # Enable with `titan --trace` or TITAN_TRACE=1
+"""
+
+from .tracer import (
+    TRACE_ENV_VAR,
+    enable_tracing,
+    get_trace_dir,
+    span,
+    trace_workflow,
+    traced,
+    tracing_enabled,
+)
+from .analysis import (
+    critical_path,
+    format_report,
+    latest_trace_file,
+    load_trace,
+    summarize_spans,
+)
+
+__all__ = [
+    "TRACE_ENV_VAR",
+    "enable_tracing",
+    "get_trace_dir",
+    "span",
+    "trace_workflow",
+    "traced",
+    "tracing_enabled",
+    "critical_path",
+    "format_report",
+    "latest_trace_file",
+    "load_trace",
+    "summarize_spans",
+]
@@ -0,0 +1,184 @@
+"""
+Reading trace files back: the span tree, its critical path, and self-time totals.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .tracer import get_trace_dir
+
+
+@dataclass
+class SpanNode:
+    """A span of a loaded trace. Times are microseconds from the start of the trace."""
+    span_id: int
+    parent_id: Optional[int]
+    name: str
+    category: str
+    start: float
+    end: float
+    args: Dict[str, Any] = field(default_factory=dict)
+    children: List["SpanNode"] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    @property
+    def self_time(self) -> float:
+        """Duration not covered by any child (overlapping children count once)."""
+        covered = 0.0
+        cursor = self.start
+        for child in sorted(self.children, key=lambda c: c.start):
+            start = max(child.start, cursor)
+            end = min(child.end, self.end)
+            if end > start:
+                covered += end - start
+                cursor = end
+        return max(self.duration - covered, 0.0)
+
+
+@dataclass
+class SpanSummary:
+    """Totals of every span sharing a name and category."""
+    name: str
+    category: str
+    count: int = 0
+    total: float = 0.0
+    self_total: float = 0.0
+
+
+@dataclass
+class LoadedTrace:
+    """A trace file parsed into its span tree."""
+    path: Path
+    workflow: str
+    roots: List[SpanNode]
+    span_count: int
+
+    @property
+    def duration(self) -> float:
+        if not self.roots:
+            return 0.0
+        return max(root.end for root in self.roots) - min(root.start for root in self.roots)
+
+
+def latest_trace_file(directory: Optional[Path] = None) -> Optional[Path]:
+    """Most recent trace file, or None when there is none."""
+    traces = sorted((directory or get_trace_dir()).glob("*.json"))
+    return traces[-1] if traces else None
+
+
+def load_trace(path: Path) -> LoadedTrace:
+    """
+    Parse a trace file written by the tracer.
+
+    Raises:
+        ValueError: If the file is not a Chrome trace document
+    """
+    try:
+        document = json.loads(Path(path).read_text(encoding="utf-8"))
+        events = document["traceEvents"]
+    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        raise ValueError(f"{path} is not a trace file: {e}") from e
+
+    nodes: Dict[int, SpanNode] = {}
+    for index, event in enumerate(events):
+        if event.get("ph") != "X":
+            continue
+        args = dict(event.get("args") or {})
+        span_id = args.pop("span_id", -(index + 1))
+        parent_id = args.pop("parent_id", None)
+        nodes[span_id] = SpanNode(
+            span_id=span_id,
+            parent_id=parent_id,
+            name=event.get("name", "?"),
+            category=event.get("cat", ""),
+            start=float(event["ts"]),
+            end=float(event["ts"]) + float(event.get("dur", 0)),
+            args=args,
+        )
+
+    roots = []
+    for node in nodes.values():
+        parent = nodes.get(node.parent_id) if node.parent_id is not None else None
+        if parent is None:
+            roots.append(node)
+        else:
+            parent.children.append(node)
+    for node in nodes.values():
+        node.children.sort(key=lambda c: c.start)
+    roots.sort(key=lambda r: r.start)
+
+    workflow = (document.get("otherData") or {}).get("workflow") or (roots[0].name if roots else "?")
+    return LoadedTrace(path=Path(path), workflow=workflow, roots=roots, span_count=len(nodes))
+
+
+def critical_path(node: SpanNode, depth: int = 0) -> List[Tuple[int, SpanNode]]:
+    """
+    Spans that determine when `node` ends, as (depth, span) in start order.
+
+    Walks back from the end of the span: the child finishing last is on the
+    path, then the child finishing last before that one started, and so on.
+    Of concurrent children only the one that finished last is kept, so a
+    parallel group contributes its slowest branch.
+    """
+    chain: List[SpanNode] = []
+    cursor = node.end
+    for child in sorted(node.children, key=lambda c: c.end, reverse=True):
+        if child.end <= cursor:
+            chain.append(child)
+            cursor = child.start
+
+    path = [(depth, node)]
+    for child in reversed(chain):
+        path.extend(critical_path(child, depth + 1))
+    return path
+
+
+def summarize_spans(roots: List[SpanNode]) -> List[SpanSummary]:
+    """Count, total and self time per (name, category), highest self time first."""
+    summaries: Dict[Tuple[str, str], SpanSummary] = {}
+    stack = list(roots)
+    while stack:
+        node = stack.pop()
+        stack.extend(node.children)
+        summary = summaries.setdefault((node.name, node.category), SpanSummary(node.name, node.category))
+        summary.count += 1
+        summary.total += node.duration
+        summary.self_total += node.self_time
+    return sorted(summaries.values(), key=lambda s: s.self_total, reverse=True)
+
+
+def format_duration_us(microseconds: float) -> str:
+    """Human duration of a span: 850µs, 12.3ms, 4.56s."""
+    if microseconds < 1000:
+        return f"{microseconds:.0f}µs"
+    if microseconds < 1_000_000:
+        return f"{microseconds / 1000:.1f}ms"
+    return f"{microseconds / 1_000_000:.2f}s"
+
+
+def format_report(trace: LoadedTrace, top: int = 15) -> str:
+    """Plain-text report: critical path of every root span, then the top spans by self time."""
+    lines = [
+        f"Trace: {trace.workflow} ({trace.path})",
+        f"Total {format_duration_us(trace.duration)}, {trace.span_count} spans",
+        "",
+        "Critical path:",
+    ]
+    for root in trace.roots:
+        for depth, node in critical_path(root):
+            lines.append(
+                f"  {format_duration_us(node.duration):>9}  {node.category:<10} {'  ' * depth}{node.name}"
+            )
+
+    lines += ["", "Top self time:", f"  {'self':>9}  {'total':>9}  {'calls':>5}  span"]
+    for summary in summarize_spans(trace.roots)[:top]:
+        lines.append(
+            f"  {format_duration_us(summary.self_total):>9}  {format_duration_us(summary.total):>9}"
+            f"  {summary.count:>5}  [{summary.category}] {summary.name}"
+        )
+    return "\n".join(lines)
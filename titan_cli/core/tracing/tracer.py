@@ -0,0 +1,240 @@
+"""
+Span recording for workflow runs.
+
+A trace covers one top-level workflow run. Spans nest through a context
+variable: a step span opened inside a workflow span becomes its child, and a
+`gh` call made inside the step becomes the step's child, on whatever thread
+they run. Work handed to a thread pool keeps its parent when submitted
+through `contextvars.copy_context().run`.
+
+Tracing is off unless enabled with `titan --trace` or `TITAN_TRACE=1`. While
+off, `span()` costs one global lookup, so instrumentation can stay in hot
+paths. Like the abort check in `core.interrupt`, the active trace is
+process-global: only one workflow runs at a time.
+
+Traces are written in the Chrome trace event format ("X" complete events,
+microseconds), which chrome://tracing, Perfetto and speedscope open as a
+flamegraph. Each event carries its span and parent ids in `args`, so
+`titan trace show` rebuilds the exact tree even across threads.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from itertools import count
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from titan_cli.core.logging.config import get_logger
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+TRACE_ENV_VAR = "TITAN_TRACE"
+
+# Oldest traces beyond this many are deleted when a new one is written
+_MAX_TRACE_FILES = 20
+
+logger = get_logger(__name__)
+
+_enabled = os.getenv(TRACE_ENV_VAR, "").lower() in ("1", "true", "yes")
+_active_trace: Optional["Trace"] = None
+_active_lock = threading.Lock()
+_current_span: ContextVar[Optional["Span"]] = ContextVar("titan_current_span", default=None)
+
+
+@dataclass
+class Span:
+    """One timed operation. Times are `perf_counter_ns` readings."""
+    span_id: int
+    parent_id: Optional[int]
+    name: str
+    category: str
+    start_ns: int
+    thread_id: int
+    end_ns: Optional[int] = None
+    args: Dict[str, Any] = field(default_factory=dict)
+
+
+class Trace:
+    """The spans of one workflow run."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started_at = datetime.now(timezone.utc)
+        self.origin_ns = time.perf_counter_ns()
+        self.spans: List[Span] = []
+        self._ids = count(1)
+        self._threads: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def open_span(self, name: str, category: str, parent: Optional[Span], args: Dict[str, Any]) -> Span:
+        thread = threading.current_thread()
+        with self._lock:
+            span = Span(
+                span_id=next(self._ids),
+                parent_id=parent.span_id if parent else None,
+                name=name,
+                category=category,
+                start_ns=time.perf_counter_ns(),
+                thread_id=thread.ident or 0,
+                args=args,
+            )
+            self.spans.append(span)
+            self._threads.setdefault(span.thread_id, thread.name)
+        return span
+
+    def to_chrome(self) -> Dict[str, Any]:
+        """Render the trace as a Chrome trace event document."""
+        pid = os.getpid()
+        now_ns = time.perf_counter_ns()
+        events: List[Dict[str, Any]] = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in self._threads.items()
+        ]
+        for span in self.spans:
+            end_ns = span.end_ns if span.end_ns is not None else now_ns
+            events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": (span.start_ns - self.origin_ns) / 1000,
+                "dur": (end_ns - span.start_ns) / 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": {"span_id": span.span_id, "parent_id": span.parent_id, **span.args},
+            })
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"workflow": self.name, "started_at": self.started_at.isoformat()},
+        }
+
+    def write(self, directory: Optional[Path] = None) -> Path:
+        """Write the trace to `directory` (default: the trace directory) and return its path."""
+        directory = directory or get_trace_dir()
+        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in self.name)
+        path = directory / f"{self.started_at.strftime('%Y%m%dT%H%M%S%f')}-{safe_name}.json"
+        path.write_text(json.dumps(self.to_chrome()), encoding="utf-8")
+        _prune_trace_files(directory)
+        return path
+
+
+def enable_tracing(enabled: bool = True) -> None:
+    """Turn span recording on or off for workflow runs started from now on."""
+    global _enabled
+    _enabled = enabled
+
+
+def tracing_enabled() -> bool:
+    """Whether workflow runs are traced."""
+    return _enabled
+
+
+def get_trace_dir() -> Path:
+    """
+    Directory holding trace files (XDG-compliant, next to the logs).
+
+    Default: ~/.local/state/titan/traces/
+    """
+    trace_dir = Path.home() / ".local" / "state" / "titan" / "traces"
+    try:
+        trace_dir.mkdir(parents=True, exist_ok=True)
+    except (PermissionError, OSError):
+        import tempfile
+        trace_dir = Path(tempfile.gettempdir()) / "titan" / "traces"
+        trace_dir.mkdir(parents=True, exist_ok=True)
+    return trace_dir
+
+
+def _prune_trace_files(directory: Path) -> None:
+    traces = sorted(directory.glob("*.json"))
+    for old in traces[:-_MAX_TRACE_FILES]:
+        try:
+            old.unlink()
+        except OSError:
+            pass
+
+
+@contextmanager
+def span(name: str, category: str = "function", **args: Any) -> Iterator[Optional[Span]]:
+    """
+    Time the enclosed block as a child of the current span.
+
+    Does nothing (and yields None) when no trace is being recorded.
+
+    Args:
+        name: Span name, e.g. "gh pr view"; must not contain secrets or user content
+        category: Span kind: "workflow", "step", "client", "subprocess", "http", "ai"
+        **args: Extra attributes recorded on the span
+    """
+    trace = _active_trace
+    if trace is None:
+        yield None
+        return
+
+    current = trace.open_span(name, category, _current_span.get(), args)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.args["error"] = type(e).__name__
+        raise
+    finally:
+        current.end_ns = time.perf_counter_ns()
+        _current_span.reset(token)
+
+
+def traced(name: Optional[str] = None, category: str = "function") -> Callable[[F], F]:
+    """Decorator form of `span()`, named after the function unless `name` is given."""
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active_trace is None:
+                return func(*args, **kwargs)
+            with span(span_name, category):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore
+    return decorator
+
+
+@contextmanager
+def trace_workflow(workflow_name: str, trace_dir: Optional[Path] = None) -> Iterator[Optional[Span]]:
+    """
+    Span for a workflow run; the outermost run also records and writes the trace.
+
+    Nested workflows (and runs while tracing is disabled) only open a span.
+    """
+    global _active_trace
+    owns_trace = False
+    if _enabled:
+        with _active_lock:
+            if _active_trace is None:
+                _active_trace = Trace(workflow_name)
+                owns_trace = True
+
+    if not owns_trace:
+        with span(workflow_name, "workflow") as workflow_span:
+            yield workflow_span
+        return
+
+    trace = _active_trace
+    try:
+        with span(workflow_name, "workflow") as workflow_span:
+            yield workflow_span
+    finally:
+        with _active_lock:
+            _active_trace = None
+        try:
+            path = trace.write(trace_dir)
+            logger.info("trace_written", workflow=workflow_name, path=str(path), spans=len(trace.spans))
+        except OSError as e:
+            logger.warning("trace_write_failed", workflow=workflow_name, error=str(e))
@@ -19,13 +19,24 @@ class WorkflowStepModel(BaseModel):
     on_error: Literal["fail", "continue"] = Field("fail", description="Action to take if the step fails.")
     use_shell: bool = Field(False, description="If true, execute the command in a shell. WARNING: This can be a security risk if the command uses untrusted input.")
 
+    # A parallel group runs its branch steps concurrently as one step
+    parallel: Optional[List["WorkflowStepModel"]] = Field(
+        None,
+        description="Steps to run concurrently as one step. Each branch works on its own copy of ctx.data; writes are merged in declaration order once every branch has finished.",
+    )
+    max_parallel: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Maximum number of branches of a parallel group running at once (default: 4).",
+    )
+
     # Used only in base workflow definitions to mark injection points for hooks
     hook: Optional[str] = Field(None, description="Marks this step as a hook point for extension.")
 
     @model_validator(mode='after')
     def validate_step_type(self):
         """
-        Validate that the step has exactly one of: (plugin + step), command, or workflow.
+        Validate that the step has exactly one of: (plugin + step), command, workflow, or parallel.
         Also auto-generates id from name if not provided.
         """
         # Auto-generate id from name if not provided
@@ -46,6 +57,9 @@ class WorkflowStepModel(BaseModel):
             elif self.command:
                 # For command steps, generate generic id
                 self.id = "command_step"
+            elif self.parallel:
+                # For parallel groups, generate generic id
+                self.id = "parallel"
             else:
                 # Fallback
                 self.id = "step"
@@ -57,20 +71,59 @@ class WorkflowStepModel(BaseModel):
         has_plugin_step = self.plugin is not None and self.step is not None
         has_command = self.command is not None
         has_workflow = self.workflow is not None
+        has_parallel = self.parallel is not None
 
-        provided_actions = sum([has_plugin_step, has_command, has_workflow])
+        provided_actions = sum([has_plugin_step, has_command, has_workflow, has_parallel])
 
         if provided_actions > 1:
             raise ValueError(f"Step '{self.id}' can only have one action type, but found multiple: "
                              f"{'plugin/step, ' if has_plugin_step else ''}"
                              f"{'command, ' if has_command else ''}"
-                             f"{'workflow' if has_workflow else ''}".strip(', '))
+                             f"{'workflow, ' if has_workflow else ''}"
+                             f"{'parallel' if has_parallel else ''}".strip(', '))
 
         if provided_actions == 0 and not self.hook:
-            raise ValueError(f"Step '{self.id}' must define an action: either (plugin and step), a command, a workflow, or a hook.")
+            raise ValueError(f"Step '{self.id}' must define an action: either (plugin and step), a command, a workflow, a parallel group, or a hook.")
+
+        if self.max_parallel is not None and not has_parallel:
+            raise ValueError(f"Step '{self.id}' sets 'max_parallel' but is not a parallel group.")
+
+        if has_parallel:
+            self._validate_parallel_branches()
 
         return self
 
+    def _validate_parallel_branches(self) -> None:
+        """
+        Branches are plain plugin or command steps with ids unique within the group.
+
+        Hook points and nested workflows or groups are rejected: hooks are
+        resolved against the top-level step list, and a nested workflow's
+        steps would run on the branch's isolated context with their own hooks
+        and step list, which has no sensible side-by-side rendering.
+        """
+        if not self.parallel:
+            raise ValueError(f"Parallel group '{self.id}' must define at least one branch step.")
+
+        for branch in self.parallel:
+            if branch.hook or branch.workflow or branch.parallel is not None:
+                raise ValueError(
+                    f"Parallel group '{self.id}' can only run plugin or command steps, "
+                    f"but branch '{branch.id}' is a "
+                    f"{'hook' if branch.hook else 'workflow' if branch.workflow else 'parallel group'}."
+                )
+
+        # Same suffixing as top-level steps: git_status, git_status -> git_status_1, git_status_2
+        id_counts: Dict[str, int] = {}
+        for branch in self.parallel:
+            id_counts[branch.id] = id_counts.get(branch.id, 0) + 1
+        occurrence: Dict[str, int] = {}
+        for branch in self.parallel:
+            if id_counts[branch.id] > 1:
+                original_id = branch.id
+                occurrence[original_id] = occurrence.get(original_id, 0) + 1
+                branch.id = f"{original_id}_{occurrence[original_id]}"
+
 
 class WorkflowConfigModel(BaseModel):
     """
@@ -0,0 +1,210 @@
+"""
+Parallel step groups.
+
+A step with a `parallel:` list runs its branch steps concurrently on a bounded
+thread pool and counts as one step of the workflow:
+
+    - name: Checks
+      max_parallel: 2
+      parallel:
+        - plugin: project
+          step: ruff
+        - command: pytest -q
+          on_error: continue
+
+Rules:
+    - Each branch runs on its own copy of the context. `ctx.data` is copied
+      shallowly, so a branch sees everything written before the group but
+      nothing its sibling branches write. Nested objects are shared: branches
+      should assign new values rather than mutate existing ones.
+    - Once every branch has finished, the writes of each branch (keys it
+      added, replaced or removed, plus its result metadata) are applied to
+      the workflow context in declaration order. When two branches write the
+      same key, the branch declared last wins, whatever order they finished in.
+    - A failing branch with `on_error: fail` fails the group once the running
+      branches have finished; branches not started yet are not started. A
+      failing branch with `on_error: continue` is ignored.
+    - An `Exit` from any branch exits the workflow after the group.
+    - The group's own `on_error` decides whether a failed group stops the workflow.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import dataclasses
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from titan_cli.core.interrupt import raise_if_aborted
+from titan_cli.core.logging import get_logger
+from titan_cli.core.workflows.models import WorkflowStepModel
+from titan_cli.engine.context import WorkflowContext
+from titan_cli.engine.results import WorkflowResult, Success, Error, Skip, Exit, is_error, is_skip, is_exit
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_PARALLEL = 4
+
+
+@dataclass
+class BranchOutcome:
+    """What one branch of a parallel group did (result is None when it never started)."""
+    step: WorkflowStepModel
+    result: Optional[WorkflowResult] = None
+    ctx: Optional[WorkflowContext] = None
+    duration_seconds: float = 0.0
+
+
+def branch_context(ctx: WorkflowContext) -> WorkflowContext:
+    """Copy of `ctx` with its own `data` dict and workflow stack."""
+    return dataclasses.replace(
+        ctx,
+        data=dict(ctx.data),
+        _workflow_stack=list(ctx._workflow_stack),
+    )
+
+
+def run_branches(
+    group: WorkflowStepModel,
+    ctx: WorkflowContext,
+    run_branch: Callable[[WorkflowStepModel, WorkflowContext], WorkflowResult],
+) -> List[BranchOutcome]:
+    """
+    Run the branches of a parallel group, each on its own context copy.
+
+    Args:
+        group: The parallel group step
+        ctx: Workflow context; not modified
+        run_branch: Executes one branch step on its context and returns its result
+
+    Returns:
+        One outcome per branch, in declaration order
+    """
+    outcomes = [BranchOutcome(step=branch) for branch in group.parallel]
+    stop = threading.Event()
+
+    def _run(outcome: BranchOutcome) -> None:
+        if stop.is_set():
+            return
+        # Branches still queued when the workflow is cancelled never start
+        raise_if_aborted()
+        outcome.ctx = branch_context(ctx)
+        start = time.time()
+        try:
+            result = run_branch(outcome.step, outcome.ctx)
+        except Exception as e:
+            result = Error(f"An unexpected error occurred in step '{outcome.step.name or outcome.step.id}': {e}", e)
+        outcome.duration_seconds = time.time() - start
+        outcome.result = result
+        if is_error(result) and outcome.step.on_error == "fail":
+            stop.set()
+
+    max_workers = min(group.max_parallel or DEFAULT_MAX_PARALLEL, len(outcomes))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"titan-{group.id}") as pool:
+        # Each branch runs in a copy of the caller's context, so its trace
+        # spans nest under the group's span.
+        futures = [pool.submit(contextvars.copy_context().run, _run, outcome) for outcome in outcomes]
+        for future in futures:
+            # Re-raises WorkflowAborted (and anything else not caught above)
+            future.result()
+
+    return outcomes
+
+
+def merge_branch_data(ctx: WorkflowContext, outcomes: List[BranchOutcome]) -> None:
+    """
+    Apply the writes of every finished branch to `ctx.data`, in declaration order.
+
+    Result metadata counts as a write, exactly as for a sequential step. A key
+    is written by a branch when it is new, bound to a different object, or
+    removed compared to `ctx.data` at the start of the group.
+    """
+    snapshot = dict(ctx.data)
+    writers: Dict[str, str] = {}
+
+    for outcome in outcomes:
+        if outcome.ctx is None or outcome.result is None:
+            continue
+        data = outcome.ctx.data
+        if not is_error(outcome.result) and outcome.result.metadata:
+            data.update(outcome.result.metadata)
+
+        for key, value in data.items():
+            if key in snapshot and snapshot[key] is value:
+                continue
+            _record_write(writers, key, outcome.step.id)
+            ctx.data[key] = value
+        for key in snapshot:
+            if key not in data:
+                _record_write(writers, key, outcome.step.id)
+                ctx.data.pop(key, None)
+
+
+def _record_write(writers: Dict[str, str], key: str, branch_id: str) -> None:
+    previous = writers.get(key)
+    if previous is not None and previous != branch_id:
+        logger.debug("parallel_branch_write_conflict", key=key, overridden=previous, winner=branch_id)
+    writers[key] = branch_id
+
+
+def group_result(group: WorkflowStepModel, outcomes: List[BranchOutcome]) -> WorkflowResult:
+    """
+    Fold branch results into the result of the group.
+
+    Metadata is not carried on the folded result: `merge_branch_data` has
+    already applied it in declaration order.
+    """
+    failed = [
+        outcome for outcome in outcomes
+        if outcome.result is not None and is_error(outcome.result) and outcome.step.on_error == "fail"
+    ]
+    if failed:
+        names = ", ".join(outcome.step.name or outcome.step.id for outcome in failed)
+        return Error(
+            f"Parallel group '{group.name or group.id}' failed in: {names}",
+            failed[0].result.exception,
+        )
+
+    exits = [outcome for outcome in outcomes if outcome.result is not None and is_exit(outcome.result)]
+    if exits:
+        return Exit(exits[0].result.message)
+
+    if all(outcome.result is not None and is_skip(outcome.result) for outcome in outcomes):
+        return Skip(f"All branches of '{group.name or group.id}' were skipped")
+
+    return Success(f"{len(outcomes)} parallel branches finished")
+
+
+def execute_parallel_group(
+    group: WorkflowStepModel,
+    ctx: WorkflowContext,
+    run_branch: Callable[[WorkflowStepModel, WorkflowContext], WorkflowResult],
+) -> WorkflowResult:
+    """
+    Run a parallel group, merge its branches' writes into `ctx.data`, and return its result.
+
+    Args:
+        group: The parallel group step
+        ctx: Workflow context the branch writes are merged into
+        run_branch: Executes one branch step on its context and returns its result
+
+    Returns:
+        Error if a branch with on_error=fail failed, Exit if a branch exited,
+        Skip if every branch skipped, Success otherwise
+    """
+    start = time.time()
+    outcomes = run_branches(group, ctx, run_branch)
+    merge_branch_data(ctx, outcomes)
+    result = group_result(group, outcomes)
+
+    logger.info("parallel_group_finished",
+        group=group.id,
+        branches=len(outcomes),
+        not_started=sum(1 for outcome in outcomes if outcome.result is None),
+        wall_time=round(time.time() - start, 3),
+        branch_time=round(sum(outcome.duration_seconds for outcome in outcomes), 3),
+    )
+    return result
@@ -2,6 +2,7 @@ import os
 from subprocess import Popen, PIPE
 import re
 import shlex
+from titan_cli.core.interrupt import communicate, process_group_kwargs
 from titan_cli.core.security import redact
 from titan_cli.core.workflows.models import WorkflowStepModel
 from titan_cli.engine.context import WorkflowContext
@@ -69,10 +70,12 @@ def execute_command_step(step: WorkflowStepModel, ctx: WorkflowContext) -> Workf
             stderr=PIPE,
             text=True,
             cwd=cwd,
-            env=process_env
+            env=process_env,
+            # Own process group, so cancelling the workflow stops the whole command
+            **process_group_kwargs()
         )
-        
-        stdout_output, stderr_output = process.communicate()
+
+        stdout_output, stderr_output = communicate(process)
 
         if stdout_output:
             ctx.textual.text(redact(stdout_output))
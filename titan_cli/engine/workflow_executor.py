@@ -5,6 +5,9 @@ from titan_cli.core.workflows import ParsedWorkflow
 from titan_cli.core.workflows.workflow_exceptions import WorkflowExecutionError
 from titan_cli.engine.context import WorkflowContext
 from titan_cli.engine.results import WorkflowResult, Success, Error, is_error, is_skip, is_exit
+from titan_cli.engine.parallel import execute_parallel_group
+from titan_cli.core.interrupt import raise_if_aborted
+from titan_cli.core.tracing import span, trace_workflow
 from titan_cli.core.workflows.workflow_registry import WorkflowRegistry
 from titan_cli.core.plugins.plugin_registry import PluginRegistry
 from titan_cli.core.workflows.models import WorkflowStepModel
@@ -32,6 +35,10 @@ class WorkflowExecutor:
         """
         Executes the given ParsedWorkflow.
         """
+        with trace_workflow(workflow.name):
+            return self._run_workflow(workflow, ctx, params_override)
+
+    def _run_workflow(self, workflow: ParsedWorkflow, ctx: WorkflowContext, params_override: Optional[Dict[str, Any]] = None) -> WorkflowResult:
         # Merge workflow params into ctx.data with optional overrides
         effective_params = {**workflow.params}
         if params_override:
@@ -48,6 +55,9 @@ class WorkflowExecutor:
         try:
             step_index = 0
             for step_data in workflow.steps:
+                # A cancelled workflow runs no further steps
+                raise_if_aborted()
+
                 step_config = WorkflowStepModel(**step_data)
 
                 # Hooks are resolved by the registry, so we just skip the placeholder.
@@ -61,18 +71,21 @@ class WorkflowExecutor:
                 step_id = step_config.id
                 step_name = step_config.name or step_id
 
-                try:
-                    if step_config.workflow:
-                        step_result = self._execute_workflow_step(step_config, ctx)
-                    elif step_config.plugin and step_config.step:
-                        step_result = self._execute_plugin_step(step_config, ctx)
-                    elif step_config.command:
-                        step_result = self._execute_command_step(step_config, ctx)
-                    else:
-                        # This should be caught by model validation, but as a safeguard:
-                        step_result = Error(f"Invalid step configuration for '{step_id}'.")
-                except Exception as e:
-                    step_result = Error(f"An unexpected error occurred in step '{step_name}': {e}", e)
+                with span(step_name, "step", step_id=step_id, plugin=step_config.plugin, step=step_config.step):
+                    try:
+                        if step_config.workflow:
+                            step_result = self._execute_workflow_step(step_config, ctx)
+                        elif step_config.parallel:
+                            step_result = self._execute_parallel_step(step_config, ctx)
+                        elif step_config.plugin and step_config.step:
+                            step_result = self._execute_plugin_step(step_config, ctx)
+                        elif step_config.command:
+                            step_result = self._execute_command_step(step_config, ctx)
+                        else:
+                            # This should be caught by model validation, but as a safeguard:
+                            step_result = Error(f"Invalid step configuration for '{step_id}'.")
+                    except Exception as e:
+                        step_result = Error(f"An unexpected error occurred in step '{step_name}': {e}", e)
 
                 # Handle step result
                 if is_exit(step_result):
@@ -114,6 +127,16 @@ class WorkflowExecutor:
         # The `enter_workflow` check will prevent infinite recursion.
         return self.execute(sub_workflow, ctx, params_override=step_config.params)
 
+    def _execute_parallel_step(self, step_config: WorkflowStepModel, ctx: WorkflowContext) -> WorkflowResult:
+        """Executes the branches of a parallel group concurrently (see engine.parallel)."""
+        return execute_parallel_group(step_config, ctx, self._execute_branch_step)
+
+    def _execute_branch_step(self, step_config: WorkflowStepModel, ctx: WorkflowContext) -> WorkflowResult:
+        """Executes one branch of a parallel group on its own context."""
+        with span(step_config.name or step_config.id, "step", step_id=step_config.id, plugin=step_config.plugin, step=step_config.step):
+            if step_config.plugin and step_config.step:
+                return self._execute_plugin_step(step_config, ctx)
+            return self._execute_command_step(step_config, ctx)
 
     def _execute_plugin_step(self, step_config: WorkflowStepModel, ctx: WorkflowContext) -> WorkflowResult:
         plugin_name = step_config.plugin
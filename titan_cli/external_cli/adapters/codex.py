@@ -11,6 +11,8 @@ import shutil
 import subprocess
 from typing import Any, Optional
 
+from titan_cli.core.interrupt import run_process
+
 from .base import HeadlessResponse, SupportedCLI
 
 _ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
@@ -66,7 +68,7 @@ class CodexHeadlessAdapter:
             cmd += ["-m", model]
         cmd.append(prompt)
         try:
-            result = subprocess.run(
+            result = run_process(
                 cmd,
                 capture_output=True,
                 text=True,
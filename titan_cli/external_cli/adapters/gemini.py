@@ -10,6 +10,8 @@ import shutil
 import subprocess
 from typing import Any, Optional
 
+from titan_cli.core.interrupt import run_process
+
 from .base import HeadlessResponse, SupportedCLI
 
 _ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
@@ -60,7 +62,7 @@ class GeminiHeadlessAdapter:
         if model is not None:
             cmd += ["-m", model]
         try:
-            result = subprocess.run(
+            result = run_process(
                 cmd,
                 capture_output=True,
                 text=True,
@@ -66,6 +66,7 @@ def launch_tui(debug: bool = False, devtools: bool = False):
     import os
     from titan_cli.core.config import TitanConfig
     from titan_cli.core.plugins.plugin_registry import PluginRegistry
+    from titan_cli.core.plugins.trust_cache import TrustScanCache
     from titan_cli.core.logging import disable_console_logging
     from titan_cli.core.utils import find_project_root
     from .screens import GlobalSetupWizardScreen, ProjectSetupWizardScreen, MainMenuScreen
@@ -82,13 +83,16 @@ def launch_tui(debug: bool = False, devtools: bool = False):
         # Keep logging only in the file handler, even in debug mode.
         disable_console_logging()
 
+    # Plugin trust scans reuse results across runs through the cache in ~/.titan
+    trust_scan_cache = TrustScanCache()
+
     # Check if global config exists
     global_config_path = TitanConfig.GLOBAL_CONFIG
 
     if not global_config_path.exists():
         # First-time setup: Launch global setup wizard
         # Skip plugin initialization until after setup completes
-        plugin_registry = PluginRegistry()
+        plugin_registry = PluginRegistry(trust_scan_cache=trust_scan_cache)
         config = TitanConfig(registry=plugin_registry, skip_plugin_init=True)
 
         # We'll create a special wrapper screen that handles the wizard flow
@@ -199,7 +203,7 @@ def launch_tui(debug: bool = False, devtools: bool = False):
 
     if not project_config_path.exists():
         # Project not configured: Skip plugin initialization until after setup
-        plugin_registry = PluginRegistry()
+        plugin_registry = PluginRegistry(trust_scan_cache=trust_scan_cache)
         config = TitanConfig(registry=plugin_registry, skip_plugin_init=True)
         # Create a wrapper screen similar to global wizard flow
         from .screens.base import BaseScreen
@@ -257,7 +261,7 @@ def launch_tui(debug: bool = False, devtools: bool = False):
         return
 
     # Both global and project configs exist: Initialize normally with plugins
-    plugin_registry = PluginRegistry()
+    plugin_registry = PluginRegistry(trust_scan_cache=trust_scan_cache)
     config = TitanConfig(registry=plugin_registry)  # Plugins will initialize here
     app = TitanApp(config=config)
     _run_app(app)
@@ -16,9 +16,10 @@ from titan_cli.ui.tui.widgets import HeaderWidget
 from titan_cli.ui.tui.icons import Icons
 
 from titan_cli.core.interrupt import (
+    CancellationToken,
     WorkflowAborted,
-    clear_abort_check,
-    set_abort_check,
+    clear_cancellation_token,
+    set_cancellation_token,
 )
 from titan_cli.core.workflows import ParsedWorkflow
 from titan_cli.engine.builder import WorkflowContextBuilder
@@ -104,6 +105,7 @@ class WorkflowExecutionScreen(BaseScreen):
         self.workflow_name = workflow_name
         self.workflow: Optional[ParsedWorkflow] = None
         self._worker: Optional[Worker] = None
+        self._cancel_token = CancellationToken()
         self._original_cwd = os.getcwd()
         self._should_auto_back = False  # Flag to trigger auto-back when worker finishes
 
@@ -167,11 +169,12 @@ class WorkflowExecutionScreen(BaseScreen):
 
     def _execute_workflow(self) -> None:
         """Execute the workflow in a background thread."""
-        # Let blocking calls made from this thread (AI requests, headless CLI
-        # subprocesses) notice when the app closes, so quitting mid-call doesn't
-        # leave this non-daemon thread hanging interpreter shutdown.
-        app = self.app
-        set_abort_check(lambda: not app.is_running)
+        # Blocking calls made from this thread (prompts, AI requests, headless
+        # CLI subprocesses) are released when the token is cancelled, so
+        # cancelling or quitting mid-call doesn't leave this non-daemon thread
+        # hanging interpreter shutdown. The token is bound to this thread only:
+        # another workflow started while this one unwinds has its own.
+        set_cancellation_token(self._cancel_token)
         try:
             # We're already in the project directory (current working directory)
             # No need to change directory
@@ -224,9 +227,13 @@ class WorkflowExecutionScreen(BaseScreen):
             executor.execute(self.workflow, execution_context)
 
         except WorkflowAborted:
-            # The app closed while a step was blocked in an AI call or prompt.
-            # There is no UI left to report to; just let this thread die.
-            logger.info("workflow_aborted_on_app_exit", workflow_name=self.workflow_name)
+            # The workflow was cancelled or the app closed while a step was
+            # blocked. There is no UI left to report to; just let this thread die.
+            logger.info(
+                "workflow_aborted",
+                workflow_name=self.workflow_name,
+                reason=self._cancel_token.reason,
+            )
         except (WorkflowNotFoundError, WorkflowExecutionError) as e:
             self._output(f"\n[red]{Icons.ERROR} Workflow failed: {e}[/red]")
             self._output("[dim]Press ESC or Q to return[/dim]")
@@ -234,7 +241,7 @@ class WorkflowExecutionScreen(BaseScreen):
             self._output(f"\n[red]{Icons.ERROR} Unexpected error: {type(e).__name__}: {e}[/red]")
             self._output("[dim]Press ESC or Q to return[/dim]")
         finally:
-            clear_abort_check()
+            clear_cancellation_token()
             # Restore original working directory
             os.chdir(self._original_cwd)
 
@@ -366,12 +373,17 @@ class WorkflowExecutionScreen(BaseScreen):
             #     f.write(f"[{time.time():.3f}] SCREEN: Worker finished, popping screen now\n")
             self.app.pop_screen()
 
+    def on_unmount(self) -> None:
+        """Release a workflow still running when the screen goes away (including app exit)."""
+        self._cancel_token.cancel("Workflow screen closed")
+
     def action_cancel_execution(self) -> None:
         """Cancel workflow execution and go back."""
         # Cancel worker if running
         if self._worker and self._worker.state == WorkerState.RUNNING:
-            # Try to cancel, but don't wait for it to finish
-            # The worker thread may be blocked, so we just move on
+            # Wake whatever the worker thread is blocked on, but don't wait
+            # for it to unwind
+            self._cancel_token.cancel("Workflow cancelled by user")
             try:
                 self._worker.cancel()
             except Exception:
@@ -401,6 +413,10 @@ class StepsContent(Widget):
         height: auto;
         padding: 0 1 1 1;
     }
+
+    .branch-step-widget {
+        padding: 0 1 1 3;
+    }
     """
 
     def __init__(self, **kwargs):
@@ -424,6 +440,14 @@ class StepsContent(Widget):
             self._step_widgets[step_id] = step_widget
             self.mount(step_widget)
 
+            # Branches of a parallel group are listed under it, keyed "<group>.<branch>"
+            for branch_idx, branch_data in enumerate(step_data.get("parallel") or []):
+                branch_id = branch_data.get("id") or f"branch_{branch_idx}"
+                branch_name = branch_data.get("name") or branch_id
+                branch_widget = Static(f"{Icons.PENDING} {branch_name}", classes="step-widget branch-step-widget")
+                self._step_widgets[f"{step_id}.{branch_id}"] = branch_widget
+                self.mount(branch_widget)
+
     def update_step(self, step_id: str, text: str) -> None:
         """Update a specific step's display."""
         if step_id in self._step_widgets:
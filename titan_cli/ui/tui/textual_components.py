@@ -12,8 +12,14 @@ from contextlib import contextmanager
 from textual.widget import Widget
 from textual.widgets import LoadingIndicator, Static, Markdown
 from textual.containers import Container
+from titan_cli.core.interrupt import current_token
 from titan_cli.ui.tui.widgets import Panel, PromptInput, PromptTextArea, PromptSelectionList, SelectionOption, PromptChoice, ChoiceOption, PromptOptionList, OptionItem, DecisionBadge
 
+# How often a prompt checks that the app is still running. Without a
+# cancellation token this is the only way out; with one it is just a backstop.
+_APP_CHECK_INTERVAL = 0.5
+_APP_CHECK_BACKSTOP = 5.0
+
 
 class TextualComponents:
     """
@@ -98,6 +104,45 @@ class TextualComponents:
         except Exception:
             pass
 
+    def split_columns(self, titles: List[str]) -> List["TextualComponents"]:
+        """
+        Mount side-by-side output columns and return one TextualComponents per column.
+
+        Used for the branches of a parallel step group: each branch renders
+        into its own column, so concurrent output does not interleave.
+
+        Args:
+            titles: Column headings, one per column
+
+        Returns:
+            TextualComponents rendering into each column, in order
+        """
+        from textual.containers import Horizontal, Vertical
+        from titan_cli.ui.tui.screens.workflow_execution import WorkflowExecutionContent
+
+        columns = [WorkflowExecutionContent() for _ in titles]
+
+        def _mount_columns():
+            branches = []
+            for column, title in zip(columns, titles):
+                branch = Vertical(Static(f"[bold]{title}[/bold]"), column, classes="parallel-branch")
+                branch.styles.width = "1fr"
+                branch.styles.height = "auto"
+                branch.styles.padding = (0, 1)
+                branches.append(branch)
+            row = Horizontal(*branches, classes="parallel-branches")
+            row.styles.height = "auto"
+            target = self._active_step_container if self._active_step_container else self.output_widget
+            target.mount(row)
+            self.output_widget._scroll_to_end()
+
+        try:
+            self.app.call_from_thread(_mount_columns)
+        except Exception:
+            pass
+
+        return [TextualComponents(self.app, column) for column in columns]
+
     def mount(self, widget: Widget) -> None:
         """
         Mount a widget to the output panel.
@@ -451,6 +496,36 @@ class TextualComponents:
                 self.dim_text(f"  {line}")
             self.text("")
 
+    def _wait_for_answer(self, answered: threading.Event) -> bool:
+        """
+        Block the step thread until a prompt is answered.
+
+        This runs on a non-daemon executor thread that the interpreter joins at
+        exit, so the wait needs an escape: cancelling the workflow (which the
+        screen also does when it closes) wakes it at once. Without a token, or
+        should the token never fire, the app is checked periodically so a
+        closed TUI still releases the thread. (SIGINT cannot help - it is only
+        ever delivered to the main thread.)
+
+        Returns:
+            True once answered, False if the app stopped running first
+
+        Raises:
+            WorkflowAborted: The workflow was cancelled while waiting
+        """
+        token = current_token()
+        interval = _APP_CHECK_INTERVAL if token is None else _APP_CHECK_BACKSTOP
+        unregister = token.on_cancel(answered.set) if token is not None else (lambda: None)
+        try:
+            while not answered.wait(timeout=interval):
+                if not self.app.is_running:
+                    return False
+        finally:
+            unregister()
+        if token is not None:
+            token.raise_if_cancelled()
+        return True
+
     def ask_text(self, question: str, default: str = "") -> Optional[str]:
         """
         Ask user for text input (blocks until user responds).
@@ -520,14 +595,9 @@ class TextualComponents:
             # App is closing or worker was cancelled
             return default
 
-        # BLOCK here until user responds (with timeout to allow cancellation)
-        # Wait in loop with timeout so we can be interrupted
-        while not result_event.is_set():
-            if result_event.wait(timeout=0.5):
-                break
-            # Check if app is still running
-            if not self.app.is_running:
-                return default
+        # BLOCK here until the user responds (or the workflow is cancelled)
+        if not self._wait_for_answer(result_event):
+            return default
 
         # Check if user cancelled
         if result_container.get("cancelled", False):
@@ -584,11 +654,8 @@ class TextualComponents:
         except Exception:
             return None
 
-        while not result_event.is_set():
-            if result_event.wait(timeout=0.5):
-                break
-            if not self.app.is_running:
-                return None
+        if not self._wait_for_answer(result_event):
+            return None
 
         if result_container.get("cancelled", False):
             raise KeyboardInterrupt("User cancelled input")
@@ -668,14 +735,9 @@ class TextualComponents:
             # App is closing or worker was cancelled
             return default
 
-        # BLOCK here until user responds (with timeout to allow cancellation)
-        # Wait in loop with timeout so we can be interrupted
-        while not result_event.is_set():
-            if result_event.wait(timeout=0.5):
-                break
-            # Check if app is still running
-            if not self.app.is_running:
-                return default
+        # BLOCK here until the user responds (or the workflow is cancelled)
+        if not self._wait_for_answer(result_event):
+            return default
 
         # Check if user cancelled
         if result_container.get("cancelled", False):
@@ -735,11 +797,8 @@ class TextualComponents:
         except Exception:
             return default
 
-        while not result_event.is_set():
-            if result_event.wait(timeout=0.5):
-                break
-            if not self.app.is_running:
-                return default
+        if not self._wait_for_answer(result_event):
+            return default
 
         return result_container.get("value", default)
 
@@ -794,11 +853,8 @@ class TextualComponents:
         except Exception:
             return None
 
-        while not result_event.is_set():
-            if result_event.wait(timeout=0.5):
-                break
-            if not self.app.is_running:
-                return None
+        if not self._wait_for_answer(result_event):
+            return None
 
         return result_container.get("value")
 
@@ -847,14 +903,9 @@ class TextualComponents:
 
         self.mount(selection_widget)
 
-        # Wait for user to submit. The app-exit check is what lets this thread die when
-        # the user quits mid-prompt: this thread is a non-daemon executor thread that the
-        # interpreter joins at exit, so a wait with no escape hangs the console after the
-        # TUI is gone. (A KeyboardInterrupt handler would not help here - SIGINT is only
-        # ever delivered to the main thread, never to this one.)
-        while not result_container["ready"].wait(timeout=0.5):
-            if not self.app.is_running:
-                return []
+        # Wait for user to submit (or for the workflow to be cancelled)
+        if not self._wait_for_answer(result_container["ready"]):
+            return []
 
         # Remove the widget
         def _remove():
@@ -925,13 +976,9 @@ class TextualComponents:
 
         self.mount(option_widget)
 
-        # Wait for user to select. Same app-exit escape as every other ask_* method: this
-        # runs on a non-daemon executor thread that the interpreter joins at exit, so a
-        # wait with no escape hangs the console after the TUI is gone. (KeyboardInterrupt
-        # cannot unblock it - SIGINT is only ever delivered to the main thread.)
-        while not result_container["ready"].wait(timeout=0.5):
-            if not self.app.is_running:
-                return None
+        # Wait for user to select (or for the workflow to be cancelled)
+        if not self._wait_for_answer(result_container["ready"]):
+            return None
 
         # Remove the widget
         def _remove():
@@ -1031,13 +1078,9 @@ class TextualComponents:
             # App is closing or worker was cancelled
             return -1
 
-        # Wait for completion (with timeout to allow cancellation)
-        while not result_event.is_set():
-            if result_event.wait(timeout=0.5):
-                break
-            # Check if app is still running
-            if not self.app.is_running:
-                return -1
+        # Wait for completion (or for the workflow to be cancelled)
+        if not self._wait_for_answer(result_event):
+            return -1
 
         return result_container["exit_code"]
 
@@ -9,7 +9,7 @@ from typing import Any, Dict, Optional
 
 from textual.message import Message
 
-from titan_cli.core.interrupt import WorkflowAborted, abort_requested
+from titan_cli.core.interrupt import raise_if_aborted
 from titan_cli.core.workflows import ParsedWorkflow
 from titan_cli.core.workflows.workflow_exceptions import WorkflowExecutionError
 from titan_cli.core.workflows.workflow_registry import WorkflowRegistry
@@ -18,6 +18,8 @@ from titan_cli.core.security import create_broker_factory
 from titan_cli.core.workflows.models import WorkflowStepModel
 from titan_cli.engine.context import WorkflowContext
 from titan_cli.engine.results import WorkflowResult, Success, Error, is_error, is_skip, is_exit
+from titan_cli.engine.parallel import execute_parallel_group
+from titan_cli.core.tracing import span, trace_workflow
 from titan_cli.engine.steps.command_step import execute_command_step as execute_external_command_step
 from titan_cli.engine.steps.ai_assistant_step import execute_ai_assistant_step
 from titan_cli.core.logging import get_logger
@@ -169,6 +171,16 @@ class TextualWorkflowExecutor:
         Returns:
             WorkflowResult indicating success or failure
         """
+        with trace_workflow(workflow.name):
+            return self._run_workflow(workflow, ctx, params_override)
+
+    def _run_workflow(
+        self,
+        workflow: ParsedWorkflow,
+        ctx: WorkflowContext,
+        params_override: Optional[Dict[str, Any]] = None
+    ) -> WorkflowResult:
+        """Run the steps of `workflow` (see `execute`)."""
         # Inject Textual components into context if message_target is available
         if self._message_target and hasattr(self._message_target, 'app'):
             try:
@@ -228,12 +240,10 @@ class TextualWorkflowExecutor:
         try:
             step_index = 0
             for step_data in workflow.steps:
-                # Once the app is gone there is nobody to render for and nothing
-                # to confirm with - stop before running another step.
-                if abort_requested():
-                    raise WorkflowAborted(
-                        "Application closed during workflow execution"
-                    )
+                # Once the workflow is cancelled (or the app is gone) there is
+                # nobody to render for and nothing to confirm with - stop before
+                # running another step.
+                raise_if_aborted()
 
                 step_config = WorkflowStepModel(**step_data)
 
@@ -275,22 +285,25 @@ class TextualWorkflowExecutor:
                 else:
                     ctx.secret_broker = None
 
-                try:
-                    if step_config.workflow:
-                        step_result = self._execute_workflow_step(step_config, ctx)
-                    elif step_config.plugin and step_config.step:
-                        step_result = self._execute_plugin_step(step_config, ctx)
-                    elif step_config.command:
-                        step_result = self._execute_command_step(step_config, ctx)
-                    else:
-                        step_result = Error(f"Invalid step configuration for '{step_id}'.")
-                except Exception as e:
-                    logger.exception("step_exception",
-                        workflow=workflow.name,
-                        step_id=step_id,
-                        step=step_config.step
-                    )
-                    step_result = Error(f"An unexpected error occurred in step '{step_name}': {e}", e)
+                with span(step_name, "step", step_id=step_id, plugin=step_config.plugin, step=step_config.step):
+                    try:
+                        if step_config.workflow:
+                            step_result = self._execute_workflow_step(step_config, ctx)
+                        elif step_config.parallel:
+                            step_result = self._execute_parallel_step(step_config, ctx)
+                        elif step_config.plugin and step_config.step:
+                            step_result = self._execute_plugin_step(step_config, ctx)
+                        elif step_config.command:
+                            step_result = self._execute_command_step(step_config, ctx)
+                        else:
+                            step_result = Error(f"Invalid step configuration for '{step_id}'.")
+                    except Exception as e:
+                        logger.exception("step_exception",
+                            workflow=workflow.name,
+                            step_id=step_id,
+                            step=step_config.step
+                        )
+                        step_result = Error(f"An unexpected error occurred in step '{step_name}': {e}", e)
 
                 # Handle step result
                 step_duration = time.time() - step_start_time
@@ -461,6 +474,99 @@ class TextualWorkflowExecutor:
         # Recursively execute the nested workflow
         return self.execute(sub_workflow, ctx, params_override=step_config.params)
 
+    def _execute_parallel_step(self, step_config: WorkflowStepModel, ctx: WorkflowContext) -> WorkflowResult:
+        """
+        Execute the branches of a parallel group concurrently (see engine.parallel).
+
+        Each branch renders into its own column of the output panel, and its
+        progress is reported with step messages whose id is `<group>.<branch>`.
+        """
+        columns: Dict[str, Any] = {}
+        if ctx.textual is not None:
+            panes = ctx.textual.split_columns([branch.name or branch.id for branch in step_config.parallel])
+            columns = {branch.id: pane for branch, pane in zip(step_config.parallel, panes)}
+
+        started = set()
+
+        def run_branch(branch: WorkflowStepModel, branch_ctx: WorkflowContext) -> WorkflowResult:
+            raise_if_aborted()
+            started.add(branch.id)
+            branch_ctx.textual = columns.get(branch.id, branch_ctx.textual)
+            return self._execute_branch_step(step_config, branch, branch_ctx)
+
+        result = execute_parallel_group(step_config, ctx, run_branch)
+
+        # Branches left unstarted after a failure are reported as skipped
+        for branch in step_config.parallel:
+            if branch.id not in started:
+                self._post_message_sync(
+                    self.StepSkipped(
+                        step_index=ctx.current_step,
+                        step_id=f"{step_config.id}.{branch.id}",
+                        step_name=branch.name or branch.id
+                    )
+                )
+        return result
+
+    def _execute_branch_step(
+        self,
+        group: WorkflowStepModel,
+        step_config: WorkflowStepModel,
+        ctx: WorkflowContext
+    ) -> WorkflowResult:
+        """Execute one branch of a parallel group on its own context, reporting its progress."""
+        step_id = f"{group.id}.{step_config.id}"
+        step_name = step_config.name or step_config.id
+        step_start_time = time.time()
+
+        self._post_message_sync(
+            self.StepStarted(step_index=ctx.current_step, step_id=step_id, step_name=step_name)
+        )
+
+        # Same per-plugin broker scoping as sequential steps, on the branch's own context
+        is_plugin_step = bool(step_config.plugin and step_config.step)
+        ctx.secret_broker = self._broker_factory.for_plugin(step_config.plugin) if is_plugin_step else None
+
+        with span(step_name, "step", step_id=step_id, plugin=step_config.plugin, step=step_config.step):
+            try:
+                if is_plugin_step:
+                    step_result = self._execute_plugin_step(step_config, ctx)
+                else:
+                    step_result = self._execute_command_step(step_config, ctx)
+            except Exception as e:
+                logger.exception("step_exception", workflow=ctx.workflow_name, step_id=step_id, step=step_config.step)
+                step_result = Error(f"An unexpected error occurred in step '{step_name}': {e}", e)
+
+        step_duration = round(time.time() - step_start_time, 3)
+        if is_error(step_result):
+            logger.error("step_failed",
+                workflow=ctx.workflow_name,
+                step_id=step_id,
+                error=step_result.message,
+                on_error=step_config.on_error,
+                duration=step_duration
+            )
+            self._post_message_sync(
+                self.StepFailed(
+                    step_index=ctx.current_step,
+                    step_id=step_id,
+                    step_name=step_name,
+                    error_message=step_result.message,
+                    on_error=step_config.on_error
+                )
+            )
+        elif is_skip(step_result):
+            logger.info("step_skipped", workflow=ctx.workflow_name, step_id=step_id, reason=step_result.message, duration=step_duration)
+            self._post_message_sync(
+                self.StepSkipped(step_index=ctx.current_step, step_id=step_id, step_name=step_name)
+            )
+        else:  # Success or Exit
+            logger.info("step_success", workflow=ctx.workflow_name, step_id=step_id, message=step_result.message, duration=step_duration)
+            self._post_message_sync(
+                self.StepCompleted(step_index=ctx.current_step, step_id=step_id, step_name=step_name)
+            )
+        return step_result
+
     def _execute_plugin_step(self, step_config: WorkflowStepModel, ctx: WorkflowContext) -> WorkflowResult:
         """Execute a plugin step."""
         plugin_name = step_config.plugin